@@ -81,6 +81,7 @@ QCPGrid::QCPGrid(QCPAxis *parentAxis) :
 void QCPGrid::setSubGridVisible(bool visible)
 {
   mSubGridVisible = visible;
+  markLayerDirty();
 }
 
 /*!
@@ -89,6 +90,7 @@ void QCPGrid::setSubGridVisible(bool visible)
 void QCPGrid::setAntialiasedSubGrid(bool enabled)
 {
   mAntialiasedSubGrid = enabled;
+  markLayerDirty();
 }
 
 /*!
@@ -97,6 +99,7 @@ void QCPGrid::setAntialiasedSubGrid(bool enabled)
 void QCPGrid::setAntialiasedZeroLine(bool enabled)
 {
   mAntialiasedZeroLine = enabled;
+  markLayerDirty();
 }
 
 /*!
@@ -105,6 +108,7 @@ void QCPGrid::setAntialiasedZeroLine(bool enabled)
 void QCPGrid::setPen(const QPen &pen)
 {
   mPen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -113,6 +117,7 @@ void QCPGrid::setPen(const QPen &pen)
 void QCPGrid::setSubGridPen(const QPen &pen)
 {
   mSubGridPen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -124,6 +129,7 @@ void QCPGrid::setSubGridPen(const QPen &pen)
 void QCPGrid::setZeroLinePen(const QPen &pen)
 {
   mZeroLinePen = pen;
+  markLayerDirty();
 }
 
 /*! \internal
@@ -644,6 +650,7 @@ void QCPAxis::setSelectedParts(const SelectableParts &selected)
     mSelectedParts = selected;
     emit selectionChanged(mSelectedParts);
   }
+  markLayerDirty();
 }
 
 /*!
@@ -774,6 +781,7 @@ void QCPAxis::setTicker(QSharedPointer<QCPAxisTicker> ticker)
   else
     qDebug() << Q_FUNC_INFO << "can not set nullptr as axis ticker";
   // no need to invalidate margin cache here because produced tick labels are checked for changes in setupTickVector
+  markLayerDirty();
 }
 
 /*!
@@ -791,6 +799,7 @@ void QCPAxis::setTicks(bool show)
     mTicks = show;
     mCachedMarginValid = false;
   }
+  markLayerDirty();
 }
 
 /*!
@@ -805,6 +814,7 @@ void QCPAxis::setTickLabels(bool show)
     if (!mTickLabels)
       mTickVectorLabels.clear();
   }
+  markLayerDirty();
 }
 
 /*!
@@ -818,6 +828,7 @@ void QCPAxis::setTickLabelPadding(int padding)
     mAxisPainter->tickLabelPadding = padding;
     mCachedMarginValid = false;
   }
+  markLayerDirty();
 }
 
 /*!
@@ -832,6 +843,7 @@ void QCPAxis::setTickLabelFont(const QFont &font)
     mTickLabelFont = font;
     mCachedMarginValid = false;
   }
+  markLayerDirty();
 }
 
 /*!
@@ -842,6 +854,7 @@ void QCPAxis::setTickLabelFont(const QFont &font)
 void QCPAxis::setTickLabelColor(const QColor &color)
 {
   mTickLabelColor = color;
+  markLayerDirty();
 }
 
 /*!
@@ -860,6 +873,7 @@ void QCPAxis::setTickLabelRotation(double degrees)
     mAxisPainter->tickLabelRotation = qBound(-90.0, degrees, 90.0);
     mCachedMarginValid = false;
   }
+  markLayerDirty();
 }
 
 /*!
@@ -873,6 +887,7 @@ void QCPAxis::setTickLabelSide(LabelSide side)
 {
   mAxisPainter->tickLabelSide = side;
   mCachedMarginValid = false;
+  markLayerDirty();
 }
 
 /*!
@@ -918,6 +933,7 @@ void QCPAxis::setNumberFormat(const QString &formatCode)
     return;
   }
   mCachedMarginValid = false;
+  markLayerDirty();
   
   // interpret first char as number format char:
   QString allowedFormatChars(QLatin1String("eEfgG"));
@@ -977,6 +993,7 @@ void QCPAxis::setNumberPrecision(int precision)
     mNumberPrecision = precision;
     mCachedMarginValid = false;
   }
+  markLayerDirty();
 }
 
 /*!
@@ -991,6 +1008,7 @@ void QCPAxis::setTickLength(int inside, int outside)
 {
   setTickLengthIn(inside);
   setTickLengthOut(outside);
+  markLayerDirty();
 }
 
 /*!
@@ -1005,6 +1023,7 @@ void QCPAxis::setTickLengthIn(int inside)
   {
     mAxisPainter->tickLengthIn = inside;
   }
+  markLayerDirty();
 }
 
 /*!
@@ -1021,6 +1040,7 @@ void QCPAxis::setTickLengthOut(int outside)
     mAxisPainter->tickLengthOut = outside;
     mCachedMarginValid = false; // only outside tick length can change margin
   }
+  markLayerDirty();
 }
 
 /*!
@@ -1037,6 +1057,7 @@ void QCPAxis::setSubTicks(bool show)
     mSubTicks = show;
     mCachedMarginValid = false;
   }
+  markLayerDirty();
 }
 
 /*!
@@ -1051,6 +1072,7 @@ void QCPAxis::setSubTickLength(int inside, int outside)
 {
   setSubTickLengthIn(inside);
   setSubTickLengthOut(outside);
+  markLayerDirty();
 }
 
 /*!
@@ -1065,6 +1087,7 @@ void QCPAxis::setSubTickLengthIn(int inside)
   {
     mAxisPainter->subTickLengthIn = inside;
   }
+  markLayerDirty();
 }
 
 /*!
@@ -1081,6 +1104,7 @@ void QCPAxis::setSubTickLengthOut(int outside)
     mAxisPainter->subTickLengthOut = outside;
     mCachedMarginValid = false; // only outside tick length can change margin
   }
+  markLayerDirty();
 }
 
 /*!
@@ -1091,6 +1115,7 @@ void QCPAxis::setSubTickLengthOut(int outside)
 void QCPAxis::setBasePen(const QPen &pen)
 {
   mBasePen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -1101,6 +1126,7 @@ void QCPAxis::setBasePen(const QPen &pen)
 void QCPAxis::setTickPen(const QPen &pen)
 {
   mTickPen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -1111,6 +1137,7 @@ void QCPAxis::setTickPen(const QPen &pen)
 void QCPAxis::setSubTickPen(const QPen &pen)
 {
   mSubTickPen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -1125,6 +1152,7 @@ void QCPAxis::setLabelFont(const QFont &font)
     mLabelFont = font;
     mCachedMarginValid = false;
   }
+  markLayerDirty();
 }
 
 /*!
@@ -1135,6 +1163,7 @@ void QCPAxis::setLabelFont(const QFont &font)
 void QCPAxis::setLabelColor(const QColor &color)
 {
   mLabelColor = color;
+  markLayerDirty();
 }
 
 /*!
@@ -1148,6 +1177,7 @@ void QCPAxis::setLabel(const QString &str)
     mLabel = str;
     mCachedMarginValid = false;
   }
+  markLayerDirty();
 }
 
 /*!
@@ -1162,6 +1192,7 @@ void QCPAxis::setLabelPadding(int padding)
     mAxisPainter->labelPadding = padding;
     mCachedMarginValid = false;
   }
+  markLayerDirty();
 }
 
 /*!
@@ -1181,6 +1212,7 @@ void QCPAxis::setPadding(int padding)
     mPadding = padding;
     mCachedMarginValid = false;
   }
+  markLayerDirty();
 }
 
 /*!
@@ -1208,6 +1240,7 @@ void QCPAxis::setSelectedTickLabelFont(const QFont &font)
     mSelectedTickLabelFont = font;
     // don't set mCachedMarginValid to false here because margin calculation is always done with non-selected fonts
   }
+  markLayerDirty();
 }
 
 /*!
@@ -1219,6 +1252,7 @@ void QCPAxis::setSelectedLabelFont(const QFont &font)
 {
   mSelectedLabelFont = font;
   // don't set mCachedMarginValid to false here because margin calculation is always done with non-selected fonts
+  markLayerDirty();
 }
 
 /*!
@@ -1232,6 +1266,7 @@ void QCPAxis::setSelectedTickLabelColor(const QColor &color)
   {
     mSelectedTickLabelColor = color;
   }
+  markLayerDirty();
 }
 
 /*!
@@ -1242,6 +1277,7 @@ void QCPAxis::setSelectedTickLabelColor(const QColor &color)
 void QCPAxis::setSelectedLabelColor(const QColor &color)
 {
   mSelectedLabelColor = color;
+  markLayerDirty();
 }
 
 /*!
@@ -1252,6 +1288,7 @@ void QCPAxis::setSelectedLabelColor(const QColor &color)
 void QCPAxis::setSelectedBasePen(const QPen &pen)
 {
   mSelectedBasePen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -1262,6 +1299,7 @@ void QCPAxis::setSelectedBasePen(const QPen &pen)
 void QCPAxis::setSelectedTickPen(const QPen &pen)
 {
   mSelectedTickPen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -1272,6 +1310,7 @@ void QCPAxis::setSelectedTickPen(const QPen &pen)
 void QCPAxis::setSelectedSubTickPen(const QPen &pen)
 {
   mSelectedSubTickPen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -1287,6 +1326,7 @@ void QCPAxis::setSelectedSubTickPen(const QPen &pen)
 void QCPAxis::setLowerEnding(const QCPLineEnding &ending)
 {
   mAxisPainter->lowerEnding = ending;
+  markLayerDirty();
 }
 
 /*!
@@ -1302,6 +1342,7 @@ void QCPAxis::setLowerEnding(const QCPLineEnding &ending)
 void QCPAxis::setUpperEnding(const QCPLineEnding &ending)
 {
   mAxisPainter->upperEnding = ending;
+  markLayerDirty();
 }
 
 /*!
@@ -1548,6 +1589,77 @@ double QCPAxis::coordToPixel(double value) const
   }
 }
 
+/*! \overload
+
+  Transforms the \a count pixel coordinates in \a pixels to axis coordinates and writes them to
+  \a values. This gives the same results as calling \ref pixelToCoord(double) const for each
+  element, but the transformation parameters are only determined once, which makes it much faster
+  for large arrays. \a values may be the same array as \a pixels to transform in place.
+
+  \see coordToPixel(const double*, double*, int) const
+*/
+void QCPAxis::pixelToCoord(const double *pixels, double *values, int count) const
+{
+  if (count <= 0)
+    return;
+  const bool horizontal = orientation() == Qt::Horizontal;
+  const double pixelOrigin = horizontal ? mAxisRect->left() : mAxisRect->bottom();
+  const double extent = horizontal ? mAxisRect->width() : mAxisRect->height();
+  // direction in which pixels grow when moving away from the range origin:
+  const double sign = (horizontal != mRangeReversed) ? 1.0 : -1.0;
+  const double origin = mRangeReversed ? mRange.upper : mRange.lower;
+  if (mScaleType == stLinear)
+  {
+    const double factor = sign*mRange.size()/extent;
+    for (int i=0; i<count; ++i)
+      values[i] = (pixels[i]-pixelOrigin)*factor+origin;
+  } else // mScaleType == stLogarithmic
+  {
+    const double factor = sign*qLn(mRange.upper/mRange.lower)/extent;
+    for (int i=0; i<count; ++i)
+      values[i] = qExp((pixels[i]-pixelOrigin)*factor)*origin;
+  }
+}
+
+/*! \overload
+
+  Transforms the \a count axis coordinates in \a values to pixel coordinates of the QCustomPlot
+  widget and writes them to \a pixels. This gives the same results as calling \ref
+  coordToPixel(double) const for each element, but the transformation parameters are only
+  determined once, which makes it much faster for large arrays. \a pixels may be the same array as
+  \a values to transform in place.
+
+  \see pixelToCoord(const double*, double*, int) const
+*/
+void QCPAxis::coordToPixel(const double *values, double *pixels, int count) const
+{
+  if (count <= 0)
+    return;
+  const bool horizontal = orientation() == Qt::Horizontal;
+  const double pixelOrigin = horizontal ? mAxisRect->left() : mAxisRect->bottom();
+  const double extent = horizontal ? mAxisRect->width() : mAxisRect->height();
+  const double sign = (horizontal != mRangeReversed) ? 1.0 : -1.0;
+  const double origin = mRangeReversed ? mRange.upper : mRange.lower;
+  if (mScaleType == stLinear)
+  {
+    const double factor = sign*extent/mRange.size();
+    for (int i=0; i<count; ++i)
+      pixels[i] = (values[i]-origin)*factor+pixelOrigin;
+  } else // mScaleType == stLogarithmic
+  {
+    const double factor = sign*extent/qLn(mRange.upper/mRange.lower);
+    const bool negativeDomain = mRange.upper < 0.0;
+    for (int i=0; i<count; ++i)
+    {
+      const double value = values[i];
+      if ((value >= 0.0 && negativeDomain) || (value <= 0.0 && !negativeDomain)) // invalid value for logarithmic scale, place it like the scalar version does
+        pixels[i] = coordToPixel(value);
+      else
+        pixels[i] = qLn(value/origin)*factor+pixelOrigin;
+    }
+  }
+}
+
 /*!
   Returns the part of the axis that is hit by \a pos (in pixels). The return value of this function
   is independent of the user-selectable parts defined with \ref setSelectableParts. Further, this
@@ -2114,8 +2226,7 @@ QCPAxisPainterPrivate::QCPAxisPainterPrivate(QCustomPlot *parentPlot) :
   offset(0),
   abbreviateDecimalPowers(false),
   reversedEndings(false),
-  mParentPlot(parentPlot),
-  mLabelCache(16) // cache at most 16 (tick) labels
+  mParentPlot(parentPlot)
 {
 }
 
@@ -2132,12 +2243,7 @@ QCPAxisPainterPrivate::~QCPAxisPainterPrivate()
 */
 void QCPAxisPainterPrivate::draw(QCPPainter *painter)
 {
-  QByteArray newHash = generateLabelParameterHash();
-  if (newHash != mLabelParameterHash)
-  {
-    mLabelCache.clear();
-    mLabelParameterHash = newHash;
-  }
+  mLabelParameterHash = generateLabelParameterHash();
   
   QPoint origin;
   switch (type)
@@ -2327,12 +2433,7 @@ int QCPAxisPainterPrivate::size()
 {
   int result = 0;
 
-  QByteArray newHash = generateLabelParameterHash();
-  if (newHash != mLabelParameterHash)
-  {
-    mLabelCache.clear();
-    mLabelParameterHash = newHash;
-  }
+  mLabelParameterHash = generateLabelParameterHash();
   
   // get length of tick marks pointing outwards:
   if (!tickPositions.isEmpty())
@@ -2365,25 +2466,29 @@ int QCPAxisPainterPrivate::size()
 
 /*! \internal
   
-  Clears the internal label cache. Upon the next \ref draw, all labels will be created new. This
-  method is called automatically in \ref draw, if any parameters have changed that invalidate the
-  cached labels, such as font, color, etc.
+  Clears the label cache of the parent plot (see \ref QCustomPlot::labelCache). Upon the next \ref
+  draw, all labels will be created new. Since the cache is shared by all axes of the plot, this
+  affects the other axes as well. Changes of parameters that influence the cached labels, such as
+  font, color, etc. don't require clearing the cache, since they are part of the cache keys (see
+  \ref generateLabelParameterHash).
 */
 void QCPAxisPainterPrivate::clearCache()
 {
-  mLabelCache.clear();
+  mParentPlot->labelCache()->clear();
 }
 
 /*! \internal
   
-  Returns a hash that allows uniquely identifying whether the label parameters have changed such
-  that the cached labels must be refreshed (\ref clearCache). It is used in \ref draw. If the
-  return value of this method hasn't changed since the last redraw, the respective label parameters
-  haven't changed and cached labels may be used.
+  Returns a hash that allows uniquely identifying the label parameters that influence the cached
+  labels. It is part of the keys of the labels in the label cache (see \ref labelCacheKey), so
+  axes with identical label parameters share their cached labels. It is updated in \ref draw and
+  \ref size.
 */
 QByteArray QCPAxisPainterPrivate::generateLabelParameterHash() const
 {
-  QByteArray result;
+  QByteArray result("QCPAxisPainterPrivate;");
+  result.append(QByteArray::number(int(type)));
+  result.append(QByteArray::number(int(abbreviateDecimalPowers)));
   result.append(QByteArray::number(mParentPlot->bufferDevicePixelRatio()));
   result.append(QByteArray::number(tickLabelRotation));
   result.append(QByteArray::number(int(tickLabelSide)));
@@ -2394,6 +2499,19 @@ QByteArray QCPAxisPainterPrivate::generateLabelParameterHash() const
   return result;
 }
 
+/*! \internal
+  
+  Returns the key of the tick label with \a text in the label cache of the parent plot. It consists
+  of the current label parameter hash (see \ref generateLabelParameterHash) and the text.
+*/
+QByteArray QCPAxisPainterPrivate::labelCacheKey(const QString &text) const
+{
+  QByteArray result = mLabelParameterHash;
+  result.append('\0'); // separator, doesn't appear in the parameter hash
+  result.append(text.toUtf8());
+  return result;
+}
+
 /*! \internal
   
   Draws a single tick label with the provided \a painter, utilizing the internal label cache to
@@ -2428,44 +2546,45 @@ void QCPAxisPainterPrivate::placeTickLabel(QCPPainter *painter, double position,
   }
   if (mParentPlot->plottingHints().testFlag(QCP::phCacheLabels) && !painter->modes().testFlag(QCPPainter::pmNoCaching)) // label caching enabled
   {
-    CachedLabel *cachedLabel = mLabelCache.take(text); // attempt to get label from cache
-    if (!cachedLabel)  // no cached label existed, create it
+    const QByteArray key = labelCacheKey(text);
+    QCPLabelCache::Label cachedLabel;
+    if (!mParentPlot->labelCache()->find(key, &cachedLabel))  // no cached label existed, create it
     {
-      cachedLabel = new CachedLabel;
       TickLabelData labelData = getTickLabelData(painter->font(), text);
-      cachedLabel->offset = getTickLabelDrawOffset(labelData)+labelData.rotatedTotalBounds.topLeft();
+      cachedLabel.offset = getTickLabelDrawOffset(labelData)+labelData.rotatedTotalBounds.topLeft();
       if (!qFuzzyCompare(1.0, mParentPlot->bufferDevicePixelRatio()))
       {
-        cachedLabel->pixmap = QPixmap(labelData.rotatedTotalBounds.size()*mParentPlot->bufferDevicePixelRatio());
+        cachedLabel.pixmap = QPixmap(labelData.rotatedTotalBounds.size()*mParentPlot->bufferDevicePixelRatio());
 #ifdef QCP_DEVICEPIXELRATIO_SUPPORTED
 #  ifdef QCP_DEVICEPIXELRATIO_FLOAT
-        cachedLabel->pixmap.setDevicePixelRatio(mParentPlot->devicePixelRatioF());
+        cachedLabel.pixmap.setDevicePixelRatio(mParentPlot->devicePixelRatioF());
 #  else
-        cachedLabel->pixmap.setDevicePixelRatio(mParentPlot->devicePixelRatio());
+        cachedLabel.pixmap.setDevicePixelRatio(mParentPlot->devicePixelRatio());
 #  endif
 #endif
       } else
-        cachedLabel->pixmap = QPixmap(labelData.rotatedTotalBounds.size());
-      cachedLabel->pixmap.fill(Qt::transparent);
-      QCPPainter cachePainter(&cachedLabel->pixmap);
+        cachedLabel.pixmap = QPixmap(labelData.rotatedTotalBounds.size());
+      cachedLabel.pixmap.fill(Qt::transparent);
+      QCPPainter cachePainter(&cachedLabel.pixmap);
       cachePainter.setPen(painter->pen());
       drawTickLabel(&cachePainter, -labelData.rotatedTotalBounds.topLeft().x(), -labelData.rotatedTotalBounds.topLeft().y(), labelData);
+      cachePainter.end();
+      mParentPlot->labelCache()->insert(key, cachedLabel);
     }
     // if label would be partly clipped by widget border on sides, don't draw it (only for outside tick labels):
     bool labelClippedByBorder = false;
     if (tickLabelSide == QCPAxis::lsOutside)
     {
       if (QCPAxis::orientation(type) == Qt::Horizontal)
-        labelClippedByBorder = labelAnchor.x()+cachedLabel->offset.x()+cachedLabel->pixmap.width()/mParentPlot->bufferDevicePixelRatio() > viewportRect.right() || labelAnchor.x()+cachedLabel->offset.x() < viewportRect.left();
+        labelClippedByBorder = labelAnchor.x()+cachedLabel.offset.x()+cachedLabel.pixmap.width()/mParentPlot->bufferDevicePixelRatio() > viewportRect.right() || labelAnchor.x()+cachedLabel.offset.x() < viewportRect.left();
       else
-        labelClippedByBorder = labelAnchor.y()+cachedLabel->offset.y()+cachedLabel->pixmap.height()/mParentPlot->bufferDevicePixelRatio() > viewportRect.bottom() || labelAnchor.y()+cachedLabel->offset.y() < viewportRect.top();
+        labelClippedByBorder = labelAnchor.y()+cachedLabel.offset.y()+cachedLabel.pixmap.height()/mParentPlot->bufferDevicePixelRatio() > viewportRect.bottom() || labelAnchor.y()+cachedLabel.offset.y() < viewportRect.top();
     }
     if (!labelClippedByBorder)
     {
-      painter->drawPixmap(labelAnchor+cachedLabel->offset, cachedLabel->pixmap);
-      finalSize = cachedLabel->pixmap.size()/mParentPlot->bufferDevicePixelRatio();
+      painter->drawPixmap(labelAnchor+cachedLabel.offset, cachedLabel.pixmap);
+      finalSize = cachedLabel.pixmap.size()/mParentPlot->bufferDevicePixelRatio();
     }
-    mLabelCache.insert(text, cachedLabel); // return label to cache or insert for the first time if newly created
   } else // label caching disabled, draw text directly on surface:
   {
     TickLabelData labelData = getTickLabelData(painter->font(), text);
@@ -2728,10 +2847,10 @@ void QCPAxisPainterPrivate::getMaxTickLabelSize(const QFont &font, const QString
 {
   // note: this function must return the same tick label sizes as the placeTickLabel function.
   QSize finalSize;
-  if (mParentPlot->plottingHints().testFlag(QCP::phCacheLabels) && mLabelCache.contains(text)) // label caching enabled and have cached label
+  QCPLabelCache::Label cachedLabel;
+  if (mParentPlot->plottingHints().testFlag(QCP::phCacheLabels) && mParentPlot->labelCache()->peek(labelCacheKey(text), &cachedLabel)) // label caching enabled and have cached label
   {
-    const CachedLabel *cachedLabel = mLabelCache.object(text);
-    finalSize = cachedLabel->pixmap.size()/mParentPlot->bufferDevicePixelRatio();
+    finalSize = cachedLabel.pixmap.size()/mParentPlot->bufferDevicePixelRatio();
   } else // label caching disabled or no label with this text cached:
   {
     TickLabelData labelData = getTickLabelData(font, text);
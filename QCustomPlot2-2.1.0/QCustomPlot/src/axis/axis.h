@@ -295,6 +295,8 @@ public:
   void rescale(bool onlyVisiblePlottables=false);
   double pixelToCoord(double value) const;
   double coordToPixel(double value) const;
+  void pixelToCoord(const double *pixels, double *values, int count) const;
+  void coordToPixel(const double *values, double *pixels, int count) const;
   SelectablePart getPartAt(const QPointF &pos) const;
   QList<QCPAbstractPlottable*> plottables() const;
   QList<QCPGraph*> graphs() const;
@@ -443,11 +445,6 @@ public:
   QVector<QString> tickLabels;
   
 protected:
-  struct CachedLabel
-  {
-    QPointF offset;
-    QPixmap pixmap;
-  };
   struct TickLabelData
   {
     QString basePart, expPart, suffixPart;
@@ -455,11 +452,11 @@ protected:
     QFont baseFont, expFont;
   };
   QCustomPlot *mParentPlot;
-  QByteArray mLabelParameterHash; // to determine whether mLabelCache needs to be cleared due to changed parameters
-  QCache<QString, CachedLabel> mLabelCache;
+  QByteArray mLabelParameterHash; // the part of the label cache keys that depends on the label parameters, updated in draw and size
   QRect mAxisSelectionBox, mTickLabelsSelectionBox, mLabelSelectionBox;
   
   virtual QByteArray generateLabelParameterHash() const;
+  QByteArray labelCacheKey(const QString &text) const;
   
   virtual void placeTickLabel(QCPPainter *painter, double position, int distanceToAxis, const QString &text, QSize *tickLabelsSize);
   virtual void drawTickLabel(QCPPainter *painter, double x, double y, const TickLabelData &labelData) const;
@@ -60,6 +60,10 @@
   The ticker can be created and assigned to an axis like this:
   \snippet documentation/doc-image-generator/mainwindow.cpp axistickerdatetime-creation
   
+  Formatted tick labels are memorized per tick coordinate, so panning or replotting with unchanged
+  ticks doesn't need to format the same dates again. The memorized labels are discarded when the
+  format, time spec, time zone or locale changes.
+  
   \note If you rather wish to display relative times in terms of days, hours, minutes, seconds and
   milliseconds, and are not interested in the intricacies of real calendar dates with months and
   (leap) years, have a look at QCPAxisTickerTime instead.
@@ -117,6 +121,7 @@ QCPAxisTickerDateTime::QCPAxisTickerDateTime() :
 void QCPAxisTickerDateTime::setDateTimeFormat(const QString &format)
 {
   mDateTimeFormat = format;
+  mLabelCache.clear();
 }
 
 /*!
@@ -135,6 +140,7 @@ void QCPAxisTickerDateTime::setDateTimeFormat(const QString &format)
 void QCPAxisTickerDateTime::setDateTimeSpec(Qt::TimeSpec spec)
 {
   mDateTimeSpec = spec;
+  mLabelCache.clear();
 }
 
 # if QT_VERSION >= QT_VERSION_CHECK(5, 2, 0)
@@ -148,6 +154,7 @@ void QCPAxisTickerDateTime::setTimeZone(const QTimeZone &zone)
 {
   mTimeZone = zone;
   mDateTimeSpec = Qt::TimeZone;
+  mLabelCache.clear();
 }
 #endif
 
@@ -258,20 +265,39 @@ int QCPAxisTickerDateTime::getSubTickCount(double tickStep)
   (\ref setDateTimeFormat), time spec (\ref setDateTimeSpec), and possibly time zone (\ref
   setTimeZone).
   
+  Formatting dates is expensive compared to the rest of the tick generation, so the labels are
+  memorized by the tick coordinate in milliseconds. The setters of the format, time spec and time
+  zone discard the memorized labels, as does a change of \a locale.
+  
   \seebaseclassmethod
 */
 QString QCPAxisTickerDateTime::getTickLabel(double tick, const QLocale &locale, QChar formatChar, int precision)
 {
   Q_UNUSED(precision)
   Q_UNUSED(formatChar)
+  if (locale != mLabelCacheLocale)
+  {
+    mLabelCache.clear();
+    mLabelCacheLocale = locale;
+  }
+  const qint64 tickMSecs = qint64(tick*1000.0); // same truncation as in keyToDateTime
+  QHash<qint64, QString>::const_iterator it = mLabelCache.constFind(tickMSecs);
+  if (it != mLabelCache.constEnd())
+    return it.value();
+  
+  QString result;
 # if QT_VERSION >= QT_VERSION_CHECK(5, 2, 0)
   if (mDateTimeSpec == Qt::TimeZone)
-    return locale.toString(keyToDateTime(tick).toTimeZone(mTimeZone), mDateTimeFormat);
+    result = locale.toString(keyToDateTime(tick).toTimeZone(mTimeZone), mDateTimeFormat);
   else
-    return locale.toString(keyToDateTime(tick).toTimeSpec(mDateTimeSpec), mDateTimeFormat);
+    result = locale.toString(keyToDateTime(tick).toTimeSpec(mDateTimeSpec), mDateTimeFormat);
 # else
-  return locale.toString(keyToDateTime(tick).toTimeSpec(mDateTimeSpec), mDateTimeFormat);
+  result = locale.toString(keyToDateTime(tick).toTimeSpec(mDateTimeSpec), mDateTimeFormat);
 # endif
+  if (mLabelCache.size() >= 1000) // continuous panning keeps producing new ticks, so start over at some point
+    mLabelCache.clear();
+  mLabelCache.insert(tickMSecs, result);
+  return result;
 }
 
 /*! \internal
@@ -279,44 +305,143 @@ QString QCPAxisTickerDateTime::getTickLabel(double tick, const QLocale &locale,
   Uses the passed \a tickStep as a guiding value and applies corrections in order to obtain
   non-uniform tick intervals but intuitive tick labels, e.g. falling on the same day of each month.
   
+  For day and month tick steps, the ticks are counted in whole days or months from the tick origin,
+  using plain calendar arithmetic (see \ref calendarIndex). Starting with the last tick at or
+  before the lower range bound, ticks are generated until one lies at or beyond the upper range
+  bound, so months of different lengths can't cause missing ticks at the range ends. The calendar
+  is the one of the time spec (\ref setDateTimeSpec) or time zone (\ref setTimeZone), so the ticks
+  fall on the same time of day as the labels display. With the time spec \c Qt::UTC, no QDateTime
+  is needed at all.
+  
   \seebaseclassmethod
 */
 QVector<double> QCPAxisTickerDateTime::createTickVector(double tickStep, const QCPRange &range)
 {
-  QVector<double> result = QCPAxisTicker::createTickVector(tickStep, range);
-  if (!result.isEmpty())
+  if (mDateStrategy == dsNone)
+    return QCPAxisTicker::createTickVector(tickStep, range);
+  
+  QDate uniformDate, lowerDate;
+  int uniformMSecs, lowerMSecs;
+  keyToCalendar(mTickOrigin, &uniformDate, &uniformMSecs); // this time (and day in month) will be set for all ticks, if possible
+  keyToCalendar(range.lower, &lowerDate, &lowerMSecs);
+  const double stepUnit = mDateStrategy == dsUniformTimeInDay ? 86400.0 : 86400*30.4375; // tick steps of getTickStep are whole multiples of days or average months
+  const qint64 step = qMax(Q_INT64_C(1), qRound64(tickStep/stepUnit));
+  
+  // start at the tick in the day or month of the lower bound, and step back if it lies after the lower bound:
+  const qint64 uniformIndex = calendarIndex(uniformDate);
+  const qint64 offset = calendarIndex(lowerDate)-uniformIndex;
+  qint64 steps = offset/step;
+  if (steps*step > offset) // round towards minus infinity, also for ticks before the tick origin
+    --steps;
+  qint64 index = uniformIndex+steps*step;
+  double tick = calendarIndexToKey(index, uniformDate.day(), uniformMSecs);
+  if (tick > range.lower)
+  {
+    index -= step;
+    tick = calendarIndexToKey(index, uniformDate.day(), uniformMSecs);
+  }
+  
+  QVector<double> result;
+  result.reserve(int(range.size()/tickStep)+3);
+  result.append(tick);
+  while (tick < range.upper)
   {
-    if (mDateStrategy == dsUniformTimeInDay)
-    {
-      QDateTime uniformDateTime = keyToDateTime(mTickOrigin); // the time of this datetime will be set for all other ticks, if possible
-      QDateTime tickDateTime;
-      for (int i=0; i<result.size(); ++i)
-      {
-        tickDateTime = keyToDateTime(result.at(i));
-        tickDateTime.setTime(uniformDateTime.time());
-        result[i] = dateTimeToKey(tickDateTime);
-      }
-    } else if (mDateStrategy == dsUniformDayInMonth)
-    {
-      QDateTime uniformDateTime = keyToDateTime(mTickOrigin); // this day (in month) and time will be set for all other ticks, if possible
-      QDateTime tickDateTime;
-      for (int i=0; i<result.size(); ++i)
-      {
-        tickDateTime = keyToDateTime(result.at(i));
-        tickDateTime.setTime(uniformDateTime.time());
-        int thisUniformDay = uniformDateTime.date().day() <= tickDateTime.date().daysInMonth() ? uniformDateTime.date().day() : tickDateTime.date().daysInMonth(); // don't exceed month (e.g. try to set day 31 in February)
-        if (thisUniformDay-tickDateTime.date().day() < -15) // with leap years involved, date month may jump backwards or forwards, and needs to be corrected before setting day
-          tickDateTime = tickDateTime.addMonths(1);
-        else if (thisUniformDay-tickDateTime.date().day() > 15) // with leap years involved, date month may jump backwards or forwards, and needs to be corrected before setting day
-          tickDateTime = tickDateTime.addMonths(-1);
-        tickDateTime.setDate(QDate(tickDateTime.date().year(), tickDateTime.date().month(), thisUniformDay));
-        result[i] = dateTimeToKey(tickDateTime);
-      }
-    }
+    index += step;
+    tick = calendarIndexToKey(index, uniformDate.day(), uniformMSecs);
+    if (!(tick > result.last())) // only possible for dates outside of what QDate can represent, prevents an endless loop
+      break;
+    result.append(tick);
   }
   return result;
 }
 
+/*! \internal
+  
+  Returns the number of the period that contains \a date, used to count tick steps in \ref
+  createTickVector. This is the julian day for day tick steps, and the number of months since
+  January of year 0 (1 BC in the proleptic Gregorian calendar of QDate, which has no year 0) for
+  month tick steps.
+  
+  \see calendarIndexToKey
+*/
+qint64 QCPAxisTickerDateTime::calendarIndex(const QDate &date) const
+{
+  if (mDateStrategy == dsUniformTimeInDay)
+    return date.toJulianDay();
+  const qint64 year = date.year() < 0 ? date.year()+1 : date.year(); // QDate skips year 0
+  return year*12+date.month()-1;
+}
+
+/*! \internal
+  
+  Returns the key of the tick in the period \a index (see \ref calendarIndex), at \a msecsOfDay
+  milliseconds after the start of the day. For month periods, the tick is placed on the day \a
+  dayInMonth, or on the last day of the month if the month is shorter (e.g. day 31 in February).
+*/
+double QCPAxisTickerDateTime::calendarIndexToKey(qint64 index, int dayInMonth, int msecsOfDay) const
+{
+  if (mDateStrategy == dsUniformTimeInDay)
+    return calendarToKey(QDate::fromJulianDay(index), msecsOfDay);
+  qint64 year = index/12;
+  if (year*12 > index) // round towards minus infinity for months before year 0
+    --year;
+  const int month = int(index-year*12)+1;
+  QDate date(int(year <= 0 ? year-1 : year), month, 1); // QDate skips year 0
+  date = date.addDays(qMin(dayInMonth, date.daysInMonth())-1);
+  return calendarToKey(date, msecsOfDay);
+}
+
+/*! \internal
+  
+  Splits \a key into the calendar \a date and the milliseconds since the start of that day \a
+  msecsOfDay, in the calendar of the current time spec (\ref setDateTimeSpec) or time zone (\ref
+  setTimeZone). UTC keys are split arithmetically, other time specs require a QDateTime.
+  
+  \see calendarToKey
+*/
+void QCPAxisTickerDateTime::keyToCalendar(double key, QDate *date, int *msecsOfDay) const
+{
+  if (mDateTimeSpec == Qt::UTC)
+  {
+    const qint64 msecsPerDay = 86400000;
+    const qint64 msecs = qint64(key*1000.0); // same truncation as in keyToDateTime
+    qint64 days = msecs/msecsPerDay;
+    if (msecs-days*msecsPerDay < 0) // round days towards minus infinity for keys before the epoch
+      --days;
+    *date = QDate::fromJulianDay(days+2440588); // julian day of the epoch, 1. Jan 1970
+    *msecsOfDay = int(msecs-days*msecsPerDay);
+    return;
+  }
+  QDateTime dateTime = keyToDateTime(key);
+# if QT_VERSION >= QT_VERSION_CHECK(5, 2, 0)
+  if (mDateTimeSpec == Qt::TimeZone)
+    dateTime = dateTime.toTimeZone(mTimeZone);
+  else
+    dateTime = dateTime.toTimeSpec(mDateTimeSpec);
+# else
+  dateTime = dateTime.toTimeSpec(mDateTimeSpec);
+# endif
+  *date = dateTime.date();
+  *msecsOfDay = QTime(0, 0).msecsTo(dateTime.time());
+}
+
+/*! \internal
+  
+  Returns the key of the calendar \a date at \a msecsOfDay milliseconds after the start of the
+  day, in the calendar of the current time spec (\ref setDateTimeSpec) or time zone (\ref
+  setTimeZone). This is the inverse of \ref keyToCalendar.
+*/
+double QCPAxisTickerDateTime::calendarToKey(const QDate &date, int msecsOfDay) const
+{
+  if (mDateTimeSpec == Qt::UTC)
+    return (date.toJulianDay()-2440588)*86400.0+msecsOfDay/1000.0;
+# if QT_VERSION >= QT_VERSION_CHECK(5, 2, 0)
+  if (mDateTimeSpec == Qt::TimeZone)
+    return dateTimeToKey(QDateTime(date, QTime(0, 0).addMSecs(msecsOfDay), mTimeZone));
+# endif
+  return dateTimeToKey(QDateTime(date, QTime(0, 0).addMSecs(msecsOfDay), mDateTimeSpec));
+}
+
 /*!
   A convenience method which turns \a key (in seconds since Epoch 1. Jan 1970, 00:00 UTC) into a
   QDateTime object. This can be used to turn axis coordinates to actual QDateTimes.
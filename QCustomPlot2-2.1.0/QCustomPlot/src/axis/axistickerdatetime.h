@@ -63,12 +63,20 @@ protected:
 # endif
   // non-property members:
   enum DateStrategy {dsNone, dsUniformTimeInDay, dsUniformDayInMonth} mDateStrategy;
+  QHash<qint64, QString> mLabelCache;
+  QLocale mLabelCacheLocale;
   
   // reimplemented virtual methods:
   virtual double getTickStep(const QCPRange &range) Q_DECL_OVERRIDE;
   virtual int getSubTickCount(double tickStep) Q_DECL_OVERRIDE;
   virtual QString getTickLabel(double tick, const QLocale &locale, QChar formatChar, int precision) Q_DECL_OVERRIDE;
   virtual QVector<double> createTickVector(double tickStep, const QCPRange &range) Q_DECL_OVERRIDE;
+  
+  // non-virtual methods:
+  void keyToCalendar(double key, QDate *date, int *msecsOfDay) const;
+  double calendarToKey(const QDate &date, int msecsOfDay) const;
+  qint64 calendarIndex(const QDate &date) const;
+  double calendarIndexToKey(qint64 index, int dayInMonth, int msecsOfDay) const;
 };
 
 #endif // QCP_AXISTICKERDATETIME_H
@@ -62,8 +62,7 @@ QCPLabelPainterPrivate::QCPLabelPainterPrivate(QCustomPlot *parentPlot) :
   mSubstituteExponent(true),
   mMultiplicationSymbol(QChar(215)),
   mAbbreviateDecimalPowers(false),
-  mParentPlot(parentPlot),
-  mLabelCache(16)
+  mParentPlot(parentPlot)
 {
   analyzeFontMetrics();
 }
@@ -131,14 +130,24 @@ void QCPLabelPainterPrivate::setAbbreviateDecimalPowers(bool enabled)
   mAbbreviateDecimalPowers = enabled;
 }
 
+/*!
+  Makes sure the label cache of the parent plot (see \ref QCustomPlot::labelCache), which is
+  shared by all axes, can hold at least \a labelCount labels.
+*/
 void QCPLabelPainterPrivate::setCacheSize(int labelCount)
 {
-  mLabelCache.setMaxCost(labelCount);
+  if (labelCount > mParentPlot->labelCache()->maximumCount())
+    mParentPlot->labelCache()->setMaximumCount(labelCount);
 }
 
+/*!
+  Returns the maximum number of labels in the label cache of the parent plot.
+  
+  \see setCacheSize
+*/
 int QCPLabelPainterPrivate::cacheSize() const
 {
-  return mLabelCache.maxCost();
+  return mParentPlot->labelCache()->maximumCount();
 }
 
 void QCPLabelPainterPrivate::drawTickLabel(QCPPainter *painter, const QPointF &tickPos, const QString &text)
@@ -203,25 +212,26 @@ int QCPLabelPainterPrivate::size() const
 
 /*! \internal
   
-  Clears the internal label cache. Upon the next \ref draw, all labels will be created new. This
-  method is called automatically if any parameters have changed that invalidate the cached labels,
-  such as font, color, etc. Usually you won't need to call this method manually.
+  Clears the label cache of the parent plot (see \ref QCustomPlot::labelCache). Upon the next
+  \ref drawTickLabel, all labels will be created new. Since the cache is shared by all axes of the
+  plot, this affects the other axes as well. Usually you won't need to call this method manually,
+  changed parameters such as font, color, etc. are part of the cache keys.
 */
 void QCPLabelPainterPrivate::clearCache()
 {
-  mLabelCache.clear();
+  mParentPlot->labelCache()->clear();
 }
 
 /*! \internal
   
-  Returns a hash that allows uniquely identifying whether the label parameters have changed such
-  that the cached labels must be refreshed (\ref clearCache). It is used in \ref draw. If the
-  return value of this method hasn't changed since the last redraw, the respective label parameters
-  haven't changed and cached labels may be used.
+  Returns a hash that allows uniquely identifying the label parameters that influence the cached
+  labels. Together with \ref cacheKey, it forms the key of a label in the label cache of the
+  parent plot, so label painters with identical parameters share their cached labels.
 */
 QByteArray QCPLabelPainterPrivate::generateLabelParameterHash() const
 {
-  QByteArray result;
+  QByteArray result("QCPLabelPainterPrivate;");
+  result.append(QByteArray::number(int(mAbbreviateDecimalPowers)));
   result.append(QByteArray::number(mParentPlot->bufferDevicePixelRatio()));
   result.append(QByteArray::number(mRotation));
   //result.append(QByteArray::number((int)tickLabelSide)); TODO: check whether this is really a cache-invalidating property
@@ -259,12 +269,15 @@ void QCPLabelPainterPrivate::drawLabelMaybeCached(QCPPainter *painter, const QFo
 
   if (mParentPlot->plottingHints().testFlag(QCP::phCacheLabels) && !painter->modes().testFlag(QCPPainter::pmNoCaching)) // label caching enabled
   {
-    QByteArray key = cacheKey(text, color, rotation, side);
-    CachedLabel *cachedLabel = mLabelCache.take(QString::fromUtf8(key)); // attempt to take label from cache (don't use object() because we want ownership/prevent deletion during our operations, we re-insert it afterwards)
-    if (!cachedLabel)  // no cached label existed, create it
+    QByteArray key = generateLabelParameterHash();
+    key.append('\0'); // separator, doesn't appear in the parameter hash
+    key.append(cacheKey(text, color, rotation, side));
+    QCPLabelCache::Label cachedLabel;
+    if (!mParentPlot->labelCache()->find(key, &cachedLabel))  // no cached label existed, create it
     {
       LabelData labelData = getTickLabelData(font, color, rotation, side, text);
       cachedLabel = createCachedLabel(labelData);
+      mParentPlot->labelCache()->insert(key, cachedLabel);
     }
     // if label would be partly clipped by widget border on sides, don't draw it (only for outside tick labels):
     bool labelClippedByBorder = false;
@@ -279,10 +292,9 @@ void QCPLabelPainterPrivate::drawLabelMaybeCached(QCPPainter *painter, const QFo
     */
     if (!labelClippedByBorder)
     {
-      painter->drawPixmap(pos+cachedLabel->offset, cachedLabel->pixmap);
-      finalSize = cachedLabel->pixmap.size()/mParentPlot->bufferDevicePixelRatio(); // TODO: collect this in a member rect list?
+      painter->drawPixmap(pos+cachedLabel.offset, cachedLabel.pixmap);
+      finalSize = cachedLabel.pixmap.size()/mParentPlot->bufferDevicePixelRatio(); // TODO: collect this in a member rect list?
     }
-    mLabelCache.insert(QString::fromUtf8(key), cachedLabel);
   } else // label caching disabled, draw text directly on surface:
   {
     LabelData labelData = getTickLabelData(font, color, rotation, side, text);
@@ -524,31 +536,32 @@ void QCPLabelPainterPrivate::getMaxTickLabelSize(const QFont &font, const QStrin
 }
 */
 
-QCPLabelPainterPrivate::CachedLabel *QCPLabelPainterPrivate::createCachedLabel(const LabelData &labelData) const
+QCPLabelCache::Label QCPLabelPainterPrivate::createCachedLabel(const LabelData &labelData) const
 {
-  CachedLabel *result = new CachedLabel;
+  QCPLabelCache::Label result;
   
   // allocate pixmap with the correct size and pixel ratio:
   if (!qFuzzyCompare(1.0, mParentPlot->bufferDevicePixelRatio()))
   {
-    result->pixmap = QPixmap(labelData.rotatedTotalBounds.size()*mParentPlot->bufferDevicePixelRatio());
+    result.pixmap = QPixmap(labelData.rotatedTotalBounds.size()*mParentPlot->bufferDevicePixelRatio());
 #ifdef QCP_DEVICEPIXELRATIO_SUPPORTED
 #  ifdef QCP_DEVICEPIXELRATIO_FLOAT
-    result->pixmap.setDevicePixelRatio(mParentPlot->devicePixelRatioF());
+    result.pixmap.setDevicePixelRatio(mParentPlot->devicePixelRatioF());
 #  else
-    result->pixmap.setDevicePixelRatio(mParentPlot->devicePixelRatio());
+    result.pixmap.setDevicePixelRatio(mParentPlot->devicePixelRatio());
 #  endif
 #endif
   } else
-    result->pixmap = QPixmap(labelData.rotatedTotalBounds.size());
-  result->pixmap.fill(Qt::transparent);
+    result.pixmap = QPixmap(labelData.rotatedTotalBounds.size());
+  result.pixmap.fill(Qt::transparent);
   
   // draw the label into the pixmap
   // offset is between label anchor and topleft of cache pixmap, so pixmap can be drawn at pos+offset to make the label anchor appear at pos.
   // We use rotatedTotalBounds.topLeft() because rotatedTotalBounds is in a coordinate system where the label anchor is at (0, 0)
-  result->offset = labelData.rotatedTotalBounds.topLeft();
-  QCPPainter cachePainter(&result->pixmap);
-  drawText(&cachePainter, -result->offset, labelData);
+  result.offset = labelData.rotatedTotalBounds.topLeft();
+  QCPPainter cachePainter(&result.pixmap);
+  drawText(&cachePainter, -result.offset, labelData);
+  cachePainter.end();
   return result;
 }
 
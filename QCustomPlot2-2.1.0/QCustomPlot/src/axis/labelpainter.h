@@ -28,6 +28,7 @@
 
 #include "../global.h"
 #include "../vector2d.h"
+#include "../labelcache.h"
 
 class QCPPainter;
 class QCustomPlot;
@@ -109,11 +110,6 @@ public:
   static const QChar SymbolCross;
   
 protected:
-  struct CachedLabel
-  {
-    QPoint offset;
-    QPixmap pixmap;
-  };
   struct LabelData
   {
     AnchorSide side;
@@ -141,14 +137,12 @@ protected:
   bool mAbbreviateDecimalPowers;
   // non-property members:
   QCustomPlot *mParentPlot;
-  QByteArray mLabelParameterHash; // to determine whether mLabelCache needs to be cleared due to changed parameters
-  QCache<QString, CachedLabel> mLabelCache;
   QRect mAxisSelectionBox, mTickLabelsSelectionBox, mLabelSelectionBox;
   int mLetterCapHeight, mLetterDescent;
   
   // introduced virtual methods:
   virtual void drawLabelMaybeCached(QCPPainter *painter, const QFont &font, const QColor &color, const QPointF &pos, AnchorSide side, double rotation, const QString &text);
-  virtual QByteArray generateLabelParameterHash() const; // TODO: get rid of this in favor of invalidation flag upon setters?
+  virtual QByteArray generateLabelParameterHash() const;
 
   // non-virtual methods:
   QPointF getAnchorPos(const QPointF &tickPos);
@@ -156,7 +150,7 @@ protected:
   LabelData getTickLabelData(const QFont &font, const QColor &color, double rotation, AnchorSide side, const QString &text) const;
   void applyAnchorTransform(LabelData &labelData) const;
   //void getMaxTickLabelSize(const QFont &font, const QString &text, QSize *tickLabelsSize) const;
-  CachedLabel *createCachedLabel(const LabelData &labelData) const;
+  QCPLabelCache::Label createCachedLabel(const LabelData &labelData) const;
   QByteArray cacheKey(const QString &text, const QColor &color, double rotation, AnchorSide side) const;
   AnchorSide skewedAnchorSide(const QPointF &tickPos, double sideExpandHorz, double sideExpandVert) const;
   AnchorSide rotationCorrectedSide(AnchorSide side, double rotation) const;
@@ -34,7 +34,10 @@
 #include "layoutelements/layoutelement-legend.h"
 #include "plottable.h"
 #include "plottables/plottable-graph.h"
+#include "plottables/plottable-colormap.h"
 #include "item.h"
+#include "items/item-tracer.h"
+#include "polar/polargraph.h"
 #include "selectionrect.h"
 
 ////////////////////////////////////////////////////////////////////////////////////////////////////
@@ -260,6 +263,23 @@
   \see replot, beforeReplot, afterLayout
 */
 
+/*! \fn void QCustomPlot::framesDropped(int count)
+  
+  This signal is emitted right before a replot, if \a count queued replot requests were merged into
+  it because of the frame rate limit set with \ref setMaximumFrameRate.
+  
+  \see replot
+*/
+
+/*! \fn void QCustomPlot::replotProfiled(const QVariantMap &profile)
+  
+  If profiling is enabled with \ref setProfiling, this signal is emitted after each replot, right
+  after \ref afterReplot. \a profile holds the durations measured during the replot, see \ref
+  replotProfile.
+  
+  \see setProfiling
+*/
+
 /* end of documentation of signals */
 /* start of documentation of public members */
 
@@ -388,6 +408,9 @@ QCustomPlot::QCustomPlot(QWidget *parent) :
   mSelectionRectMode(QCP::srmNone),
   mSelectionRect(nullptr),
   mOpenGl(false),
+  mMaximumFrameRate(0),
+  mProfiling(false),
+  mLabelCache(new QCPLabelCache),
   mMouseHasMoved(false),
   mMouseEventLayerable(nullptr),
   mMouseSignalLayerable(nullptr),
@@ -395,6 +418,8 @@ QCustomPlot::QCustomPlot(QWidget *parent) :
   mReplotQueued(false),
   mReplotTime(0),
   mReplotTimeAverage(0),
+  mDroppedFrames(0),
+  mProfileFlushTime(-1),
   mOpenGlMultisamples(16),
   mOpenGlAntialiasedElementsBackup(QCP::aeNone),
   mOpenGlCacheLabelsBackup(true)
@@ -872,6 +897,76 @@ void QCustomPlot::setOpenGl(bool enabled, int multisampling)
 #endif
 }
 
+/*!
+  Limits the rate of queued replots (see \ref replot with \ref rpQueuedReplot) to \a
+  framesPerSecond. A value of 0 (the default) removes the limit, so queued replots happen in the
+  next event loop iteration.
+  
+  With a frame rate limit, a queued replot is delayed until the frame interval since the start of
+  the previous replot has passed. All further replot requests queued in the meantime are merged
+  into this single replot, which then emits \ref framesDropped with the number of merged requests.
+  This allows many independent data sources to request replots as often as they like, e.g. on
+  every new sample, while the plot is redrawn at a bounded rate.
+  
+  The frame interval adapts to the replot performance: It is never shorter than twice the average
+  replot time (see \ref replotTime), so replotting doesn't occupy more than about half of the event
+  loop, even if the plot is too complex to be drawn at the requested rate.
+  
+  Direct replots with the other refresh priorities are not affected by this limit.
+  
+  \see framesDropped
+*/
+void QCustomPlot::setMaximumFrameRate(double framesPerSecond)
+{
+  mMaximumFrameRate = qMax(0.0, framesPerSecond);
+}
+
+/*!
+  Sets whether each \ref replot measures how long its individual steps take. The measurements of
+  the last replot can be retrieved with \ref replotProfile, and are also passed to the signal \ref
+  replotProfiled, which is emitted after every replot while profiling is enabled.
+  
+  This helps finding out which part of a slow plot is to blame, e.g. a large color map, a graph
+  with millions of points or the tick label layout. When profiling is disabled (the default), no
+  measurements are taken and replots have no additional overhead.
+  
+  Only replots are profiled. Exports like \ref savePng or \ref toPainter are not.
+  
+  \see replotTime
+*/
+void QCustomPlot::setProfiling(bool enabled)
+{
+  mProfiling = enabled;
+  if (!mProfiling)
+    mReplotProfile.clear();
+}
+
+/*! \fn QSharedPointer<QCPLabelCache> QCustomPlot::labelCache() const
+  
+  Returns the cache that holds the rendered tick labels of all axes of this plot. Its size can be
+  tuned with \ref QCPLabelCache::setMaximumCount, and its hit and miss counters tell how well it
+  works (\ref QCPLabelCache::hits, \ref QCPLabelCache::misses).
+  
+  \see setLabelCache
+*/
+
+/*!
+  Makes this plot use \a labelCache for the rendered tick labels of its axes, if the plotting
+  hint \ref QCP::phCacheLabels is set. Pass the \ref labelCache of another plot to share the
+  labels between both plots, e.g. when a dashboard shows many small plots with the same fonts and
+  similar ranges. If \a labelCache is null, the plot gets a new, empty cache of its own.
+  
+  Each plot starts with a cache of its own, which is shared by all its axes. The cache is
+  thread-safe, so plots sharing a cache may also be exported concurrently from other threads (see
+  \ref toImage).
+  
+  \see QCPLabelCache
+*/
+void QCustomPlot::setLabelCache(const QSharedPointer<QCPLabelCache> &labelCache)
+{
+  mLabelCache = labelCache ? labelCache : QSharedPointer<QCPLabelCache>(new QCPLabelCache);
+}
+
 /*!
   Sets the viewport of this QCustomPlot. Usually users of QCustomPlot don't need to change the
   viewport manually.
@@ -1857,6 +1952,7 @@ void QCustomPlot::deselectAll()
     foreach (QCPLayerable *layerable, layer->children())
       layerable->deselectEvent(nullptr);
   }
+  markAllLayersDirty();
 }
 
 /*!
@@ -1893,8 +1989,9 @@ void QCustomPlot::replot(QCustomPlot::RefreshPriority refreshPriority)
     if (!mReplotQueued)
     {
       mReplotQueued = true;
-      QTimer::singleShot(0, this, SLOT(replot()));
-    }
+      QTimer::singleShot(queuedReplotDelay(), this, SLOT(replot()));
+    } else if (mMaximumFrameRate > 0)
+      ++mDroppedFrames;
     return;
   }
   
@@ -1902,6 +1999,13 @@ void QCustomPlot::replot(QCustomPlot::RefreshPriority refreshPriority)
     return;
   mReplotting = true;
   mReplotQueued = false;
+  mFrameClock.start();
+  if (mDroppedFrames > 0)
+  {
+    const int droppedFrames = mDroppedFrames;
+    mDroppedFrames = 0;
+    emit framesDropped(droppedFrames);
+  }
   emit beforeReplot();
   
 # if QT_VERSION < QT_VERSION_CHECK(4, 8, 0)
@@ -1912,33 +2016,128 @@ void QCustomPlot::replot(QCustomPlot::RefreshPriority refreshPriority)
   replotTimer.start();
 # endif
   
+  // with profiling, the timer is read after every step, so the timestamps (in milliseconds) are collected here:
+  const bool profiling = mProfiling; // signal handlers might change it during the replot
+  QVector<double> profileTimestamps;
+  QVariantList layerProfiles;
+  mProfileFlushTime = -1; // set by paintEvent if the widget is painted immediately
+  
   updateLayout();
+  if (profiling)
+    profileTimestamps << replotElapsed(replotTimer);
+  if (mPlottingHints.testFlag(QCP::phTrackDirtyLayers))
+    markChangedLayersDirty();
   // draw all layered objects (grid, axes, plottables, items, legend,...) into their buffers:
   setupPaintBuffers();
+  if (profiling)
+    profileTimestamps << replotElapsed(replotTimer);
+  mRedrawnLayers.clear();
   foreach (QCPLayer *layer, mLayers)
-    layer->drawToPaintBuffer();
+  {
+    // setupPaintBuffers only keeps the content of buffers whose layers are all unchanged, the others are invalidated:
+    QSharedPointer<QCPAbstractPaintBuffer> pb = layer->mPaintBuffer.toStrongRef();
+    if (!pb || pb->invalidated())
+    {
+      if (profiling)
+      {
+        const double layerStart = replotElapsed(replotTimer);
+        QVariantList layerableProfiles;
+        layer->drawToPaintBuffer(&layerableProfiles);
+        QVariantMap layerProfile;
+        layerProfile.insert(QLatin1String("name"), layer->name());
+        layerProfile.insert(QLatin1String("time"), replotElapsed(replotTimer)-layerStart);
+        layerProfile.insert(QLatin1String("layerables"), layerableProfiles);
+        layerProfiles.append(layerProfile);
+      } else
+        layer->drawToPaintBuffer();
+      mRedrawnLayers.append(layer->name());
+    }
+    layer->mDirty = false;
+  }
   foreach (QSharedPointer<QCPAbstractPaintBuffer> buffer, mPaintBuffers)
     buffer->setInvalidated(false);
+  if (profiling)
+    profileTimestamps << replotElapsed(replotTimer);
   
   if ((refreshPriority == rpRefreshHint && mPlottingHints.testFlag(QCP::phImmediateRefresh)) || refreshPriority==rpImmediateRefresh)
     repaint();
   else
     update();
   
-# if QT_VERSION < QT_VERSION_CHECK(4, 8, 0)
-  mReplotTime = replotTimer.elapsed();
-# else
-  mReplotTime = replotTimer.nsecsElapsed()*1e-6;
-# endif
+  mReplotTime = replotElapsed(replotTimer);
   if (!qFuzzyIsNull(mReplotTimeAverage))
     mReplotTimeAverage = mReplotTimeAverage*0.9 + mReplotTime*0.1; // exponential moving average with a time constant of 10 last replots
   else
     mReplotTimeAverage = mReplotTime; // no previous replots to average with, so initialize with replot time
   
+  if (profiling)
+  {
+    mReplotProfile.clear();
+    mReplotProfile.insert(QLatin1String("replotTime"), mReplotTime);
+    mReplotProfile.insert(QLatin1String("layoutTime"), profileTimestamps.at(0));
+    mReplotProfile.insert(QLatin1String("bufferSetupTime"), profileTimestamps.at(1)-profileTimestamps.at(0));
+    mReplotProfile.insert(QLatin1String("drawTime"), profileTimestamps.at(2)-profileTimestamps.at(1));
+    mReplotProfile.insert(QLatin1String("refreshTime"), mReplotTime-profileTimestamps.at(2));
+    if (mProfileFlushTime >= 0)
+      mReplotProfile.insert(QLatin1String("flushTime"), mProfileFlushTime);
+    mReplotProfile.insert(QLatin1String("layers"), layerProfiles);
+  }
+  
   emit afterReplot();
+  if (profiling)
+    emit replotProfiled(mReplotProfile);
   mReplotting = false;
 }
 
+/*! \fn QVariantMap QCustomPlot::replotProfile() const
+  
+  Returns the measurements of the last \ref replot, if profiling is enabled with \ref
+  setProfiling. Otherwise, an empty map is returned. All durations are given in milliseconds.
+  
+  The map contains the following keys:
+  \li "replotTime": the duration of the whole replot, like \ref replotTime
+  \li "layoutTime": the layout update, i.e. the calculation of margins, axis rects, tick labels etc.
+  \li "bufferSetupTime": the preparation of the paint buffers (see \ref setupPaintBuffers),
+  including the detection of changed layers with \ref QCP::phTrackDirtyLayers
+  \li "drawTime": the drawing of all layers into the paint buffers
+  \li "refreshTime": the refresh of the widget (see \ref RefreshPriority). For replots with
+  immediate refresh, this includes painting the widget. Otherwise, the widget is painted later in
+  the event loop, and only scheduling the paint event is measured. Together with the three steps
+  above, this adds up to "replotTime".
+  \li "flushTime": the drawing of the paint buffers onto the widget in its paint event. For replots
+  with immediate refresh, this key is present when \ref replotProfiled is emitted. Otherwise, it is
+  added to the profile of the last replot once the widget is painted in the event loop.
+  \li "layers": a QVariantList with one QVariantMap per layer that was drawn, in rendering order.
+  It has the keys "name" (the layer name), "time" (including the start and end of painting on the
+  paint buffer) and "layerables", a QVariantList with one QVariantMap per visible layerable on the
+  layer, with the keys "name", "className" and "time". The name is the plottable name for
+  plottables (see \ref QCPAbstractPlottable::setName) and the object name otherwise.
+  
+  Layers whose paint buffer was reused because of the plotting hint \ref QCP::phTrackDirtyLayers
+  are missing in the list of layers, like in \ref redrawnLayers.
+  
+  From Python, the profile is a dict with lists of dicts.
+  
+  \see replotProfiled
+*/
+
+/*! \internal
+  
+  Returns the time in milliseconds since \a timer was started, used by \ref replot and \ref
+  paintEvent.
+*/
+# if QT_VERSION < QT_VERSION_CHECK(4, 8, 0)
+double QCustomPlot::replotElapsed(const QTime &timer)
+{
+  return timer.elapsed();
+}
+# else
+double QCustomPlot::replotElapsed(const QElapsedTimer &timer)
+{
+  return timer.nsecsElapsed()*1e-6;
+}
+# endif
+
 /*!
   Returns the time in milliseconds that the last replot took. If \a average is set to true, an
   exponential moving average over the last couple of replots is returned.
@@ -1950,6 +2149,15 @@ double QCustomPlot::replotTime(bool average) const
   return average ? mReplotTimeAverage : mReplotTime;
 }
 
+/*! \fn QStringList QCustomPlot::redrawnLayers() const
+  
+  Returns the names of the layers that were drawn into their paint buffers by the last \ref
+  replot, in rendering order. Without the plotting hint \ref QCP::phTrackDirtyLayers, these are
+  always all layers. With it, layers whose paint buffer could be reused are missing.
+  
+  \see replotTime
+*/
+
 /*!
   Rescales the axes such that all plottables (like graphs) in the plot are fully visible.
   
@@ -2240,6 +2448,13 @@ QSize QCustomPlot::sizeHint() const
 void QCustomPlot::paintEvent(QPaintEvent *event)
 {
   Q_UNUSED(event)
+# if QT_VERSION < QT_VERSION_CHECK(4, 8, 0)
+  QTime flushTimer;
+  flushTimer.start();
+# else
+  QElapsedTimer flushTimer;
+  flushTimer.start();
+# endif
   QCPPainter painter(this);
   if (painter.isActive())
   {
@@ -2252,6 +2467,15 @@ void QCustomPlot::paintEvent(QPaintEvent *event)
     foreach (QSharedPointer<QCPAbstractPaintBuffer> buffer, mPaintBuffers)
       buffer->draw(&painter);
   }
+  if (mProfiling)
+  {
+    // the paint buffers are drawn here, so this is where the flush of the last replot is measured:
+    const double flushTime = replotElapsed(flushTimer);
+    if (mReplotting) // immediate refresh, replot inserts the flush time into the profile it is assembling
+      mProfileFlushTime = flushTime;
+    else if (!mReplotProfile.isEmpty())
+      mReplotProfile.insert(QLatin1String("flushTime"), flushTime);
+  }
 }
 
 /*! \internal
@@ -2572,6 +2796,20 @@ void QCustomPlot::drawBackground(QCPPainter *painter)
   }
 }
 
+/*! \internal
+
+  Returns the delay in milliseconds after which a replot queued now with \ref rpQueuedReplot should
+  take place, to honor the frame rate limit of \ref setMaximumFrameRate. The frame interval is
+  backed off to twice the average replot time, if replots take longer than half the interval.
+*/
+int QCustomPlot::queuedReplotDelay() const
+{
+  if (mMaximumFrameRate <= 0 || !mFrameClock.isValid())
+    return 0;
+  const double frameInterval = qMax(1000.0/mMaximumFrameRate, 2.0*mReplotTimeAverage);
+  return qMax(0, qRound(frameInterval-double(mFrameClock.elapsed())));
+}
+
 /*! \internal
 
   Goes through the layers and makes sure this QCustomPlot instance holds the correct number of
@@ -2585,7 +2823,10 @@ void QCustomPlot::drawBackground(QCPPainter *painter)
   This method uses \ref createPaintBuffer to create new paint buffers.
 
   After this method, the paint buffers are empty (filled with \c Qt::transparent) and invalidated
-  (so an attempt to replot only a single buffered layer causes a full replot).
+  (so an attempt to replot only a single buffered layer causes a full replot). If the plotting hint
+  \ref QCP::phTrackDirtyLayers is set, this only happens for buffers which were already
+  invalidated, which were reallocated, or which hold a dirty layer (\ref QCPLayer::isDirty). The
+  other buffers keep their content, so \ref replot doesn't need to redraw their layers.
 
   This method is called in every \ref replot call, prior to actually drawing the layers (into their
   associated paint buffer). If the paint buffers don't need changing/reallocating, this method
@@ -2600,6 +2841,7 @@ void QCustomPlot::setupPaintBuffers()
   for (int layerIndex = 0; layerIndex < mLayers.size(); ++layerIndex)
   {
     QCPLayer *layer = mLayers.at(layerIndex);
+    QSharedPointer<QCPAbstractPaintBuffer> previousBuffer = layer->mPaintBuffer.toStrongRef();
     if (layer->mode() == QCPLayer::lmLogical)
     {
       layer->mPaintBuffer = mPaintBuffers.at(bufferIndex).toWeakRef();
@@ -2616,17 +2858,155 @@ void QCustomPlot::setupPaintBuffers()
           mPaintBuffers.append(QSharedPointer<QCPAbstractPaintBuffer>(createPaintBuffer()));
       }
     }
+    if (layer->mPaintBuffer.toStrongRef() != previousBuffer) // layer changed buffer, so both the old and the new buffer contents are outdated
+    {
+      layer->mDirty = true;
+      if (previousBuffer)
+        previousBuffer->setInvalidated();
+    }
   }
   // remove unneeded buffers:
   while (mPaintBuffers.size()-1 > bufferIndex)
     mPaintBuffers.removeLast();
-  // resize buffers to viewport size and clear contents:
+  const bool trackDirtyLayers = mPlottingHints.testFlag(QCP::phTrackDirtyLayers);
+  if (trackDirtyLayers)
+  {
+    foreach (QCPLayer *layer, mLayers)
+    {
+      QSharedPointer<QCPAbstractPaintBuffer> pb = layer->mPaintBuffer.toStrongRef();
+      if (layer->mDirty && pb)
+        pb->setInvalidated();
+    }
+  }
+  // resize buffers to viewport size and clear contents of the buffers that will be redrawn:
   foreach (QSharedPointer<QCPAbstractPaintBuffer> buffer, mPaintBuffers)
   {
-    buffer->setSize(viewport().size()); // won't do anything if already correct size
-    buffer->clear(Qt::transparent);
-    buffer->setInvalidated();
+    buffer->setSize(viewport().size()); // won't do anything if already correct size, otherwise invalidates buffer
+    if (!trackDirtyLayers || buffer->invalidated())
+    {
+      buffer->clear(Qt::transparent);
+      buffer->setInvalidated();
+    }
+  }
+}
+
+/*! \internal
+
+  Used by \ref replot if the plotting hint \ref QCP::phTrackDirtyLayers is set, to detect changes
+  which don't mark layers dirty by themselves.
+
+  The layout, axis ranges, ticks and global drawing settings affect almost every layerable, so if
+  the viewport, the outer or inner rect of any layout element, the range, range reversal, scale
+  type or offset of any axis, the tick and sub tick coordinates or tick labels of any axis (which
+  reflect ticker and number format changes), the antialiasing overrides or the plotting hints
+  differ from the previous replot, all layers are marked dirty. Further, color maps whose data was
+  modified via \ref QCPColorMapData mark their layer dirty, because the data instance doesn't know
+  its color map.
+  
+  Finally, dirtiness is propagated to layerables that display state of other layerables: legend
+  items of plottables on dirty layers (e.g. after \ref QCPAbstractPlottable::setName), tracers
+  following graphs on dirty layers, and items with positions anchored to items on dirty layers.
+*/
+void QCustomPlot::markChangedLayersDirty()
+{
+  QVector<double> state;
+  state << mViewport.x() << mViewport.y() << mViewport.width() << mViewport.height();
+  state << int(mAntialiasedElements) << int(mNotAntialiasedElements) << int(mPlottingHints);
+  foreach (QCPLayoutElement *element, mPlotLayout->elements(true))
+  {
+    if (element)
+    {
+      const QRect outerRect = element->outerRect();
+      const QRect rect = element->rect();
+      state << outerRect.x() << outerRect.y() << outerRect.width() << outerRect.height();
+      state << rect.x() << rect.y() << rect.width() << rect.height();
+    }
+  }
+  foreach (QCPAxisRect *axisRect, axisRects())
+  {
+    foreach (QCPAxis *axis, axisRect->axes())
+    {
+      state << axis->range().lower << axis->range().upper << axis->rangeReversed() << axis->scaleType() << axis->offset();
+      state << axis->mTickVector.size() << axis->mSubTickVector.size();
+      state << axis->mTickVector << axis->mSubTickVector;
+      uint labelHash = 0;
+      foreach (const QString &label, axis->mTickVectorLabels)
+        labelHash = labelHash*31 + qHash(label);
+      state << labelHash;
+    }
+  }
+  if (state != mDirtyTrackingState)
+  {
+    markAllLayersDirty();
+    mDirtyTrackingState = state;
+  }
+  
+  foreach (QCPAbstractPlottable *plottable, mPlottables)
+  {
+    if (QCPColorMap *colorMap = qobject_cast<QCPColorMap*>(plottable))
+    {
+      const QCPColorMapData *data = colorMap->data();
+      if (data->mDataModified || !data->mModifiedCells.isEmpty() || !data->mScrollOffset.isNull())
+        colorMap->markLayerDirty();
+    }
+  }
+  
+  // propagate dirtiness to layerables which display state of layerables on dirty layers:
+  foreach (QCPLayoutElement *element, mPlotLayout->elements(true))
+  {
+    QCPLayerable *source = nullptr;
+    if (QCPPlottableLegendItem *plottableItem = qobject_cast<QCPPlottableLegendItem*>(element))
+      source = plottableItem->plottable();
+    else if (QCPPolarLegendItem *polarItem = qobject_cast<QCPPolarLegendItem*>(element))
+      source = polarItem->polarGraph();
+    if (source && source->layer() && source->layer()->isDirty() && element->layer())
+      element->layer()->markDirty();
   }
+  bool propagated = true;
+  while (propagated) // repeat until stable, so chains of anchored items are handled regardless of their order
+  {
+    propagated = false;
+    QSet<QCPItemAnchor*> dirtyAnchors;
+    foreach (QCPAbstractItem *item, mItems)
+    {
+      if (item->layer() && item->layer()->isDirty())
+      {
+        foreach (QCPItemAnchor *anchor, item->anchors())
+          dirtyAnchors.insert(anchor);
+      }
+    }
+    foreach (QCPAbstractItem *item, mItems)
+    {
+      if (!item->layer() || item->layer()->isDirty())
+        continue;
+      bool dependsOnDirty = false;
+      if (QCPItemTracer *tracer = qobject_cast<QCPItemTracer*>(item))
+        dependsOnDirty = tracer->graph() && tracer->graph()->layer() && tracer->graph()->layer()->isDirty();
+      foreach (QCPItemPosition *position, item->positions())
+      {
+        if (dependsOnDirty)
+          break;
+        dependsOnDirty = dirtyAnchors.contains(position->parentAnchorX()) || dirtyAnchors.contains(position->parentAnchorY());
+      }
+      if (dependsOnDirty)
+      {
+        item->layer()->markDirty();
+        propagated = true;
+      }
+    }
+  }
+}
+
+/*! \internal
+
+  Marks all layers dirty, so the next \ref replot redraws every layer also if the plotting hint
+  \ref QCP::phTrackDirtyLayers is set. Used for changes which potentially affect many layerables,
+  like a selection change by the user.
+*/
+void QCustomPlot::markAllLayersDirty()
+{
+  foreach (QCPLayer *layer, mLayers)
+    layer->markDirty();
 }
 
 /*! \internal
@@ -2872,6 +3252,7 @@ void QCustomPlot::processRectSelection(QRect rect, QMouseEvent *event)
   
   if (selectionStateChanged)
   {
+    markAllLayersDirty();
     emit selectionChangedByUser();
     replot(rpQueuedReplot);
   } else if (mSelectionRect)
@@ -2949,6 +3330,7 @@ void QCustomPlot::processPointSelection(QMouseEvent *event)
   }
   if (selectionStateChanged)
   {
+    markAllLayersDirty();
     emit selectionChangedByUser();
     replot(rpQueuedReplot);
   }
@@ -3139,11 +3521,14 @@ QList<QCPLayerable*> QCustomPlot::layerableListAt(const QPointF &pos, bool onlyS
   which units \a resolution is given, by setting \a resolutionUnit. The \a resolution is converted
   to the format's expected resolution unit internally.
 
+  Since the plot is rendered via \ref toImage, this function doesn't require the GUI thread. See
+  \ref toImage for the conditions under which it may be called from other threads.
+
   \see saveBmp, saveJpg, savePng, savePdf
 */
 bool QCustomPlot::saveRastered(const QString &fileName, int width, int height, double scale, const char *format, int quality, int resolution, QCP::ResolutionUnit resolutionUnit)
 {
-  QImage buffer = toPixmap(width, height, scale).toImage();
+  QImage buffer = toImage(width, height, scale);
   
   int dotsPerMeter = 0;
   switch (resolutionUnit)
@@ -3212,6 +3597,85 @@ QPixmap QCustomPlot::toPixmap(int width, int height, double scale)
   return result;
 }
 
+/*!
+  Renders the plot to an image of the given \a format and returns it.
+  
+  The plot is sized to \a width and \a height in pixels and scaled with \a scale. (width 100 and
+  scale 2.0 lead to a full resolution image with width 200.) If \a width or \a height is zero, the
+  current widget size is used.
+  
+  Unlike \ref toPixmap, this function only paints on a QImage with Qt's raster engine, and neither
+  uses the widget's paint buffers nor shows or updates the widget. This makes it suitable for
+  headless rendering (e.g. with the "offscreen" platform plugin), and allows calling it from a
+  thread other than the GUI thread. That way, multiple plots can be rendered concurrently, e.g. for
+  generating reports. The following restrictions apply when doing so:
+  
+  \li The QCustomPlot itself, being a QWidget, must still be created in the GUI thread. It may then
+  be configured and rendered by a worker thread, as long as no other thread accesses it at the same
+  time. In particular, the plot must not be shown or replotted by the GUI thread while a worker
+  thread is rendering it, because this function temporarily changes the viewport.
+  \li Signals emitted during rendering (e.g. \ref afterLayout) are emitted from the calling thread.
+  \li Pixmaps (e.g. \ref setBackground, scatters with \ref QCPScatterStyle::ssPixmap, \ref
+  QCPItemPixmap) are only safe to draw outside the GUI thread if the platform supports threaded
+  pixmaps, which is the case for the raster based platform plugins.
+  
+  Like with any other export, the tick labels are drawn directly rather than from the label cache
+  (\ref QCP::phCacheLabels). The layout still looks up the sizes of cached labels, so the label
+  cache of the plot (\ref labelCache) is accessed by the calling thread. The cache is thread-safe,
+  so this also works while other plots that share the cache (\ref setLabelCache) are replotted or
+  exported by other threads.
+  
+  \see toPixmap, toPainter, saveRastered
+*/
+QImage QCustomPlot::toImage(int width, int height, double scale, QImage::Format format)
+{
+  // this method is similar to toPixmap. Change something here, and a change in toPixmap might be necessary, too.
+  int newWidth, newHeight;
+  if (width == 0 || height == 0)
+  {
+    newWidth = this->width();
+    newHeight = this->height();
+  } else
+  {
+    newWidth = width;
+    newHeight = height;
+  }
+  int scaledWidth = qRound(scale*newWidth);
+  int scaledHeight = qRound(scale*newHeight);
+  
+  QImage result(scaledWidth, scaledHeight, format);
+  if (result.isNull())
+  {
+    qDebug() << Q_FUNC_INFO << "Couldn't allocate image of size" << scaledWidth << "x" << scaledHeight;
+    return QImage();
+  }
+  result.fill(mBackgroundBrush.style() == Qt::SolidPattern ? mBackgroundBrush.color() : QColor(Qt::transparent)); // if using non-solid pattern, make transparent now and draw brush pattern later
+  QCPPainter painter;
+  painter.begin(&result);
+  if (painter.isActive())
+  {
+    QRect oldViewport = viewport();
+    setViewport(QRect(0, 0, newWidth, newHeight));
+    painter.setMode(QCPPainter::pmNoCaching);
+    if (!qFuzzyCompare(scale, 1.0))
+    {
+      if (scale > 1.0) // for scale < 1 we always want cosmetic pens where possible, because else lines might disappear for very small scales
+        painter.setMode(QCPPainter::pmNonCosmetic);
+      painter.scale(scale, scale);
+    }
+    if (mBackgroundBrush.style() != Qt::SolidPattern && mBackgroundBrush.style() != Qt::NoBrush) // solid fills were done a few lines above with QImage::fill
+      painter.fillRect(mViewport, mBackgroundBrush);
+    draw(&painter);
+    setViewport(oldViewport);
+    painter.end();
+  } else
+  {
+    qDebug() << Q_FUNC_INFO << "Couldn't activate painter on image";
+    return QImage();
+  }
+  return result;
+}
+
 /*!
   Renders the plot using the passed \a painter.
   
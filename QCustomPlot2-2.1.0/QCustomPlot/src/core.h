@@ -30,6 +30,7 @@
 #include "axis/range.h"
 #include "axis/axis.h"
 #include "paintbuffer.h"
+#include "labelcache.h"
 #include "plottable.h"
 
 class QCPPainter;
@@ -54,6 +55,7 @@ class QCP_LIB_DECL QCustomPlot : public QWidget
   Q_PROPERTY(bool noAntialiasingOnDrag READ noAntialiasingOnDrag WRITE setNoAntialiasingOnDrag)
   Q_PROPERTY(Qt::KeyboardModifier multiSelectModifier READ multiSelectModifier WRITE setMultiSelectModifier)
   Q_PROPERTY(bool openGl READ openGl WRITE setOpenGl)
+  Q_PROPERTY(double maximumFrameRate READ maximumFrameRate WRITE setMaximumFrameRate)
   /// \endcond
 public:
   /*!
@@ -74,7 +76,7 @@ public:
   enum RefreshPriority { rpImmediateRefresh ///< Replots immediately and repaints the widget immediately by calling QWidget::repaint() after the replot
                          ,rpQueuedRefresh   ///< Replots immediately, but queues the widget repaint, by calling QWidget::update() after the replot. This way multiple redundant widget repaints can be avoided.
                          ,rpRefreshHint     ///< Whether to use immediate or queued refresh depends on whether the plotting hint \ref QCP::phImmediateRefresh is set, see \ref setPlottingHints.
-                         ,rpQueuedReplot    ///< Queues the entire replot for the next event loop iteration. This way multiple redundant replots can be avoided. The actual replot is then done with \ref rpRefreshHint priority.
+                         ,rpQueuedReplot    ///< Queues the entire replot for the next event loop iteration. This way multiple redundant replots can be avoided. The actual replot is then done with \ref rpRefreshHint priority. If a maximum frame rate is set (\ref setMaximumFrameRate), the replot may be delayed further.
                        };
   Q_ENUMS(RefreshPriority)
   
@@ -99,6 +101,9 @@ public:
   QCP::SelectionRectMode selectionRectMode() const { return mSelectionRectMode; }
   QCPSelectionRect *selectionRect() const { return mSelectionRect; }
   bool openGl() const { return mOpenGl; }
+  double maximumFrameRate() const { return mMaximumFrameRate; }
+  bool profiling() const { return mProfiling; }
+  QSharedPointer<QCPLabelCache> labelCache() const { return mLabelCache; }
   
   // setters:
   void setViewport(const QRect &rect);
@@ -123,6 +128,9 @@ public:
   void setSelectionRectMode(QCP::SelectionRectMode mode);
   void setSelectionRect(QCPSelectionRect *selectionRect);
   void setOpenGl(bool enabled, int multisampling=16);
+  void setMaximumFrameRate(double framesPerSecond);
+  void setProfiling(bool enabled);
+  void setLabelCache(const QSharedPointer<QCPLabelCache> &labelCache);
   
   // non-property methods:
   // plottable interface:
@@ -190,9 +198,12 @@ public:
   bool saveBmp(const QString &fileName, int width=0, int height=0, double scale=1.0, int resolution=96, QCP::ResolutionUnit resolutionUnit=QCP::ruDotsPerInch);
   bool saveRastered(const QString &fileName, int width, int height, double scale, const char *format, int quality=-1, int resolution=96, QCP::ResolutionUnit resolutionUnit=QCP::ruDotsPerInch);
   QPixmap toPixmap(int width=0, int height=0, double scale=1.0);
+  QImage toImage(int width=0, int height=0, double scale=1.0, QImage::Format format=QImage::Format_ARGB32_Premultiplied);
   void toPainter(QCPPainter *painter, int width=0, int height=0);
   Q_SLOT void replot(QCustomPlot::RefreshPriority refreshPriority=QCustomPlot::rpRefreshHint);
   double replotTime(bool average=false) const;
+  QStringList redrawnLayers() const { return mRedrawnLayers; }
+  QVariantMap replotProfile() const { return mReplotProfile; }
   
   QCPAxis *xAxis, *yAxis, *xAxis2, *yAxis2;
   QCPLegend *legend;
@@ -217,6 +228,8 @@ signals:
   void beforeReplot();
   void afterLayout();
   void afterReplot();
+  void framesDropped(int count);
+  void replotProfiled(const QVariantMap &profile);
   
 protected:
   // property members:
@@ -243,6 +256,9 @@ protected:
   QCP::SelectionRectMode mSelectionRectMode;
   QCPSelectionRect *mSelectionRect;
   bool mOpenGl;
+  double mMaximumFrameRate;
+  bool mProfiling;
+  QSharedPointer<QCPLabelCache> mLabelCache;
   
   // non-property members:
   QList<QSharedPointer<QCPAbstractPaintBuffer> > mPaintBuffers;
@@ -255,6 +271,16 @@ protected:
   bool mReplotting;
   bool mReplotQueued;
   double mReplotTime, mReplotTimeAverage;
+  int mDroppedFrames;
+#if QT_VERSION < QT_VERSION_CHECK(4, 8, 0)
+  QTime mFrameClock;
+#else
+  QElapsedTimer mFrameClock;
+#endif
+  QStringList mRedrawnLayers;
+  QVariantMap mReplotProfile;
+  double mProfileFlushTime;
+  QVector<double> mDirtyTrackingState;
   int mOpenGlMultisamples;
   QCP::AntialiasedElements mOpenGlAntialiasedElementsBackup;
   bool mOpenGlCacheLabelsBackup;
@@ -292,7 +318,15 @@ protected:
   QCPLayerable *layerableAt(const QPointF &pos, bool onlySelectable, QVariant *selectionDetails=nullptr) const;
   QList<QCPLayerable*> layerableListAt(const QPointF &pos, bool onlySelectable, QList<QVariant> *selectionDetails=nullptr) const;
   void drawBackground(QCPPainter *painter);
+  int queuedReplotDelay() const;
+#if QT_VERSION < QT_VERSION_CHECK(4, 8, 0)
+  static double replotElapsed(const QTime &timer);
+#else
+  static double replotElapsed(const QElapsedTimer &timer);
+#endif
   void setupPaintBuffers();
+  void markChangedLayersDirty();
+  void markAllLayersDirty();
   QCPAbstractPaintBuffer *createPaintBuffer();
   bool hasInvalidatedPaintBuffers();
   bool setupOpenGl();
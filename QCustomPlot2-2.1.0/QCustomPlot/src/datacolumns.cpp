@@ -0,0 +1,417 @@
+/***************************************************************************
+**                                                                        **
+**  QCustomPlot, an easy to use, modern plotting widget for Qt            **
+**  Copyright (C) 2011-2021 Emanuel Eichhammer                            **
+**                                                                        **
+**  This program is free software: you can redistribute it and/or modify  **
+**  it under the terms of the GNU General Public License as published by  **
+**  the Free Software Foundation, either version 3 of the License, or     **
+**  (at your option) any later version.                                   **
+**                                                                        **
+**  This program is distributed in the hope that it will be useful,       **
+**  but WITHOUT ANY WARRANTY; without even the implied warranty of        **
+**  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         **
+**  GNU General Public License for more details.                          **
+**                                                                        **
+**  You should have received a copy of the GNU General Public License     **
+**  along with this program.  If not, see http://www.gnu.org/licenses/.   **
+**                                                                        **
+****************************************************************************
+**           Author: Emanuel Eichhammer                                   **
+**  Website/Contact: http://www.qcustomplot.com/                          **
+**             Date: 29.03.21                                             **
+**          Version: 2.1.0                                                **
+****************************************************************************/
+
+#include "datacolumns.h"
+
+////////////////////////////////////////////////////////////////////////////////////////////////////
+//////////////////// QCPDataColumns
+////////////////////////////////////////////////////////////////////////////////////////////////////
+
+/*! \class QCPDataColumns
+  \brief Holds key/value data of one-dimensional plottables in two separate columns
+
+  In contrast to \ref QCPDataContainer, which stores complete data points (e.g. \ref QCPGraphData)
+  one after another, this class stores all keys in one contiguous array of doubles and all values
+  in another one (a so-called structure of arrays). Like \ref QCPDataContainer, the data is always
+  kept sorted by key.
+
+  This layout is convenient whenever large amounts of data are scanned or exchanged as a whole:
+  \ref keyRange and \ref valueRange only touch the column they need and operate on plain double
+  arrays, and the columns can be handed to and from other array-based code (e.g. NumPy in the
+  Python bindings) via \ref keyData and \ref valueData without building one object per data point.
+
+  The plottables \ref QCPGraph, \ref QCPBars and \ref QCPPolarGraph accept a QCPDataColumns
+  instance in their \a setData overloads. The plottables draw from their \ref QCPDataContainer,
+  since their line and scatter optimization, selection, level of detail index and spatial index
+  are built on its per-point layout. So \a setData converts the columns into the data container,
+  in a single pass without sorting (the columns are already sorted). The plottable doesn't refer
+  to the columns afterwards, so they may be modified or discarded:
+  
+  \code
+  QCPDataColumns columns(keys, values);
+  bool foundRange;
+  QCPRange valueRange = columns.valueRange(foundRange);
+  graph->setData(columns);
+  \endcode
+*/
+
+/* start documentation of inline functions */
+
+/*! \fn int QCPDataColumns::size() const
+  
+  Returns the number of data points in the columns.
+*/
+
+/*! \fn bool QCPDataColumns::isEmpty() const
+  
+  Returns whether the columns hold no data points.
+*/
+
+/*! \fn QVector<double> QCPDataColumns::keys() const
+  
+  Returns the key column. Since QVector is implicitly shared, this doesn't copy the data. The
+  returned vector stays valid when the columns are modified or destroyed afterwards, because the
+  columns then detach from the shared data. The Python bindings use this to provide NumPy views
+  on the columns without copying.
+*/
+
+/*! \fn QVector<double> QCPDataColumns::values() const
+  
+  Returns the value column. Since QVector is implicitly shared, this doesn't copy the data. Like
+  with \ref keys, the returned vector stays valid when the columns are modified or destroyed
+  afterwards.
+*/
+
+/*! \fn const double *QCPDataColumns::keyData() const
+  
+  Returns a pointer to the first element of the key column, which holds \ref size elements. The
+  pointer stays valid until the columns are modified or destroyed.
+*/
+
+/*! \fn const double *QCPDataColumns::valueData() const
+  
+  Returns a pointer to the first element of the value column, which holds \ref size elements. The
+  pointer stays valid until the columns are modified or destroyed.
+*/
+
+/* end documentation of inline functions */
+
+/*!
+  Constructs empty data columns.
+*/
+QCPDataColumns::QCPDataColumns()
+{
+}
+
+/*!
+  Constructs data columns holding the provided \a keys and \a values, see \ref set.
+*/
+QCPDataColumns::QCPDataColumns(const QVector<double> &keys, const QVector<double> &values, bool alreadySorted)
+{
+  set(keys, values, alreadySorted);
+}
+
+/*! \overload
+  
+  Constructs data columns holding \a count keys and values copied from the arrays \a keys and \a
+  values, see \ref set.
+*/
+QCPDataColumns::QCPDataColumns(const double *keys, const double *values, int count, bool alreadySorted)
+{
+  set(keys, values, count, alreadySorted);
+}
+
+/*!
+  Replaces the current data with the provided \a keys and \a values. The provided vectors should
+  have equal length. Else, the number of data points will be the size of the smallest vector.
+  
+  If you can guarantee that the passed data points are sorted by \a keys in ascending order, you
+  can set \a alreadySorted to true, to improve performance by saving a sorting run.
+  
+  If both vectors have the same size, they are shared with the passed vectors instead of copied.
+*/
+void QCPDataColumns::set(const QVector<double> &keys, const QVector<double> &values, bool alreadySorted)
+{
+  if (keys.size() != values.size())
+  {
+    qDebug() << Q_FUNC_INFO << "keys and values have different sizes:" << keys.size() << values.size();
+    set(keys.constData(), values.constData(), qMin(keys.size(), values.size()), alreadySorted);
+    return;
+  }
+  mKeys = keys;
+  mValues = values;
+  if (!alreadySorted)
+    sort();
+}
+
+/*! \overload
+  
+  Replaces the current data with \a count keys and values copied from the arrays \a keys and \a
+  values.
+*/
+void QCPDataColumns::set(const double *keys, const double *values, int count, bool alreadySorted)
+{
+  clear();
+  add(keys, values, count, alreadySorted);
+}
+
+/*!
+  Adds \a count keys and values copied from the arrays \a keys and \a values to the current data.
+  
+  If you can guarantee that the passed data points are sorted by \a keys in ascending order, you
+  can set \a alreadySorted to true, to improve performance by saving a sorting run.
+  
+  Appending data with keys that are larger than the existing ones is the fastest case. Otherwise
+  the new data is merged into the existing columns in linear time.
+*/
+void QCPDataColumns::add(const double *keys, const double *values, int count, bool alreadySorted)
+{
+  if (count <= 0 || !keys || !values)
+    return;
+  if (!alreadySorted)
+    alreadySorted = std::is_sorted(keys, keys+count);
+  
+  const int oldSize = mKeys.size();
+  if (!alreadySorted)
+  {
+    mKeys.resize(oldSize+count);
+    mValues.resize(oldSize+count);
+    std::copy(keys, keys+count, mKeys.data()+oldSize);
+    std::copy(values, values+count, mValues.data()+oldSize);
+    sort();
+  } else if (oldSize == 0 || keys[0] >= mKeys.last()) // new data is appended, keeps columns sorted
+  {
+    mKeys.resize(oldSize+count);
+    mValues.resize(oldSize+count);
+    std::copy(keys, keys+count, mKeys.data()+oldSize);
+    std::copy(values, values+count, mValues.data()+oldSize);
+  } else // both old and new data are sorted, merge them
+  {
+    QVector<double> mergedKeys(oldSize+count);
+    QVector<double> mergedValues(oldSize+count);
+    const double *oldKeys = mKeys.constData();
+    const double *oldValues = mValues.constData();
+    double *outKeys = mergedKeys.data();
+    double *outValues = mergedValues.data();
+    int i = 0, j = 0, k = 0;
+    while (i < oldSize && j < count)
+    {
+      if (keys[j] < oldKeys[i]) // existing points stay in front of new points with equal key
+      {
+        outKeys[k] = keys[j];
+        outValues[k] = values[j];
+        ++j;
+      } else
+      {
+        outKeys[k] = oldKeys[i];
+        outValues[k] = oldValues[i];
+        ++i;
+      }
+      ++k;
+    }
+    for (; i < oldSize; ++i, ++k)
+    {
+      outKeys[k] = oldKeys[i];
+      outValues[k] = oldValues[i];
+    }
+    for (; j < count; ++j, ++k)
+    {
+      outKeys[k] = keys[j];
+      outValues[k] = values[j];
+    }
+    mKeys = mergedKeys;
+    mValues = mergedValues;
+  }
+}
+
+/*! \overload
+  
+  Adds a single data point with \a key and \a value to the current data.
+*/
+void QCPDataColumns::add(double key, double value)
+{
+  add(&key, &value, 1, true);
+}
+
+/*!
+  Removes all data points.
+*/
+void QCPDataColumns::clear()
+{
+  mKeys.clear();
+  mValues.clear();
+}
+
+/*!
+  Re-sorts all data points by key. Data points with equal keys keep their relative order.
+  
+  Usually this doesn't need to be called, since all methods that add data keep the columns sorted.
+*/
+void QCPDataColumns::sort()
+{
+  const int n = mKeys.size();
+  const double *keys = mKeys.constData();
+  if (std::is_sorted(keys, keys+n))
+    return;
+  
+  struct IndexLessThanKey
+  {
+    explicit IndexLessThanKey(const double *keys) : mKeys(keys) {}
+    bool operator()(int a, int b) const { return mKeys[a] < mKeys[b]; }
+    const double *mKeys;
+  };
+  QVector<int> permutation(n);
+  for (int i=0; i<n; ++i)
+    permutation[i] = i;
+  std::stable_sort(permutation.begin(), permutation.end(), IndexLessThanKey(keys));
+  
+  QVector<double> sortedKeys(n);
+  QVector<double> sortedValues(n);
+  const double *values = mValues.constData();
+  for (int i=0; i<n; ++i)
+  {
+    sortedKeys[i] = keys[permutation.at(i)];
+    sortedValues[i] = values[permutation.at(i)];
+  }
+  mKeys = sortedKeys;
+  mValues = sortedValues;
+}
+
+/*!
+  Returns the index of the data point with a key that is equal to, just below, or just above \a
+  key. If \a expandedRange is true, the data point just below \a key will be considered, otherwise
+  the one just above.
+  
+  If the columns are empty, \ref size (i.e. zero) is returned.
+  
+  This is the index based equivalent of \ref QCPDataContainer::findBegin.
+  
+  \see findEnd
+*/
+int QCPDataColumns::findBegin(double key, bool expandedRange) const
+{
+  if (isEmpty())
+    return size();
+  
+  int index = int(std::lower_bound(mKeys.constBegin(), mKeys.constEnd(), key)-mKeys.constBegin());
+  if (expandedRange && index > 0)
+    --index;
+  return index;
+}
+
+/*!
+  Returns the index after the data point with a key that is equal to, just above or just below \a
+  key. If \a expandedRange is true, the data point just above \a key will be considered, otherwise
+  the one just below.
+  
+  If the columns are empty, \ref size (i.e. zero) is returned.
+  
+  This is the index based equivalent of \ref QCPDataContainer::findEnd.
+  
+  \see findBegin
+*/
+int QCPDataColumns::findEnd(double key, bool expandedRange) const
+{
+  if (isEmpty())
+    return size();
+  
+  int index = int(std::upper_bound(mKeys.constBegin(), mKeys.constEnd(), key)-mKeys.constBegin());
+  if (expandedRange && index < size())
+    ++index;
+  return index;
+}
+
+/*!
+  Returns the range encompassed by the keys of all data points with a non-NaN value. The output
+  parameter \a foundRange indicates whether a sensible range was found.
+  
+  Use \a signDomain to control which sign of the keys should be considered. Since the keys are
+  sorted, the sign domain boundary is found by binary search and only the first and last points
+  with a non-NaN value need to be determined, which is usually very quick.
+  
+  \see valueRange, QCPDataContainer::keyRange
+*/
+QCPRange QCPDataColumns::keyRange(bool &foundRange, QCP::SignDomain signDomain) const
+{
+  const double *keys = mKeys.constData();
+  const double *values = mValues.constData();
+  int begin = 0;
+  int end = size();
+  if (signDomain == QCP::sdNegative)
+    end = int(std::lower_bound(keys, keys+end, 0.0)-keys);
+  else if (signDomain == QCP::sdPositive)
+    begin = int(std::upper_bound(keys, keys+end, 0.0)-keys);
+  
+  while (begin < end && qIsNaN(values[begin]))
+    ++begin;
+  while (end > begin && qIsNaN(values[end-1]))
+    --end;
+  
+  foundRange = begin < end;
+  if (!foundRange)
+    return QCPRange();
+  return QCPRange(keys[begin], keys[end-1]);
+}
+
+/*!
+  Returns the range encompassed by the values of the data points in the specified key range (\a
+  inKeyRange). NaN values are ignored. The output parameter \a foundRange indicates whether a
+  sensible range was found.
+
+  If \a inKeyRange has both lower and upper bound set to zero (is equal to <tt>QCPRange()</tt>),
+  all data points are considered, without any restriction on the keys.
+
+  Use \a signDomain to control which sign of the values should be considered.
+  
+  The scan only reads the value column and consists of simple minimum/maximum operations on a
+  contiguous array, which the compiler can vectorize.
+  
+  \see keyRange, QCPDataContainer::valueRange
+*/
+QCPRange QCPDataColumns::valueRange(bool &foundRange, QCP::SignDomain signDomain, const QCPRange &inKeyRange) const
+{
+  int begin = 0;
+  int end = size();
+  if (inKeyRange != QCPRange())
+  {
+    begin = findBegin(inKeyRange.lower, false);
+    end = findEnd(inKeyRange.upper, false);
+  }
+  
+  // comparisons with NaN are always false, so NaN values don't modify lower and upper:
+  const double *values = mValues.constData();
+  double lower = std::numeric_limits<double>::infinity();
+  double upper = -std::numeric_limits<double>::infinity();
+  if (signDomain == QCP::sdBoth)
+  {
+    for (int i=begin; i<end; ++i)
+    {
+      const double v = values[i];
+      lower = v < lower ? v : lower;
+      upper = v > upper ? v : upper;
+    }
+  } else if (signDomain == QCP::sdNegative)
+  {
+    for (int i=begin; i<end; ++i)
+    {
+      const double v = values[i];
+      lower = v < lower && v < 0 ? v : lower;
+      upper = v > upper && v < 0 ? v : upper;
+    }
+  } else if (signDomain == QCP::sdPositive)
+  {
+    for (int i=begin; i<end; ++i)
+    {
+      const double v = values[i];
+      lower = v < lower && v > 0 ? v : lower;
+      upper = v > upper && v > 0 ? v : upper;
+    }
+  }
+  
+  foundRange = lower <= upper;
+  if (!foundRange)
+    return QCPRange();
+  return QCPRange(lower, upper);
+}
@@ -0,0 +1,89 @@
+/***************************************************************************
+**                                                                        **
+**  QCustomPlot, an easy to use, modern plotting widget for Qt            **
+**  Copyright (C) 2011-2021 Emanuel Eichhammer                            **
+**                                                                        **
+**  This program is free software: you can redistribute it and/or modify  **
+**  it under the terms of the GNU General Public License as published by  **
+**  the Free Software Foundation, either version 3 of the License, or     **
+**  (at your option) any later version.                                   **
+**                                                                        **
+**  This program is distributed in the hope that it will be useful,       **
+**  but WITHOUT ANY WARRANTY; without even the implied warranty of        **
+**  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         **
+**  GNU General Public License for more details.                          **
+**                                                                        **
+**  You should have received a copy of the GNU General Public License     **
+**  along with this program.  If not, see http://www.gnu.org/licenses/.   **
+**                                                                        **
+****************************************************************************
+**           Author: Emanuel Eichhammer                                   **
+**  Website/Contact: http://www.qcustomplot.com/                          **
+**             Date: 29.03.21                                             **
+**          Version: 2.1.0                                                **
+****************************************************************************/
+/*! \file */
+#ifndef QCP_DATACOLUMNS_H
+#define QCP_DATACOLUMNS_H
+
+#include "global.h"
+#include "axis/range.h"
+
+class QCP_LIB_DECL QCPDataColumns
+{
+public:
+  QCPDataColumns();
+  QCPDataColumns(const QVector<double> &keys, const QVector<double> &values, bool alreadySorted=false);
+  QCPDataColumns(const double *keys, const double *values, int count, bool alreadySorted=false);
+  
+  // getters:
+  int size() const { return mKeys.size(); }
+  bool isEmpty() const { return mKeys.isEmpty(); }
+  QVector<double> keys() const { return mKeys; }
+  QVector<double> values() const { return mValues; }
+  const double *keyData() const { return mKeys.constData(); }
+  const double *valueData() const { return mValues.constData(); }
+  
+  // non-virtual methods:
+  void set(const QVector<double> &keys, const QVector<double> &values, bool alreadySorted=false);
+  void set(const double *keys, const double *values, int count, bool alreadySorted=false);
+  void add(const double *keys, const double *values, int count, bool alreadySorted=false);
+  void add(double key, double value);
+  void clear();
+  void sort();
+  int findBegin(double key, bool expandedRange=true) const;
+  int findEnd(double key, bool expandedRange=true) const;
+  QCPRange keyRange(bool &foundRange, QCP::SignDomain signDomain=QCP::sdBoth) const;
+  QCPRange valueRange(bool &foundRange, QCP::SignDomain signDomain=QCP::sdBoth, const QCPRange &inKeyRange=QCPRange()) const;
+  template <class DataType> QVector<DataType> toDataVector() const;
+  
+protected:
+  // non-property members:
+  QVector<double> mKeys;
+  QVector<double> mValues;
+};
+Q_DECLARE_TYPEINFO(QCPDataColumns, Q_MOVABLE_TYPE);
+
+/*! \fn QVector<DataType> QCPDataColumns::toDataVector() const
+  
+  Returns the columns as a vector of \a DataType points, each initialized with the
+  <tt>DataType(key, value)</tt> constructor. Since the columns are always sorted by key, the
+  result can be passed to \ref QCPDataContainer::set with \a alreadySorted set to true.
+  
+  This is used by the plottables' <tt>setData(const QCPDataColumns &)</tt> overloads, e.g. \ref
+  QCPGraph::setData(const QCPDataColumns &columns).
+*/
+template <class DataType>
+QVector<DataType> QCPDataColumns::toDataVector() const
+{
+  const int n = mKeys.size();
+  QVector<DataType> result(n);
+  const double *keys = mKeys.constData();
+  const double *values = mValues.constData();
+  DataType *it = result.data();
+  for (int i=0; i<n; ++i)
+    it[i] = DataType(keys[i], values[i]);
+  return result;
+}
+
+#endif // QCP_DATACOLUMNS_H
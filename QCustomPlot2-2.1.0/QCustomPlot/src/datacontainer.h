@@ -51,9 +51,13 @@ public:
   int size() const { return mData.size()-mPreallocSize; }
   bool isEmpty() const { return size() == 0; }
   bool autoSqueeze() const { return mAutoSqueeze; }
+  int streamingCapacity() const { return mStreamingCapacity; }
+  bool levelOfDetailIndex() const { return mLevelOfDetailIndex; }
   
   // setters:
   void setAutoSqueeze(bool enabled);
+  void setStreamingCapacity(int capacity);
+  void setLevelOfDetailIndex(bool enabled);
   
   // non-virtual methods:
   void set(const QCPDataContainer<DataType> &data);
@@ -80,19 +84,29 @@ public:
   QCPRange valueRange(bool &foundRange, QCP::SignDomain signDomain=QCP::sdBoth, const QCPRange &inKeyRange=QCPRange());
   QCPDataRange dataRange() const { return QCPDataRange(0, size()); }
   void limitIteratorsToDataRange(const_iterator &begin, const_iterator &end, const QCPDataRange &dataRange) const;
+  QCPRange valueSpan(bool &foundRange, const_iterator begin, const_iterator end) const;
+  void invalidateLevelOfDetailIndex() { invalidateLevelOfDetail(0); }
   
 protected:
   // property members:
   bool mAutoSqueeze;
+  int mStreamingCapacity;
+  bool mLevelOfDetailIndex;
   
   // non-property memebers:
   QVector<DataType> mData;
   int mPreallocSize;
   int mPreallocIteration;
+  mutable QVector<QVector<QCPRange> > mLevelOfDetailLevels;
+  mutable int mLevelOfDetailValidSize;
   
   // non-virtual methods:
   void preallocateGrow(int minimumPreallocSize);
   void performAutoSqueeze();
+  void enforceStreamingCapacity();
+  void invalidateLevelOfDetail(int physicalIndex) { if (physicalIndex < mLevelOfDetailValidSize) mLevelOfDetailValidSize = physicalIndex; }
+  void updateLevelOfDetail() const;
+  static int levelOfDetailBlockSize() { return 32; }
 };
 
 
@@ -135,6 +149,22 @@ protected:
   done by subclassing from \ref QCPAbstractPlottable1D "QCPAbstractPlottable1D<T>", which
   introduces an according \a mDataContainer member and some convenience methods.
 
+  \section qcpdatacontainer-streaming Streaming mode
+
+  For live data which is continuously appended while the oldest data points are discarded, the
+  container can be limited to a fixed number of data points with \ref setStreamingCapacity. Adding
+  a data point beyond the capacity then evicts the data point with the smallest key in constant
+  time, without the need to call \ref removeBefore. The data stays contiguous and sorted, so
+  lookups via \ref findBegin and \ref findEnd, as well as the iterators, work as usual.
+
+  \section qcpdatacontainer-lod Level of detail index
+
+  Plottables that reduce many data points to a few pixels (e.g. \ref QCPGraph with adaptive
+  sampling) need the value span of consecutive data point ranges, see \ref valueSpan. For very
+  large data sets, \ref setLevelOfDetailIndex enables a precomputed min/max pyramid, with which
+  the value span of any range is found in logarithmic time instead of by scanning all points. The
+  index is updated incrementally, e.g. appending data only recomputes the last few index entries.
+
   \section qcpdatacontainer-datatype Requirements for the DataType template parameter
 
   The template parameter <tt>DataType</tt> is the type of the stored data points. It must be
@@ -181,6 +211,31 @@ protected:
   Returns whether this container holds no data points.
 */
 
+/*! \fn bool QCPDataContainer<DataType>::levelOfDetailIndex() const
+  
+  Returns whether the min/max pyramid used by \ref valueSpan is maintained.
+  
+  \see setLevelOfDetailIndex
+*/
+
+/*! \fn void QCPDataContainer<DataType>::invalidateLevelOfDetailIndex()
+  
+  Marks the whole level of detail index as outdated, so it is rebuilt on the next call of \ref
+  valueSpan.
+  
+  All methods of this container which modify the data keep the index up to date automatically.
+  Only if you modify the values of data points in-place via the non-const iterators (\ref begin,
+  \ref end) while \ref setLevelOfDetailIndex is enabled, you must call this method afterwards.
+*/
+
+/*! \fn int QCPDataContainer<DataType>::streamingCapacity() const
+  
+  Returns the maximum number of data points kept by this container, or zero if the streaming mode
+  is disabled.
+  
+  \see setStreamingCapacity
+*/
+
 /*! \fn QCPDataContainer::const_iterator QCPDataContainer<DataType>::constBegin() const
   
   Returns a const iterator to the first data point in this container.
@@ -234,8 +289,11 @@ protected:
 template <class DataType>
 QCPDataContainer<DataType>::QCPDataContainer() :
   mAutoSqueeze(true),
+  mStreamingCapacity(0),
+  mLevelOfDetailIndex(false),
   mPreallocSize(0),
-  mPreallocIteration(0)
+  mPreallocIteration(0),
+  mLevelOfDetailValidSize(0)
 {
 }
 
@@ -258,6 +316,65 @@ void QCPDataContainer<DataType>::setAutoSqueeze(bool enabled)
   }
 }
 
+/*!
+  Enables the streaming mode, in which the container holds at most \a capacity data points. Set \a
+  capacity to zero to disable the streaming mode, which is the default.
+  
+  Whenever data is added such that the container would exceed its capacity, the data points with
+  the smallest (sort-)keys are removed. For the typical live data case, where data points are
+  appended at the end, this replaces the manual \ref removeBefore call after every \ref add. Both
+  appending a single data point and evicting the oldest one are constant time operations.
+  
+  Internally, the container reserves memory for twice the capacity. Evicted data points are moved
+  to the preallocation pool like with \ref removeBefore, and once the pool reaches the capacity,
+  the remaining data points are moved back to the start of the memory block in a single pass. The
+  data thus stays contiguous (and the iterators remain plain pointers), while the amortized cost
+  per data point is constant and no reallocations occur. Automatic squeezing (\ref setAutoSqueeze)
+  is suspended while the streaming mode is enabled.
+  
+  If the container currently holds more than \a capacity data points, the ones with the smallest
+  (sort-)keys are removed immediately.
+*/
+template <class DataType>
+void QCPDataContainer<DataType>::setStreamingCapacity(int capacity)
+{
+  capacity = qMax(0, capacity);
+  if (mStreamingCapacity != capacity)
+  {
+    mStreamingCapacity = capacity;
+    if (mStreamingCapacity > 0)
+    {
+      squeeze(true, false);
+      mData.reserve(2*mStreamingCapacity);
+      enforceStreamingCapacity();
+    } else if (mAutoSqueeze)
+      performAutoSqueeze();
+  }
+}
+
+/*!
+  Sets whether this container maintains a level of detail index, a min/max pyramid over the value
+  ranges of its data points, which allows \ref valueSpan to find the value span of arbitrarily
+  large data point ranges in logarithmic time.
+  
+  The index is built lazily on the first query and afterwards only the parts that were affected by
+  data changes are recomputed. It requires about one sixteenth of the memory of the data points
+  themselves (for \ref QCPGraphData). When disabled (the default), the index is released and \ref
+  valueSpan scans the data points.
+  
+  \see QCPGraph::setLevelOfDetailIndex
+*/
+template <class DataType>
+void QCPDataContainer<DataType>::setLevelOfDetailIndex(bool enabled)
+{
+  if (mLevelOfDetailIndex != enabled)
+  {
+    mLevelOfDetailIndex = enabled;
+    mLevelOfDetailLevels.clear();
+    mLevelOfDetailValidSize = 0;
+  }
+}
+
 /*! \overload
   
   Replaces the current data in this container with the provided \a data.
@@ -286,8 +403,10 @@ void QCPDataContainer<DataType>::set(const QVector<DataType> &data, bool already
   mData = data;
   mPreallocSize = 0;
   mPreallocIteration = 0;
+  invalidateLevelOfDetail(0);
   if (!alreadySorted)
     sort();
+  enforceStreamingCapacity();
 }
 
 /*! \overload
@@ -311,13 +430,19 @@ void QCPDataContainer<DataType>::add(const QCPDataContainer<DataType> &data)
       preallocateGrow(n);
     mPreallocSize -= n;
     std::copy(data.constBegin(), data.constEnd(), begin());
+    invalidateLevelOfDetail(mPreallocSize);
   } else // don't need to prepend, so append and merge if necessary
   {
+    invalidateLevelOfDetail(mData.size());
     mData.resize(mData.size()+n);
     std::copy(data.constBegin(), data.constEnd(), end()-n);
     if (oldSize > 0 && !qcpLessThanSortKey<DataType>(*(constEnd()-n-1), *(constEnd()-n))) // if appended range keys aren't all greater than existing ones, merge the two partitions
+    {
       std::inplace_merge(begin(), end()-n, end(), qcpLessThanSortKey<DataType>);
+      invalidateLevelOfDetail(mPreallocSize);
+    }
   }
+  enforceStreamingCapacity();
 }
 
 /*!
@@ -348,15 +473,21 @@ void QCPDataContainer<DataType>::add(const QVector<DataType> &data, bool already
       preallocateGrow(n);
     mPreallocSize -= n;
     std::copy(data.constBegin(), data.constEnd(), begin());
+    invalidateLevelOfDetail(mPreallocSize);
   } else // don't need to prepend, so append and then sort and merge if necessary
   {
+    invalidateLevelOfDetail(mData.size());
     mData.resize(mData.size()+n);
     std::copy(data.constBegin(), data.constEnd(), end()-n);
     if (!alreadySorted) // sort appended subrange if it wasn't already sorted
       std::sort(end()-n, end(), qcpLessThanSortKey<DataType>);
     if (oldSize > 0 && !qcpLessThanSortKey<DataType>(*(constEnd()-n-1), *(constEnd()-n))) // if appended range keys aren't all greater than existing ones, merge the two partitions
+    {
       std::inplace_merge(begin(), end()-n, end(), qcpLessThanSortKey<DataType>);
+      invalidateLevelOfDetail(mPreallocSize);
+    }
   }
+  enforceStreamingCapacity();
 }
 
 /*! \overload
@@ -370,6 +501,7 @@ void QCPDataContainer<DataType>::add(const DataType &data)
 {
   if (isEmpty() || !qcpLessThanSortKey<DataType>(data, *(constEnd()-1))) // quickly handle appends if new data key is greater or equal to existing ones
   {
+    invalidateLevelOfDetail(mData.size());
     mData.append(data);
   } else if (qcpLessThanSortKey<DataType>(data, *constBegin()))  // quickly handle prepends using preallocated space
   {
@@ -377,11 +509,14 @@ void QCPDataContainer<DataType>::add(const DataType &data)
       preallocateGrow(1);
     --mPreallocSize;
     *begin() = data;
+    invalidateLevelOfDetail(mPreallocSize);
   } else // handle inserts, maintaining sorted keys
   {
     QCPDataContainer<DataType>::iterator insertionPoint = std::lower_bound(begin(), end(), data, qcpLessThanSortKey<DataType>);
+    invalidateLevelOfDetail(int(insertionPoint-mData.begin()));
     mData.insert(insertionPoint, data);
   }
+  enforceStreamingCapacity();
 }
 
 /*!
@@ -395,7 +530,9 @@ void QCPDataContainer<DataType>::removeBefore(double sortKey)
   QCPDataContainer<DataType>::iterator it = begin();
   QCPDataContainer<DataType>::iterator itEnd = std::lower_bound(begin(), end(), DataType::fromSortKey(sortKey), qcpLessThanSortKey<DataType>);
   mPreallocSize += int(itEnd-it); // don't actually delete, just add it to the preallocated block (if it gets too large, squeeze will take care of it)
-  if (mAutoSqueeze)
+  if (mStreamingCapacity > 0)
+    enforceStreamingCapacity();
+  else if (mAutoSqueeze)
     performAutoSqueeze();
 }
 
@@ -409,6 +546,7 @@ void QCPDataContainer<DataType>::removeAfter(double sortKey)
 {
   QCPDataContainer<DataType>::iterator it = std::upper_bound(begin(), end(), DataType::fromSortKey(sortKey), qcpLessThanSortKey<DataType>);
   QCPDataContainer<DataType>::iterator itEnd = end();
+  invalidateLevelOfDetail(int(it-mData.begin()));
   mData.erase(it, itEnd); // typically adds it to the postallocated block
   if (mAutoSqueeze)
     performAutoSqueeze();
@@ -429,6 +567,7 @@ void QCPDataContainer<DataType>::remove(double sortKeyFrom, double sortKeyTo)
   
   QCPDataContainer<DataType>::iterator it = std::lower_bound(begin(), end(), DataType::fromSortKey(sortKeyFrom), qcpLessThanSortKey<DataType>);
   QCPDataContainer<DataType>::iterator itEnd = std::upper_bound(it, end(), DataType::fromSortKey(sortKeyTo), qcpLessThanSortKey<DataType>);
+  invalidateLevelOfDetail(int(it-mData.begin()));
   mData.erase(it, itEnd);
   if (mAutoSqueeze)
     performAutoSqueeze();
@@ -452,7 +591,10 @@ void QCPDataContainer<DataType>::remove(double sortKey)
     if (it == begin())
       ++mPreallocSize; // don't actually delete, just add it to the preallocated block (if it gets too large, squeeze will take care of it)
     else
+    {
+      invalidateLevelOfDetail(int(it-mData.begin()));
       mData.erase(it);
+    }
   }
   if (mAutoSqueeze)
     performAutoSqueeze();
@@ -469,6 +611,8 @@ void QCPDataContainer<DataType>::clear()
   mData.clear();
   mPreallocIteration = 0;
   mPreallocSize = 0;
+  mLevelOfDetailLevels.clear();
+  mLevelOfDetailValidSize = 0;
 }
 
 /*!
@@ -486,6 +630,7 @@ template <class DataType>
 void QCPDataContainer<DataType>::sort()
 {
   std::sort(begin(), end(), qcpLessThanSortKey<DataType>);
+  invalidateLevelOfDetail(mPreallocSize);
 }
 
 /*!
@@ -508,6 +653,7 @@ void QCPDataContainer<DataType>::squeeze(bool preAllocation, bool postAllocation
       std::copy(begin(), end(), mData.begin());
       mData.resize(size());
       mPreallocSize = 0;
+      invalidateLevelOfDetail(0);
     }
     mPreallocIteration = 0;
   }
@@ -804,6 +950,81 @@ void QCPDataContainer<DataType>::limitIteratorsToDataRange(const_iterator &begin
   end = constBegin()+iteratorRange.end();
 }
 
+/*!
+  Returns the range spanned by the value ranges (\a DataType::valueRange) of the data points from
+  \a begin up to, but not including, \a end. NaN values are ignored. The output parameter \a
+  foundRange indicates whether a sensible range was found.
+  
+  If the level of detail index is enabled (\ref setLevelOfDetailIndex), the span is composed of
+  the precomputed spans of blocks of data points, so only the few points at the boundaries of the
+  range need to be visited and the cost grows logarithmically with the size of the range.
+  Otherwise all data points in the range are scanned.
+  
+  This is used e.g. by \ref QCPGraph to determine the value span of all data points that fall
+  into the same pixel.
+*/
+template <class DataType>
+QCPRange QCPDataContainer<DataType>::valueSpan(bool &foundRange, const_iterator begin, const_iterator end) const
+{
+  double lower = std::numeric_limits<double>::infinity();
+  double upper = -std::numeric_limits<double>::infinity();
+  int first = int(begin-mData.constBegin());
+  int last = int(end-mData.constBegin());
+  const int blockSize = levelOfDetailBlockSize();
+  
+  if (mLevelOfDetailIndex && last-first >= 2*blockSize)
+  {
+    updateLevelOfDetail();
+    int firstBlock = (first+blockSize-1)/blockSize;
+    int lastBlock = last/blockSize;
+    // scan data points in the partial blocks at both ends of the range:
+    for (QCPDataContainer<DataType>::const_iterator it = begin; it != mData.constBegin()+firstBlock*blockSize; ++it)
+    {
+      const QCPRange current = it->valueRange();
+      if (current.lower < lower) lower = current.lower;
+      if (current.upper > upper) upper = current.upper;
+    }
+    for (QCPDataContainer<DataType>::const_iterator it = mData.constBegin()+lastBlock*blockSize; it != end; ++it)
+    {
+      const QCPRange current = it->valueRange();
+      if (current.lower < lower) lower = current.lower;
+      if (current.upper > upper) upper = current.upper;
+    }
+    // combine the complete blocks in between, moving up one pyramid level per iteration:
+    for (int level=0; level < mLevelOfDetailLevels.size() && firstBlock < lastBlock; ++level)
+    {
+      const QVector<QCPRange> &spans = mLevelOfDetailLevels.at(level);
+      if (firstBlock & 1)
+      {
+        if (spans.at(firstBlock).lower < lower) lower = spans.at(firstBlock).lower;
+        if (spans.at(firstBlock).upper > upper) upper = spans.at(firstBlock).upper;
+        ++firstBlock;
+      }
+      if (lastBlock & 1)
+      {
+        --lastBlock;
+        if (spans.at(lastBlock).lower < lower) lower = spans.at(lastBlock).lower;
+        if (spans.at(lastBlock).upper > upper) upper = spans.at(lastBlock).upper;
+      }
+      firstBlock /= 2;
+      lastBlock /= 2;
+    }
+  } else
+  {
+    for (QCPDataContainer<DataType>::const_iterator it = begin; it != end; ++it)
+    {
+      const QCPRange current = it->valueRange();
+      if (current.lower < lower) lower = current.lower;
+      if (current.upper > upper) upper = current.upper;
+    }
+  }
+  
+  foundRange = lower <= upper;
+  if (!foundRange)
+    return QCPRange();
+  return QCPRange(lower, upper);
+}
+
 /*! \internal
   
   Increases the preallocation pool to have a size of at least \a minimumPreallocSize. Depending on
@@ -827,6 +1048,7 @@ void QCPDataContainer<DataType>::preallocateGrow(int minimumPreallocSize)
   mData.resize(mData.size()+sizeDifference);
   std::copy_backward(mData.begin()+mPreallocSize, mData.end()-sizeDifference, mData.end());
   mPreallocSize = newPreallocSize;
+  invalidateLevelOfDetail(0);
 }
 
 /*! \internal
@@ -846,6 +1068,8 @@ void QCPDataContainer<DataType>::preallocateGrow(int minimumPreallocSize)
 template <class DataType>
 void QCPDataContainer<DataType>::performAutoSqueeze()
 {
+  if (mStreamingCapacity > 0) // streaming mode keeps its memory reserved on purpose
+    return;
   const int totalAlloc = mData.capacity();
   const int postAllocSize = totalAlloc-mData.size();
   const int usedSize = size();
@@ -865,5 +1089,95 @@ void QCPDataContainer<DataType>::performAutoSqueeze()
     squeeze(shrinkPreAllocation, shrinkPostAllocation);
 }
 
+/*! \internal
+  
+  If the streaming mode is enabled (see \ref setStreamingCapacity), removes the data points with
+  the smallest (sort-)keys such that at most \ref streamingCapacity data points remain.
+  
+  Removed data points are added to the preallocation pool in constant time. Once the pool is as
+  large as the capacity, the remaining data is moved to the beginning of the memory block, so the
+  total memory stays at twice the capacity and appending never needs to reallocate.
+*/
+template <class DataType>
+void QCPDataContainer<DataType>::enforceStreamingCapacity()
+{
+  if (mStreamingCapacity <= 0)
+    return;
+  
+  const int excess = size()-mStreamingCapacity;
+  if (excess > 0)
+    mPreallocSize += excess;
+  if (mPreallocSize >= mStreamingCapacity)
+  {
+    std::copy(begin(), end(), mData.begin());
+    mData.resize(size()); // doesn't release the reserved capacity
+    mPreallocSize = 0;
+    mPreallocIteration = 0;
+    invalidateLevelOfDetail(0);
+  }
+  if (mData.capacity() < 2*mStreamingCapacity)
+    mData.reserve(2*mStreamingCapacity);
+}
+
+/*! \internal
+  
+  Brings the level of detail index up to date, see \ref setLevelOfDetailIndex.
+  
+  The lowest level holds the value span of each complete block of \ref levelOfDetailBlockSize
+  data points, indexed by the physical position in the internal data vector. Every higher level
+  combines two neighbouring spans of the level below. Since the physical positions of data points
+  don't change when data is appended or removed from the front (see \ref removeBefore), only the
+  blocks starting at \a mLevelOfDetailValidSize need to be recomputed, along with the spans above
+  them.
+  
+  Empty blocks (e.g. all values NaN) have a span with lower bound +inf and upper bound -inf, such
+  that they don't influence any combined span.
+*/
+template <class DataType>
+void QCPDataContainer<DataType>::updateLevelOfDetail() const
+{
+  const int blockSize = levelOfDetailBlockSize();
+  const int blockCount = mData.size()/blockSize;
+  if (mLevelOfDetailValidSize >= blockCount*blockSize && !mLevelOfDetailLevels.isEmpty() && mLevelOfDetailLevels.first().size() == blockCount)
+    return;
+  
+  int dirtyIndex = mLevelOfDetailValidSize/blockSize; // first block in the current level that needs to be recomputed
+  int levelSize = blockCount;
+  int level = 0;
+  while (levelSize > 0 || level == 0)
+  {
+    if (mLevelOfDetailLevels.size() <= level)
+      mLevelOfDetailLevels.append(QVector<QCPRange>());
+    QVector<QCPRange> &spans = mLevelOfDetailLevels[level];
+    spans.resize(levelSize);
+    for (int i=dirtyIndex; i<levelSize; ++i)
+    {
+      QCPRange span; // not using the constructor with bounds, since it would normalize the empty span
+      span.lower = std::numeric_limits<double>::infinity();
+      span.upper = -std::numeric_limits<double>::infinity();
+      if (level == 0)
+      {
+        QCPDataContainer<DataType>::const_iterator itEnd = mData.constBegin()+(i+1)*blockSize;
+        for (QCPDataContainer<DataType>::const_iterator it = mData.constBegin()+i*blockSize; it != itEnd; ++it)
+        {
+          const QCPRange current = it->valueRange();
+          if (current.lower < span.lower) span.lower = current.lower;
+          if (current.upper > span.upper) span.upper = current.upper;
+        }
+      } else
+      {
+        const QVector<QCPRange> &below = mLevelOfDetailLevels.at(level-1);
+        span.lower = qMin(below.at(2*i).lower, below.at(2*i+1).lower);
+        span.upper = qMax(below.at(2*i).upper, below.at(2*i+1).upper);
+      }
+      spans[i] = span;
+    }
+    dirtyIndex /= 2;
+    levelSize /= 2;
+    ++level;
+  }
+  mLevelOfDetailLevels.resize(level);
+  mLevelOfDetailValidSize = blockCount*blockSize;
+}
 
 #endif // QCP_DATACONTAINER_H
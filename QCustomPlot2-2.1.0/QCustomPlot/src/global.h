@@ -58,14 +58,19 @@
 #include <QtGui/QMouseEvent>
 #include <QtGui/QWheelEvent>
 #include <QtGui/QPixmap>
+#include <QtGui/QPixmapCache>
 #include <QtCore/QVector>
 #include <QtCore/QString>
+#include <QtCore/QStringList>
 #include <QtCore/QDateTime>
 #include <QtCore/QMultiMap>
 #include <QtCore/QFlags>
 #include <QtCore/QDebug>
 #include <QtCore/QStack>
 #include <QtCore/QCache>
+#include <QtCore/QThread>
+#include <QtCore/QMutex>
+#include <QtCore/QCoreApplication>
 #include <QtCore/QMargins>
 #include <qmath.h>
 #include <limits>
@@ -233,6 +238,11 @@ enum PlottingHint { phNone              = 0x000 ///< <tt>0x000</tt> No hints are
                     ,phImmediateRefresh = 0x002 ///< <tt>0x002</tt> causes an immediate repaint() instead of a soft update() when QCustomPlot::replot() is called with parameter \ref QCustomPlot::rpRefreshHint.
                                                 ///<                This is set by default to prevent the plot from freezing on fast consecutive replots (e.g. user drags ranges with mouse).
                     ,phCacheLabels      = 0x004 ///< <tt>0x004</tt> axis (tick) labels will be cached as pixmaps, increasing replot performance.
+                    ,phTrackDirtyLayers = 0x008 ///< <tt>0x008</tt> QCustomPlot::replot only redraws the paint buffers of layers that changed since the last replot (see \ref QCPLayer::markDirty), and reuses the
+                                                ///<                buffered content of the others. Changes made through the setters of layerables (including plottable data via setData/addData), the layout, axis ranges and ticks
+                                                ///<                are detected automatically. Changes made elsewhere, e.g. directly to a data container obtained via \c data(), must be announced with \ref QCPLayer::markDirty.
+                    ,phCacheScatters    = 0x010 ///< <tt>0x010</tt> scatter symbols of graphs and curves are rendered once per scatter style, pen, brush and device pixel ratio, and then copied to each data point as pixmaps (see
+                                                ///<                \ref QCPScatterStyle::drawShapes). This greatly speeds up plots with many scatter points, while the symbols are placed on whole pixels. Exports still draw vector shapes.
                   };
 Q_DECLARE_FLAGS(PlottingHints, PlottingHint)
 
@@ -342,6 +342,8 @@ void QCPItemPosition::setTypeX(QCPItemPosition::PositionType type)
       pixel = pixelPosition();
     
     mPositionTypeX = type;
+    if (mParentItem && mParentItem->layer())
+      mParentItem->layer()->markDirty();
     
     if (retainPixelPosition)
       setPixelPosition(pixel);
@@ -372,6 +374,8 @@ void QCPItemPosition::setTypeY(QCPItemPosition::PositionType type)
       pixel = pixelPosition();
     
     mPositionTypeY = type;
+    if (mParentItem && mParentItem->layer())
+      mParentItem->layer()->markDirty();
     
     if (retainPixelPosition)
       setPixelPosition(pixel);
@@ -554,6 +558,8 @@ void QCPItemPosition::setCoords(double key, double value)
 {
   mKey = key;
   mValue = value;
+  if (mParentItem && mParentItem->layer())
+    mParentItem->layer()->markDirty();
 }
 
 /*! \overload
@@ -676,6 +682,8 @@ void QCPItemPosition::setAxes(QCPAxis *keyAxis, QCPAxis *valueAxis)
 {
   mKeyAxis = keyAxis;
   mValueAxis = valueAxis;
+  if (mParentItem && mParentItem->layer())
+    mParentItem->layer()->markDirty();
 }
 
 /*!
@@ -686,6 +694,8 @@ void QCPItemPosition::setAxes(QCPAxis *keyAxis, QCPAxis *valueAxis)
 void QCPItemPosition::setAxisRect(QCPAxisRect *axisRect)
 {
   mAxisRect = axisRect;
+  if (mParentItem && mParentItem->layer())
+    mParentItem->layer()->markDirty();
 }
 
 /*!
@@ -1002,6 +1012,7 @@ void QCPAbstractItem::setClipToAxisRect(bool clip)
   mClipToAxisRect = clip;
   if (mClipToAxisRect)
     setParentLayerable(mClipAxisRect.data());
+  markLayerDirty();
 }
 
 /*!
@@ -1015,6 +1026,7 @@ void QCPAbstractItem::setClipAxisRect(QCPAxisRect *rect)
   mClipAxisRect = rect;
   if (mClipToAxisRect)
     setParentLayerable(mClipAxisRect.data());
+  markLayerDirty();
 }
 
 /*!
@@ -1056,6 +1068,7 @@ void QCPAbstractItem::setSelected(bool selected)
     mSelected = selected;
     emit selectionChanged(mSelected);
   }
+  markLayerDirty();
 }
 
 /*!
@@ -89,6 +89,7 @@ QCPItemBracket::~QCPItemBracket()
 void QCPItemBracket::setPen(const QPen &pen)
 {
   mPen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -99,6 +100,7 @@ void QCPItemBracket::setPen(const QPen &pen)
 void QCPItemBracket::setSelectedPen(const QPen &pen)
 {
   mSelectedPen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -112,6 +114,7 @@ void QCPItemBracket::setSelectedPen(const QPen &pen)
 void QCPItemBracket::setLength(double length)
 {
   mLength = length;
+  markLayerDirty();
 }
 
 /*!
@@ -122,6 +125,7 @@ void QCPItemBracket::setLength(double length)
 void QCPItemBracket::setStyle(QCPItemBracket::BracketStyle style)
 {
   mStyle = style;
+  markLayerDirty();
 }
 
 /* inherits documentation from base class */
@@ -83,6 +83,7 @@ QCPItemCurve::~QCPItemCurve()
 void QCPItemCurve::setPen(const QPen &pen)
 {
   mPen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -93,6 +94,7 @@ void QCPItemCurve::setPen(const QPen &pen)
 void QCPItemCurve::setSelectedPen(const QPen &pen)
 {
   mSelectedPen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -106,6 +108,7 @@ void QCPItemCurve::setSelectedPen(const QPen &pen)
 void QCPItemCurve::setHead(const QCPLineEnding &head)
 {
   mHead = head;
+  markLayerDirty();
 }
 
 /*!
@@ -119,6 +122,7 @@ void QCPItemCurve::setHead(const QCPLineEnding &head)
 void QCPItemCurve::setTail(const QCPLineEnding &tail)
 {
   mTail = tail;
+  markLayerDirty();
 }
 
 /* inherits documentation from base class */
@@ -81,6 +81,7 @@ QCPItemEllipse::~QCPItemEllipse()
 void QCPItemEllipse::setPen(const QPen &pen)
 {
   mPen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -91,6 +92,7 @@ void QCPItemEllipse::setPen(const QPen &pen)
 void QCPItemEllipse::setSelectedPen(const QPen &pen)
 {
   mSelectedPen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -102,6 +104,7 @@ void QCPItemEllipse::setSelectedPen(const QPen &pen)
 void QCPItemEllipse::setBrush(const QBrush &brush)
 {
   mBrush = brush;
+  markLayerDirty();
 }
 
 /*!
@@ -113,6 +116,7 @@ void QCPItemEllipse::setBrush(const QBrush &brush)
 void QCPItemEllipse::setSelectedBrush(const QBrush &brush)
 {
   mSelectedBrush = brush;
+  markLayerDirty();
 }
 
 /* inherits documentation from base class */
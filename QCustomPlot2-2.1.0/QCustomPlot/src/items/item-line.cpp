@@ -72,6 +72,7 @@ QCPItemLine::~QCPItemLine()
 void QCPItemLine::setPen(const QPen &pen)
 {
   mPen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -82,6 +83,7 @@ void QCPItemLine::setPen(const QPen &pen)
 void QCPItemLine::setSelectedPen(const QPen &pen)
 {
   mSelectedPen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -95,6 +97,7 @@ void QCPItemLine::setSelectedPen(const QPen &pen)
 void QCPItemLine::setHead(const QCPLineEnding &head)
 {
   mHead = head;
+  markLayerDirty();
 }
 
 /*!
@@ -108,6 +111,7 @@ void QCPItemLine::setHead(const QCPLineEnding &head)
 void QCPItemLine::setTail(const QCPLineEnding &tail)
 {
   mTail = tail;
+  markLayerDirty();
 }
 
 /* inherits documentation from base class */
@@ -87,6 +87,7 @@ void QCPItemPixmap::setPixmap(const QPixmap &pixmap)
   mScaledPixmapInvalidated = true;
   if (mPixmap.isNull())
     qDebug() << Q_FUNC_INFO << "pixmap is null";
+  markLayerDirty();
 }
 
 /*!
@@ -99,6 +100,7 @@ void QCPItemPixmap::setScaled(bool scaled, Qt::AspectRatioMode aspectRatioMode,
   mAspectRatioMode = aspectRatioMode;
   mTransformationMode = transformationMode;
   mScaledPixmapInvalidated = true;
+  markLayerDirty();
 }
 
 /*!
@@ -109,6 +111,7 @@ void QCPItemPixmap::setScaled(bool scaled, Qt::AspectRatioMode aspectRatioMode,
 void QCPItemPixmap::setPen(const QPen &pen)
 {
   mPen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -119,6 +122,7 @@ void QCPItemPixmap::setPen(const QPen &pen)
 void QCPItemPixmap::setSelectedPen(const QPen &pen)
 {
   mSelectedPen = pen;
+  markLayerDirty();
 }
 
 /* inherits documentation from base class */
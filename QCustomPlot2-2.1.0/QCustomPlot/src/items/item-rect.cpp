@@ -78,6 +78,7 @@ QCPItemRect::~QCPItemRect()
 void QCPItemRect::setPen(const QPen &pen)
 {
   mPen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -88,6 +89,7 @@ void QCPItemRect::setPen(const QPen &pen)
 void QCPItemRect::setSelectedPen(const QPen &pen)
 {
   mSelectedPen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -99,6 +101,7 @@ void QCPItemRect::setSelectedPen(const QPen &pen)
 void QCPItemRect::setBrush(const QBrush &brush)
 {
   mBrush = brush;
+  markLayerDirty();
 }
 
 /*!
@@ -110,6 +113,7 @@ void QCPItemRect::setBrush(const QBrush &brush)
 void QCPItemRect::setSelectedBrush(const QBrush &brush)
 {
   mSelectedBrush = brush;
+  markLayerDirty();
 }
 
 /* inherits documentation from base class */
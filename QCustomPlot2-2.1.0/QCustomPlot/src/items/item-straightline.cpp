@@ -70,6 +70,7 @@ QCPItemStraightLine::~QCPItemStraightLine()
 void QCPItemStraightLine::setPen(const QPen &pen)
 {
   mPen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -80,6 +81,7 @@ void QCPItemStraightLine::setPen(const QPen &pen)
 void QCPItemStraightLine::setSelectedPen(const QPen &pen)
 {
   mSelectedPen = pen;
+  markLayerDirty();
 }
 
 /* inherits documentation from base class */
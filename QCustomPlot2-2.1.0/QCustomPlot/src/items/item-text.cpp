@@ -88,6 +88,7 @@ QCPItemText::~QCPItemText()
 void QCPItemText::setColor(const QColor &color)
 {
   mColor = color;
+  markLayerDirty();
 }
 
 /*!
@@ -96,6 +97,7 @@ void QCPItemText::setColor(const QColor &color)
 void QCPItemText::setSelectedColor(const QColor &color)
 {
   mSelectedColor = color;
+  markLayerDirty();
 }
 
 /*!
@@ -107,6 +109,7 @@ void QCPItemText::setSelectedColor(const QColor &color)
 void QCPItemText::setPen(const QPen &pen)
 {
   mPen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -118,6 +121,7 @@ void QCPItemText::setPen(const QPen &pen)
 void QCPItemText::setSelectedPen(const QPen &pen)
 {
   mSelectedPen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -129,6 +133,7 @@ void QCPItemText::setSelectedPen(const QPen &pen)
 void QCPItemText::setBrush(const QBrush &brush)
 {
   mBrush = brush;
+  markLayerDirty();
 }
 
 /*!
@@ -140,6 +145,7 @@ void QCPItemText::setBrush(const QBrush &brush)
 void QCPItemText::setSelectedBrush(const QBrush &brush)
 {
   mSelectedBrush = brush;
+  markLayerDirty();
 }
 
 /*!
@@ -150,6 +156,7 @@ void QCPItemText::setSelectedBrush(const QBrush &brush)
 void QCPItemText::setFont(const QFont &font)
 {
   mFont = font;
+  markLayerDirty();
 }
 
 /*!
@@ -160,6 +167,7 @@ void QCPItemText::setFont(const QFont &font)
 void QCPItemText::setSelectedFont(const QFont &font)
 {
   mSelectedFont = font;
+  markLayerDirty();
 }
 
 /*!
@@ -171,6 +179,7 @@ void QCPItemText::setSelectedFont(const QFont &font)
 void QCPItemText::setText(const QString &text)
 {
   mText = text;
+  markLayerDirty();
 }
 
 /*!
@@ -188,6 +197,7 @@ void QCPItemText::setText(const QString &text)
 void QCPItemText::setPositionAlignment(Qt::Alignment alignment)
 {
   mPositionAlignment = alignment;
+  markLayerDirty();
 }
 
 /*!
@@ -196,6 +206,7 @@ void QCPItemText::setPositionAlignment(Qt::Alignment alignment)
 void QCPItemText::setTextAlignment(Qt::Alignment alignment)
 {
   mTextAlignment = alignment;
+  markLayerDirty();
 }
 
 /*!
@@ -205,6 +216,7 @@ void QCPItemText::setTextAlignment(Qt::Alignment alignment)
 void QCPItemText::setRotation(double degrees)
 {
   mRotation = degrees;
+  markLayerDirty();
 }
 
 /*!
@@ -214,6 +226,7 @@ void QCPItemText::setRotation(double degrees)
 void QCPItemText::setPadding(const QMargins &padding)
 {
   mPadding = padding;
+  markLayerDirty();
 }
 
 /* inherits documentation from base class */
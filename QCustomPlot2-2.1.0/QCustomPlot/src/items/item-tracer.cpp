@@ -98,6 +98,7 @@ QCPItemTracer::~QCPItemTracer()
 void QCPItemTracer::setPen(const QPen &pen)
 {
   mPen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -108,6 +109,7 @@ void QCPItemTracer::setPen(const QPen &pen)
 void QCPItemTracer::setSelectedPen(const QPen &pen)
 {
   mSelectedPen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -118,6 +120,7 @@ void QCPItemTracer::setSelectedPen(const QPen &pen)
 void QCPItemTracer::setBrush(const QBrush &brush)
 {
   mBrush = brush;
+  markLayerDirty();
 }
 
 /*!
@@ -128,6 +131,7 @@ void QCPItemTracer::setBrush(const QBrush &brush)
 void QCPItemTracer::setSelectedBrush(const QBrush &brush)
 {
   mSelectedBrush = brush;
+  markLayerDirty();
 }
 
 /*!
@@ -137,6 +141,7 @@ void QCPItemTracer::setSelectedBrush(const QBrush &brush)
 void QCPItemTracer::setSize(double size)
 {
   mSize = size;
+  markLayerDirty();
 }
 
 /*!
@@ -148,6 +153,7 @@ void QCPItemTracer::setSize(double size)
 void QCPItemTracer::setStyle(QCPItemTracer::TracerStyle style)
 {
   mStyle = style;
+  markLayerDirty();
 }
 
 /*!
@@ -176,6 +182,7 @@ void QCPItemTracer::setGraph(QCPGraph *graph)
   {
     mGraph = nullptr;
   }
+  markLayerDirty();
 }
 
 /*!
@@ -190,6 +197,7 @@ void QCPItemTracer::setGraph(QCPGraph *graph)
 void QCPItemTracer::setGraphKey(double key)
 {
   mGraphKey = key;
+  markLayerDirty();
 }
 
 /*!
@@ -206,6 +214,7 @@ void QCPItemTracer::setGraphKey(double key)
 void QCPItemTracer::setInterpolating(bool enabled)
 {
   mInterpolating = enabled;
+  markLayerDirty();
 }
 
 /* inherits documentation from base class */
@@ -323,6 +332,10 @@ void QCPItemTracer::draw(QCPPainter *painter)
   out-of-date coordinates.
   
   If there is no graph set on this tracer, this function does nothing.
+  
+  The position on the graph is looked up with \ref QCPGraph::valuesAt. To read the graph values at
+  many keys at once, e.g. for a readout across many graphs, use that method directly instead of
+  one tracer per key.
 */
 void QCPItemTracer::updatePosition()
 {
@@ -330,43 +343,11 @@ void QCPItemTracer::updatePosition()
   {
     if (mParentPlot->hasPlottable(mGraph))
     {
-      if (mGraph->data()->size() > 1)
-      {
-        QCPGraphDataContainer::const_iterator first = mGraph->data()->constBegin();
-        QCPGraphDataContainer::const_iterator last = mGraph->data()->constEnd()-1;
-        if (mGraphKey <= first->key)
-          position->setCoords(first->key, first->value);
-        else if (mGraphKey >= last->key)
-          position->setCoords(last->key, last->value);
-        else
-        {
-          QCPGraphDataContainer::const_iterator it = mGraph->data()->findBegin(mGraphKey);
-          if (it != mGraph->data()->constEnd()) // mGraphKey is not exactly on last iterator, but somewhere between iterators
-          {
-            QCPGraphDataContainer::const_iterator prevIt = it;
-            ++it; // won't advance to constEnd because we handled that case (mGraphKey >= last->key) before
-            if (mInterpolating)
-            {
-              // interpolate between iterators around mGraphKey:
-              double slope = 0;
-              if (!qFuzzyCompare(double(it->key), double(prevIt->key)))
-                slope = (it->value-prevIt->value)/(it->key-prevIt->key);
-              position->setCoords(mGraphKey, (mGraphKey-prevIt->key)*slope+prevIt->value);
-            } else
-            {
-              // find iterator with key closest to mGraphKey:
-              if (mGraphKey < (prevIt->key+it->key)*0.5)
-                position->setCoords(prevIt->key, prevIt->value);
-              else
-                position->setCoords(it->key, it->value);
-            }
-          } else // mGraphKey is exactly on last iterator (should actually be caught when comparing first/last keys, but this is a failsafe for fp uncertainty)
-            position->setCoords(it->key, it->value);
-        }
-      } else if (mGraph->data()->size() == 1)
+      if (!mGraph->data()->isEmpty())
       {
-        QCPGraphDataContainer::const_iterator it = mGraph->data()->constBegin();
-        position->setCoords(it->key, it->value);
+        double key, value;
+        mGraph->valuesAt(&mGraphKey, &value, 1, mInterpolating, &key);
+        position->setCoords(key, value);
       } else
         qDebug() << Q_FUNC_INFO << "graph has no data";
     } else
@@ -0,0 +1,200 @@
+/***************************************************************************
+**                                                                        **
+**  QCustomPlot, an easy to use, modern plotting widget for Qt            **
+**  Copyright (C) 2011-2021 Emanuel Eichhammer                            **
+**                                                                        **
+**  This program is free software: you can redistribute it and/or modify  **
+**  it under the terms of the GNU General Public License as published by  **
+**  the Free Software Foundation, either version 3 of the License, or     **
+**  (at your option) any later version.                                   **
+**                                                                        **
+**  This program is distributed in the hope that it will be useful,       **
+**  but WITHOUT ANY WARRANTY; without even the implied warranty of        **
+**  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         **
+**  GNU General Public License for more details.                          **
+**                                                                        **
+**  You should have received a copy of the GNU General Public License     **
+**  along with this program.  If not, see http://www.gnu.org/licenses/.   **
+**                                                                        **
+****************************************************************************
+**           Author: Emanuel Eichhammer                                   **
+**  Website/Contact: http://www.qcustomplot.com/                          **
+**             Date: 29.03.21                                             **
+**          Version: 2.1.0                                                **
+****************************************************************************/
+
+#include "labelcache.h"
+
+////////////////////////////////////////////////////////////////////////////////////////////////////
+//////////////////// QCPLabelCache
+////////////////////////////////////////////////////////////////////////////////////////////////////
+
+/*! \class QCPLabelCache
+  \brief Stores rendered tick labels, so they can be shared by all axes of a plot or of several plots
+
+  Drawing text is one of the most expensive operations of a replot. If the plotting hint \ref
+  QCP::phCacheLabels is set (the default), axes therefore render each tick label only once into a
+  pixmap and copy that pixmap in subsequent replots. The pixmaps are stored in a QCPLabelCache,
+  which each QCustomPlot owns and shares between all its axes (see \ref QCustomPlot::labelCache).
+  Axes with the same tick label font, color, rotation and device pixel ratio thus reuse each other's
+  labels, e.g. in a grid of many small axis rects showing similar ranges.
+  
+  Several plots can share the same cache with \ref QCustomPlot::setLabelCache.
+  
+  The labels are identified by a key which contains the text and all parameters that influence
+  the rendered pixmap. When the cache is full, the least recently used labels are removed. The
+  capacity is set with \ref setMaximumCount. To tune it, \ref hits and \ref misses report how often
+  a requested label was found in the cache, or had to be rendered.
+  
+  All methods are thread-safe. Exports (e.g. \ref QCustomPlot::toImage) don't draw cached labels,
+  but the layout of every replot and export looks up the sizes of the cached labels (see \ref
+  peek). So a cache that is shared by several plots may be accessed by the GUI thread and by
+  threads exporting plots at the same time. Note that a lookup also marks the label as recently
+  used, so even lookups modify the cache.
+*/
+
+/*!
+  Creates an empty label cache which holds up to \a maximumCount labels.
+*/
+QCPLabelCache::QCPLabelCache(int maximumCount) :
+  mCache(qMax(0, maximumCount)),
+  mHits(0),
+  mMisses(0)
+{
+}
+
+/*!
+  Returns the maximum number of labels the cache holds, see \ref setMaximumCount.
+*/
+int QCPLabelCache::maximumCount() const
+{
+  QMutexLocker locker(&mMutex);
+  return mCache.maxCost();
+}
+
+/*!
+  Returns the number of labels currently in the cache.
+*/
+int QCPLabelCache::count() const
+{
+  QMutexLocker locker(&mMutex);
+  return mCache.count();
+}
+
+/*!
+  Returns how often \ref find found the requested label since the cache was created, or since the last call
+  of \ref resetStatistics.
+  
+  \see misses
+*/
+qint64 QCPLabelCache::hits() const
+{
+  QMutexLocker locker(&mMutex);
+  return mHits;
+}
+
+/*!
+  Returns how often \ref find didn't find the requested label since the cache was created, or since
+  the last call of \ref resetStatistics. Each miss usually means a label had to be rendered. If
+  this number keeps growing while the plot only shows recurring labels, the cache is too small.
+  
+  \see hits, setMaximumCount
+*/
+qint64 QCPLabelCache::misses() const
+{
+  QMutexLocker locker(&mMutex);
+  return mMisses;
+}
+
+/*!
+  Sets the maximum number of labels the cache holds. If there are more labels in the cache, the
+  least recently used ones are removed.
+  
+  A plot needs about as many labels as all its axes show at once. Panning or zooming reuses labels
+  of previous replots, as long as they are still in the cache.
+*/
+void QCPLabelCache::setMaximumCount(int count)
+{
+  QMutexLocker locker(&mMutex);
+  mCache.setMaxCost(qMax(0, count));
+}
+
+/*!
+  Looks up the label with \a key. If it is in the cache, copies it to \a label, marks it as
+  recently used and returns true. Otherwise returns false and leaves \a label unchanged.
+  
+  Each call is counted as a hit or a miss (see \ref hits, \ref misses).
+*/
+bool QCPLabelCache::find(const QByteArray &key, Label *label)
+{
+  QMutexLocker locker(&mMutex);
+  if (const Label *cachedLabel = mCache.object(key))
+  {
+    *label = *cachedLabel;
+    ++mHits;
+    return true;
+  }
+  ++mMisses;
+  return false;
+}
+
+/*!
+  Like \ref find, but doesn't count as a hit or miss. This is used where a cached label is only
+  inspected, e.g. to determine the size of tick labels during the layout, so that \ref hits and
+  \ref misses reflect how often labels were drawn from the cache or had to be rendered.
+  
+  Like \ref find, this marks the label as recently used.
+*/
+bool QCPLabelCache::peek(const QByteArray &key, Label *label) const
+{
+  QMutexLocker locker(&mMutex);
+  if (const Label *cachedLabel = mCache.object(key))
+  {
+    *label = *cachedLabel;
+    return true;
+  }
+  return false;
+}
+
+/*!
+  Returns whether a label with \a key is in the cache. Unlike \ref find, this doesn't count as a
+  hit or miss, and doesn't mark the label as recently used.
+  
+  \see peek
+*/
+bool QCPLabelCache::contains(const QByteArray &key) const
+{
+  QMutexLocker locker(&mMutex);
+  return mCache.contains(key);
+}
+
+/*!
+  Adds \a label to the cache under \a key, replacing a label with the same key. If the cache is
+  full, the least recently used label is removed.
+*/
+void QCPLabelCache::insert(const QByteArray &key, const Label &label)
+{
+  QMutexLocker locker(&mMutex);
+  mCache.insert(key, new Label(label));
+}
+
+/*!
+  Removes all labels from the cache. The hit and miss counters are not changed.
+  
+  \see resetStatistics
+*/
+void QCPLabelCache::clear()
+{
+  QMutexLocker locker(&mMutex);
+  mCache.clear();
+}
+
+/*!
+  Sets the counters of \ref hits and \ref misses to zero.
+*/
+void QCPLabelCache::resetStatistics()
+{
+  QMutexLocker locker(&mMutex);
+  mHits = 0;
+  mMisses = 0;
+}
@@ -0,0 +1,73 @@
+/***************************************************************************
+**                                                                        **
+**  QCustomPlot, an easy to use, modern plotting widget for Qt            **
+**  Copyright (C) 2011-2021 Emanuel Eichhammer                            **
+**                                                                        **
+**  This program is free software: you can redistribute it and/or modify  **
+**  it under the terms of the GNU General Public License as published by  **
+**  the Free Software Foundation, either version 3 of the License, or     **
+**  (at your option) any later version.                                   **
+**                                                                        **
+**  This program is distributed in the hope that it will be useful,       **
+**  but WITHOUT ANY WARRANTY; without even the implied warranty of        **
+**  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         **
+**  GNU General Public License for more details.                          **
+**                                                                        **
+**  You should have received a copy of the GNU General Public License     **
+**  along with this program.  If not, see http://www.gnu.org/licenses/.   **
+**                                                                        **
+****************************************************************************
+**           Author: Emanuel Eichhammer                                   **
+**  Website/Contact: http://www.qcustomplot.com/                          **
+**             Date: 29.03.21                                             **
+**          Version: 2.1.0                                                **
+****************************************************************************/
+/*! \file */
+#ifndef QCP_LABELCACHE_H
+#define QCP_LABELCACHE_H
+
+#include "global.h"
+
+class QCP_LIB_DECL QCPLabelCache
+{
+public:
+  /*!
+    A rendered label as stored in the cache. The \a pixmap is drawn at the label anchor position
+    plus \a offset.
+  */
+  struct Label
+  {
+    QPointF offset;
+    QPixmap pixmap;
+  };
+  
+  explicit QCPLabelCache(int maximumCount=512);
+  
+  // getters:
+  int maximumCount() const;
+  int count() const;
+  qint64 hits() const;
+  qint64 misses() const;
+  
+  // setters:
+  void setMaximumCount(int count);
+  
+  // non-property methods:
+  bool find(const QByteArray &key, Label *label);
+  bool peek(const QByteArray &key, Label *label) const;
+  bool contains(const QByteArray &key) const;
+  void insert(const QByteArray &key, const Label &label);
+  void clear();
+  void resetStatistics();
+  
+protected:
+  // non-property members:
+  mutable QMutex mMutex;
+  QCache<QByteArray, Label> mCache;
+  qint64 mHits, mMisses;
+  
+private:
+  Q_DISABLE_COPY(QCPLabelCache)
+};
+
+#endif // QCP_LABELCACHE_H
@@ -86,6 +86,17 @@
   compared with a full replot of all layers. Upon creation of a new layer, the layer mode is
   initialized to \ref lmLogical. The only layer that is set to \ref lmBuffered in a new \ref
   QCustomPlot instance is the "overlay" layer, containing the selection rect.
+  
+  \section qcplayer-dirty Replotting only changed layers
+  
+  If the plotting hint \ref QCP::phTrackDirtyLayers is set (see \ref QCustomPlot::setPlottingHint),
+  \ref QCustomPlot::replot only redraws the paint buffers of layers which are marked dirty, and
+  reuses the buffered content of all other layers. Layers are marked dirty automatically for common
+  changes, see the documentation of \ref QCP::phTrackDirtyLayers. Changes which aren't detected
+  automatically must be announced with \ref markDirty. Since layers in mode \ref lmLogical share
+  a paint buffer with their adjacent logical layers, all of them are redrawn if one of them is
+  dirty. So, to benefit from this mechanism, place frequently changing layerables on a dedicated
+  layer in mode \ref lmBuffered.
 */
 
 /* start documentation of inline functions */
@@ -96,6 +107,14 @@
   layerables with higher indices are drawn above layerables with lower indices.
 */
 
+/*! \fn bool QCPLayer::isDirty() const
+  
+  Returns whether this layer has changed since it was last drawn, and thus needs to be redrawn by
+  the next \ref QCustomPlot::replot, if the plotting hint \ref QCP::phTrackDirtyLayers is set.
+  
+  \see markDirty
+*/
+
 /*! \fn int QCPLayer::index() const
   
   Returns the index this layer has in the QCustomPlot. The index is the integer number by which this layer can be
@@ -120,7 +139,8 @@ QCPLayer::QCPLayer(QCustomPlot *parentPlot, const QString &layerName) :
   mName(layerName),
   mIndex(-1), // will be set to a proper value by the QCustomPlot layer creation function
   mVisible(true),
-  mMode(lmLogical)
+  mMode(lmLogical),
+  mDirty(true)
 {
   // Note: no need to make sure layerName is unique, because layer
   // management is done with QCustomPlot functions.
@@ -150,7 +170,11 @@ QCPLayer::~QCPLayer()
 */
 void QCPLayer::setVisible(bool visible)
 {
-  mVisible = visible;
+  if (mVisible != visible)
+  {
+    mVisible = visible;
+    mDirty = true;
+  }
 }
 
 /*!
@@ -187,20 +211,45 @@ void QCPLayer::setMode(QCPLayer::LayerMode mode)
 /*! \internal
 
   Draws the contents of this layer with the provided \a painter.
+  
+  If \a profile is not nullptr, the duration of each layerable's draw call is measured and appended
+  to \a profile as a QVariantMap with the keys "name", "className" and "time" (in milliseconds).
+  The name is the plottable name for plottables, and the object name otherwise. This is used by
+  \ref QCustomPlot::setProfiling.
 
   \see replot, drawToPaintBuffer
 */
-void QCPLayer::draw(QCPPainter *painter)
+void QCPLayer::draw(QCPPainter *painter, QVariantList *profile)
 {
+# if QT_VERSION < QT_VERSION_CHECK(4, 8, 0)
+  QTime drawTimer;
+# else
+  QElapsedTimer drawTimer;
+# endif
   foreach (QCPLayerable *child, mChildren)
   {
     if (child->realVisibility())
     {
+      if (profile)
+        drawTimer.start();
       painter->save();
       painter->setClipRect(child->clipRect().translated(0, -1));
       child->applyDefaultAntialiasingHint(painter);
       child->draw(painter);
       painter->restore();
+      if (profile)
+      {
+        const QVariant name = child->property("name");
+        QVariantMap entry;
+        entry.insert(QLatin1String("name"), name.isValid() ? name.toString() : child->objectName());
+        entry.insert(QLatin1String("className"), QString::fromLatin1(child->metaObject()->className()));
+# if QT_VERSION < QT_VERSION_CHECK(4, 8, 0)
+        entry.insert(QLatin1String("time"), double(drawTimer.elapsed()));
+# else
+        entry.insert(QLatin1String("time"), drawTimer.nsecsElapsed()*1e-6);
+# endif
+        profile->append(entry);
+      }
     }
   }
 }
@@ -210,17 +259,19 @@ void QCPLayer::draw(QCPPainter *painter)
   Draws the contents of this layer into the paint buffer which is associated with this layer. The
   association is established by the parent QCustomPlot, which manages all paint buffers (see \ref
   QCustomPlot::setupPaintBuffers).
+  
+  \a profile is passed on to \ref draw.
 
   \see draw
 */
-void QCPLayer::drawToPaintBuffer()
+void QCPLayer::drawToPaintBuffer(QVariantList *profile)
 {
   if (QSharedPointer<QCPAbstractPaintBuffer> pb = mPaintBuffer.toStrongRef())
   {
     if (QCPPainter *painter = pb->startPainting())
     {
       if (painter->isActive())
-        draw(painter);
+        draw(painter, profile);
       else
         qDebug() << Q_FUNC_INFO << "paint buffer returned inactive painter";
       delete painter;
@@ -254,6 +305,7 @@ void QCPLayer::replot()
       pb->clear(Qt::transparent);
       drawToPaintBuffer();
       pb->setInvalidated(false); // since layer is lmBuffered, we know only this layer is on buffer and we can reset invalidated flag
+      mDirty = false;
       mParentPlot->update();
     } else
       qDebug() << Q_FUNC_INFO << "no valid paint buffer associated with this layer";
@@ -261,6 +313,21 @@ void QCPLayer::replot()
     mParentPlot->replot();
 }
 
+/*!
+  Marks this layer as dirty, so the next \ref QCustomPlot::replot redraws it, if the plotting hint
+  \ref QCP::phTrackDirtyLayers is set.
+  
+  Call this method after changing any of the layerables on this layer in a way that isn't detected
+  automatically, for example when modifying the data container of a plottable directly via its
+  \c data() method, or when moving an item.
+  
+  \see isDirty
+*/
+void QCPLayer::markDirty()
+{
+  mDirty = true;
+}
+
 /*! \internal
   
   Adds the \a layerable to the list of this layer. If \a prepend is set to true, the layerable will
@@ -446,7 +513,11 @@ QCPLayerable::~QCPLayerable()
 */
 void QCPLayerable::setVisible(bool on)
 {
-  mVisible = on;
+  if (mVisible != on)
+  {
+    mVisible = on;
+    markLayerDirty();
+  }
 }
 
 /*!
@@ -493,7 +564,11 @@ bool QCPLayerable::setLayer(const QString &layerName)
 */
 void QCPLayerable::setAntialiased(bool enabled)
 {
-  mAntialiased = enabled;
+  if (mAntialiased != enabled)
+  {
+    mAntialiased = enabled;
+    markLayerDirty();
+  }
 }
 
 /*!
@@ -655,6 +730,18 @@ void QCPLayerable::applyAntialiasingHint(QCPPainter *painter, bool localAntialia
     painter->setAntialiasing(localAntialiased);
 }
 
+/*! \internal
+
+  Marks the layer of this layerable as dirty, see \ref QCPLayer::markDirty. Subclasses call this
+  method whenever a change affects their appearance, so the next \ref QCustomPlot::replot redraws
+  the layer if the plotting hint \ref QCP::phTrackDirtyLayers is set.
+*/
+void QCPLayerable::markLayerDirty()
+{
+  if (mLayer)
+    mLayer->markDirty();
+}
+
 /*! \internal
 
   This function is called by \ref initializeParentPlot, to allow subclasses to react on the setting
@@ -73,6 +73,7 @@ public:
   QList<QCPLayerable*> children() const { return mChildren; }
   bool visible() const { return mVisible; }
   LayerMode mode() const { return mMode; }
+  bool isDirty() const { return mDirty; }
   
   // setters:
   void setVisible(bool visible);
@@ -80,6 +81,7 @@ public:
   
   // non-virtual methods:
   void replot();
+  void markDirty();
   
 protected:
   // property members:
@@ -92,10 +94,11 @@ protected:
   
   // non-property members:
   QWeakPointer<QCPAbstractPaintBuffer> mPaintBuffer;
+  bool mDirty;
   
   // non-virtual methods:
-  void draw(QCPPainter *painter);
-  void drawToPaintBuffer();
+  void draw(QCPPainter *painter, QVariantList *profile=nullptr);
+  void drawToPaintBuffer(QVariantList *profile=nullptr);
   void addChild(QCPLayerable *layerable, bool prepend);
   void removeChild(QCPLayerable *layerable);
   
@@ -172,6 +175,7 @@ protected:
   void setParentLayerable(QCPLayerable* parentLayerable);
   bool moveToLayer(QCPLayer *layer, bool prepend);
   void applyAntialiasingHint(QCPPainter *painter, bool localAntialiased, QCP::AntialiasedElement overrideElement) const;
+  void markLayerDirty();
   
 private:
   Q_DISABLE_COPY(QCPLayerable)
@@ -667,6 +667,7 @@ void QCPAxisRect::setBackground(const QPixmap &pm)
 {
   mBackgroundPixmap = pm;
   mScaledBackgroundPixmap = QPixmap();
+  markLayerDirty();
 }
 
 /*! \overload
@@ -685,6 +686,7 @@ void QCPAxisRect::setBackground(const QPixmap &pm)
 void QCPAxisRect::setBackground(const QBrush &brush)
 {
   mBackgroundBrush = brush;
+  markLayerDirty();
 }
 
 /*! \overload
@@ -700,6 +702,7 @@ void QCPAxisRect::setBackground(const QPixmap &pm, bool scaled, Qt::AspectRatioM
   mScaledBackgroundPixmap = QPixmap();
   mBackgroundScaled = scaled;
   mBackgroundScaledMode = mode;
+  markLayerDirty();
 }
 
 /*!
@@ -715,6 +718,7 @@ void QCPAxisRect::setBackground(const QPixmap &pm, bool scaled, Qt::AspectRatioM
 void QCPAxisRect::setBackgroundScaled(bool scaled)
 {
   mBackgroundScaled = scaled;
+  markLayerDirty();
 }
 
 /*!
@@ -725,6 +729,7 @@ void QCPAxisRect::setBackgroundScaled(bool scaled)
 void QCPAxisRect::setBackgroundScaledMode(Qt::AspectRatioMode mode)
 {
   mBackgroundScaledMode = mode;
+  markLayerDirty();
 }
 
 /*!
@@ -193,6 +193,7 @@ void QCPColorScale::setType(QCPAxis::AxisType type)
   if (mType != type)
   {
     mType = type;
+    markLayerDirty();
     QCPRange rangeTransfer(0, 6);
     QString labelTransfer;
     QSharedPointer<QCPAxisTicker> tickerTransfer;
@@ -244,6 +245,9 @@ void QCPColorScale::setDataRange(const QCPRange &dataRange)
     mDataRange = dataRange;
     if (mColorAxis)
       mColorAxis.data()->setRange(mDataRange);
+    markLayerDirty();
+    if (mAxisRect)
+      mAxisRect.data()->markLayerDirty();
     emit dataRangeChanged(mDataRange);
   }
 }
@@ -276,6 +280,9 @@ void QCPColorScale::setDataScaleType(QCPAxis::ScaleType scaleType)
       mColorAxis.data()->setScaleType(mDataScaleType);
     if (mDataScaleType == QCPAxis::stLogarithmic)
       setDataRange(mDataRange.sanitizedForLogScale());
+    markLayerDirty();
+    if (mAxisRect)
+      mAxisRect.data()->markLayerDirty();
     emit dataScaleTypeChanged(mDataScaleType);
   }
 }
@@ -293,7 +300,11 @@ void QCPColorScale::setGradient(const QCPColorGradient &gradient)
   {
     mGradient = gradient;
     if (mAxisRect)
+    {
       mAxisRect.data()->mGradientImageInvalidated = true;
+      mAxisRect.data()->markLayerDirty();
+    }
+    markLayerDirty();
     emit gradientChanged(mGradient);
   }
 }
@@ -320,6 +331,9 @@ void QCPColorScale::setLabel(const QString &str)
 void QCPColorScale::setBarWidth(int width)
 {
   mBarWidth = width;
+  markLayerDirty();
+  if (mAxisRect)
+    mAxisRect.data()->markLayerDirty();
 }
 
 /*!
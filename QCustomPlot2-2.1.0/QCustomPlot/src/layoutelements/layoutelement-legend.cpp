@@ -93,6 +93,7 @@ QCPAbstractLegendItem::QCPAbstractLegendItem(QCPLegend *parent) :
 void QCPAbstractLegendItem::setFont(const QFont &font)
 {
   mFont = font;
+  markLayerDirty();
 }
 
 /*!
@@ -103,6 +104,7 @@ void QCPAbstractLegendItem::setFont(const QFont &font)
 void QCPAbstractLegendItem::setTextColor(const QColor &color)
 {
   mTextColor = color;
+  markLayerDirty();
 }
 
 /*!
@@ -114,6 +116,7 @@ void QCPAbstractLegendItem::setTextColor(const QColor &color)
 void QCPAbstractLegendItem::setSelectedFont(const QFont &font)
 {
   mSelectedFont = font;
+  markLayerDirty();
 }
 
 /*!
@@ -125,6 +128,7 @@ void QCPAbstractLegendItem::setSelectedFont(const QFont &font)
 void QCPAbstractLegendItem::setSelectedTextColor(const QColor &color)
 {
   mSelectedTextColor = color;
+  markLayerDirty();
 }
 
 /*!
@@ -156,6 +160,7 @@ void QCPAbstractLegendItem::setSelected(bool selected)
     mSelected = selected;
     emit selectionChanged(mSelected);
   }
+  markLayerDirty();
 }
 
 /* inherits documentation from base class */
@@ -451,6 +456,7 @@ QCPLegend::SelectableParts QCPLegend::selectedParts() const
 void QCPLegend::setBorderPen(const QPen &pen)
 {
   mBorderPen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -459,6 +465,7 @@ void QCPLegend::setBorderPen(const QPen &pen)
 void QCPLegend::setBrush(const QBrush &brush)
 {
   mBrush = brush;
+  markLayerDirty();
 }
 
 /*!
@@ -478,6 +485,7 @@ void QCPLegend::setFont(const QFont &font)
     if (item(i))
       item(i)->setFont(mFont);
   }
+  markLayerDirty();
 }
 
 /*!
@@ -497,6 +505,7 @@ void QCPLegend::setTextColor(const QColor &color)
     if (item(i))
       item(i)->setTextColor(color);
   }
+  markLayerDirty();
 }
 
 /*!
@@ -506,6 +515,7 @@ void QCPLegend::setTextColor(const QColor &color)
 void QCPLegend::setIconSize(const QSize &size)
 {
   mIconSize = size;
+  markLayerDirty();
 }
 
 /*! \overload
@@ -514,6 +524,7 @@ void QCPLegend::setIconSize(int width, int height)
 {
   mIconSize.setWidth(width);
   mIconSize.setHeight(height);
+  markLayerDirty();
 }
 
 /*!
@@ -524,6 +535,7 @@ void QCPLegend::setIconSize(int width, int height)
 void QCPLegend::setIconTextPadding(int padding)
 {
   mIconTextPadding = padding;
+  markLayerDirty();
 }
 
 /*!
@@ -535,6 +547,7 @@ void QCPLegend::setIconTextPadding(int padding)
 void QCPLegend::setIconBorderPen(const QPen &pen)
 {
   mIconBorderPen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -600,6 +613,7 @@ void QCPLegend::setSelectedParts(const SelectableParts &selected)
     mSelectedParts = newSelected;
     emit selectionChanged(mSelectedParts);
   }
+  markLayerDirty();
 }
 
 /*!
@@ -611,6 +625,7 @@ void QCPLegend::setSelectedParts(const SelectableParts &selected)
 void QCPLegend::setSelectedBorderPen(const QPen &pen)
 {
   mSelectedBorderPen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -621,6 +636,7 @@ void QCPLegend::setSelectedBorderPen(const QPen &pen)
 void QCPLegend::setSelectedIconBorderPen(const QPen &pen)
 {
   mSelectedIconBorderPen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -632,6 +648,7 @@ void QCPLegend::setSelectedIconBorderPen(const QPen &pen)
 void QCPLegend::setSelectedBrush(const QBrush &brush)
 {
   mSelectedBrush = brush;
+  markLayerDirty();
 }
 
 /*!
@@ -649,6 +666,7 @@ void QCPLegend::setSelectedFont(const QFont &font)
     if (item(i))
       item(i)->setSelectedFont(font);
   }
+  markLayerDirty();
 }
 
 /*!
@@ -666,6 +684,7 @@ void QCPLegend::setSelectedTextColor(const QColor &color)
     if (item(i))
       item(i)->setSelectedTextColor(color);
   }
+  markLayerDirty();
 }
 
 /*!
@@ -194,6 +194,7 @@ QCPTextElement::QCPTextElement(QCustomPlot *parentPlot, const QString &text, con
 void QCPTextElement::setText(const QString &text)
 {
   mText = text;
+  markLayerDirty();
 }
 
 /*!
@@ -219,6 +220,7 @@ void QCPTextElement::setText(const QString &text)
 void QCPTextElement::setTextFlags(int flags)
 {
   mTextFlags = flags;
+  markLayerDirty();
 }
 
 /*!
@@ -229,6 +231,7 @@ void QCPTextElement::setTextFlags(int flags)
 void QCPTextElement::setFont(const QFont &font)
 {
   mFont = font;
+  markLayerDirty();
 }
 
 /*!
@@ -239,6 +242,7 @@ void QCPTextElement::setFont(const QFont &font)
 void QCPTextElement::setTextColor(const QColor &color)
 {
   mTextColor = color;
+  markLayerDirty();
 }
 
 /*!
@@ -249,6 +253,7 @@ void QCPTextElement::setTextColor(const QColor &color)
 void QCPTextElement::setSelectedFont(const QFont &font)
 {
   mSelectedFont = font;
+  markLayerDirty();
 }
 
 /*!
@@ -259,6 +264,7 @@ void QCPTextElement::setSelectedFont(const QFont &font)
 void QCPTextElement::setSelectedTextColor(const QColor &color)
 {
   mSelectedTextColor = color;
+  markLayerDirty();
 }
 
 /*!
@@ -290,6 +296,7 @@ void QCPTextElement::setSelected(bool selected)
     mSelected = selected;
     emit selectionChanged(mSelected);
   }
+  markLayerDirty();
 }
 
 /* inherits documentation from base class */
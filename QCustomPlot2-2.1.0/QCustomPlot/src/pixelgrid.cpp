@@ -0,0 +1,345 @@
+/***************************************************************************
+**                                                                        **
+**  QCustomPlot, an easy to use, modern plotting widget for Qt            **
+**  Copyright (C) 2011-2021 Emanuel Eichhammer                            **
+**                                                                        **
+**  This program is free software: you can redistribute it and/or modify  **
+**  it under the terms of the GNU General Public License as published by  **
+**  the Free Software Foundation, either version 3 of the License, or     **
+**  (at your option) any later version.                                   **
+**                                                                        **
+**  This program is distributed in the hope that it will be useful,       **
+**  but WITHOUT ANY WARRANTY; without even the implied warranty of        **
+**  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         **
+**  GNU General Public License for more details.                          **
+**                                                                        **
+**  You should have received a copy of the GNU General Public License     **
+**  along with this program.  If not, see http://www.gnu.org/licenses/.   **
+**                                                                        **
+****************************************************************************
+**           Author: Emanuel Eichhammer                                   **
+**  Website/Contact: http://www.qcustomplot.com/                          **
+**             Date: 29.03.21                                             **
+**          Version: 2.1.0                                                **
+****************************************************************************/
+
+#include "pixelgrid.h"
+
+#include "vector2d.h"
+
+////////////////////////////////////////////////////////////////////////////////////////////////////
+//////////////////// QCPPixelGrid
+////////////////////////////////////////////////////////////////////////////////////////////////////
+
+/*! \class QCPPixelGrid
+  \brief A uniform grid over a pixel area, for fast nearest neighbour and rectangle queries
+
+  QCPPixelGrid partitions a pixel area (\ref bounds) into square cells of \ref cellSize pixels and
+  stores in each cell the indices of the points and line segments that lie in or cross it. Once
+  built with \ref build, the point or segment closest to a pixel position (\ref nearest) and the
+  points inside a rectangle (\ref pointsInRect) can be found by only visiting the cells around the
+  query, instead of all points.
+
+  Plottables use it as a spatial index to speed up their selection tests (\ref
+  QCPAbstractPlottable::selectTest, \ref QCPPlottableInterface1D::selectTestRect) when the user
+  hovers or clicks the plot, see \ref QCPGraph::setSpatialIndex. The grid itself doesn't know about
+  plot coordinates, so it must be rebuilt whenever the pixel positions change, e.g. after the axis
+  ranges or the data were modified.
+
+  Points and segments outside the bounds are assigned to the border cells closest to them, so the
+  queries also take them into account correctly, they just aren't sped up for such elements.
+*/
+
+/* start documentation of inline functions */
+
+/*! \fn bool QCPPixelGrid::isEmpty() const
+
+  Returns whether the grid holds neither points nor line segments.
+*/
+
+/*! \fn QRect QCPPixelGrid::bounds() const
+
+  Returns the pixel area that is partitioned into cells, as passed to \ref build.
+*/
+
+/*! \fn int QCPPixelGrid::cellSize() const
+
+  Returns the edge length of the cells in pixels, as passed to \ref build.
+*/
+
+/* end documentation of inline functions */
+
+/*!
+  Creates an empty grid. Use \ref build to fill it.
+*/
+QCPPixelGrid::QCPPixelGrid() :
+  mCellSize(1),
+  mColumns(0),
+  mRows(0),
+  mLineStep(1),
+  mSegmentCount(0)
+{
+}
+
+/*!
+  Partitions the pixel area \a bounds into cells of \a cellSize pixels and distributes \a points
+  and the line segments given by \a lines to them. Any previous content is discarded.
+
+  The line segments connect the consecutive points of \a lines, like a polyline. If \a lineStep is
+  2, only every other pair is connected, i.e. <tt>lines[0]</tt> with <tt>lines[1]</tt>,
+  <tt>lines[2]</tt> with <tt>lines[3]</tt> and so on, as used for impulse plots. Points and
+  segments with NaN coordinates are skipped, which is how gaps in line data are represented.
+
+  The cell size should be in the order of the distances that are typically queried, e.g. the
+  selection tolerance (\ref QCustomPlot::setSelectionTolerance). Building takes linear time in the
+  number of points plus the number of cells crossed by the segments.
+*/
+void QCPPixelGrid::build(const QRect &bounds, int cellSize, const QVector<QPointF> &points, const QVector<QPointF> &lines, int lineStep)
+{
+  clear();
+  if (bounds.width() <= 0 || bounds.height() <= 0 || cellSize < 1)
+    return;
+  mBounds = bounds;
+  mCellSize = cellSize;
+  mColumns = (bounds.width()+cellSize-1)/cellSize;
+  mRows = (bounds.height()+cellSize-1)/cellSize;
+  mPoints = points;
+  mLines = lines;
+  mLineStep = qMax(1, lineStep);
+  const int cellCount = mColumns*mRows;
+  
+  // distribute points to cells by counting sort, so the points of each cell are stored contiguously (and in ascending index order):
+  QVector<int> pointCells(points.size());
+  mPointCellStart.fill(0, cellCount+1);
+  for (int i=0; i<points.size(); ++i)
+  {
+    const QPointF &point = points.at(i);
+    if (qIsNaN(point.x()) || qIsNaN(point.y()))
+    {
+      pointCells[i] = -1;
+    } else
+    {
+      pointCells[i] = cellRow(point.y())*mColumns+cellColumn(point.x());
+      ++mPointCellStart[pointCells.at(i)+1];
+    }
+  }
+  for (int cell=0; cell<cellCount; ++cell)
+    mPointCellStart[cell+1] += mPointCellStart.at(cell);
+  mPointIndices.resize(mPointCellStart.last());
+  QVector<int> cursor = mPointCellStart;
+  for (int i=0; i<points.size(); ++i)
+  {
+    if (pointCells.at(i) >= 0)
+      mPointIndices[cursor[pointCells.at(i)]++] = i;
+  }
+  
+  // distribute segments the same way, a segment is registered in every cell it crosses:
+  QVector<int> segmentCells, segmentOfCell, cells;
+  for (int i=0; i+1<lines.size(); i+=mLineStep)
+  {
+    const QPointF &start = lines.at(i);
+    const QPointF &end = lines.at(i+1);
+    if (!qIsFinite(start.x()) || !qIsFinite(start.y()) || !qIsFinite(end.x()) || !qIsFinite(end.y()))
+      continue;
+    cells.clear();
+    segmentCells(start, end, cells);
+    for (int k=0; k<cells.size(); ++k)
+    {
+      segmentCells.append(cells.at(k));
+      segmentOfCell.append(i);
+    }
+    ++mSegmentCount;
+  }
+  mSegmentCellStart.fill(0, cellCount+1);
+  for (int k=0; k<segmentCells.size(); ++k)
+    ++mSegmentCellStart[segmentCells.at(k)+1];
+  for (int cell=0; cell<cellCount; ++cell)
+    mSegmentCellStart[cell+1] += mSegmentCellStart.at(cell);
+  mSegmentIndices.resize(segmentCells.size());
+  cursor = mSegmentCellStart;
+  for (int k=0; k<segmentCells.size(); ++k)
+    mSegmentIndices[cursor[segmentCells.at(k)]++] = segmentOfCell.at(k);
+}
+
+/*!
+  Removes all points and segments from the grid.
+*/
+void QCPPixelGrid::clear()
+{
+  mBounds = QRect();
+  mColumns = 0;
+  mRows = 0;
+  mPoints.clear();
+  mLines.clear();
+  mSegmentCount = 0;
+  mPointCellStart.clear();
+  mPointIndices.clear();
+  mSegmentCellStart.clear();
+  mSegmentIndices.clear();
+}
+
+/*!
+  Returns the distance in pixels from \a pos to the closest point or line segment in the grid, or
+  -1 if the grid is empty.
+
+  If \a pointIndex is not null, it is set to the index (in the points passed to \ref build) of the
+  point closest to \a pos, which may be farther away than the closest segment. It is set to -1 if
+  there are no points.
+
+  The cells are visited in rings of growing size around \a pos, until no unvisited cell can hold
+  anything closer than what was already found. So the query time depends on the distance to the
+  closest element and the number of elements in the cells close to \a pos, not on the total number
+  of elements.
+*/
+double QCPPixelGrid::nearest(const QPointF &pos, int *pointIndex) const
+{
+  if (pointIndex)
+    *pointIndex = -1;
+  if (isEmpty())
+    return -1;
+  
+  const QCPVector2D p(pos);
+  const int column0 = cellColumn(pos.x());
+  const int row0 = cellRow(pos.y());
+  const int maxRing = qMax(qMax(column0, mColumns-1-column0), qMax(row0, mRows-1-row0));
+  double minPointDistSqr = (std::numeric_limits<double>::max)();
+  double minSegmentDistSqr = (std::numeric_limits<double>::max)();
+  int closestPoint = -1;
+  for (int ring=0; ring<=maxRing; ++ring)
+  {
+    const int rowMin = qMax(0, row0-ring);
+    const int rowMax = qMin(mRows-1, row0+ring);
+    for (int row=rowMin; row<=rowMax; ++row)
+    {
+      // in the first and last row of the ring, visit all columns, otherwise only the left and right ones:
+      const int columnStep = (row == row0-ring || row == row0+ring) ? 1 : 2*ring;
+      for (int column=column0-ring; column<=column0+ring; column+=columnStep)
+      {
+        if (column < 0 || column >= mColumns)
+          continue;
+        const int cell = row*mColumns+column;
+        for (int k=mPointCellStart.at(cell); k<mPointCellStart.at(cell+1); ++k)
+        {
+          const int index = mPointIndices.at(k);
+          const double distSqr = (QCPVector2D(mPoints.at(index))-p).lengthSquared();
+          if (distSqr < minPointDistSqr || (distSqr == minPointDistSqr && index < closestPoint))
+          {
+            minPointDistSqr = distSqr;
+            closestPoint = index;
+          }
+        }
+        for (int k=mSegmentCellStart.at(cell); k<mSegmentCellStart.at(cell+1); ++k)
+        {
+          const int index = mSegmentIndices.at(k);
+          const double distSqr = p.distanceSquaredToLine(mLines.at(index), mLines.at(index+1));
+          if (distSqr < minSegmentDistSqr)
+            minSegmentDistSqr = distSqr;
+        }
+      }
+    }
+    // anything in cells outside the current ring is at least ring*mCellSize away from pos:
+    const double bound = double(ring)*mCellSize;
+    if (mPoints.isEmpty() ? qMin(minPointDistSqr, minSegmentDistSqr) <= bound*bound : minPointDistSqr <= bound*bound)
+      break;
+  }
+  
+  if (pointIndex)
+    *pointIndex = closestPoint;
+  return qSqrt(qMin(minPointDistSqr, minSegmentDistSqr));
+}
+
+/*!
+  Returns the indices (in the points passed to \ref build) of all points inside \a rect, including
+  its edges, in ascending order.
+
+  Only the cells overlapping \a rect are visited.
+*/
+QVector<int> QCPPixelGrid::pointsInRect(const QRectF &rect) const
+{
+  QVector<int> result;
+  if (mPoints.isEmpty())
+    return result;
+  const QRectF normRect = rect.normalized();
+  const int columnMin = cellColumn(normRect.left());
+  const int columnMax = cellColumn(normRect.right());
+  const int rowMin = cellRow(normRect.top());
+  const int rowMax = cellRow(normRect.bottom());
+  for (int row=rowMin; row<=rowMax; ++row)
+  {
+    for (int column=columnMin; column<=columnMax; ++column)
+    {
+      const int cell = row*mColumns+column;
+      for (int k=mPointCellStart.at(cell); k<mPointCellStart.at(cell+1); ++k)
+      {
+        const QPointF &point = mPoints.at(mPointIndices.at(k));
+        if (point.x() >= normRect.left() && point.x() <= normRect.right() && point.y() >= normRect.top() && point.y() <= normRect.bottom())
+          result.append(mPointIndices.at(k));
+      }
+    }
+  }
+  std::sort(result.begin(), result.end());
+  return result;
+}
+
+/*! \internal
+
+  Returns the column of the cell containing the pixel coordinate \a x. Coordinates outside the
+  bounds are assigned to the first or last column.
+*/
+int QCPPixelGrid::cellColumn(double x) const
+{
+  const double column = (x-mBounds.left())/double(mCellSize);
+  if (!(column > 0)) // also catches NaN
+    return 0;
+  if (column >= mColumns)
+    return mColumns-1;
+  return int(column);
+}
+
+/*! \internal
+
+  Returns the row of the cell containing the pixel coordinate \a y. Coordinates outside the bounds
+  are assigned to the first or last row.
+*/
+int QCPPixelGrid::cellRow(double y) const
+{
+  const double row = (y-mBounds.top())/double(mCellSize);
+  if (!(row > 0)) // also catches NaN
+    return 0;
+  if (row >= mRows)
+    return mRows-1;
+  return int(row);
+}
+
+/*! \internal
+
+  Appends the indices of all cells crossed by the line segment from \a start to \a end to \a cells.
+
+  For every column touched by the segment, the vertical extent of the part of the segment inside
+  that column determines the rows. The first and last column are considered to extend infinitely
+  beyond the bounds, consistent with \ref cellColumn.
+*/
+void QCPPixelGrid::segmentCells(const QPointF &start, const QPointF &end, QVector<int> &cells) const
+{
+  const double xMin = qMin(start.x(), end.x());
+  const double xMax = qMax(start.x(), end.x());
+  const int columnMin = cellColumn(xMin);
+  const int columnMax = cellColumn(xMax);
+  const double slope = columnMin != columnMax ? (end.y()-start.y())/(end.x()-start.x()) : 0;
+  for (int column=columnMin; column<=columnMax; ++column)
+  {
+    double yA = start.y();
+    double yB = end.y();
+    if (columnMin != columnMax)
+    {
+      const double spanLeft = column == 0 ? xMin : qMax(xMin, double(mBounds.left()+column*mCellSize));
+      const double spanRight = column == mColumns-1 ? xMax : qMin(xMax, double(mBounds.left()+(column+1)*mCellSize));
+      yA = start.y()+(spanLeft-start.x())*slope;
+      yB = start.y()+(spanRight-start.x())*slope;
+    }
+    const int rowMin = cellRow(qMin(yA, yB));
+    const int rowMax = cellRow(qMax(yA, yB));
+    for (int row=rowMin; row<=rowMax; ++row)
+      cells.append(row*mColumns+column);
+  }
+}
@@ -0,0 +1,66 @@
+/***************************************************************************
+**                                                                        **
+**  QCustomPlot, an easy to use, modern plotting widget for Qt            **
+**  Copyright (C) 2011-2021 Emanuel Eichhammer                            **
+**                                                                        **
+**  This program is free software: you can redistribute it and/or modify  **
+**  it under the terms of the GNU General Public License as published by  **
+**  the Free Software Foundation, either version 3 of the License, or     **
+**  (at your option) any later version.                                   **
+**                                                                        **
+**  This program is distributed in the hope that it will be useful,       **
+**  but WITHOUT ANY WARRANTY; without even the implied warranty of        **
+**  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         **
+**  GNU General Public License for more details.                          **
+**                                                                        **
+**  You should have received a copy of the GNU General Public License     **
+**  along with this program.  If not, see http://www.gnu.org/licenses/.   **
+**                                                                        **
+****************************************************************************
+**           Author: Emanuel Eichhammer                                   **
+**  Website/Contact: http://www.qcustomplot.com/                          **
+**             Date: 29.03.21                                             **
+**          Version: 2.1.0                                                **
+****************************************************************************/
+/*! \file */
+#ifndef QCP_PIXELGRID_H
+#define QCP_PIXELGRID_H
+
+#include "global.h"
+
+class QCP_LIB_DECL QCPPixelGrid
+{
+public:
+  QCPPixelGrid();
+  
+  // getters:
+  bool isEmpty() const { return mPoints.isEmpty() && mSegmentCount == 0; }
+  QRect bounds() const { return mBounds; }
+  int cellSize() const { return mCellSize; }
+  int pointCount() const { return mPoints.size(); }
+  int segmentCount() const { return mSegmentCount; }
+  
+  // non-virtual methods:
+  void build(const QRect &bounds, int cellSize, const QVector<QPointF> &points, const QVector<QPointF> &lines=QVector<QPointF>(), int lineStep=1);
+  void clear();
+  double nearest(const QPointF &pos, int *pointIndex=nullptr) const;
+  QVector<int> pointsInRect(const QRectF &rect) const;
+  
+protected:
+  // non-property members:
+  QRect mBounds;
+  int mCellSize, mColumns, mRows;
+  QVector<QPointF> mPoints;
+  QVector<QPointF> mLines;
+  int mLineStep, mSegmentCount;
+  QVector<int> mPointCellStart, mPointIndices;
+  QVector<int> mSegmentCellStart, mSegmentIndices;
+  
+  // non-virtual methods:
+  int cellColumn(double x) const;
+  int cellRow(double y) const;
+  void segmentCells(const QPointF &start, const QPointF &end, QVector<int> &cells) const;
+};
+Q_DECLARE_TYPEINFO(QCPPixelGrid, Q_MOVABLE_TYPE);
+
+#endif // QCP_PIXELGRID_H
@@ -82,6 +82,7 @@ QCPSelectionDecorator::~QCPSelectionDecorator()
 void QCPSelectionDecorator::setPen(const QPen &pen)
 {
   mPen = pen;
+  markPlottableLayerDirty();
 }
 
 /*!
@@ -90,6 +91,7 @@ void QCPSelectionDecorator::setPen(const QPen &pen)
 void QCPSelectionDecorator::setBrush(const QBrush &brush)
 {
   mBrush = brush;
+  markPlottableLayerDirty();
 }
 
 /*!
@@ -115,6 +117,7 @@ void QCPSelectionDecorator::setScatterStyle(const QCPScatterStyle &scatterStyle,
 void QCPSelectionDecorator::setUsedScatterProperties(const QCPScatterStyle::ScatterProperties &properties)
 {
   mUsedScatterProperties = properties;
+  markPlottableLayerDirty();
 }
 
 /*!
@@ -206,6 +209,18 @@ bool QCPSelectionDecorator::registerWithPlottable(QCPAbstractPlottable *plottabl
   }
 }
 
+/*! \internal
+  
+  Marks the layer of the plottable this selection decorator is registered with as dirty, so a
+  changed decorator property is picked up by the next replot when \ref QCP::phTrackDirtyLayers is
+  set. Does nothing if the decorator isn't registered with a plottable yet.
+*/
+void QCPSelectionDecorator::markPlottableLayerDirty()
+{
+  if (mPlottable && mPlottable->layer())
+    mPlottable->layer()->markDirty();
+}
+
 
 ////////////////////////////////////////////////////////////////////////////////////////////////////
 //////////////////// QCPAbstractPlottable
@@ -229,6 +244,7 @@ bool QCPSelectionDecorator::registerWithPlottable(QCPAbstractPlottable *plottabl
   \li A statistical box plot: \ref QCPStatisticalBox
   \li A color encoded two-dimensional map: \ref QCPColorMap
   \li An OHLC/Candlestick chart: \ref QCPFinancial
+  \li Many lightweight markers and text labels: \ref QCPAnnotations
   
   \section plottables-subclassing Creating own plottables
   
@@ -459,6 +475,7 @@ QCPAbstractPlottable::~QCPAbstractPlottable()
 void QCPAbstractPlottable::setName(const QString &name)
 {
   mName = name;
+  markLayerDirty();
 }
 
 /*!
@@ -470,6 +487,7 @@ void QCPAbstractPlottable::setName(const QString &name)
 void QCPAbstractPlottable::setAntialiasedFill(bool enabled)
 {
   mAntialiasedFill = enabled;
+  markLayerDirty();
 }
 
 /*!
@@ -481,6 +499,7 @@ void QCPAbstractPlottable::setAntialiasedFill(bool enabled)
 void QCPAbstractPlottable::setAntialiasedScatters(bool enabled)
 {
   mAntialiasedScatters = enabled;
+  markLayerDirty();
 }
 
 /*!
@@ -494,6 +513,7 @@ void QCPAbstractPlottable::setAntialiasedScatters(bool enabled)
 void QCPAbstractPlottable::setPen(const QPen &pen)
 {
   mPen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -508,6 +528,7 @@ void QCPAbstractPlottable::setPen(const QPen &pen)
 void QCPAbstractPlottable::setBrush(const QBrush &brush)
 {
   mBrush = brush;
+  markLayerDirty();
 }
 
 /*!
@@ -524,6 +545,7 @@ void QCPAbstractPlottable::setBrush(const QBrush &brush)
 void QCPAbstractPlottable::setKeyAxis(QCPAxis *axis)
 {
   mKeyAxis = axis;
+  markLayerDirty();
 }
 
 /*!
@@ -540,6 +562,7 @@ void QCPAbstractPlottable::setKeyAxis(QCPAxis *axis)
 void QCPAbstractPlottable::setValueAxis(QCPAxis *axis)
 {
   mValueAxis = axis;
+  markLayerDirty();
 }
 
 
@@ -570,6 +593,7 @@ void QCPAbstractPlottable::setSelection(QCPDataSelection selection)
     emit selectionChanged(selected());
     emit selectionChanged(mSelection);
   }
+  markLayerDirty();
 }
 
 /*!
@@ -595,6 +619,7 @@ void QCPAbstractPlottable::setSelectionDecorator(QCPSelectionDecorator *decorato
     delete mSelectionDecorator;
     mSelectionDecorator = nullptr;
   }
+  markLayerDirty();
 }
 
 /*!
@@ -701,6 +726,76 @@ void QCPAbstractPlottable::pixelsToCoords(const QPointF &pixelPos, double &key,
   pixelsToCoords(pixelPos.x(), pixelPos.y(), key, value);
 }
 
+/*! \overload
+
+  Transforms the \a count key/value pairs given by the arrays \a keys and \a values to pixels and
+  writes them to the arrays \a x and \a y, taking the orientations of the axes into account.
+
+  This is equivalent to calling \ref coordsToPixels(double, double, double&, double&) const for
+  each pair, but much faster for large arrays, see \ref QCPAxis::coordToPixel(const double*,
+  double*, int) const. The output arrays may be the same as the input arrays, i.e. \a x may be \a
+  keys and \a y may be \a values if the key axis is horizontal, or swapped if it is vertical.
+  
+  If the key or value axis is invalid, \a x and \a y are filled with NaN.
+*/
+void QCPAbstractPlottable::coordsToPixels(const double *keys, const double *values, double *x, double *y, int count) const
+{
+  QCPAxis *keyAxis = mKeyAxis.data();
+  QCPAxis *valueAxis = mValueAxis.data();
+  if (!keyAxis || !valueAxis)
+  {
+    qDebug() << Q_FUNC_INFO << "invalid key or value axis";
+    std::fill(x, x+count, qQNaN());
+    std::fill(y, y+count, qQNaN());
+    return;
+  }
+  
+  if (keyAxis->orientation() == Qt::Horizontal)
+  {
+    keyAxis->coordToPixel(keys, x, count);
+    valueAxis->coordToPixel(values, y, count);
+  } else
+  {
+    keyAxis->coordToPixel(keys, y, count);
+    valueAxis->coordToPixel(values, x, count);
+  }
+}
+
+/*! \overload
+
+  Transforms the \a count pixel positions given by the arrays \a x and \a y to plot coordinates
+  and writes them to the arrays \a keys and \a values, taking the orientations of the axes into
+  account.
+
+  This is equivalent to calling \ref pixelsToCoords(double, double, double&, double&) const for
+  each position, but much faster for large arrays, see \ref QCPAxis::pixelToCoord(const double*,
+  double*, int) const.
+  
+  If the key or value axis is invalid, \a keys and \a values are filled with NaN.
+*/
+void QCPAbstractPlottable::pixelsToCoords(const double *x, const double *y, double *keys, double *values, int count) const
+{
+  QCPAxis *keyAxis = mKeyAxis.data();
+  QCPAxis *valueAxis = mValueAxis.data();
+  if (!keyAxis || !valueAxis)
+  {
+    qDebug() << Q_FUNC_INFO << "invalid key or value axis";
+    std::fill(keys, keys+count, qQNaN());
+    std::fill(values, values+count, qQNaN());
+    return;
+  }
+  
+  if (keyAxis->orientation() == Qt::Horizontal)
+  {
+    keyAxis->pixelToCoord(x, keys, count);
+    valueAxis->pixelToCoord(y, values, count);
+  } else
+  {
+    keyAxis->pixelToCoord(y, keys, count);
+    valueAxis->pixelToCoord(x, values, count);
+  }
+}
+
 /*!
   Rescales the key and value axes associated with this plottable to contain all displayed data, so
   the whole plottable is visible. If the scaling of an axis is logarithmic, rescaleAxes will make
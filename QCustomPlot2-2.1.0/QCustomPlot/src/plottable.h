@@ -79,6 +79,9 @@ protected:
   // introduced virtual methods:
   virtual bool registerWithPlottable(QCPAbstractPlottable *plottable);
   
+  // non-virtual methods:
+  void markPlottableLayerDirty();
+  
 private:
   Q_DISABLE_COPY(QCPSelectionDecorator)
   friend class QCPAbstractPlottable;
@@ -141,6 +144,8 @@ public:
   const QPointF coordsToPixels(double key, double value) const;
   void pixelsToCoords(double x, double y, double &key, double &value) const;
   void pixelsToCoords(const QPointF &pixelPos, double &key, double &value) const;
+  void coordsToPixels(const double *keys, const double *values, double *x, double *y, int count) const;
+  void pixelsToCoords(const double *x, const double *y, double *keys, double *values, int count) const;
   void rescaleAxes(bool onlyEnlarge=false) const;
   void rescaleKeyAxis(bool onlyEnlarge=false) const;
   void rescaleValueAxis(bool onlyEnlarge=false, bool inKeyRange=false) const;
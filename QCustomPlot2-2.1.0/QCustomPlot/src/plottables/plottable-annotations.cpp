@@ -0,0 +1,852 @@
+/***************************************************************************
+**                                                                        **
+**  QCustomPlot, an easy to use, modern plotting widget for Qt            **
+**  Copyright (C) 2011-2021 Emanuel Eichhammer                            **
+**                                                                        **
+**  This program is free software: you can redistribute it and/or modify  **
+**  it under the terms of the GNU General Public License as published by  **
+**  the Free Software Foundation, either version 3 of the License, or     **
+**  (at your option) any later version.                                   **
+**                                                                        **
+**  This program is distributed in the hope that it will be useful,       **
+**  but WITHOUT ANY WARRANTY; without even the implied warranty of        **
+**  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         **
+**  GNU General Public License for more details.                          **
+**                                                                        **
+**  You should have received a copy of the GNU General Public License     **
+**  along with this program.  If not, see http://www.gnu.org/licenses/.   **
+**                                                                        **
+****************************************************************************
+**           Author: Emanuel Eichhammer                                   **
+**  Website/Contact: http://www.qcustomplot.com/                          **
+**             Date: 29.03.21                                             **
+**          Version: 2.1.0                                                **
+****************************************************************************/
+
+#include "plottable-annotations.h"
+
+#include "../painter.h"
+#include "../core.h"
+#include "../axis/axis.h"
+#include "../layoutelements/layoutelement-axisrect.h"
+
+////////////////////////////////////////////////////////////////////////////////////////////////////
+//////////////////// QCPAnnotationData
+////////////////////////////////////////////////////////////////////////////////////////////////////
+
+/*! \class QCPAnnotationData
+  \brief Holds the data of one single annotation for QCPAnnotations.
+
+  The stored data is:
+  \li \a key: coordinate on the key axis of the annotation (this is the \a mainKey and the \a sortKey)
+  \li \a value: coordinate on the value axis of the annotation (this is the \a mainValue)
+  \li \a text: the label text, may be empty to only show a marker
+  \li \a styleIndex: index of the marker style in the style table of the plottable (\ref
+  QCPAnnotations::setStyles)
+
+  The container for storing multiple annotations is \ref QCPAnnotationDataContainer. It is a
+  typedef for \ref QCPDataContainer with \ref QCPAnnotationData as the DataType template parameter.
+  See the documentation there for an explanation regarding the data type's generic methods.
+
+  \see QCPAnnotationDataContainer
+*/
+
+/* start documentation of inline functions */
+
+/*! \fn double QCPAnnotationData::sortKey() const
+
+  Returns the \a key member of this data point.
+
+  For a general explanation of what this method is good for in the context of the data container,
+  see the documentation of \ref QCPDataContainer.
+*/
+
+/*! \fn static QCPAnnotationData QCPAnnotationData::fromSortKey(double sortKey)
+
+  Returns a data point with the specified \a sortKey. All other members are set to zero or empty.
+
+  For a general explanation of what this method is good for in the context of the data container,
+  see the documentation of \ref QCPDataContainer.
+*/
+
+/*! \fn static static bool QCPAnnotationData::sortKeyIsMainKey()
+
+  Since the member \a key is both the data point key coordinate and the data ordering parameter,
+  this method returns true.
+
+  For a general explanation of what this method is good for in the context of the data container,
+  see the documentation of \ref QCPDataContainer.
+*/
+
+/*! \fn double QCPAnnotationData::mainKey() const
+
+  Returns the \a key member of this data point.
+
+  For a general explanation of what this method is good for in the context of the data container,
+  see the documentation of \ref QCPDataContainer.
+*/
+
+/*! \fn double QCPAnnotationData::mainValue() const
+
+  Returns the \a value member of this data point.
+
+  For a general explanation of what this method is good for in the context of the data container,
+  see the documentation of \ref QCPDataContainer.
+*/
+
+/*! \fn QCPRange QCPAnnotationData::valueRange() const
+
+  Returns a QCPRange with both lower and upper boundary set to \a value of this data point.
+
+  For a general explanation of what this method is good for in the context of the data container,
+  see the documentation of \ref QCPDataContainer.
+*/
+
+/* end documentation of inline functions */
+
+/*!
+  Constructs an annotation with key and value set to zero, an empty text and style index zero.
+*/
+QCPAnnotationData::QCPAnnotationData() :
+  key(0),
+  value(0),
+  styleIndex(0)
+{
+}
+
+/*!
+  Constructs an annotation with the specified \a key, \a value, \a text and \a styleIndex.
+*/
+QCPAnnotationData::QCPAnnotationData(double key, double value, const QString &text, int styleIndex) :
+  key(key),
+  value(value),
+  text(text),
+  styleIndex(styleIndex)
+{
+}
+
+
+////////////////////////////////////////////////////////////////////////////////////////////////////
+//////////////////// QCPAnnotations
+////////////////////////////////////////////////////////////////////////////////////////////////////
+
+/*! \class QCPAnnotations
+  \brief A plottable representing many lightweight markers and text labels in a plot.
+
+  Items like \ref QCPItemText or \ref QCPItemTracer are convenient for a few annotations, but each
+  of them is a separate layerable with its own positions, selection test and drawing setup. With
+  thousands of annotations, e.g. trade fills or alarm events on a time axis, replots and hover
+  effects become slow. QCPAnnotations instead holds any number of annotations in a single data
+  container (\ref QCPAnnotationDataContainer), each consisting of a position, an optional text and
+  the index of a marker style.
+
+  To plot annotations, assign them with the \ref setData or \ref addData functions. Alternatively,
+  you can also access and modify the data via the \ref data method, which returns a pointer to the
+  internal \ref QCPAnnotationDataContainer. In that case, call \ref invalidateCaches afterwards.
+
+  \section qcpannotations-appearance Changing the appearance
+
+  The markers are drawn with the scatter styles of the style table (\ref setStyles, \ref addStyle),
+  selected per annotation by its \a styleIndex. Styles without an own pen use the pen of the
+  plottable (\ref setPen). All labels share the font, color and placement relative to their marker
+  (\ref setFont, \ref setTextColor, \ref setPositionAlignment, \ref setTextOffset).
+
+  \section qcpannotations-performance Performance
+
+  The annotations are drawn in one pass: markers of the same style are collected and drawn together
+  (see \ref QCPScatterStyle::drawShapes), and the labels share one font and pen setup. Only the
+  annotations in the visible key range are visited, found by binary search in the data container,
+  and markers and labels outside the axis rect are skipped. The label sizes are measured once after
+  each data or font change and cached.
+
+  Selection tests go through a \ref QCPPixelGrid of the visible marker positions, which is built
+  lazily by the first selection test after the view or the data changed. Hover effects thus stay
+  fast with many annotations. The markers are the selectable parts, the labels are not tested.
+*/
+
+/* start of documentation of inline functions */
+
+/*! \fn QSharedPointer<QCPAnnotationDataContainer> QCPAnnotations::data() const
+
+  Returns a shared pointer to the internal data storage of type \ref QCPAnnotationDataContainer.
+  You may use it to directly manipulate the data, which may be more convenient and faster than
+  using the regular \ref setData or \ref addData methods. Call \ref invalidateCaches after
+  modifying the data this way.
+*/
+
+/* end of documentation of inline functions */
+
+/*!
+  Constructs an annotations plottable which uses \a keyAxis as its key axis ("x") and \a valueAxis
+  as its value axis ("y"). \a keyAxis and \a valueAxis must reside in the same QCustomPlot instance
+  and not have the same orientation. If either of these restrictions is violated, a corresponding
+  message is printed to the debug output (qDebug), the construction is not aborted, though.
+
+  The created QCPAnnotations is automatically registered with the QCustomPlot instance inferred
+  from \a keyAxis. This QCustomPlot instance takes ownership of the QCPAnnotations, so do not delete
+  it manually but use QCustomPlot::removePlottable() instead.
+
+  The style table initially holds a single circle style, which is used by annotations with style
+  index zero.
+*/
+QCPAnnotations::QCPAnnotations(QCPAxis *keyAxis, QCPAxis *valueAxis) :
+  QCPAbstractPlottable1D<QCPAnnotationData>(keyAxis, valueAxis),
+  mTextColor(Qt::black),
+  mPositionAlignment(Qt::AlignHCenter|Qt::AlignBottom),
+  mTextAlignment(Qt::AlignTop|Qt::AlignHCenter),
+  mTextOffset(0, -5),
+  mLabelExtent(0)
+{
+  setPen(QPen(Qt::blue, 0));
+  setBrush(Qt::NoBrush);
+  setFont(QFont());
+  addStyle(QCPScatterStyle(QCPScatterStyle::ssCircle, 6));
+}
+
+QCPAnnotations::~QCPAnnotations()
+{
+}
+
+/*!
+  Returns the marker style with the given \a index in the style table, or a style with shape \ref
+  QCPScatterStyle::ssNone if \a index is out of range.
+
+  \see setStyles, styleCount
+*/
+QCPScatterStyle QCPAnnotations::style(int index) const
+{
+  if (index >= 0 && index < mStyles.size())
+    return mStyles.at(index);
+  return QCPScatterStyle();
+}
+
+/*! \overload
+
+  Replaces the current data container with the provided \a data container.
+
+  Since a QSharedPointer is used, multiple QCPAnnotations may share the same data container
+  safely. Modifying the data in the container will then affect all plottables that share the
+  container.
+
+  \see addData
+*/
+void QCPAnnotations::setData(QSharedPointer<QCPAnnotationDataContainer> data)
+{
+  mDataContainer = data;
+  invalidateCaches();
+  markLayerDirty();
+}
+
+/*! \overload
+
+  Replaces the current data with the annotations given by \a keys, \a values, \a texts and \a
+  styleIndices. \a texts and \a styleIndices may be empty, the annotations then have no text or
+  style index zero, respectively. Otherwise, the number of added annotations is the size of the
+  smallest vector.
+
+  If you can guarantee that the passed annotations are sorted by \a keys in ascending order, you
+  can set \a alreadySorted to true, to improve performance by saving a sorting run.
+
+  \see addData
+*/
+void QCPAnnotations::setData(const QVector<double> &keys, const QVector<double> &values, const QStringList &texts, const QVector<int> &styleIndices, bool alreadySorted)
+{
+  mDataContainer->clear();
+  addData(keys, values, texts, styleIndices, alreadySorted);
+}
+
+/*! \overload
+
+  Replaces the current data with the \a count annotations provided in the raw arrays \a keys, \a
+  values, \a texts and \a styleIndices. All arrays must hold at least \a count elements. \a texts
+  and \a styleIndices may be null, the annotations then have no text or style index zero,
+  respectively.
+
+  This overload avoids intermediate containers and is thus well suited for handing over large
+  blocks of contiguous memory, e.g. from language bindings.
+
+  If you can guarantee that the passed annotations are sorted by \a keys in ascending order, you
+  can set \a alreadySorted to true, to improve performance by saving a sorting run.
+
+  \see addData
+*/
+void QCPAnnotations::setData(const double *keys, const double *values, const QString *texts, const int *styleIndices, int count, bool alreadySorted)
+{
+  mDataContainer->clear();
+  addData(keys, values, texts, styleIndices, count, alreadySorted);
+}
+
+/*!
+  Replaces the style table with \a styles. The \a styleIndex of each annotation selects the marker
+  style from this table. Annotations with an index outside the table use the first style. To show
+  only the label of an annotation, use a style with shape \ref QCPScatterStyle::ssNone.
+
+  \see addStyle, setStyle
+*/
+void QCPAnnotations::setStyles(const QVector<QCPScatterStyle> &styles)
+{
+  mStyles = styles;
+  markLayerDirty();
+}
+
+/*!
+  Replaces the marker style at \a index in the style table with \a style. If \a index is out of
+  range, a message is printed to the debug output and the style table is not changed.
+
+  \see addStyle, setStyles
+*/
+void QCPAnnotations::setStyle(int index, const QCPScatterStyle &style)
+{
+  if (index < 0 || index >= mStyles.size())
+  {
+    qDebug() << Q_FUNC_INFO << "style index out of range:" << index;
+    return;
+  }
+  mStyles[index] = style;
+  markLayerDirty();
+}
+
+/*!
+  Sets the font of the labels.
+
+  \see setTextColor
+*/
+void QCPAnnotations::setFont(const QFont &font)
+{
+  mFont = font;
+  markLayerDirty();
+}
+
+/*!
+  Sets the color of the labels. Selected labels use the pen color of the selection decorator
+  instead (see \ref setSelectionDecorator).
+
+  \see setFont
+*/
+void QCPAnnotations::setTextColor(const QColor &color)
+{
+  mTextColor = color;
+  markLayerDirty();
+}
+
+/*!
+  Sets which side of the label rect is placed at the marker position (plus the offset given by
+  \ref setTextOffset). For example, if \a alignment is <tt>Qt::AlignHCenter|Qt::AlignBottom</tt>
+  (the default), the label is horizontally centered above the marker.
+
+  \see setTextAlignment, QCPItemText::setPositionAlignment
+*/
+void QCPAnnotations::setPositionAlignment(Qt::Alignment alignment)
+{
+  mPositionAlignment = alignment;
+  markLayerDirty();
+}
+
+/*!
+  Controls how (multi-lined) label texts are aligned inside their label rect (typically
+  Qt::AlignLeft, Qt::AlignCenter or Qt::AlignRight).
+
+  \see setPositionAlignment
+*/
+void QCPAnnotations::setTextAlignment(Qt::Alignment alignment)
+{
+  mTextAlignment = alignment;
+  markLayerDirty();
+}
+
+/*!
+  Sets the offset in pixels of the label anchor relative to the marker position. The default
+  offset moves the label a few pixels up, so it doesn't cover the marker.
+
+  \see setPositionAlignment
+*/
+void QCPAnnotations::setTextOffset(const QPointF &offset)
+{
+  mTextOffset = offset;
+  markLayerDirty();
+}
+
+/*!
+  Appends \a style to the style table and returns its index, which can then be used as \a
+  styleIndex of annotations.
+
+  \see setStyles
+*/
+int QCPAnnotations::addStyle(const QCPScatterStyle &style)
+{
+  mStyles.append(style);
+  markLayerDirty();
+  return mStyles.size()-1;
+}
+
+/*! \overload
+
+  Adds the annotations given by \a keys, \a values, \a texts and \a styleIndices to the current
+  data. \a texts and \a styleIndices may be empty, the annotations then have no text or style
+  index zero, respectively. Otherwise, the number of added annotations is the size of the smallest
+  vector.
+
+  If you can guarantee that the passed annotations are sorted by \a keys in ascending order, you
+  can set \a alreadySorted to true, to improve performance by saving a sorting run.
+
+  Alternatively, you can also access and modify the data directly via the \ref data method, which
+  returns a pointer to the internal data container.
+*/
+void QCPAnnotations::addData(const QVector<double> &keys, const QVector<double> &values, const QStringList &texts, const QVector<int> &styleIndices, bool alreadySorted)
+{
+  int n = qMin(keys.size(), values.size());
+  if (!texts.isEmpty())
+    n = qMin(n, texts.size());
+  if (!styleIndices.isEmpty())
+    n = qMin(n, styleIndices.size());
+  if (n != keys.size() || n != values.size() || (!texts.isEmpty() && n != texts.size()) || (!styleIndices.isEmpty() && n != styleIndices.size()))
+    qDebug() << Q_FUNC_INFO << "keys, values, texts and style indices have different sizes:" << keys.size() << values.size() << texts.size() << styleIndices.size();
+  const QVector<QString> textVector = texts.toVector();
+  addData(keys.constData(), values.constData(), textVector.isEmpty() ? nullptr : textVector.constData(), styleIndices.isEmpty() ? nullptr : styleIndices.constData(), n, alreadySorted);
+}
+
+/*! \overload
+
+  Adds the \a count annotations provided in the raw arrays \a keys, \a values, \a texts and \a
+  styleIndices to the current data. All arrays must hold at least \a count elements. \a texts and
+  \a styleIndices may be null, the annotations then have no text or style index zero,
+  respectively.
+
+  If you can guarantee that the passed annotations are sorted by \a keys in ascending order, you
+  can set \a alreadySorted to true, to improve performance by saving a sorting run. If \a
+  alreadySorted is false, the keys are checked for ascending order in a single linear pass first,
+  so that the sorting run is only performed if it is actually necessary.
+*/
+void QCPAnnotations::addData(const double *keys, const double *values, const QString *texts, const int *styleIndices, int count, bool alreadySorted)
+{
+  if (count <= 0 || !keys || !values)
+    return;
+  if (!alreadySorted)
+    alreadySorted = std::is_sorted(keys, keys+count);
+  QVector<QCPAnnotationData> tempData(count);
+  QVector<QCPAnnotationData>::iterator it = tempData.begin();
+  const QVector<QCPAnnotationData>::iterator itEnd = tempData.end();
+  while (it != itEnd)
+  {
+    it->key = *keys++;
+    it->value = *values++;
+    if (texts)
+      it->text = *texts++;
+    if (styleIndices)
+      it->styleIndex = *styleIndices++;
+    ++it;
+  }
+  mDataContainer->add(tempData, alreadySorted); // don't modify tempData beyond this to prevent copy on write
+  invalidateCaches();
+  markLayerDirty();
+}
+
+/*! \overload
+
+  Adds a single annotation at \a key and \a value with the label \a text and the marker style \a
+  styleIndex to the current data.
+
+  Alternatively, you can also access and modify the data directly via the \ref data method, which
+  returns a pointer to the internal data container.
+*/
+void QCPAnnotations::addData(double key, double value, const QString &text, int styleIndex)
+{
+  mDataContainer->add(QCPAnnotationData(key, value, text, styleIndex));
+  invalidateCaches();
+  markLayerDirty();
+}
+
+/*!
+  Discards the cached label sizes and the spatial index used for selection tests, so they are
+  rebuilt by the next replot or selection test, respectively.
+
+  This happens automatically when the data is changed via \ref setData or \ref addData, or the
+  axes or the font change. If you modify the data via the data container (\ref data) directly,
+  you must call this method afterwards.
+*/
+void QCPAnnotations::invalidateCaches()
+{
+  mLabelSizesState.clear();
+  mLabelSizes.clear();
+  mSpatialIndexState.clear();
+  mSpatialIndexGrid.clear();
+  mSpatialIndexDataIndices.clear();
+}
+
+/*!
+  Implements a selectTest specific to this plottable's point geometry. The distance is measured to
+  the closest marker position, using the spatial index of the visible annotations.
+
+  If \a details is not 0, it will be set to a \ref QCPDataSelection, describing the closest
+  annotation to \a pos.
+
+  \seebaseclassmethod \ref QCPAbstractPlottable::selectTest
+*/
+double QCPAnnotations::selectTest(const QPointF &pos, bool onlySelectable, QVariant *details) const
+{
+  if ((onlySelectable && mSelectable == QCP::stNone) || mDataContainer->isEmpty())
+    return -1;
+  if (!mKeyAxis || !mValueAxis)
+    return -1;
+
+  if (mKeyAxis.data()->axisRect()->rect().contains(pos.toPoint()) || mParentPlot->interactions().testFlag(QCP::iSelectPlottablesBeyondAxisRect))
+  {
+    updateSpatialIndex();
+    int pointIndex = -1;
+    const double result = mSpatialIndexGrid.nearest(pos, &pointIndex);
+    if (pointIndex < 0)
+      return -1;
+    if (details)
+    {
+      const int dataIndex = mSpatialIndexDataIndices.at(pointIndex);
+      details->setValue(QCPDataSelection(QCPDataRange(dataIndex, dataIndex+1)));
+    }
+    return result;
+  } else
+    return -1;
+}
+
+/*!
+  Returns the annotations whose marker positions lie inside \a rect, using the spatial index of
+  the visible annotations. If \a rect reaches beyond the axis rect in key direction, this is the
+  regular implementation of \ref QCPAbstractPlottable1D.
+
+  \seebaseclassmethod \ref QCPAbstractPlottable1D::selectTestRect
+*/
+QCPDataSelection QCPAnnotations::selectTestRect(const QRectF &rect, bool onlySelectable) const
+{
+  if ((onlySelectable && mSelectable == QCP::stNone) || mDataContainer->isEmpty() || !mKeyAxis || !mValueAxis)
+    return QCPDataSelection();
+
+  // the index only holds the annotations of the visible key range, make sure rect doesn't reach beyond it:
+  const QRectF axisRect = mKeyAxis.data()->axisRect()->rect();
+  const QRectF normRect = rect.normalized();
+  const bool withinKeyRange = mKeyAxis.data()->orientation() == Qt::Horizontal ?
+        normRect.left() >= axisRect.left() && normRect.right() <= axisRect.right() :
+        normRect.top() >= axisRect.top() && normRect.bottom() <= axisRect.bottom();
+  if (!withinKeyRange)
+    return QCPAbstractPlottable1D<QCPAnnotationData>::selectTestRect(rect, onlySelectable);
+
+  updateSpatialIndex();
+  QCPDataSelection result;
+  const QVector<int> indices = mSpatialIndexGrid.pointsInRect(normRect);
+  int segmentBegin = -1, segmentEnd = -1; // combine consecutive data indices to data ranges
+  for (int i=0; i<indices.size(); ++i)
+  {
+    const int dataIndex = mSpatialIndexDataIndices.at(indices.at(i));
+    if (segmentBegin == -1)
+    {
+      segmentBegin = dataIndex;
+    } else if (dataIndex != segmentEnd)
+    {
+      result.addDataRange(QCPDataRange(segmentBegin, segmentEnd), false);
+      segmentBegin = dataIndex;
+    }
+    segmentEnd = dataIndex+1;
+  }
+  if (segmentBegin != -1)
+    result.addDataRange(QCPDataRange(segmentBegin, segmentEnd), false);
+
+  result.simplify();
+  return result;
+}
+
+/* inherits documentation from base class */
+QCPRange QCPAnnotations::getKeyRange(bool &foundRange, QCP::SignDomain inSignDomain) const
+{
+  return mDataContainer->keyRange(foundRange, inSignDomain);
+}
+
+/* inherits documentation from base class */
+QCPRange QCPAnnotations::getValueRange(bool &foundRange, QCP::SignDomain inSignDomain, const QCPRange &inKeyRange) const
+{
+  return mDataContainer->valueRange(foundRange, inSignDomain, inKeyRange);
+}
+
+/* inherits documentation from base class */
+void QCPAnnotations::draw(QCPPainter *painter)
+{
+  if (!mKeyAxis || !mValueAxis) { qDebug() << Q_FUNC_INFO << "invalid key or value axis"; return; }
+  if (mKeyAxis.data()->range().size() <= 0 || mDataContainer->isEmpty()) return;
+
+  updateLabelSizes(painter);
+  const double markerMargin = markerExtent();
+  QCPAnnotationDataContainer::const_iterator visibleBegin, visibleEnd;
+  getVisibleDataBounds(visibleBegin, visibleEnd, markerMargin+qAbs(mTextOffset.x())+qAbs(mTextOffset.y())+mLabelExtent);
+  if (visibleBegin == visibleEnd)
+    return;
+
+  const QRectF clip = clipRect();
+  const QRectF markerClip = clip.adjusted(-markerMargin, -markerMargin, markerMargin, markerMargin);
+  QVector<QVector<QPointF> > markers(mStyles.size()); // marker positions per style, so each style is set up only once
+  QVector<QRectF> labelRects;
+  QStringList labelTexts;
+
+  // loop over and draw segments of unselected/selected data:
+  QList<QCPDataRange> selectedSegments, unselectedSegments, allSegments;
+  getDataSegments(selectedSegments, unselectedSegments);
+  allSegments << unselectedSegments << selectedSegments;
+  for (int i=0; i<allSegments.size(); ++i)
+  {
+    const bool isSelectedSegment = i >= unselectedSegments.size();
+    QCPAnnotationDataContainer::const_iterator begin = visibleBegin;
+    QCPAnnotationDataContainer::const_iterator end = visibleEnd;
+    mDataContainer->limitIteratorsToDataRange(begin, end, allSegments.at(i));
+    if (begin == end)
+      continue;
+
+    // collect the visible markers and labels:
+    for (int s=0; s<markers.size(); ++s)
+      markers[s].clear();
+    labelRects.clear();
+    labelTexts.clear();
+    for (QCPAnnotationDataContainer::const_iterator it=begin; it!=end; ++it)
+    {
+      const QPointF pos = coordsToPixels(it->key, it->value);
+      if (qIsNaN(pos.x()) || qIsNaN(pos.y()))
+        continue;
+      const int styleIndex = effectiveStyleIndex(it->styleIndex);
+      if (styleIndex >= 0 && markerClip.contains(pos))
+        markers[styleIndex].append(pos);
+      if (!it->text.isEmpty())
+      {
+        const QRectF rect = labelRect(pos, mLabelSizes.at(int(it-mDataContainer->constBegin())));
+        if (rect.intersects(clip))
+        {
+          labelRects.append(rect);
+          labelTexts.append(it->text);
+        }
+      }
+    }
+
+    // draw markers, one batch per style:
+    for (int s=0; s<markers.size(); ++s)
+    {
+      if (markers.at(s).isEmpty())
+        continue;
+      QCPScatterStyle finalStyle = mStyles.at(s);
+      if (isSelectedSegment && mSelectionDecorator)
+        finalStyle = mSelectionDecorator->getFinalScatterStyle(mStyles.at(s));
+      if (!finalStyle.isNone())
+        drawMarkers(painter, markers.at(s), finalStyle);
+    }
+
+    // draw labels:
+    if (!labelRects.isEmpty())
+      drawLabels(painter, labelRects, labelTexts, isSelectedSegment && mSelectionDecorator ? mSelectionDecorator->pen().color() : mTextColor);
+  }
+
+  // draw other selection decoration that isn't just scatter pens and text colors:
+  if (mSelectionDecorator)
+    mSelectionDecorator->drawDecoration(painter, selection());
+}
+
+/* inherits documentation from base class */
+void QCPAnnotations::drawLegendIcon(QCPPainter *painter, const QRectF &rect) const
+{
+  if (mStyles.isEmpty() || mStyles.first().isNone())
+    return;
+  const QCPScatterStyle &style = mStyles.first();
+  applyScattersAntialiasingHint(painter);
+  // scale scatter pixmap if it's too large to fit in legend icon rect:
+  if (style.shape() == QCPScatterStyle::ssPixmap && (style.pixmap().size().width() > rect.width() || style.pixmap().size().height() > rect.height()))
+  {
+    QCPScatterStyle scaledStyle(style);
+    scaledStyle.setPixmap(scaledStyle.pixmap().scaled(rect.size().toSize(), Qt::KeepAspectRatio, Qt::SmoothTransformation));
+    scaledStyle.applyTo(painter, mPen);
+    scaledStyle.drawShape(painter, QRectF(rect).center());
+  } else
+  {
+    style.applyTo(painter, mPen);
+    style.drawShape(painter, QRectF(rect).center());
+  }
+}
+
+/*!  \internal
+
+  Draws the markers at the pixel \a positions with the marker \a style. This is called once per
+  style and data segment.
+
+  \see drawLabels
+*/
+void QCPAnnotations::drawMarkers(QCPPainter *painter, const QVector<QPointF> &positions, const QCPScatterStyle &style) const
+{
+  applyScattersAntialiasingHint(painter);
+  style.applyTo(painter, mPen);
+  style.drawShapes(painter, positions, mParentPlot->plottingHints().testFlag(QCP::phCacheScatters));
+}
+
+/*!  \internal
+
+  Draws the label \a texts into the pixel \a rects with the text \a color. \a rects and \a texts
+  have the same size. This is called once per data segment.
+
+  \see drawMarkers
+*/
+void QCPAnnotations::drawLabels(QCPPainter *painter, const QVector<QRectF> &rects, const QStringList &texts, const QColor &color) const
+{
+  applyDefaultAntialiasingHint(painter);
+  painter->setFont(mFont);
+  painter->setPen(QPen(color));
+  painter->setBrush(Qt::NoBrush);
+  for (int i=0; i<rects.size(); ++i)
+    painter->drawText(rects.at(i), Qt::TextDontClip|mTextAlignment, texts.at(i));
+}
+
+/*!  \internal
+
+  Returns the range of annotations that may be visible, in \a begin and \a end. The visible key
+  range of the key axis is extended by \a pixelMargin pixels on both sides, so markers and labels
+  reaching into the axis rect from outside are included.
+*/
+void QCPAnnotations::getVisibleDataBounds(QCPAnnotationDataContainer::const_iterator &begin, QCPAnnotationDataContainer::const_iterator &end, double pixelMargin) const
+{
+  QCPAxis *keyAxis = mKeyAxis.data();
+  if (!keyAxis) { qDebug() << Q_FUNC_INFO << "invalid key axis"; begin = end = mDataContainer->constEnd(); return; }
+  const double lowerPixel = keyAxis->coordToPixel(keyAxis->range().lower);
+  const double upperPixel = keyAxis->coordToPixel(keyAxis->range().upper);
+  const double direction = upperPixel >= lowerPixel ? 1 : -1;
+  double lowerKey = keyAxis->pixelToCoord(lowerPixel-direction*pixelMargin);
+  double upperKey = keyAxis->pixelToCoord(upperPixel+direction*pixelMargin);
+  if (lowerKey > upperKey)
+    qSwap(lowerKey, upperKey);
+  begin = mDataContainer->findBegin(lowerKey, false);
+  end = mDataContainer->findEnd(upperKey, false);
+}
+
+/*!  \internal
+
+  Returns the index in the style table that is used for an annotation with the given \a
+  styleIndex, i.e. \a styleIndex itself if it is valid and zero otherwise. Returns -1 if the style
+  table is empty.
+*/
+int QCPAnnotations::effectiveStyleIndex(int styleIndex) const
+{
+  if (styleIndex >= 0 && styleIndex < mStyles.size())
+    return styleIndex;
+  return mStyles.isEmpty() ? -1 : 0;
+}
+
+/*!  \internal
+
+  Returns how far in pixels the largest marker of the style table reaches from its position.
+*/
+double QCPAnnotations::markerExtent() const
+{
+  double result = 0;
+  for (int i=0; i<mStyles.size(); ++i)
+  {
+    const QCPScatterStyle &style = mStyles.at(i);
+    double size = style.size();
+    if (style.shape() == QCPScatterStyle::ssPixmap)
+      size = qMax(size, double(qMax(style.pixmap().width(), style.pixmap().height())));
+    result = qMax(result, size/2.0+qMax(1.0, style.pen().widthF()));
+  }
+  return result;
+}
+
+/*!  \internal
+
+  Returns the pixel rect of a label with the given \a size, whose marker is at \a anchor. The rect
+  is placed according to \ref setPositionAlignment and \ref setTextOffset.
+*/
+QRectF QCPAnnotations::labelRect(const QPointF &anchor, const QSize &size) const
+{
+  QPointF topLeft = anchor+mTextOffset;
+  if (mPositionAlignment.testFlag(Qt::AlignHCenter))
+    topLeft.rx() -= size.width()/2.0;
+  else if (mPositionAlignment.testFlag(Qt::AlignRight))
+    topLeft.rx() -= size.width();
+  if (mPositionAlignment.testFlag(Qt::AlignVCenter))
+    topLeft.ry() -= size.height()/2.0;
+  else if (mPositionAlignment.testFlag(Qt::AlignBottom))
+    topLeft.ry() -= size.height();
+  return QRectF(topLeft, QSizeF(size));
+}
+
+/*!  \internal
+
+  Measures the label sizes of all annotations with the font metrics of \a painter, unless they are
+  still valid from a previous call, i.e. the data container, the font, the text alignment and the
+  resolution of the paint device didn't change. Also determines the largest label extent, which
+  widens the key range of annotations considered by \ref draw.
+
+  Identical texts are only measured once, which is common for annotations of the same kind.
+
+  \see invalidateCaches
+*/
+void QCPAnnotations::updateLabelSizes(QCPPainter *painter) const
+{
+  QVector<double> state;
+  state << double(quintptr(mDataContainer.data())) << mDataContainer->size() << int(mTextAlignment)
+        << (painter->device() ? painter->device()->logicalDpiX() : 0) << (painter->device() ? painter->device()->logicalDpiY() : 0);
+  if (state == mLabelSizesState && mFont == mLabelSizesFont)
+    return;
+  mLabelSizesState = state;
+  mLabelSizesFont = mFont;
+
+  painter->setFont(mFont);
+  const QFontMetrics metrics = painter->fontMetrics();
+  QHash<QString, QSize> measured;
+  mLabelSizes.resize(mDataContainer->size());
+  mLabelExtent = 0;
+  int i = 0;
+  for (QCPAnnotationDataContainer::const_iterator it=mDataContainer->constBegin(); it!=mDataContainer->constEnd(); ++it, ++i)
+  {
+    if (it->text.isEmpty())
+    {
+      mLabelSizes[i] = QSize(0, 0);
+      continue;
+    }
+    QHash<QString, QSize>::const_iterator cached = measured.constFind(it->text);
+    if (cached == measured.constEnd())
+    {
+      const QSize size = metrics.boundingRect(0, 0, 0, 0, Qt::TextDontClip|mTextAlignment, it->text).size();
+      cached = measured.insert(it->text, size);
+      mLabelExtent = qMax(mLabelExtent, qMax(size.width(), size.height()));
+    }
+    mLabelSizes[i] = cached.value();
+  }
+}
+
+/*! \internal
+
+  Rebuilds the spatial index of the visible marker positions, unless it is still valid, i.e. the
+  axis ranges and scale types, the axis rect geometry, the data container and the selection
+  tolerance didn't change since it was built.
+
+  \see invalidateCaches
+*/
+void QCPAnnotations::updateSpatialIndex() const
+{
+  QCPAxis *keyAxis = mKeyAxis.data();
+  QCPAxis *valueAxis = mValueAxis.data();
+  if (!keyAxis || !valueAxis) { qDebug() << Q_FUNC_INFO << "invalid key or value axis"; return; }
+
+  const QRect axisRect = keyAxis->axisRect()->rect();
+  QVector<double> state;
+  state << keyAxis->range().lower << keyAxis->range().upper << keyAxis->rangeReversed() << keyAxis->scaleType() << keyAxis->orientation()
+        << valueAxis->range().lower << valueAxis->range().upper << valueAxis->rangeReversed() << valueAxis->scaleType()
+        << axisRect.left() << axisRect.top() << axisRect.width() << axisRect.height()
+        << double(quintptr(mDataContainer.data())) << mDataContainer->size() << mParentPlot->selectionTolerance();
+  if (state == mSpatialIndexState)
+    return;
+  mSpatialIndexState = state;
+
+  // pixel positions of the markers in the visible key range, and their data indices:
+  QCPAnnotationDataContainer::const_iterator begin, end;
+  getVisibleDataBounds(begin, end, mParentPlot->selectionTolerance());
+  QVector<QPointF> points;
+  points.reserve(int(end-begin));
+  mSpatialIndexDataIndices.clear();
+  mSpatialIndexDataIndices.reserve(int(end-begin));
+  for (QCPAnnotationDataContainer::const_iterator it=begin; it!=end; ++it)
+  {
+    const QPointF pos = coordsToPixels(it->key, it->value);
+    if (qIsNaN(pos.x()) || qIsNaN(pos.y()))
+      continue;
+    points.append(pos);
+    mSpatialIndexDataIndices.append(int(it-mDataContainer->constBegin()));
+  }
+  mSpatialIndexGrid.build(axisRect, qMax(1, mParentPlot->selectionTolerance()), points);
+}
@@ -0,0 +1,161 @@
+/***************************************************************************
+**                                                                        **
+**  QCustomPlot, an easy to use, modern plotting widget for Qt            **
+**  Copyright (C) 2011-2021 Emanuel Eichhammer                            **
+**                                                                        **
+**  This program is free software: you can redistribute it and/or modify  **
+**  it under the terms of the GNU General Public License as published by  **
+**  the Free Software Foundation, either version 3 of the License, or     **
+**  (at your option) any later version.                                   **
+**                                                                        **
+**  This program is distributed in the hope that it will be useful,       **
+**  but WITHOUT ANY WARRANTY; without even the implied warranty of        **
+**  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         **
+**  GNU General Public License for more details.                          **
+**                                                                        **
+**  You should have received a copy of the GNU General Public License     **
+**  along with this program.  If not, see http://www.gnu.org/licenses/.   **
+**                                                                        **
+****************************************************************************
+**           Author: Emanuel Eichhammer                                   **
+**  Website/Contact: http://www.qcustomplot.com/                          **
+**             Date: 29.03.21                                             **
+**          Version: 2.1.0                                                **
+****************************************************************************/
+/*! \file */
+#ifndef QCP_PLOTTABLE_ANNOTATIONS_H
+#define QCP_PLOTTABLE_ANNOTATIONS_H
+
+#include "../global.h"
+#include "../axis/range.h"
+#include "../plottable1d.h"
+#include "../painter.h"
+#include "../datacontainer.h"
+#include "../scatterstyle.h"
+#include "../pixelgrid.h"
+
+class QCPPainter;
+class QCPAxis;
+
+class QCP_LIB_DECL QCPAnnotationData
+{
+public:
+  QCPAnnotationData();
+  QCPAnnotationData(double key, double value, const QString &text=QString(), int styleIndex=0);
+
+  inline double sortKey() const { return key; }
+  inline static QCPAnnotationData fromSortKey(double sortKey) { return QCPAnnotationData(sortKey, 0); }
+  inline static bool sortKeyIsMainKey() { return true; }
+
+  inline double mainKey() const { return key; }
+  inline double mainValue() const { return value; }
+
+  inline QCPRange valueRange() const { return QCPRange(value, value); }
+
+  double key, value;
+  QString text;
+  int styleIndex;
+};
+Q_DECLARE_TYPEINFO(QCPAnnotationData, Q_MOVABLE_TYPE);
+
+
+/*! \typedef QCPAnnotationDataContainer
+
+  Container for storing \ref QCPAnnotationData points. The data is stored sorted by \a key.
+
+  This template instantiation is the container in which QCPAnnotations holds its data. For details
+  about the generic container, see the documentation of the class template \ref QCPDataContainer.
+
+  \see QCPAnnotationData, QCPAnnotations::setData
+*/
+typedef QCPDataContainer<QCPAnnotationData> QCPAnnotationDataContainer;
+
+class QCP_LIB_DECL QCPAnnotations : public QCPAbstractPlottable1D<QCPAnnotationData>
+{
+  Q_OBJECT
+  /// \cond INCLUDE_QPROPERTIES
+  Q_PROPERTY(QFont font READ font WRITE setFont)
+  Q_PROPERTY(QColor textColor READ textColor WRITE setTextColor)
+  Q_PROPERTY(Qt::Alignment positionAlignment READ positionAlignment WRITE setPositionAlignment)
+  Q_PROPERTY(Qt::Alignment textAlignment READ textAlignment WRITE setTextAlignment)
+  Q_PROPERTY(QPointF textOffset READ textOffset WRITE setTextOffset)
+  /// \endcond
+public:
+  explicit QCPAnnotations(QCPAxis *keyAxis, QCPAxis *valueAxis);
+  virtual ~QCPAnnotations() Q_DECL_OVERRIDE;
+
+  // getters:
+  QSharedPointer<QCPAnnotationDataContainer> data() const { return mDataContainer; }
+  QVector<QCPScatterStyle> styles() const { return mStyles; }
+  QCPScatterStyle style(int index) const;
+  int styleCount() const { return mStyles.size(); }
+  QFont font() const { return mFont; }
+  QColor textColor() const { return mTextColor; }
+  Qt::Alignment positionAlignment() const { return mPositionAlignment; }
+  Qt::Alignment textAlignment() const { return mTextAlignment; }
+  QPointF textOffset() const { return mTextOffset; }
+
+  // setters:
+  void setData(QSharedPointer<QCPAnnotationDataContainer> data);
+  void setData(const QVector<double> &keys, const QVector<double> &values, const QStringList &texts=QStringList(), const QVector<int> &styleIndices=QVector<int>(), bool alreadySorted=false);
+  void setData(const double *keys, const double *values, const QString *texts, const int *styleIndices, int count, bool alreadySorted=false);
+  void setStyles(const QVector<QCPScatterStyle> &styles);
+  void setStyle(int index, const QCPScatterStyle &style);
+  void setFont(const QFont &font);
+  void setTextColor(const QColor &color);
+  void setPositionAlignment(Qt::Alignment alignment);
+  void setTextAlignment(Qt::Alignment alignment);
+  void setTextOffset(const QPointF &offset);
+
+  // non-property methods:
+  int addStyle(const QCPScatterStyle &style);
+  void addData(const QVector<double> &keys, const QVector<double> &values, const QStringList &texts=QStringList(), const QVector<int> &styleIndices=QVector<int>(), bool alreadySorted=false);
+  void addData(const double *keys, const double *values, const QString *texts, const int *styleIndices, int count, bool alreadySorted=false);
+  void addData(double key, double value, const QString &text=QString(), int styleIndex=0);
+  void invalidateCaches();
+
+  // reimplemented virtual methods:
+  virtual double selectTest(const QPointF &pos, bool onlySelectable, QVariant *details=nullptr) const Q_DECL_OVERRIDE;
+  virtual QCPDataSelection selectTestRect(const QRectF &rect, bool onlySelectable) const Q_DECL_OVERRIDE;
+  virtual QCPRange getKeyRange(bool &foundRange, QCP::SignDomain inSignDomain=QCP::sdBoth) const Q_DECL_OVERRIDE;
+  virtual QCPRange getValueRange(bool &foundRange, QCP::SignDomain inSignDomain=QCP::sdBoth, const QCPRange &inKeyRange=QCPRange()) const Q_DECL_OVERRIDE;
+
+protected:
+  // property members:
+  QVector<QCPScatterStyle> mStyles;
+  QFont mFont;
+  QColor mTextColor;
+  Qt::Alignment mPositionAlignment;
+  Qt::Alignment mTextAlignment;
+  QPointF mTextOffset;
+
+  // non-property members:
+  mutable QVector<QSize> mLabelSizes;
+  mutable QVector<double> mLabelSizesState;
+  mutable QFont mLabelSizesFont;
+  mutable int mLabelExtent;
+  mutable QCPPixelGrid mSpatialIndexGrid;
+  mutable QVector<double> mSpatialIndexState;
+  mutable QVector<int> mSpatialIndexDataIndices;
+
+  // reimplemented virtual methods:
+  virtual void draw(QCPPainter *painter) Q_DECL_OVERRIDE;
+  virtual void drawLegendIcon(QCPPainter *painter, const QRectF &rect) const Q_DECL_OVERRIDE;
+
+  // introduced virtual methods:
+  virtual void drawMarkers(QCPPainter *painter, const QVector<QPointF> &positions, const QCPScatterStyle &style) const;
+  virtual void drawLabels(QCPPainter *painter, const QVector<QRectF> &rects, const QStringList &texts, const QColor &color) const;
+
+  // non-virtual methods:
+  void getVisibleDataBounds(QCPAnnotationDataContainer::const_iterator &begin, QCPAnnotationDataContainer::const_iterator &end, double pixelMargin) const;
+  int effectiveStyleIndex(int styleIndex) const;
+  double markerExtent() const;
+  QRectF labelRect(const QPointF &anchor, const QSize &size) const;
+  void updateLabelSizes(QCPPainter *painter) const;
+  void updateSpatialIndex() const;
+
+  friend class QCustomPlot;
+  friend class QCPLegend;
+};
+
+#endif // QCP_PLOTTABLE_ANNOTATIONS_H
@@ -125,6 +125,11 @@ QCPBarsGroup::~QCPBarsGroup()
 void QCPBarsGroup::setSpacingType(SpacingType spacingType)
 {
   mSpacingType = spacingType;
+  foreach (QCPBars *bars, mBars)
+  {
+    if (bars->layer())
+      bars->layer()->markDirty();
+  }
 }
 
 /*!
@@ -136,6 +141,11 @@ void QCPBarsGroup::setSpacingType(SpacingType spacingType)
 void QCPBarsGroup::setSpacing(double spacing)
 {
   mSpacing = spacing;
+  foreach (QCPBars *bars, mBars)
+  {
+    if (bars->layer())
+      bars->layer()->markDirty();
+  }
 }
 
 /*!
@@ -523,7 +533,8 @@ QCPBars::QCPBars(QCPAxis *keyAxis, QCPAxis *valueAxis) :
   mWidthType(wtPlotCoords),
   mBarsGroup(nullptr),
   mBaseValue(0),
-  mStackingGap(1)
+  mStackingGap(1),
+  mStackedTopsBaseValue(0)
 {
   // modify inherited properties from abstract plottable:
   mPen.setColor(Qt::blue);
@@ -558,6 +569,8 @@ QCPBars::~QCPBars()
 void QCPBars::setData(QSharedPointer<QCPBarsDataContainer> data)
 {
   mDataContainer = data;
+  invalidateStacking();
+  markLayerDirty();
 }
 
 /*! \overload
@@ -575,6 +588,28 @@ void QCPBars::setData(const QVector<double> &keys, const QVector<double> &values
 {
   mDataContainer->clear();
   addData(keys, values, alreadySorted);
+  invalidateStacking();
+  markLayerDirty();
+}
+
+/*! \overload
+  
+  Replaces the current data with the key/value pairs held by \a columns.
+  
+  Since \ref QCPDataColumns keeps its data sorted by key, the points are transferred into the
+  data container in a single pass, without sorting or per-point insertion. This is the preferred
+  way to hand over large data sets that are available as separate key and value arrays.
+  
+  The points are copied: the plottable draws from its own data container and doesn't refer to \a
+  columns afterwards, so \a columns can be discarded once the data is set.
+  
+  \see QCPDataColumns
+*/
+void QCPBars::setData(const QCPDataColumns &columns)
+{
+  mDataContainer->set(columns.toDataVector<QCPBarsData>(), true);
+  invalidateStacking();
+  markLayerDirty();
 }
 
 /*!
@@ -586,6 +621,7 @@ void QCPBars::setData(const QVector<double> &keys, const QVector<double> &values
 void QCPBars::setWidth(double width)
 {
   mWidth = width;
+  markLayerDirty();
 }
 
 /*!
@@ -599,6 +635,7 @@ void QCPBars::setWidth(double width)
 void QCPBars::setWidthType(QCPBars::WidthType widthType)
 {
   mWidthType = widthType;
+  markLayerDirty();
 }
 
 /*!
@@ -616,6 +653,7 @@ void QCPBars::setBarsGroup(QCPBarsGroup *barsGroup)
   // register at new group:
   if (mBarsGroup)
     mBarsGroup->registerBars(this);
+  markLayerDirty();
 }
 
 /*!
@@ -633,6 +671,8 @@ void QCPBars::setBarsGroup(QCPBarsGroup *barsGroup)
 void QCPBars::setBaseValue(double baseValue)
 {
   mBaseValue = baseValue;
+  invalidateStacking();
+  markLayerDirty();
 }
 
 /*!
@@ -643,6 +683,7 @@ void QCPBars::setBaseValue(double baseValue)
 void QCPBars::setStackingGap(double pixels)
 {
   mStackingGap = pixels;
+  markLayerDirty();
 }
 
 /*! \overload
@@ -674,6 +715,8 @@ void QCPBars::addData(const QVector<double> &keys, const QVector<double> &values
     ++i;
   }
   mDataContainer->add(tempData, alreadySorted); // don't modify tempData beyond this to prevent copy on write
+  invalidateStacking();
+  markLayerDirty();
 }
 
 /*! \overload
@@ -685,6 +728,8 @@ void QCPBars::addData(const QVector<double> &keys, const QVector<double> &values
 void QCPBars::addData(double key, double value)
 {
   mDataContainer->add(QCPBarsData(key, value));
+  invalidateStacking();
+  markLayerDirty();
 }
 
 /*!
@@ -753,6 +798,24 @@ void QCPBars::moveAbove(QCPBars *bars)
   }
 }
 
+/*!
+  Discards the cached stacking of this bars plottable and all bars stacked above it, so the base
+  values of the stacked bars are recalculated when they are needed next.
+  
+  The base values of all bars in a stack (see \ref moveAbove, \ref moveBelow) are accumulated
+  once for the whole stack and then reused by drawing, selection tests and range calculations,
+  until the data of a bars plottable in the stack changes. This happens automatically when the
+  data is changed via \ref setData or \ref addData, bars are moved within the stack or the base
+  value changes. A changed number of data points in a data container is detected at the start of
+  the next drawing, selection test or range calculation. If you modify the keys
+  or values via the data container (\ref data) directly, you must call this method afterwards.
+*/
+void QCPBars::invalidateStacking()
+{
+  for (QCPBars *bars = this; bars; bars = bars->mBarAbove.data())
+    bars->mStackedTopsState.clear();
+}
+
 /*!
   \copydoc QCPPlottableInterface1D::selectTestRect
 */
@@ -764,6 +827,7 @@ QCPDataSelection QCPBars::selectTestRect(const QRectF &rect, bool onlySelectable
   if (!mKeyAxis || !mValueAxis)
     return result;
   
+  prepareStacking();
   QCPBarsDataContainer::const_iterator visibleBegin, visibleEnd;
   getVisibleDataBounds(visibleBegin, visibleEnd);
   
@@ -794,6 +858,7 @@ double QCPBars::selectTest(const QPointF &pos, bool onlySelectable, QVariant *de
   
   if (mKeyAxis.data()->axisRect()->rect().contains(pos.toPoint()) || mParentPlot->interactions().testFlag(QCP::iSelectPlottablesBeyondAxisRect))
   {
+    prepareStacking();
     // get visible data range:
     QCPBarsDataContainer::const_iterator visibleBegin, visibleEnd;
     getVisibleDataBounds(visibleBegin, visibleEnd);
@@ -869,6 +934,7 @@ QCPRange QCPBars::getValueRange(bool &foundRange, QCP::SignDomain inSignDomain,
     itBegin = mDataContainer->findBegin(inKeyRange.lower, false);
     itEnd = mDataContainer->findEnd(inKeyRange.upper, false);
   }
+  prepareStacking();
   for (QCPBarsDataContainer::const_iterator it = itBegin; it != itEnd; ++it)
   {
     const double current = it->value + getStackedBaseValue(it->key, it->value >= 0);
@@ -901,6 +967,7 @@ QPointF QCPBars::dataPixelPosition(int index) const
     QCPAxis *valueAxis = mValueAxis.data();
     if (!keyAxis || !valueAxis) { qDebug() << Q_FUNC_INFO << "invalid key or value axis"; return {}; }
     
+    prepareStacking();
     const QCPDataContainer<QCPBarsData>::const_iterator it = mDataContainer->constBegin()+index;
     const double valuePixel = valueAxis->coordToPixel(getStackedBaseValue(it->key, it->value >= 0) + it->value);
     const double keyPixel = keyAxis->coordToPixel(it->key) + (mBarsGroup ? mBarsGroup->keyPixelOffset(this, it->key) : 0);
@@ -921,6 +988,7 @@ void QCPBars::draw(QCPPainter *painter)
   if (!mKeyAxis || !mValueAxis) { qDebug() << Q_FUNC_INFO << "invalid key or value axis"; return; }
   if (mDataContainer->isEmpty()) return;
   
+  prepareStacking();
   QCPBarsDataContainer::const_iterator visibleBegin, visibleEnd;
   getVisibleDataBounds(visibleBegin, visibleEnd);
   
@@ -1136,34 +1204,167 @@ void QCPBars::getPixelWidth(double key, double &lower, double &upper) const
   positive and negative bars are separated per stack (positive are stacked above baseValue upwards,
   negative are stacked below baseValue downwards). This can be indicated with \a positive. So if the
   bar for which we need the base value is negative, set \a positive to false.
+  
+  The base value is looked up in the cached stack tops of the bars below (see \ref stackedTops), so
+  this takes a single binary search, independent of the depth of the stack. The tops aren't
+  validated against the data of the stack here, this is done once per pass by \ref
+  prepareStacking. They are only recalculated here if they were invalidated (\ref
+  invalidateStacking) since.
 */
 double QCPBars::getStackedBaseValue(double key, bool positive) const
 {
   if (mBarBelow)
   {
-    double max = 0; // don't initialize with mBaseValue here because only base value of bottom-most bar has meaning in a bar stack
-    // find bars of mBarBelow that are approximately at key and find largest one:
+    const QCPBars *barBelow = mBarBelow.data();
+    if (barBelow->mStackedTopsState.isEmpty()) // invalidated since the last prepareStacking call
+      barBelow->updateStackedTops();
+    const QVector<StackedTop> &tops = barBelow->mStackedTops;
+    // find the stack top that is approximately at key:
     double epsilon = qAbs(key)*(sizeof(key)==4 ? 1e-6 : 1e-14); // should be safe even when changed to use float at some point
     if (key == 0)
       epsilon = (sizeof(key)==4 ? 1e-6 : 1e-14);
-    QCPBarsDataContainer::const_iterator it = mBarBelow.data()->mDataContainer->findBegin(key-epsilon);
-    QCPBarsDataContainer::const_iterator itEnd = mBarBelow.data()->mDataContainer->findEnd(key+epsilon);
-    while (it != itEnd)
+    int low = 0, high = tops.size(); // binary search for the first top with key > key-epsilon
+    while (low < high)
     {
-      if (it->key > key-epsilon && it->key < key+epsilon)
-      {
-        if ((positive && it->value > max) ||
-            (!positive && it->value < max))
-          max = it->value;
-      }
-      ++it;
+      const int middle = (low+high)/2;
+      if (tops.at(middle).key > key-epsilon)
+        high = middle;
+      else
+        low = middle+1;
     }
-    // recurse down the bar-stack to find the total height:
-    return max + mBarBelow.data()->getStackedBaseValue(key, positive);
+    if (low < tops.size() && tops.at(low).key < key+epsilon)
+      return positive ? tops.at(low).positive : tops.at(low).negative;
+    return barBelow->mStackedTopsBaseValue; // no bars below at this key
   } else
     return mBaseValue;
 }
 
+/*! \internal
+  
+  Makes sure the stack tops of the bars below this bars plottable (\ref stackedTops) are up to
+  date. This walks the stack once, so it is called once at the start of each pass over the data
+  (drawing, selection tests and range calculations), before the base values of the individual bars
+  are looked up with \ref getStackedBaseValue.
+*/
+void QCPBars::prepareStacking() const
+{
+  if (mBarBelow)
+    mBarBelow.data()->stackedTops();
+}
+
+/*! \internal
+  
+  Returns the tops of the bar stack up to and including this bars plottable, i.e. the values where
+  the bars stacked directly above this one start. There is one entry per distinct key of this and
+  all bars below, sorted by key, holding the top of the positive and of the negative bars.
+  
+  The tops are calculated once for the whole stack and then cached, until the stack or the data of
+  any bars in it changes (see \ref invalidateStacking).
+*/
+const QVector<QCPBars::StackedTop> &QCPBars::stackedTops() const
+{
+  if (!stackedTopsValid())
+    updateStackedTops();
+  return mStackedTops;
+}
+
+/*! \internal
+  
+  Returns whether the cached stack tops (\ref stackedTops) are still valid. They become invalid
+  when \ref invalidateStacking was called, or the bars below, their data containers, the number of
+  data points in them, or the base value of the bottom-most bars have changed since the tops were
+  calculated.
+*/
+bool QCPBars::stackedTopsValid() const
+{
+  int i = 0;
+  const QCPBars *bars = this;
+  while (true)
+  {
+    if (i+3 > mStackedTopsState.size() ||
+        mStackedTopsState.at(i) != quintptr(bars) ||
+        mStackedTopsState.at(i+1) != quintptr(bars->mDataContainer.data()) ||
+        mStackedTopsState.at(i+2) != quintptr(bars->mDataContainer->size()))
+      return false;
+    i += 3;
+    if (!bars->mBarBelow)
+      break;
+    bars = bars->mBarBelow.data();
+  }
+  return i == mStackedTopsState.size() && mStackedTopsBaseValue == bars->mBaseValue;
+}
+
+/*! \internal
+  
+  Calculates the stack tops (\ref stackedTops) of this bars plottable, by adding the largest
+  positive and the smallest negative value at each key to the tops of the bars below. This takes a
+  single merging pass over the data and the tops of the bars below, which are updated first if
+  necessary. Keys that are approximately equal are treated as the same key, like in \ref
+  getStackedBaseValue.
+*/
+void QCPBars::updateStackedTops() const
+{
+  QVector<StackedTop> belowTops;
+  double baseValue = mBaseValue;
+  if (mBarBelow)
+  {
+    belowTops = mBarBelow.data()->stackedTops();
+    baseValue = mBarBelow.data()->mStackedTopsBaseValue;
+  }
+  
+  mStackedTops.clear();
+  mStackedTops.reserve(mDataContainer->size()+belowTops.size());
+  QCPBarsDataContainer::const_iterator it = mDataContainer->constBegin();
+  const QCPBarsDataContainer::const_iterator itEnd = mDataContainer->constEnd();
+  int belowIndex = 0;
+  while (it != itEnd || belowIndex < belowTops.size())
+  {
+    // the next key is the smaller one of the next data point and the next top below:
+    StackedTop top;
+    if (it != itEnd && (belowIndex >= belowTops.size() || it->key <= belowTops.at(belowIndex).key))
+      top.key = it->key;
+    else
+      top.key = belowTops.at(belowIndex).key;
+    double epsilon = qAbs(top.key)*(sizeof(top.key)==4 ? 1e-6 : 1e-14);
+    if (top.key == 0)
+      epsilon = (sizeof(top.key)==4 ? 1e-6 : 1e-14);
+    // the base at this key is the top below, if there is one:
+    top.positive = baseValue;
+    top.negative = baseValue;
+    if (belowIndex < belowTops.size() && belowTops.at(belowIndex).key < top.key+epsilon)
+    {
+      top.positive = belowTops.at(belowIndex).positive;
+      top.negative = belowTops.at(belowIndex).negative;
+      ++belowIndex;
+    }
+    // add the largest positive and the smallest negative value of this bars at this key:
+    double max = 0, min = 0;
+    while (it != itEnd && it->key < top.key+epsilon)
+    {
+      if (it->value > max)
+        max = it->value;
+      else if (it->value < min)
+        min = it->value;
+      ++it;
+    }
+    top.positive += max;
+    top.negative += min;
+    mStackedTops.append(top);
+  }
+  
+  // remember what the tops were calculated from, see stackedTopsValid:
+  mStackedTopsState.clear();
+  const QCPBars *bars = this;
+  while (true)
+  {
+    mStackedTopsState << quintptr(bars) << quintptr(bars->mDataContainer.data()) << quintptr(bars->mDataContainer->size());
+    if (!bars->mBarBelow)
+      break;
+    bars = bars->mBarBelow.data();
+  }
+  mStackedTopsBaseValue = baseValue;
+}
+
 /*! \internal
 
   Connects \a below and \a above to each other via their mBarAbove/mBarBelow properties. The bar(s)
@@ -1171,11 +1372,14 @@ double QCPBars::getStackedBaseValue(double key, bool positive) const
   
   If lower is zero, upper will be disconnected at the bottom.
   If upper is zero, lower will be disconnected at the top.
+  
+  The stacking of the bars that get a new bar below them is invalidated (\ref invalidateStacking).
 */
 void QCPBars::connectBars(QCPBars *lower, QCPBars *upper)
 {
   if (!lower && !upper) return;
   
+  QCPBars *disconnectedAbove = nullptr; // old bar above lower, which loses its bar below
   if (!lower) // disconnect upper at bottom
   {
     // disconnect old bar below upper:
@@ -1186,19 +1390,29 @@ void QCPBars::connectBars(QCPBars *lower, QCPBars *upper)
   {
     // disconnect old bar above lower:
     if (lower->mBarAbove && lower->mBarAbove.data()->mBarBelow.data() == lower)
-      lower->mBarAbove.data()->mBarBelow = nullptr;
+    {
+      disconnectedAbove = lower->mBarAbove.data();
+      disconnectedAbove->mBarBelow = nullptr;
+    }
     lower->mBarAbove = nullptr;
   } else // connect lower and upper
   {
     // disconnect old bar above lower:
     if (lower->mBarAbove && lower->mBarAbove.data()->mBarBelow.data() == lower)
-      lower->mBarAbove.data()->mBarBelow = nullptr;
+    {
+      disconnectedAbove = lower->mBarAbove.data();
+      disconnectedAbove->mBarBelow = nullptr;
+    }
     // disconnect old bar below upper:
     if (upper->mBarBelow && upper->mBarBelow.data()->mBarAbove.data() == upper)
       upper->mBarBelow.data()->mBarAbove = nullptr;
     lower->mBarAbove = upper;
     upper->mBarBelow = lower;
   }
+  if (disconnectedAbove && disconnectedAbove != upper)
+    disconnectedAbove->invalidateStacking();
+  if (upper)
+    upper->invalidateStacking();
 }
 
 
@@ -30,6 +30,7 @@
 #include "../axis/range.h"
 #include "../plottable1d.h"
 #include "../datacontainer.h"
+#include "../datacolumns.h"
 
 class QCPPainter;
 class QCPAxis;
@@ -172,6 +173,7 @@ public:
   // setters:
   void setData(QSharedPointer<QCPBarsDataContainer> data);
   void setData(const QVector<double> &keys, const QVector<double> &values, bool alreadySorted=false);
+  void setData(const QCPDataColumns &columns);
   void setWidth(double width);
   void setWidthType(WidthType widthType);
   void setBarsGroup(QCPBarsGroup *barsGroup);
@@ -183,6 +185,7 @@ public:
   void addData(double key, double value);
   void moveBelow(QCPBars *bars);
   void moveAbove(QCPBars *bars);
+  void invalidateStacking();
   
   // reimplemented virtual methods:
   virtual QCPDataSelection selectTestRect(const QRectF &rect, bool onlySelectable) const Q_DECL_OVERRIDE;
@@ -200,6 +203,15 @@ protected:
   double mStackingGap;
   QPointer<QCPBars> mBarBelow, mBarAbove;
   
+  // non-property members:
+  struct StackedTop
+  {
+    double key, positive, negative;
+  };
+  mutable QVector<StackedTop> mStackedTops;
+  mutable QVector<quintptr> mStackedTopsState;
+  mutable double mStackedTopsBaseValue;
+  
   // reimplemented virtual methods:
   virtual void draw(QCPPainter *painter) Q_DECL_OVERRIDE;
   virtual void drawLegendIcon(QCPPainter *painter, const QRectF &rect) const Q_DECL_OVERRIDE;
@@ -209,6 +221,10 @@ protected:
   QRectF getBarRect(double key, double value) const;
   void getPixelWidth(double key, double &lower, double &upper) const;
   double getStackedBaseValue(double key, bool positive) const;
+  void prepareStacking() const;
+  const QVector<StackedTop> &stackedTops() const;
+  bool stackedTopsValid() const;
+  void updateStackedTops() const;
   static void connectBars(QCPBars* lower, QCPBars* upper);
   
   friend class QCustomPlot;
@@ -47,7 +47,15 @@
   The data cells can be accessed in two ways: They can be directly addressed by an integer index
   with \ref setCell. This is the fastest method. Alternatively, they can be addressed by their plot
   coordinate with \ref setData. plot coordinate to cell index transformations and vice versa are
-  provided by the functions \ref coordToCell and \ref cellToCoord.
+  provided by the functions \ref coordToCell and \ref cellToCoord. Whole rectangular blocks of
+  cells, up to the entire map, can be copied from and to external arrays in one call with \ref
+  setCells and \ref cells.
+  
+  Modifications of single cells or blocks of cells are tracked, so the \ref QCPColorMap only needs
+  to recolorize the affected region of its map image on the next replot, instead of the entire map.
+  For displays that continuously append data at one edge, like waterfall diagrams, \ref scroll
+  moves all cells by a number of cells in key and/or value direction. The color map then shifts
+  its existing map image accordingly, so only the newly inserted cells need to be colorized.
   
   A \ref QCPColorMapData also holds an on-demand two-dimensional array of alpha values which (if
   allocated) has the same size as the data map. It can be accessed via \ref setAlpha, \ref
@@ -323,7 +331,7 @@ void QCPColorMapData::setData(double key, double value, double z)
       mDataBounds.lower = z;
     if (z > mDataBounds.upper)
       mDataBounds.upper = z;
-     mDataModified = true;
+    addModifiedCells(keyCell, valueCell);
   }
 }
 
@@ -347,7 +355,7 @@ void QCPColorMapData::setCell(int keyIndex, int valueIndex, double z)
       mDataBounds.lower = z;
     if (z > mDataBounds.upper)
       mDataBounds.upper = z;
-     mDataModified = true;
+    addModifiedCells(keyIndex, valueIndex);
   } else
     qDebug() << Q_FUNC_INFO << "index out of bounds:" << keyIndex << valueIndex;
 }
@@ -374,12 +382,111 @@ void QCPColorMapData::setAlpha(int keyIndex, int valueIndex, unsigned char alpha
     if (mAlpha || createAlpha())
     {
       mAlpha[valueIndex*mKeySize + keyIndex] = alpha;
-      mDataModified = true;
+      addModifiedCells(keyIndex, valueIndex);
     }
   } else
     qDebug() << Q_FUNC_INFO << "index out of bounds:" << keyIndex << valueIndex;
 }
 
+/*!
+  Sets the data of a rectangular block of cells at once. The block starts at the cell with indices
+  \a keyIndex and \a valueIndex and spans \a keyCount cells in the key and \a valueCount cells in
+  the value dimension. It must lie completely inside the map (see \ref setSize).
+  
+  The new values are read from \a cells. The value for the cell (\a keyIndex + k, \a valueIndex +
+  v) is taken from <tt>cells[k*keyStride + v*valueStride]</tt>, so the strides define the memory
+  layout of \a cells, in numbers of elements. The default \a keyStride of 1 and a \a valueStride
+  of 0, which means \a keyCount*\a keyStride, correspond to a densely packed array where one row
+  of key cells follows the other. This is the same layout QCPColorMapData uses internally, in which
+  case whole rows are copied with \c memcpy. For a column-major array where one column of value
+  cells follows the other, pass a \a keyStride of \a valueCount and a \a valueStride of 1.
+  
+  This is much faster than calling \ref setCell for every cell, e.g. when loading a whole map or
+  when a scrolling spectrogram only replaces the newest columns. The buffered data bounds are
+  extended by the new values like with \ref setCell. If the block covers the entire map, they are
+  set to the exact range of the new values.
+  
+  \see cells, setAlphas, setCell
+*/
+void QCPColorMapData::setCells(int keyIndex, int valueIndex, int keyCount, int valueCount, const double *cells, int keyStride, int valueStride)
+{
+  if (!checkCellRect(keyIndex, valueIndex, keyCount, valueCount) || !cells)
+    return;
+  if (valueStride == 0)
+    valueStride = keyCount*keyStride;
+  
+  const bool coversMap = keyCount == mKeySize && valueCount == mValueSize;
+  double minValue = std::numeric_limits<double>::max();
+  double maxValue = -std::numeric_limits<double>::max();
+  for (int v=0; v<valueCount; ++v)
+  {
+    double *row = mData + (valueIndex+v)*mKeySize + keyIndex;
+    const double *source = cells + qptrdiff(v)*valueStride;
+    if (keyStride == 1)
+      memcpy(row, source, sizeof(double)*size_t(keyCount));
+    else
+    {
+      for (int k=0; k<keyCount; ++k)
+        row[k] = source[qptrdiff(k)*keyStride];
+    }
+    for (int k=0; k<keyCount; ++k)
+    {
+      if (row[k] < minValue)
+        minValue = row[k];
+      if (row[k] > maxValue)
+        maxValue = row[k];
+    }
+  }
+  if (minValue <= maxValue) // false if all new values are NaN
+  {
+    if (coversMap)
+      mDataBounds = QCPRange(minValue, maxValue);
+    else
+    {
+      if (minValue < mDataBounds.lower)
+        mDataBounds.lower = minValue;
+      if (maxValue > mDataBounds.upper)
+        mDataBounds.upper = maxValue;
+    }
+  }
+  addModifiedCells(keyIndex, valueIndex, keyCount, valueCount);
+}
+
+/*!
+  Sets the alpha of a rectangular block of cells at once. The block and the memory layout of \a
+  alphas are given in the same way as for \ref setCells.
+
+  If an alpha map doesn't exist yet for this color map data, it will be created here, see \ref
+  setAlpha.
+
+  \see setAlpha, fillAlpha, clearAlpha
+*/
+void QCPColorMapData::setAlphas(int keyIndex, int valueIndex, int keyCount, int valueCount, const unsigned char *alphas, int keyStride, int valueStride)
+{
+  if (!checkCellRect(keyIndex, valueIndex, keyCount, valueCount) || !alphas)
+    return;
+  if (valueStride == 0)
+    valueStride = keyCount*keyStride;
+  
+  const bool coversMap = keyCount == mKeySize && valueCount == mValueSize;
+  if (mAlpha || createAlpha(!coversMap)) // alpha map only needs initialization if it's not overwritten completely
+  {
+    for (int v=0; v<valueCount; ++v)
+    {
+      unsigned char *row = mAlpha + (valueIndex+v)*mKeySize + keyIndex;
+      const unsigned char *source = alphas + qptrdiff(v)*valueStride;
+      if (keyStride == 1)
+        memcpy(row, source, size_t(keyCount));
+      else
+      {
+        for (int k=0; k<keyCount; ++k)
+          row[k] = source[qptrdiff(k)*keyStride];
+      }
+    }
+    addModifiedCells(keyIndex, valueIndex, keyCount, valueCount);
+  }
+}
+
 /*!
   Goes through the data and updates the buffered minimum and maximum data values.
   
@@ -467,6 +574,104 @@ void QCPColorMapData::fillAlpha(unsigned char alpha)
   }
 }
 
+/*!
+  Moves all cells by \a keyCells in key direction and by \a valueCells in value direction. For
+  example, <tt>scroll(-1)</tt> moves the content of every cell to its left neighbor (in the
+  standard plot configuration), so the newest data column can then be inserted at the right edge
+  with \ref setCells. Cells moved beyond the map boundaries are discarded. The vacated cells are
+  set to 0 and, if an alpha map exists, to full opacity.
+  
+  This is the fastest way to implement scrolling displays like waterfall diagrams, because the
+  \ref QCPColorMap shifts its existing map image in the same way, instead of recolorizing every
+  cell. Only the vacated cells and cells modified afterwards are colorized on the next replot.
+  
+  The buffered data bounds are left unchanged, see \ref recalculateDataBounds.
+*/
+void QCPColorMapData::scroll(int keyCells, int valueCells)
+{
+  if (mIsEmpty || !mData || (keyCells == 0 && valueCells == 0))
+    return;
+  
+  const int keepKeys = qMax(0, mKeySize-qAbs(keyCells));
+  const int keepValues = qMax(0, mValueSize-qAbs(valueCells));
+  if (keepKeys > 0 && keepValues > 0)
+  {
+    const int sourceKey = qMax(0, -keyCells);
+    const int targetKey = qMax(0, keyCells);
+    // move rows in an order that doesn't overwrite rows which still need to be moved:
+    for (int i=0; i<keepValues; ++i)
+    {
+      const int targetValue = valueCells > 0 ? mValueSize-1-i : i;
+      const int sourceValue = targetValue-valueCells;
+      memmove(mData+targetValue*mKeySize+targetKey, mData+sourceValue*mKeySize+sourceKey, sizeof(double)*size_t(keepKeys));
+      if (mAlpha)
+        memmove(mAlpha+targetValue*mKeySize+targetKey, mAlpha+sourceValue*mKeySize+sourceKey, size_t(keepKeys));
+    }
+  }
+  
+  // reset vacated cells:
+  const int vacatedKeyBegin = keyCells > 0 ? 0 : keepKeys;
+  const int vacatedKeyEnd = keyCells > 0 ? mKeySize-keepKeys : mKeySize;
+  const int vacatedValueBegin = valueCells > 0 ? 0 : keepValues;
+  const int vacatedValueEnd = valueCells > 0 ? mValueSize-keepValues : mValueSize;
+  for (int v=0; v<mValueSize; ++v)
+  {
+    const bool vacatedRow = v >= vacatedValueBegin && v < vacatedValueEnd;
+    const int begin = vacatedRow ? 0 : vacatedKeyBegin;
+    const int end = vacatedRow ? mKeySize : vacatedKeyEnd;
+    for (int k=begin; k<end; ++k)
+    {
+      mData[v*mKeySize+k] = 0;
+      if (mAlpha)
+        mAlpha[v*mKeySize+k] = 255;
+    }
+  }
+  
+  if (keepKeys == 0 || keepValues == 0)
+    mDataModified = true;
+  else
+  {
+    mScrollOffset += QPoint(keyCells, valueCells);
+    if (!mModifiedCells.isEmpty())
+      mModifiedCells = mModifiedCells.translated(keyCells, valueCells).intersected(QRect(0, 0, mKeySize, mValueSize));
+    if (vacatedKeyEnd > vacatedKeyBegin)
+      addModifiedCells(vacatedKeyBegin, 0, vacatedKeyEnd-vacatedKeyBegin, mValueSize);
+    if (vacatedValueEnd > vacatedValueBegin)
+      addModifiedCells(0, vacatedValueBegin, mKeySize, vacatedValueEnd-vacatedValueBegin);
+  }
+}
+
+/*!
+  Copies the data of a rectangular block of cells to \a cells. The block starts at the cell with
+  indices \a keyIndex and \a valueIndex and spans \a keyCount cells in the key and \a valueCount
+  cells in the value dimension. It must lie completely inside the map.
+  
+  \a cells must provide room for all copied values, which are written in the memory layout given by
+  \a keyStride and \a valueStride, see \ref setCells.
+  
+  \see setCells, cell
+*/
+void QCPColorMapData::cells(int keyIndex, int valueIndex, int keyCount, int valueCount, double *cells, int keyStride, int valueStride) const
+{
+  if (!checkCellRect(keyIndex, valueIndex, keyCount, valueCount) || !cells)
+    return;
+  if (valueStride == 0)
+    valueStride = keyCount*keyStride;
+  
+  for (int v=0; v<valueCount; ++v)
+  {
+    const double *row = mData + (valueIndex+v)*mKeySize + keyIndex;
+    double *target = cells + qptrdiff(v)*valueStride;
+    if (keyStride == 1)
+      memcpy(target, row, sizeof(double)*size_t(keyCount));
+    else
+    {
+      for (int k=0; k<keyCount; ++k)
+        target[qptrdiff(k)*keyStride] = row[k];
+    }
+  }
+}
+
 /*!
   Transforms plot coordinates given by \a key and \a value to cell indices of this QCPColorMapData
   instance. The resulting cell indices are returned via the output parameters \a keyIndex and \a
@@ -553,6 +758,46 @@ bool QCPColorMapData::createAlpha(bool initializeOpaque)
   }
 }
 
+/*! \internal
+
+  Returns whether the rectangular block of cells starting at \a keyIndex and \a valueIndex with
+  \a keyCount times \a valueCount cells is non-empty and lies inside the allocated data map. If
+  not, a debug message is printed. Used by the block access methods like \ref setCells.
+*/
+bool QCPColorMapData::checkCellRect(int keyIndex, int valueIndex, int keyCount, int valueCount) const
+{
+  if (keyIndex < 0 || valueIndex < 0 || keyCount <= 0 || valueCount <= 0 ||
+      keyCount > mKeySize-keyIndex || valueCount > mValueSize-valueIndex || !mData)
+  {
+    qDebug() << Q_FUNC_INFO << "cell block out of bounds:" << keyIndex << valueIndex << keyCount << valueCount;
+    return false;
+  }
+  return true;
+}
+
+/*! \internal
+
+  Marks the rectangular block of cells starting at \a keyIndex and \a valueIndex with \a keyCount
+  times \a valueCount cells as modified, so the next \ref QCPColorMap::updateMapImage recolorizes
+  this region of the map image.
+*/
+void QCPColorMapData::addModifiedCells(int keyIndex, int valueIndex, int keyCount, int valueCount)
+{
+  mModifiedCells |= QRect(keyIndex, valueIndex, keyCount, valueCount);
+}
+
+/*! \internal
+
+  Called by \ref QCPColorMap::updateMapImage after the map image was brought up to date with this
+  data instance. Clears the modification state, including any pending scroll offset.
+*/
+void QCPColorMapData::resetModifiedCells()
+{
+  mDataModified = false;
+  mModifiedCells = QRect();
+  mScrollOffset = QPoint();
+}
+
 
 ////////////////////////////////////////////////////////////////////////////////////////////////////
 //////////////////// QCPColorMap
@@ -685,7 +930,8 @@ QCPColorMap::QCPColorMap(QCPAxis *keyAxis, QCPAxis *valueAxis) :
   mGradient(QCPColorGradient::gpCold),
   mInterpolate(true),
   mTightBoundary(false),
-  mMapImageInvalidated(true)
+  mMapImageInvalidated(true),
+  mMapImageKeyOrientation(Qt::Horizontal)
 {
 }
 
@@ -717,6 +963,7 @@ void QCPColorMap::setData(QCPColorMapData *data, bool copy)
     mMapData = data;
   }
   mMapImageInvalidated = true;
+  markLayerDirty();
 }
 
 /*!
@@ -739,6 +986,7 @@ void QCPColorMap::setDataRange(const QCPRange &dataRange)
     mMapImageInvalidated = true;
     emit dataRangeChanged(mDataRange);
   }
+  markLayerDirty();
 }
 
 /*!
@@ -756,6 +1004,7 @@ void QCPColorMap::setDataScaleType(QCPAxis::ScaleType scaleType)
     if (mDataScaleType == QCPAxis::stLogarithmic)
       setDataRange(mDataRange.sanitizedForLogScale());
   }
+  markLayerDirty();
 }
 
 /*!
@@ -777,6 +1026,7 @@ void QCPColorMap::setGradient(const QCPColorGradient &gradient)
     mMapImageInvalidated = true;
     emit gradientChanged(mGradient);
   }
+  markLayerDirty();
 }
 
 /*!
@@ -789,6 +1039,7 @@ void QCPColorMap::setInterpolate(bool enabled)
 {
   mInterpolate = enabled;
   mMapImageInvalidated = true; // because oversampling factors might need to change
+  markLayerDirty();
 }
 
 /*!
@@ -805,6 +1056,7 @@ void QCPColorMap::setInterpolate(bool enabled)
 void QCPColorMap::setTightBoundary(bool enabled)
 {
   mTightBoundary = enabled;
+  markLayerDirty();
 }
 
 /*!
@@ -845,6 +1097,7 @@ void QCPColorMap::setColorScale(QCPColorScale *colorScale)
     connect(mColorScale.data(), SIGNAL(gradientChanged(QCPColorGradient)), this, SLOT(setGradient(QCPColorGradient)));
     connect(mColorScale.data(), SIGNAL(dataScaleTypeChanged(QCPAxis::ScaleType)), this, SLOT(setDataScaleType(QCPAxis::ScaleType)));
   }
+  markLayerDirty();
 }
 
 /*!
@@ -986,6 +1239,11 @@ QCPRange QCPColorMap::getValueRange(bool &foundRange, QCP::SignDomain inSignDoma
   has been invalidated for a different reason (e.g. a change of the data range with \ref
   setDataRange).
   
+  If only some cells of the data were modified (e.g. with \ref QCPColorMapData::setCell or \ref
+  QCPColorMapData::setCells) or the data was scrolled (\ref QCPColorMapData::scroll), the existing
+  map image is shifted accordingly and only the modified region is recolorized. Anything else, like
+  a change of the data range or gradient, recolorizes the entire map.
+  
   If the map cell count is low, the image created will be oversampled in order to avoid a
   QPainter::drawImage bug which makes inner pixel boundaries jitter when stretch-drawing images
   without smooth transform enabled. Accordingly, oversampling isn't performed if \ref
@@ -1002,12 +1260,18 @@ void QCPColorMap::updateMapImage()
   const int valueSize = mMapData->valueSize();
   int keyOversamplingFactor = mInterpolate ? 1 : int(1.0+100.0/double(keySize)); // make mMapImage have at least size 100, factor becomes 1 if size > 200 or interpolation is on
   int valueOversamplingFactor = mInterpolate ? 1 : int(1.0+100.0/double(valueSize)); // make mMapImage have at least size 100, factor becomes 1 if size > 200 or interpolation is on
+  bool fullUpdate = mMapImageInvalidated || mMapData->mDataModified || keyAxis->orientation() != mMapImageKeyOrientation;
   
   // resize mMapImage to correct dimensions including possible oversampling factors, according to key/value axes orientation:
   if (keyAxis->orientation() == Qt::Horizontal && (mMapImage.width() != keySize*keyOversamplingFactor || mMapImage.height() != valueSize*valueOversamplingFactor))
+  {
     mMapImage = QImage(QSize(keySize*keyOversamplingFactor, valueSize*valueOversamplingFactor), format);
-  else if (keyAxis->orientation() == Qt::Vertical && (mMapImage.width() != valueSize*valueOversamplingFactor || mMapImage.height() != keySize*keyOversamplingFactor))
+    fullUpdate = true;
+  } else if (keyAxis->orientation() == Qt::Vertical && (mMapImage.width() != valueSize*valueOversamplingFactor || mMapImage.height() != keySize*keyOversamplingFactor))
+  {
     mMapImage = QImage(QSize(valueSize*valueOversamplingFactor, keySize*keyOversamplingFactor), format);
+    fullUpdate = true;
+  }
   
   if (mMapImage.isNull())
   {
@@ -1021,39 +1285,35 @@ void QCPColorMap::updateMapImage()
     {
       // resize undersampled map image to actual key/value cell sizes:
       if (keyAxis->orientation() == Qt::Horizontal && (mUndersampledMapImage.width() != keySize || mUndersampledMapImage.height() != valueSize))
+      {
         mUndersampledMapImage = QImage(QSize(keySize, valueSize), format);
-      else if (keyAxis->orientation() == Qt::Vertical && (mUndersampledMapImage.width() != valueSize || mUndersampledMapImage.height() != keySize))
+        fullUpdate = true;
+      } else if (keyAxis->orientation() == Qt::Vertical && (mUndersampledMapImage.width() != valueSize || mUndersampledMapImage.height() != keySize))
+      {
         mUndersampledMapImage = QImage(QSize(valueSize, keySize), format);
+        fullUpdate = true;
+      }
       localMapImage = &mUndersampledMapImage; // make the colorization run on the undersampled image
     } else if (!mUndersampledMapImage.isNull())
       mUndersampledMapImage = QImage(); // don't need oversampling mechanism anymore (map size has changed) but mUndersampledMapImage still has nonzero size, free it
     
-    const double *rawData = mMapData->mData;
-    const unsigned char *rawAlpha = mMapData->mAlpha;
-    if (keyAxis->orientation() == Qt::Horizontal)
-    {
-      const int lineCount = valueSize;
-      const int rowCount = keySize;
-      for (int line=0; line<lineCount; ++line)
-      {
-        QRgb* pixels = reinterpret_cast<QRgb*>(localMapImage->scanLine(lineCount-1-line)); // invert scanline index because QImage counts scanlines from top, but our vertical index counts from bottom (mathematical coordinate system)
-        if (rawAlpha)
-          mGradient.colorize(rawData+line*rowCount, rawAlpha+line*rowCount, mDataRange, pixels, rowCount, 1, mDataScaleType==QCPAxis::stLogarithmic);
-        else
-          mGradient.colorize(rawData+line*rowCount, mDataRange, pixels, rowCount, 1, mDataScaleType==QCPAxis::stLogarithmic);
-      }
-    } else // keyAxis->orientation() == Qt::Vertical
+    const QRect mapCells(0, 0, keySize, valueSize);
+    if (fullUpdate)
+      colorizeMapImage(localMapImage, mapCells);
+    else
     {
-      const int lineCount = keySize;
-      const int rowCount = valueSize;
-      for (int line=0; line<lineCount; ++line)
+      // bring the existing image up to date by following the data scroll and recolorizing only modified cells:
+      const QPoint scrollOffset = mMapData->mScrollOffset;
+      if (!scrollOffset.isNull())
       {
-        QRgb* pixels = reinterpret_cast<QRgb*>(localMapImage->scanLine(lineCount-1-line)); // invert scanline index because QImage counts scanlines from top, but our vertical index counts from bottom (mathematical coordinate system)
-        if (rawAlpha)
-          mGradient.colorize(rawData+line, rawAlpha+line, mDataRange, pixels, rowCount, lineCount, mDataScaleType==QCPAxis::stLogarithmic);
+        if (keyAxis->orientation() == Qt::Horizontal)
+          scrollImage(localMapImage, scrollOffset.x(), -scrollOffset.y()); // scanlines are inverted, see colorizeMapImage
         else
-          mGradient.colorize(rawData+line, mDataRange, pixels, rowCount, lineCount, mDataScaleType==QCPAxis::stLogarithmic);
+          scrollImage(localMapImage, scrollOffset.y(), -scrollOffset.x());
       }
+      const QRect modifiedCells = mMapData->mModifiedCells.intersected(mapCells);
+      if (!modifiedCells.isEmpty())
+        colorizeMapImage(localMapImage, modifiedCells);
     }
     
     if (keyOversamplingFactor > 1 || valueOversamplingFactor > 1)
@@ -1064,8 +1324,77 @@ void QCPColorMap::updateMapImage()
         mMapImage = mUndersampledMapImage.scaled(valueSize*valueOversamplingFactor, keySize*keyOversamplingFactor, Qt::IgnoreAspectRatio, Qt::FastTransformation);
     }
   }
-  mMapData->mDataModified = false;
+  mMapData->resetModifiedCells();
   mMapImageInvalidated = false;
+  mMapImageKeyOrientation = keyAxis->orientation();
+}
+
+/*! \internal
+  
+  Colorizes the rectangular block \a cells of the map data into the corresponding pixels of \a
+  image, which must have the size of the map (without oversampling) in the current key axis
+  orientation. \a cells is given in cell indices, with the key index as x and the value index as y.
+  
+  \see updateMapImage
+*/
+void QCPColorMap::colorizeMapImage(QImage *image, const QRect &cells)
+{
+  const double *rawData = mMapData->mData;
+  const unsigned char *rawAlpha = mMapData->mAlpha;
+  const int keySize = mMapData->keySize();
+  const bool logarithmic = mDataScaleType == QCPAxis::stLogarithmic;
+  if (mKeyAxis->orientation() == Qt::Horizontal)
+  {
+    const int lineCount = mMapData->valueSize();
+    for (int line=cells.top(); line<=cells.bottom(); ++line)
+    {
+      QRgb* pixels = reinterpret_cast<QRgb*>(image->scanLine(lineCount-1-line))+cells.left(); // invert scanline index because QImage counts scanlines from top, but our vertical index counts from bottom (mathematical coordinate system)
+      const int dataIndex = line*keySize+cells.left();
+      if (rawAlpha)
+        mGradient.colorize(rawData+dataIndex, rawAlpha+dataIndex, mDataRange, pixels, cells.width(), 1, logarithmic);
+      else
+        mGradient.colorize(rawData+dataIndex, mDataRange, pixels, cells.width(), 1, logarithmic);
+    }
+  } else // keyAxis->orientation() == Qt::Vertical
+  {
+    const int lineCount = keySize;
+    for (int line=cells.left(); line<=cells.right(); ++line)
+    {
+      QRgb* pixels = reinterpret_cast<QRgb*>(image->scanLine(lineCount-1-line))+cells.top(); // invert scanline index because QImage counts scanlines from top, but our vertical index counts from bottom (mathematical coordinate system)
+      const int dataIndex = cells.top()*keySize+line;
+      if (rawAlpha)
+        mGradient.colorize(rawData+dataIndex, rawAlpha+dataIndex, mDataRange, pixels, cells.height(), keySize, logarithmic);
+      else
+        mGradient.colorize(rawData+dataIndex, mDataRange, pixels, cells.height(), keySize, logarithmic);
+    }
+  }
+}
+
+/*! \internal
+  
+  Shifts the pixels of \a image by \a dx pixels to the right and \a dy pixels down. Pixels
+  shifted beyond the image boundaries are discarded, the vacated pixels keep their previous
+  content.
+  
+  \see updateMapImage
+*/
+void QCPColorMap::scrollImage(QImage *image, int dx, int dy)
+{
+  const int width = image->width();
+  const int height = image->height();
+  const int keepWidth = width-qAbs(dx);
+  const int keepHeight = height-qAbs(dy);
+  if (keepWidth <= 0 || keepHeight <= 0)
+    return;
+  
+  const int bytesPerPixel = image->depth()/8;
+  // move scanlines in an order that doesn't overwrite scanlines which still need to be moved:
+  for (int i=0; i<keepHeight; ++i)
+  {
+    const int targetLine = dy > 0 ? height-1-i : i;
+    const int sourceLine = targetLine-dy;
+    memmove(image->scanLine(targetLine)+qMax(0, dx)*bytesPerPixel, image->scanLine(sourceLine)+qMax(0, -dx)*bytesPerPixel, size_t(keepWidth*bytesPerPixel));
+  }
 }
 
 /* inherits documentation from base class */
@@ -1075,7 +1404,7 @@ void QCPColorMap::draw(QCPPainter *painter)
   if (!mKeyAxis || !mValueAxis) return;
   applyDefaultAntialiasingHint(painter);
   
-  if (mMapData->mDataModified || mMapImageInvalidated)
+  if (mMapData->mDataModified || !mMapData->mModifiedCells.isEmpty() || !mMapData->mScrollOffset.isNull() || mMapImageInvalidated)
     updateMapImage();
   
   // use buffer if painting vectorized (PDF):
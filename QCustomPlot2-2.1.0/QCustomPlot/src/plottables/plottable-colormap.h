@@ -64,13 +64,17 @@ public:
   void setData(double key, double value, double z);
   void setCell(int keyIndex, int valueIndex, double z);
   void setAlpha(int keyIndex, int valueIndex, unsigned char alpha);
+  void setCells(int keyIndex, int valueIndex, int keyCount, int valueCount, const double *cells, int keyStride=1, int valueStride=0);
+  void setAlphas(int keyIndex, int valueIndex, int keyCount, int valueCount, const unsigned char *alphas, int keyStride=1, int valueStride=0);
   
   // non-property methods:
+  void cells(int keyIndex, int valueIndex, int keyCount, int valueCount, double *cells, int keyStride=1, int valueStride=0) const;
   void recalculateDataBounds();
   void clear();
   void clearAlpha();
   void fill(double z);
   void fillAlpha(unsigned char alpha);
+  void scroll(int keyCells, int valueCells=0);
   bool isEmpty() const { return mIsEmpty; }
   void coordToCell(double key, double value, int *keyIndex, int *valueIndex) const;
   void cellToCoord(int keyIndex, int valueIndex, double *key, double *value) const;
@@ -86,10 +90,16 @@ protected:
   unsigned char *mAlpha;
   QCPRange mDataBounds;
   bool mDataModified;
+  QRect mModifiedCells;
+  QPoint mScrollOffset;
   
   bool createAlpha(bool initializeOpaque=true);
+  bool checkCellRect(int keyIndex, int valueIndex, int keyCount, int valueCount) const;
+  void addModifiedCells(int keyIndex, int valueIndex, int keyCount=1, int valueCount=1);
+  void resetModifiedCells();
   
   friend class QCPColorMap;
+  friend class QCustomPlot;
 };
 
 
@@ -154,10 +164,15 @@ protected:
   QImage mMapImage, mUndersampledMapImage;
   QPixmap mLegendIcon;
   bool mMapImageInvalidated;
+  Qt::Orientation mMapImageKeyOrientation;
   
   // introduced virtual methods:
   virtual void updateMapImage();
   
+  // non-virtual methods:
+  void colorizeMapImage(QImage *image, const QRect &cells);
+  static void scrollImage(QImage *image, int dx, int dy);
+  
   // reimplemented virtual methods:
   virtual void draw(QCPPainter *painter) Q_DECL_OVERRIDE;
   virtual void drawLegendIcon(QCPPainter *painter, const QRectF &rect) const Q_DECL_OVERRIDE;
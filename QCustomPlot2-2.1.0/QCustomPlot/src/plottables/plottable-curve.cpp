@@ -188,7 +188,8 @@ QCPCurveData::QCPCurveData(double t, double key, double value) :
 QCPCurve::QCPCurve(QCPAxis *keyAxis, QCPAxis *valueAxis) :
   QCPAbstractPlottable1D<QCPCurveData>(keyAxis, valueAxis),
   mScatterSkip{},
-  mLineStyle{}
+  mLineStyle{},
+  mAdaptiveSampling{}
 {
   // modify inherited properties from abstract plottable:
   setPen(QPen(Qt::blue, 0));
@@ -197,6 +198,7 @@ QCPCurve::QCPCurve(QCPAxis *keyAxis, QCPAxis *valueAxis) :
   setScatterStyle(QCPScatterStyle());
   setLineStyle(lsLine);
   setScatterSkip(0);
+  setAdaptiveSampling(false);
 }
 
 QCPCurve::~QCPCurve()
@@ -221,6 +223,7 @@ QCPCurve::~QCPCurve()
 void QCPCurve::setData(QSharedPointer<QCPCurveDataContainer> data)
 {
   mDataContainer = data;
+  markLayerDirty();
 }
 
 /*! \overload
@@ -238,6 +241,7 @@ void QCPCurve::setData(const QVector<double> &t, const QVector<double> &keys, co
 {
   mDataContainer->clear();
   addData(t, keys, values, alreadySorted);
+  markLayerDirty();
 }
 
 
@@ -256,6 +260,7 @@ void QCPCurve::setData(const QVector<double> &keys, const QVector<double> &value
 {
   mDataContainer->clear();
   addData(keys, values);
+  markLayerDirty();
 }
 
 /*!
@@ -268,6 +273,7 @@ void QCPCurve::setData(const QVector<double> &keys, const QVector<double> &value
 void QCPCurve::setScatterStyle(const QCPScatterStyle &style)
 {
   mScatterStyle = style;
+  markLayerDirty();
 }
 
 /*!
@@ -284,6 +290,7 @@ void QCPCurve::setScatterStyle(const QCPScatterStyle &style)
 void QCPCurve::setScatterSkip(int skip)
 {
   mScatterSkip = qMax(0, skip);
+  markLayerDirty();
 }
 
 /*!
@@ -296,6 +303,29 @@ void QCPCurve::setScatterSkip(int skip)
 void QCPCurve::setLineStyle(QCPCurve::LineStyle style)
 {
   mLineStyle = style;
+  markLayerDirty();
+}
+
+/*!
+  Sets whether adaptive sampling shall be used when plotting this curve. Adaptive sampling can
+  drastically improve the replot performance for curves with a large number of points (e.g. above
+  100,000), that are densely packed in pixel space, such as long parametric or phase-space traces.
+  
+  Since a curve isn't sorted by key, the sampling can't be done per key pixel like in \ref
+  QCPGraph::setAdaptiveSampling. Instead, consecutive points that fall into the same pixel are
+  merged: Of every run of points staying within one pixel, only the first and the last one are
+  kept. The resulting line thus deviates from the original by less than one pixel, so the visual
+  envelope of the curve (including outliers and the fill polygon) is preserved. Scatters are
+  reduced in the same manner, so at most one scatter symbol is drawn per pixel and run.
+  
+  By default, adaptive sampling is disabled, so every data point is drawn.
+  
+  \see QCPGraph::setAdaptiveSampling
+*/
+void QCPCurve::setAdaptiveSampling(bool enabled)
+{
+  mAdaptiveSampling = enabled;
+  markLayerDirty();
 }
 
 /*! \overload
@@ -328,6 +358,7 @@ void QCPCurve::addData(const QVector<double> &t, const QVector<double> &keys, co
     ++i;
   }
   mDataContainer->add(tempData, alreadySorted); // don't modify tempData beyond this to prevent copy on write
+  markLayerDirty();
 }
 
 /*! \overload
@@ -365,6 +396,7 @@ void QCPCurve::addData(const QVector<double> &keys, const QVector<double> &value
     ++i;
   }
   mDataContainer->add(tempData, true); // don't modify tempData beyond this to prevent copy on write
+  markLayerDirty();
 }
 
 /*! \overload
@@ -376,6 +408,7 @@ void QCPCurve::addData(const QVector<double> &keys, const QVector<double> &value
 void QCPCurve::addData(double t, double key, double value)
 {
   mDataContainer->add(QCPCurveData(t, key, value));
+  markLayerDirty();
 }
 
 /*! \overload
@@ -394,6 +427,7 @@ void QCPCurve::addData(double key, double value)
     mDataContainer->add(QCPCurveData((mDataContainer->constEnd()-1)->t + 1.0, key, value));
   else
     mDataContainer->add(QCPCurveData(0.0, key, value));
+  markLayerDirty();
 }
 
 /*!
@@ -567,9 +601,7 @@ void QCPCurve::drawScatterPlot(QCPPainter *painter, const QVector<QPointF> &poin
   // draw scatter point symbols:
   applyScattersAntialiasingHint(painter);
   style.applyTo(painter, mPen);
-  foreach (const QPointF &point, points)
-    if (!qIsNaN(point.x()) && !qIsNaN(point.y()))
-      style.drawShape(painter,  point);
+  style.drawShapes(painter, points, mParentPlot->plottingHints().testFlag(QCP::phCacheScatters));
 }
 
 /*! \internal
@@ -681,6 +713,8 @@ void QCPCurve::getCurveLines(QVector<QPointF> *lines, const QCPDataRange &dataRa
     ++it;
   }
   *lines << trailingPoints;
+  if (mAdaptiveSampling)
+    getSampledPoints(lines, true);
 }
 
 /*! \internal
@@ -780,6 +814,57 @@ void QCPCurve::getScatters(QVector<QPointF> *scatters, const QCPDataRange &dataR
       }
     }
   }
+  if (mAdaptiveSampling)
+    getSampledPoints(scatters, false);
+}
+
+/*! \internal
+
+  Called by \ref getCurveLines and \ref getScatters when adaptive sampling is enabled (\ref
+  setAdaptiveSampling). Reduces the pixel coordinates in \a points in place, by merging runs of
+  consecutive points that lie in the same pixel.
+  
+  If \a keepCellExits is true, the last point of each run is kept in addition to the first one, so
+  the polyline through the remaining points still enters and leaves every pixel at the original
+  positions. This is used for lines and fills. If it is false, only the first point of each run is
+  kept, which is sufficient for scatters.
+  
+  Points with NaN coordinates (gaps in the curve) are always kept.
+*/
+void QCPCurve::getSampledPoints(QVector<QPointF> *points, bool keepCellExits) const
+{
+  const int count = points->size();
+  if (count < 3)
+    return;
+  
+  QPointF *data = points->data();
+  int outIndex = 1;
+  double cellX = floor(data[0].x());
+  double cellY = floor(data[0].y());
+  QPointF runEnd = data[0]; // last point of the current run that wasn't kept yet
+  bool runEndPending = false;
+  for (int i=1; i<count; ++i)
+  {
+    const QPointF point = data[i];
+    const double x = floor(point.x());
+    const double y = floor(point.y());
+    if (x == cellX && y == cellY) // still in the same pixel (never true for NaN coordinates)
+    {
+      runEnd = point;
+      runEndPending = true;
+    } else // entered a new pixel, keep the previous run's last point and this one
+    {
+      if (runEndPending && keepCellExits)
+        data[outIndex++] = runEnd;
+      data[outIndex++] = point;
+      cellX = x;
+      cellY = y;
+      runEndPending = false;
+    }
+  }
+  if (runEndPending && keepCellExits) // always keep the very last point, so closed curves stay closed
+    data[outIndex++] = runEnd;
+  points->resize(outIndex);
 }
 
 /*! \internal
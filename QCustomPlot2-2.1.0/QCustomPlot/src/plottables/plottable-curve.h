@@ -74,6 +74,7 @@ class QCP_LIB_DECL QCPCurve : public QCPAbstractPlottable1D<QCPCurveData>
   Q_PROPERTY(QCPScatterStyle scatterStyle READ scatterStyle WRITE setScatterStyle)
   Q_PROPERTY(int scatterSkip READ scatterSkip WRITE setScatterSkip)
   Q_PROPERTY(LineStyle lineStyle READ lineStyle WRITE setLineStyle)
+  Q_PROPERTY(bool adaptiveSampling READ adaptiveSampling WRITE setAdaptiveSampling)
   /// \endcond
 public:
   /*!
@@ -94,6 +95,7 @@ public:
   QCPScatterStyle scatterStyle() const { return mScatterStyle; }
   int scatterSkip() const { return mScatterSkip; }
   LineStyle lineStyle() const { return mLineStyle; }
+  bool adaptiveSampling() const { return mAdaptiveSampling; }
   
   // setters:
   void setData(QSharedPointer<QCPCurveDataContainer> data);
@@ -102,6 +104,7 @@ public:
   void setScatterStyle(const QCPScatterStyle &style);
   void setScatterSkip(int skip);
   void setLineStyle(LineStyle style);
+  void setAdaptiveSampling(bool enabled);
   
   // non-property methods:
   void addData(const QVector<double> &t, const QVector<double> &keys, const QVector<double> &values, bool alreadySorted=false);
@@ -119,6 +122,7 @@ protected:
   QCPScatterStyle mScatterStyle;
   int mScatterSkip;
   LineStyle mLineStyle;
+  bool mAdaptiveSampling;
   
   // reimplemented virtual methods:
   virtual void draw(QCPPainter *painter) Q_DECL_OVERRIDE;
@@ -131,6 +135,7 @@ protected:
   // non-virtual methods:
   void getCurveLines(QVector<QPointF> *lines, const QCPDataRange &dataRange, double penWidth) const;
   void getScatters(QVector<QPointF> *scatters, const QCPDataRange &dataRange, double scatterWidth) const;
+  void getSampledPoints(QVector<QPointF> *points, bool keepCellExits) const;
   int getRegion(double key, double value, double keyMin, double valueMax, double keyMax, double valueMin) const;
   QPointF getOptimizedPoint(int otherRegion, double otherKey, double otherValue, double key, double value, double keyMin, double valueMax, double keyMax, double valueMin) const;
   QVector<QPointF> getOptimizedCornerPoints(int prevRegion, int currentRegion, double prevKey, double prevValue, double key, double value, double keyMin, double valueMax, double keyMax, double valueMin) const;
@@ -171,6 +171,7 @@ QCPErrorBars::~QCPErrorBars()
 void QCPErrorBars::setData(QSharedPointer<QCPErrorBarsDataContainer> data)
 {
   mDataContainer = data;
+  markLayerDirty();
 }
 
 /*! \overload
@@ -186,6 +187,7 @@ void QCPErrorBars::setData(const QVector<double> &error)
 {
   mDataContainer->clear();
   addData(error);
+  markLayerDirty();
 }
 
 /*! \overload
@@ -202,6 +204,7 @@ void QCPErrorBars::setData(const QVector<double> &errorMinus, const QVector<doub
 {
   mDataContainer->clear();
   addData(errorMinus, errorPlus);
+  markLayerDirty();
 }
 
 /*!
@@ -234,6 +237,7 @@ void QCPErrorBars::setDataPlottable(QCPAbstractPlottable *plottable)
   }
   
   mDataPlottable = plottable;
+  markLayerDirty();
 }
 
 /*!
@@ -243,6 +247,7 @@ void QCPErrorBars::setDataPlottable(QCPAbstractPlottable *plottable)
 void QCPErrorBars::setErrorType(ErrorType type)
 {
   mErrorType = type;
+  markLayerDirty();
 }
 
 /*!
@@ -252,6 +257,7 @@ void QCPErrorBars::setErrorType(ErrorType type)
 void QCPErrorBars::setWhiskerWidth(double pixels)
 {
   mWhiskerWidth = pixels;
+  markLayerDirty();
 }
 
 /*!
@@ -262,6 +268,7 @@ void QCPErrorBars::setWhiskerWidth(double pixels)
 void QCPErrorBars::setSymbolGap(double pixels)
 {
   mSymbolGap = pixels;
+  markLayerDirty();
 }
 
 /*! \overload
@@ -276,6 +283,7 @@ void QCPErrorBars::setSymbolGap(double pixels)
 void QCPErrorBars::addData(const QVector<double> &error)
 {
   addData(error, error);
+  markLayerDirty();
 }
 
 /*! \overload
@@ -296,6 +304,7 @@ void QCPErrorBars::addData(const QVector<double> &errorMinus, const QVector<doub
   mDataContainer->reserve(n);
   for (int i=0; i<n; ++i)
     mDataContainer->append(QCPErrorBarsData(errorMinus.at(i), errorPlus.at(i)));
+  markLayerDirty();
 }
 
 /*! \overload
@@ -310,6 +319,7 @@ void QCPErrorBars::addData(const QVector<double> &errorMinus, const QVector<doub
 void QCPErrorBars::addData(double error)
 {
   mDataContainer->append(QCPErrorBarsData(error));
+  markLayerDirty();
 }
 
 /*! \overload
@@ -325,6 +335,7 @@ void QCPErrorBars::addData(double error)
 void QCPErrorBars::addData(double errorMinus, double errorPlus)
 {
   mDataContainer->append(QCPErrorBarsData(errorMinus, errorPlus));
+  markLayerDirty();
 }
 
 /* inherits documentation from base class */
@@ -212,7 +212,8 @@ QCPFinancial::QCPFinancial(QCPAxis *keyAxis, QCPAxis *valueAxis) :
   mBrushPositive(QBrush(QColor(50, 160, 0))),
   mBrushNegative(QBrush(QColor(180, 0, 15))),
   mPenPositive(QPen(QColor(40, 150, 0))),
-  mPenNegative(QPen(QColor(170, 5, 5)))
+  mPenNegative(QPen(QColor(170, 5, 5))),
+  mAdaptiveSampling(true)
 {
   mSelectionDecorator->setBrush(QBrush(QColor(160, 160, 255)));
 }
@@ -239,6 +240,7 @@ QCPFinancial::~QCPFinancial()
 void QCPFinancial::setData(QSharedPointer<QCPFinancialDataContainer> data)
 {
   mDataContainer = data;
+  markLayerDirty();
 }
 
 /*! \overload
@@ -256,6 +258,7 @@ void QCPFinancial::setData(const QVector<double> &keys, const QVector<double> &o
 {
   mDataContainer->clear();
   addData(keys, open, high, low, close, alreadySorted);
+  markLayerDirty();
 }
 
 /*!
@@ -264,6 +267,7 @@ void QCPFinancial::setData(const QVector<double> &keys, const QVector<double> &o
 void QCPFinancial::setChartStyle(QCPFinancial::ChartStyle style)
 {
   mChartStyle = style;
+  markLayerDirty();
 }
 
 /*!
@@ -274,6 +278,7 @@ void QCPFinancial::setChartStyle(QCPFinancial::ChartStyle style)
 void QCPFinancial::setWidth(double width)
 {
   mWidth = width;
+  markLayerDirty();
 }
 
 /*!
@@ -287,6 +292,7 @@ void QCPFinancial::setWidth(double width)
 void QCPFinancial::setWidthType(QCPFinancial::WidthType widthType)
 {
   mWidthType = widthType;
+  markLayerDirty();
 }
 
 /*!
@@ -301,6 +307,7 @@ void QCPFinancial::setWidthType(QCPFinancial::WidthType widthType)
 void QCPFinancial::setTwoColored(bool twoColored)
 {
   mTwoColored = twoColored;
+  markLayerDirty();
 }
 
 /*!
@@ -315,6 +322,7 @@ void QCPFinancial::setTwoColored(bool twoColored)
 void QCPFinancial::setBrushPositive(const QBrush &brush)
 {
   mBrushPositive = brush;
+  markLayerDirty();
 }
 
 /*!
@@ -329,6 +337,7 @@ void QCPFinancial::setBrushPositive(const QBrush &brush)
 void QCPFinancial::setBrushNegative(const QBrush &brush)
 {
   mBrushNegative = brush;
+  markLayerDirty();
 }
 
 /*!
@@ -343,6 +352,7 @@ void QCPFinancial::setBrushNegative(const QBrush &brush)
 void QCPFinancial::setPenPositive(const QPen &pen)
 {
   mPenPositive = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -357,6 +367,31 @@ void QCPFinancial::setPenPositive(const QPen &pen)
 void QCPFinancial::setPenNegative(const QPen &pen)
 {
   mPenNegative = pen;
+  markLayerDirty();
+}
+
+/*!
+  Sets whether adaptive sampling shall be used when plotting this financial chart.
+  
+  When zoomed out far enough that multiple data points fall into the same pixel column along the
+  key axis, drawing every single bar/candlestick only produces many overlapping shapes. With
+  adaptive sampling enabled, all data points inside one pixel column are then merged into a single
+  bar/candlestick, like \ref timeSeriesToOhlc would bin them: It takes the open of the first data
+  point, the maximum high, the minimum low and the close of the last data point in that column.
+  This reduces the replot time for charts with many data points dramatically, while the visible
+  price envelope stays the same.
+  
+  As long as there are fewer data points than pixels in the visible key range, the data points are
+  drawn individually, irrespective of this setting.
+  
+  By default, adaptive sampling is enabled.
+  
+  \see QCPGraph::setAdaptiveSampling
+*/
+void QCPFinancial::setAdaptiveSampling(bool enabled)
+{
+  mAdaptiveSampling = enabled;
+  markLayerDirty();
 }
 
 /*! \overload
@@ -393,6 +428,7 @@ void QCPFinancial::addData(const QVector<double> &keys, const QVector<double> &o
     ++i;
   }
   mDataContainer->add(tempData, alreadySorted); // don't modify tempData beyond this to prevent copy on write
+  markLayerDirty();
 }
 
 /*! \overload
@@ -408,6 +444,7 @@ void QCPFinancial::addData(const QVector<double> &keys, const QVector<double> &o
 void QCPFinancial::addData(double key, double open, double high, double low, double close)
 {
   mDataContainer->add(QCPFinancialData(key, open, high, low, close));
+  markLayerDirty();
 }
 
 /*!
@@ -556,6 +593,8 @@ void QCPFinancial::draw(QCPPainter *painter)
   QCPFinancialDataContainer::const_iterator visibleBegin, visibleEnd;
   getVisibleDataBounds(visibleBegin, visibleEnd);
   
+  QVector<QCPFinancialData> aggregated; // holds merged data points if adaptive sampling applies
+  
   // loop over and draw segments of unselected/selected data:
   QList<QCPDataRange> selectedSegments, unselectedSegments, allSegments;
   getDataSegments(selectedSegments, unselectedSegments);
@@ -569,6 +608,13 @@ void QCPFinancial::draw(QCPPainter *painter)
     if (begin == end)
       continue;
     
+    // merge data points sharing a pixel column, if adaptive sampling applies:
+    if (mAdaptiveSampling && getAggregatedData(&aggregated, begin, end))
+    {
+      begin = aggregated.constBegin();
+      end = aggregated.constEnd();
+    }
+    
     // draw data segment according to configured style:
     switch (mChartStyle)
     {
@@ -818,6 +864,59 @@ double QCPFinancial::getPixelWidth(double key, double keyPixel) const
   return result;
 }
 
+/*! \internal
+
+  Called by \ref draw when adaptive sampling is enabled (\ref setAdaptiveSampling). Merges the data
+  points from \a begin to \a end-1 that fall into the same pixel column of the key axis into a
+  single data point and writes the result to \a aggregated. The merged data point has the key and
+  open of the first data point, the maximum high, the minimum low and the close of the last data
+  point in the respective pixel column.
+  
+  The merging only pays off if there are more data points than pixels along the key axis in the
+  passed range. If that's not the case, \a aggregated is left untouched and false is returned. The
+  data points should then be drawn directly.
+  
+  The range from \a begin to \a end is expected to be obtained via \ref getVisibleDataBounds, so
+  it only spans a pixel range in the order of the axis rect size.
+*/
+bool QCPFinancial::getAggregatedData(QVector<QCPFinancialData> *aggregated, const QCPFinancialDataContainer::const_iterator &begin, const QCPFinancialDataContainer::const_iterator &end) const
+{
+  QCPAxis *keyAxis = mKeyAxis.data();
+  if (!keyAxis) { qDebug() << Q_FUNC_INFO << "invalid key axis"; return false; }
+  
+  const int dataCount = int(end-begin);
+  const double pixelSpan = qAbs(keyAxis->coordToPixel((end-1)->key)-keyAxis->coordToPixel(begin->key));
+  if (dataCount <= pixelSpan+1) // at most one data point per pixel column on average, nothing to gain
+    return false;
+  
+  aggregated->clear();
+  aggregated->reserve(int(pixelSpan)+2);
+  QCPFinancialDataContainer::const_iterator it = begin;
+  QCPFinancialData bin = *it;
+  double binColumn = floor(keyAxis->coordToPixel(it->key));
+  ++it;
+  while (it != end)
+  {
+    const double column = floor(keyAxis->coordToPixel(it->key));
+    if (column == binColumn) // same pixel column, merge into current bin
+    {
+      if (it->high > bin.high)
+        bin.high = it->high;
+      if (it->low < bin.low)
+        bin.low = it->low;
+      bin.close = it->close;
+    } else // reached next pixel column, finish current bin
+    {
+      aggregated->append(bin);
+      bin = *it;
+      binColumn = column;
+    }
+    ++it;
+  }
+  aggregated->append(bin);
+  return true;
+}
+
 /*! \internal
 
   This method is a helper function for \ref selectTest. It is used to test for selection when the
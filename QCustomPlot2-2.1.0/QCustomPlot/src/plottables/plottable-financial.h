@@ -78,6 +78,7 @@ class QCP_LIB_DECL QCPFinancial : public QCPAbstractPlottable1D<QCPFinancialData
   Q_PROPERTY(QBrush brushNegative READ brushNegative WRITE setBrushNegative)
   Q_PROPERTY(QPen penPositive READ penPositive WRITE setPenPositive)
   Q_PROPERTY(QPen penNegative READ penNegative WRITE setPenNegative)
+  Q_PROPERTY(bool adaptiveSampling READ adaptiveSampling WRITE setAdaptiveSampling)
   /// \endcond
 public:
   /*!
@@ -115,6 +116,7 @@ public:
   QBrush brushNegative() const { return mBrushNegative; }
   QPen penPositive() const { return mPenPositive; }
   QPen penNegative() const { return mPenNegative; }
+  bool adaptiveSampling() const { return mAdaptiveSampling; }
   
   // setters:
   void setData(QSharedPointer<QCPFinancialDataContainer> data);
@@ -127,6 +129,7 @@ public:
   void setBrushNegative(const QBrush &brush);
   void setPenPositive(const QPen &pen);
   void setPenNegative(const QPen &pen);
+  void setAdaptiveSampling(bool enabled);
   
   // non-property methods:
   void addData(const QVector<double> &keys, const QVector<double> &open, const QVector<double> &high, const QVector<double> &low, const QVector<double> &close, bool alreadySorted=false);
@@ -149,6 +152,7 @@ protected:
   bool mTwoColored;
   QBrush mBrushPositive, mBrushNegative;
   QPen mPenPositive, mPenNegative;
+  bool mAdaptiveSampling;
   
   // reimplemented virtual methods:
   virtual void draw(QCPPainter *painter) Q_DECL_OVERRIDE;
@@ -158,6 +162,7 @@ protected:
   void drawOhlcPlot(QCPPainter *painter, const QCPFinancialDataContainer::const_iterator &begin, const QCPFinancialDataContainer::const_iterator &end, bool isSelected);
   void drawCandlestickPlot(QCPPainter *painter, const QCPFinancialDataContainer::const_iterator &begin, const QCPFinancialDataContainer::const_iterator &end, bool isSelected);
   double getPixelWidth(double key, double keyPixel) const;
+  bool getAggregatedData(QVector<QCPFinancialData> *aggregated, const QCPFinancialDataContainer::const_iterator &begin, const QCPFinancialDataContainer::const_iterator &end) const;
   double ohlcSelectTest(const QPointF &pos, const QCPFinancialDataContainer::const_iterator &begin, const QCPFinancialDataContainer::const_iterator &end, QCPFinancialDataContainer::const_iterator &closestDataPoint) const;
   double candlestickSelectTest(const QPointF &pos, const QCPFinancialDataContainer::const_iterator &begin, const QCPFinancialDataContainer::const_iterator &end, QCPFinancialDataContainer::const_iterator &closestDataPoint) const;
   void getVisibleDataBounds(QCPFinancialDataContainer::const_iterator &begin, QCPFinancialDataContainer::const_iterator &end) const;
@@ -189,7 +189,10 @@ QCPGraph::QCPGraph(QCPAxis *keyAxis, QCPAxis *valueAxis) :
   QCPAbstractPlottable1D<QCPGraphData>(keyAxis, valueAxis),
   mLineStyle{},
   mScatterSkip{},
-  mAdaptiveSampling{}
+  mAdaptiveSampling{},
+  mLevelOfDetailIndex{},
+  mSpatialIndex{},
+  mSpatialIndexDataOffset(0)
 {
   // special handling for QCPGraphs to maintain the simple graph interface:
   mParentPlot->registerGraph(this);
@@ -201,6 +204,8 @@ QCPGraph::QCPGraph(QCPAxis *keyAxis, QCPAxis *valueAxis) :
   setScatterSkip(0);
   setChannelFillGraph(nullptr);
   setAdaptiveSampling(true);
+  setLevelOfDetailIndex(false);
+  setSpatialIndex(false);
 }
 
 QCPGraph::~QCPGraph()
@@ -220,11 +225,18 @@ QCPGraph::~QCPGraph()
   the \ref QCPDataContainer<DataType>::set method on the graph's data container directly:
   \snippet documentation/doc-code-snippets/mainwindow.cpp qcpgraph-datasharing-2
   
+  If \ref setLevelOfDetailIndex is enabled for this graph, it is also enabled on the new \a data
+  container.
+  
   \see addData
 */
 void QCPGraph::setData(QSharedPointer<QCPGraphDataContainer> data)
 {
   mDataContainer = data;
+  if (mLevelOfDetailIndex)
+    mDataContainer->setLevelOfDetailIndex(true);
+  invalidateSpatialIndex();
+  markLayerDirty();
 }
 
 /*! \overload
@@ -242,6 +254,50 @@ void QCPGraph::setData(const QVector<double> &keys, const QVector<double> &value
 {
   mDataContainer->clear();
   addData(keys, values, alreadySorted);
+  invalidateSpatialIndex();
+  markLayerDirty();
+}
+
+/*! \overload
+
+  Replaces the current data with the \a count points provided in the raw arrays \a keys and \a
+  values. Both arrays must hold at least \a count elements.
+
+  This overload avoids the intermediate QVector instances required by \ref setData(const
+  QVector<double> &keys, const QVector<double> &values, bool alreadySorted) and is thus well suited
+  for handing over large blocks of contiguous memory, e.g. from language bindings.
+
+  If you can guarantee that the passed data points are sorted by \a keys in ascending order, you
+  can set \a alreadySorted to true, to improve performance by saving a sorting run.
+
+  \see addData
+*/
+void QCPGraph::setData(const double *keys, const double *values, int count, bool alreadySorted)
+{
+  mDataContainer->clear();
+  addData(keys, values, count, alreadySorted);
+  invalidateSpatialIndex();
+  markLayerDirty();
+}
+
+/*! \overload
+  
+  Replaces the current data with the key/value pairs held by \a columns.
+  
+  Since \ref QCPDataColumns keeps its data sorted by key, the points are transferred into the
+  data container in a single pass, without sorting or per-point insertion. This is the preferred
+  way to hand over large data sets that are available as separate key and value arrays.
+  
+  The points are copied: the plottable draws from its own data container and doesn't refer to \a
+  columns afterwards, so \a columns can be discarded once the data is set.
+  
+  \see QCPDataColumns
+*/
+void QCPGraph::setData(const QCPDataColumns &columns)
+{
+  mDataContainer->set(columns.toDataVector<QCPGraphData>(), true);
+  invalidateSpatialIndex();
+  markLayerDirty();
 }
 
 /*!
@@ -253,6 +309,7 @@ void QCPGraph::setData(const QVector<double> &keys, const QVector<double> &value
 void QCPGraph::setLineStyle(LineStyle ls)
 {
   mLineStyle = ls;
+  markLayerDirty();
 }
 
 /*!
@@ -264,6 +321,7 @@ void QCPGraph::setLineStyle(LineStyle ls)
 void QCPGraph::setScatterStyle(const QCPScatterStyle &style)
 {
   mScatterStyle = style;
+  markLayerDirty();
 }
 
 /*!
@@ -280,6 +338,7 @@ void QCPGraph::setScatterStyle(const QCPScatterStyle &style)
 void QCPGraph::setScatterSkip(int skip)
 {
   mScatterSkip = qMax(0, skip);
+  markLayerDirty();
 }
 
 /*!
@@ -309,6 +368,7 @@ void QCPGraph::setChannelFillGraph(QCPGraph *targetGraph)
   }
   
   mChannelFillGraph = targetGraph;
+  markLayerDirty();
 }
 
 /*!
@@ -345,6 +405,64 @@ void QCPGraph::setChannelFillGraph(QCPGraph *targetGraph)
 void QCPGraph::setAdaptiveSampling(bool enabled)
 {
   mAdaptiveSampling = enabled;
+  markLayerDirty();
+}
+
+/*!
+  Sets whether the data container of this graph maintains a level of detail index (see \ref
+  QCPDataContainer::setLevelOfDetailIndex), a precomputed min/max pyramid over the data values.
+  
+  When adaptive sampling (\ref setAdaptiveSampling) reduces the line of a graph with many more data
+  points than pixels, it normally visits every visible data point on each replot. With the level
+  of detail index, the adaptive sampling instead jumps from pixel to pixel via binary search and
+  queries the value span of each pixel from the index. The replot time then scales with the number
+  of pixels (and logarithmically with the number of data points), which makes zoomed-out views of
+  tens of millions of data points interactive.
+  
+  The index is updated incrementally when data is added or removed, e.g. for appending live data
+  only the last few entries are recomputed. It requires additional memory of about one sixteenth of
+  the data itself. By default, the level of detail index is disabled.
+  
+  The resulting line is the same as with regular adaptive sampling. The scatter points (\ref
+  setScatterStyle) are not affected by this setting.
+*/
+void QCPGraph::setLevelOfDetailIndex(bool enabled)
+{
+  mLevelOfDetailIndex = enabled;
+  mDataContainer->setLevelOfDetailIndex(enabled);
+  markLayerDirty();
+}
+
+/*!
+  Sets whether this graph maintains a spatial index of its pixel representation, to speed up the
+  selection tests \ref selectTest and \ref selectTestRect.
+  
+  Without the index, every selection test transforms the data points around the tested position
+  to pixels and recalculates the whole visible graph line, to find its distance to the position.
+  Since QCustomPlot performs a selection test on every plottable for each click, and applications
+  commonly do so for each mouse move to implement hover effects, this becomes a bottleneck for
+  many graphs with hundreds of thousands of points.
+  
+  With the index, the pixel positions of the visible data points and line segments are sorted into
+  a \ref QCPPixelGrid with a cell size of the selection tolerance (\ref
+  QCustomPlot::setSelectionTolerance). Selection tests then only visit the cells around the tested
+  position. The index is built lazily, by the first selection test after the axis ranges, the axis
+  rect geometry, the line style or the data (via \ref setData or \ref addData) have changed, i.e.
+  typically once after each replot that changed the view. If you modify the data container
+  directly, call \ref invalidateSpatialIndex afterwards.
+  
+  Building the index takes about as long as a single selection test without the index, and it
+  requires memory in the order of the visible data. It is thus worthwhile if more than a few
+  selection tests are performed per change of the view. By default, the spatial index is disabled.
+  
+  Within the selection tolerance, the results are the same as without the index. Beyond it, the
+  reported distance and closest data point may differ, since the index takes all visible data
+  points into account, not only the ones close to the tested position in key direction.
+*/
+void QCPGraph::setSpatialIndex(bool enabled)
+{
+  mSpatialIndex = enabled;
+  invalidateSpatialIndex();
 }
 
 /*! \overload
@@ -363,19 +481,42 @@ void QCPGraph::addData(const QVector<double> &keys, const QVector<double> &value
 {
   if (keys.size() != values.size())
     qDebug() << Q_FUNC_INFO << "keys and values have different sizes:" << keys.size() << values.size();
-  const int n = qMin(keys.size(), values.size());
-  QVector<QCPGraphData> tempData(n);
+  addData(keys.constData(), values.constData(), qMin(keys.size(), values.size()), alreadySorted);
+  invalidateSpatialIndex();
+  markLayerDirty();
+}
+
+/*! \overload
+
+  Adds the \a count points provided in the raw arrays \a keys and \a values to the current data.
+  Both arrays must hold at least \a count elements.
+
+  If you can guarantee that the passed data points are sorted by \a keys in ascending order, you
+  can set \a alreadySorted to true, to improve performance by saving a sorting run. If \a
+  alreadySorted is false, the keys are checked for ascending order in a single linear pass first,
+  so that the sorting run is only performed if it is actually necessary.
+
+  Alternatively, you can also access and modify the data directly via the \ref data method, which
+  returns a pointer to the internal data container.
+*/
+void QCPGraph::addData(const double *keys, const double *values, int count, bool alreadySorted)
+{
+  if (count <= 0 || !keys || !values)
+    return;
+  if (!alreadySorted)
+    alreadySorted = std::is_sorted(keys, keys+count);
+  QVector<QCPGraphData> tempData(count);
   QVector<QCPGraphData>::iterator it = tempData.begin();
   const QVector<QCPGraphData>::iterator itEnd = tempData.end();
-  int i = 0;
   while (it != itEnd)
   {
-    it->key = keys[i];
-    it->value = values[i];
+    it->key = *keys++;
+    it->value = *values++;
     ++it;
-    ++i;
   }
   mDataContainer->add(tempData, alreadySorted); // don't modify tempData beyond this to prevent copy on write
+  invalidateSpatialIndex();
+  markLayerDirty();
 }
 
 /*! \overload
@@ -388,6 +529,141 @@ void QCPGraph::addData(const QVector<double> &keys, const QVector<double> &value
 void QCPGraph::addData(double key, double value)
 {
   mDataContainer->add(QCPGraphData(key, value));
+  invalidateSpatialIndex();
+  markLayerDirty();
+}
+
+/*!
+  Discards the spatial index (see \ref setSpatialIndex), so it is rebuilt by the next selection
+  test.
+  
+  This happens automatically when the data is changed via \ref setData or \ref addData, or the
+  axes or the graph line change. If you modify the data via the data container (\ref data)
+  directly while the spatial index is enabled, you must call this method afterwards.
+*/
+void QCPGraph::invalidateSpatialIndex()
+{
+  mSpatialIndexState.clear();
+  mSpatialIndexGrid.clear();
+}
+
+/*!
+  Returns the values of the graph at the provided \a keys, in the same order as \a keys.
+
+  If \a interpolate is true, the value is linearly interpolated between the two data points around
+  each key. Otherwise, the value of the data point with the key closest to each key is returned.
+  Keys outside the key range of the data are clamped to the first or last data point. This is the
+  same lookup a \ref QCPItemTracer performs for its graph key (see \ref
+  QCPItemTracer::setInterpolating), so it can be used to read many positions of a graph at once,
+  e.g. for crosshair readouts or sampling a graph at the keys of another one.
+
+  The \a keys don't need to be sorted, but sorted keys are looked up faster, see the raw array
+  overload of this method. If the graph has no data, or a key is NaN, the respective value is NaN.
+
+  \see QCPItemTracer::updatePosition
+*/
+QVector<double> QCPGraph::valuesAt(const QVector<double> &keys, bool interpolate) const
+{
+  QVector<double> result(keys.size());
+  valuesAt(keys.constData(), result.data(), keys.size(), interpolate);
+  return result;
+}
+
+/*! \overload
+
+  Writes the values of the graph at the \a count keys in the raw array \a keys to the array \a
+  values, which must hold at least \a count elements. If \a resultKeys is not nullptr, it receives
+  the key each value belongs to: the data point key if \a interpolate is false, the clamped key
+  otherwise.
+
+  The lookup of each key starts at the data point found for the previous key and gallops from
+  there, so ascending keys are looked up in a single merged walk over the data, with a cost that
+  grows only logarithmically with the distance between consecutive keys. Unsorted keys are still
+  handled correctly, with a cost per key of at most two binary searches.
+*/
+void QCPGraph::valuesAt(const double *keys, double *values, int count, bool interpolate, double *resultKeys) const
+{
+  if (count <= 0 || !keys || !values)
+    return;
+  const int dataCount = mDataContainer->size();
+  if (dataCount == 0)
+  {
+    std::fill(values, values+count, qQNaN());
+    if (resultKeys)
+      std::fill(resultKeys, resultKeys+count, qQNaN());
+    return;
+  }
+  
+  const QCPGraphDataContainer::const_iterator dataBegin = mDataContainer->constBegin();
+  const QCPGraphData &first = *dataBegin;
+  const QCPGraphData &last = *(dataBegin+dataCount-1);
+  int upper = 1; // index of the first data point with a key not below the previous key, in [1, dataCount-1] for keys inside the data key range
+  for (int i=0; i<count; ++i)
+  {
+    const double key = keys[i];
+    if (qIsNaN(key))
+    {
+      values[i] = qQNaN();
+      if (resultKeys)
+        resultKeys[i] = qQNaN();
+      continue;
+    }
+    if (key <= first.key || key >= last.key) // also covers a graph with a single data point
+    {
+      const QCPGraphData &clamped = key <= first.key ? first : last;
+      values[i] = clamped.value;
+      if (resultKeys)
+        resultKeys[i] = clamped.key;
+      continue;
+    }
+    // gallop from the previous position to find the first data point with a key not below key,
+    // which is in [1, dataCount-1] since first.key < key < last.key:
+    const QCPGraphData searchKey = QCPGraphData::fromSortKey(key);
+    int lo, hi; // the result lies in [lo, hi]
+    if ((dataBegin+upper)->key < key) // key is above the previous position, search forward
+    {
+      lo = upper+1;
+      int step = 1;
+      hi = qMin(upper+step, dataCount-1);
+      while (hi < dataCount-1 && (dataBegin+hi)->key < key)
+      {
+        lo = hi+1;
+        step *= 2;
+        hi = qMin(upper+step, dataCount-1);
+      }
+    } else if ((dataBegin+upper-1)->key >= key) // key is below the previous position, search backward
+    {
+      hi = upper-1;
+      int step = 1;
+      lo = qMax(upper-1-step, 1);
+      while (lo > 1 && (dataBegin+lo)->key >= key)
+      {
+        hi = lo;
+        step *= 2;
+        lo = qMax(upper-1-step, 1);
+      }
+    } else // key is between the same two data points as the previous key
+      lo = hi = upper;
+    upper = int(std::lower_bound(dataBegin+lo, dataBegin+hi, searchKey, qcpLessThanSortKey<QCPGraphData>)-dataBegin);
+    
+    const QCPGraphData &prev = *(dataBegin+upper-1);
+    const QCPGraphData &next = *(dataBegin+upper);
+    if (interpolate)
+    {
+      double slope = 0;
+      if (!qFuzzyCompare(double(next.key), double(prev.key)))
+        slope = (next.value-prev.value)/(next.key-prev.key);
+      values[i] = (key-prev.key)*slope+prev.value;
+      if (resultKeys)
+        resultKeys[i] = key;
+    } else
+    {
+      const QCPGraphData &closest = key < (prev.key+next.key)*0.5 ? prev : next;
+      values[i] = closest.value;
+      if (resultKeys)
+        resultKeys[i] = closest.key;
+    }
+  }
 }
 
 /*!
@@ -419,6 +695,49 @@ double QCPGraph::selectTest(const QPointF &pos, bool onlySelectable, QVariant *d
     return -1;
 }
 
+/*!
+  If the spatial index is enabled (\ref setSpatialIndex), only the data points in the cells of the
+  index overlapping \a rect are tested. Otherwise, and if \a rect reaches beyond the axis rect in
+  key direction, this is the regular implementation of \ref QCPAbstractPlottable1D.
+  
+  \seebaseclassmethod \ref QCPAbstractPlottable1D::selectTestRect
+*/
+QCPDataSelection QCPGraph::selectTestRect(const QRectF &rect, bool onlySelectable) const
+{
+  if (!mSpatialIndex || (onlySelectable && mSelectable == QCP::stNone) || mDataContainer->isEmpty() || !mKeyAxis || !mValueAxis)
+    return QCPAbstractPlottable1D<QCPGraphData>::selectTestRect(rect, onlySelectable);
+  
+  // the index only holds the data points of the visible key range, make sure rect doesn't reach beyond it:
+  const QRectF axisRect = mKeyAxis.data()->axisRect()->rect();
+  const QRectF normRect = rect.normalized();
+  const bool withinKeyRange = mKeyAxis.data()->orientation() == Qt::Horizontal ?
+        normRect.left() >= axisRect.left() && normRect.right() <= axisRect.right() :
+        normRect.top() >= axisRect.top() && normRect.bottom() <= axisRect.bottom();
+  if (!withinKeyRange)
+    return QCPAbstractPlottable1D<QCPGraphData>::selectTestRect(rect, onlySelectable);
+  
+  updateSpatialIndex();
+  QCPDataSelection result;
+  const QVector<int> indices = mSpatialIndexGrid.pointsInRect(normRect);
+  int segmentBegin = -1; // combine consecutive point indices to data ranges
+  for (int i=0; i<indices.size(); ++i)
+  {
+    if (segmentBegin == -1)
+    {
+      segmentBegin = indices.at(i);
+    } else if (indices.at(i) != indices.at(i-1)+1)
+    {
+      result.addDataRange(QCPDataRange(mSpatialIndexDataOffset+segmentBegin, mSpatialIndexDataOffset+indices.at(i-1)+1), false);
+      segmentBegin = indices.at(i);
+    }
+  }
+  if (segmentBegin != -1)
+    result.addDataRange(QCPDataRange(mSpatialIndexDataOffset+segmentBegin, mSpatialIndexDataOffset+indices.last()+1), false);
+  
+  result.simplify();
+  return result;
+}
+
 /* inherits documentation from base class */
 QCPRange QCPGraph::getKeyRange(bool &foundRange, QCP::SignDomain inSignDomain) const
 {
@@ -933,8 +1252,7 @@ void QCPGraph::drawScatterPlot(QCPPainter *painter, const QVector<QPointF> &scat
 {
   applyScattersAntialiasingHint(painter);
   style.applyTo(painter, mPen);
-  foreach (const QPointF &scatter, scatters)
-    style.drawShape(painter, scatter.x(), scatter.y());
+  style.drawShapes(painter, scatters, mParentPlot->plottingHints().testFlag(QCP::phCacheScatters));
 }
 
 /*!  \internal
@@ -1003,7 +1321,42 @@ void QCPGraph::getOptimizedLineData(QVector<QCPGraphData> *lineData, const QCPGr
       maxCount = int(2*keyPixelSpan+2);
   }
   
-  if (mAdaptiveSampling && dataCount >= maxCount) // use adaptive sampling only if there are at least two points per pixel on average
+  if (mAdaptiveSampling && dataCount >= maxCount && mDataContainer->levelOfDetailIndex()) // adaptive sampling that jumps over the data points of each pixel, using the level of detail index for their value span
+  {
+    int reversedFactor = keyAxis->pixelOrientation(); // is used to calculate keyEpsilon pixel into the correct direction
+    int reversedRound = reversedFactor==-1 ? 1 : 0; // is used to switch between floor (normal) and ceil (reversed) rounding of currentIntervalStartKey
+    double currentIntervalStartKey = keyAxis->pixelToCoord(int(keyAxis->coordToPixel(begin->key)+reversedRound));
+    double lastIntervalEndKey = currentIntervalStartKey;
+    double keyEpsilon = qAbs(currentIntervalStartKey-keyAxis->pixelToCoord(keyAxis->coordToPixel(currentIntervalStartKey)+1.0*reversedFactor)); // interval of one pixel on screen when mapped to plot key coordinates
+    bool keyEpsilonVariable = keyAxis->scaleType() == QCPAxis::stLogarithmic; // indicates whether keyEpsilon needs to be updated after every interval (for log axes)
+    QCPGraphDataContainer::const_iterator it = begin;
+    while (it != end)
+    {
+      QCPGraphDataContainer::const_iterator intervalEnd = std::lower_bound(it+1, end, QCPGraphData::fromSortKey(currentIntervalStartKey+keyEpsilon), qcpLessThanSortKey<QCPGraphData>);
+      if (intervalEnd-it >= 2) // pixel has multiple data points, consolidate them to a cluster
+      {
+        bool foundRange;
+        QCPRange span = mDataContainer->valueSpan(foundRange, it, intervalEnd);
+        if (!foundRange)
+          span = QCPRange(it->value, it->value);
+        if (lastIntervalEndKey < currentIntervalStartKey-keyEpsilon) // last point is further away, so first point of this cluster must be at a real data point
+          lineData->append(QCPGraphData(currentIntervalStartKey+keyEpsilon*0.2, it->value));
+        lineData->append(QCPGraphData(currentIntervalStartKey+keyEpsilon*0.25, span.lower));
+        lineData->append(QCPGraphData(currentIntervalStartKey+keyEpsilon*0.75, span.upper));
+        if (intervalEnd != end && intervalEnd->key > currentIntervalStartKey+keyEpsilon*2) // new pixel starts further away from this cluster, so make sure the last point of the cluster is at a real data point
+          lineData->append(QCPGraphData(currentIntervalStartKey+keyEpsilon*0.8, (intervalEnd-1)->value));
+      } else
+        lineData->append(*it);
+      lastIntervalEndKey = (intervalEnd-1)->key;
+      it = intervalEnd;
+      if (it != end)
+      {
+        currentIntervalStartKey = keyAxis->pixelToCoord(int(keyAxis->coordToPixel(it->key)+reversedRound));
+        if (keyEpsilonVariable)
+          keyEpsilon = qAbs(currentIntervalStartKey-keyAxis->pixelToCoord(keyAxis->coordToPixel(currentIntervalStartKey)+1.0*reversedFactor));
+      }
+    }
+  } else if (mAdaptiveSampling && dataCount >= maxCount) // use adaptive sampling only if there are at least two points per pixel on average
   {
     QCPGraphDataContainer::const_iterator it = begin;
     double minValue = it->value;
@@ -1711,6 +2064,9 @@ int QCPGraph::findIndexAboveY(const QVector<QPointF> *data, double y) const
   
   If either the graph has no data or if the line style is \ref lsNone and the scatter style's shape
   is \ref QCPScatterStyle::ssNone (i.e. there is no visual representation of the graph), returns -1.0.
+  
+  If the spatial index is enabled (\ref setSpatialIndex) and \a pixelPoint lies inside the axis
+  rect, the distance is looked up in the index.
 */
 double QCPGraph::pointDistance(const QPointF &pixelPoint, QCPGraphDataContainer::const_iterator &closestData) const
 {
@@ -1720,6 +2076,19 @@ double QCPGraph::pointDistance(const QPointF &pixelPoint, QCPGraphDataContainer:
   if (mLineStyle == lsNone && mScatterStyle.isNone())
     return -1.0;
   
+  if (mSpatialIndex && mKeyAxis && mKeyAxis.data()->axisRect()->rect().contains(pixelPoint.toPoint()))
+  {
+    updateSpatialIndex();
+    if (!mSpatialIndexGrid.isEmpty())
+    {
+      int pointIndex;
+      const double result = mSpatialIndexGrid.nearest(pixelPoint, &pointIndex);
+      if (pointIndex >= 0)
+        closestData = mDataContainer->constBegin()+mSpatialIndexDataOffset+pointIndex;
+      return result;
+    }
+  }
+  
   // calculate minimum distances to graph data points and find closestData iterator:
   double minDistSqr = (std::numeric_limits<double>::max)();
   // determine which key range comes into question, taking selection tolerance around pos into account:
@@ -1760,6 +2129,46 @@ double QCPGraph::pointDistance(const QPointF &pixelPoint, QCPGraphDataContainer:
   return qSqrt(minDistSqr);
 }
 
+/*! \internal
+  
+  Makes sure the spatial index (see \ref setSpatialIndex) reflects the current pixel
+  representation of the graph. The index is only rebuilt, if the axis ranges, scale types, range
+  reversals, the axis rect geometry, the data container, the line style, adaptive sampling or the
+  selection tolerance changed since it was last built, or if it was invalidated with \ref
+  invalidateSpatialIndex.
+*/
+void QCPGraph::updateSpatialIndex() const
+{
+  QCPAxis *keyAxis = mKeyAxis.data();
+  QCPAxis *valueAxis = mValueAxis.data();
+  if (!keyAxis || !valueAxis) { qDebug() << Q_FUNC_INFO << "invalid key or value axis"; return; }
+  
+  const QRect axisRect = keyAxis->axisRect()->rect();
+  QVector<double> state;
+  state << keyAxis->range().lower << keyAxis->range().upper << keyAxis->rangeReversed() << keyAxis->scaleType() << keyAxis->orientation()
+        << valueAxis->range().lower << valueAxis->range().upper << valueAxis->rangeReversed() << valueAxis->scaleType()
+        << axisRect.left() << axisRect.top() << axisRect.width() << axisRect.height()
+        << double(quintptr(mDataContainer.data())) << mDataContainer->size()
+        << mLineStyle << mAdaptiveSampling << mParentPlot->selectionTolerance();
+  if (state == mSpatialIndexState)
+    return;
+  mSpatialIndexState = state;
+  
+  // pixel positions of the visible data points:
+  QCPGraphDataContainer::const_iterator begin, end;
+  getVisibleDataBounds(begin, end, QCPDataRange(0, dataCount()));
+  mSpatialIndexDataOffset = int(begin-mDataContainer->constBegin());
+  QVector<QPointF> points;
+  points.reserve(int(end-begin));
+  for (QCPGraphDataContainer::const_iterator it=begin; it!=end; ++it)
+    points.append(coordsToPixels(it->key, it->value));
+  // graph line, the same way pointDistance would calculate it:
+  QVector<QPointF> lines;
+  if (mLineStyle != lsNone)
+    getLines(&lines, QCPDataRange(0, dataCount()));
+  mSpatialIndexGrid.build(axisRect, qMax(1, mParentPlot->selectionTolerance()), points, lines, mLineStyle == lsImpulse ? 2 : 1);
+}
+
 /*! \internal
   
   Finds the highest index of \a data, whose points y value is just below \a y. Assumes y values in
@@ -31,6 +31,8 @@
 #include "../plottable1d.h"
 #include "../painter.h"
 #include "../datacontainer.h"
+#include "../datacolumns.h"
+#include "../pixelgrid.h"
 
 class QCPPainter;
 class QCPAxis;
@@ -102,22 +104,33 @@ public:
   int scatterSkip() const { return mScatterSkip; }
   QCPGraph *channelFillGraph() const { return mChannelFillGraph.data(); }
   bool adaptiveSampling() const { return mAdaptiveSampling; }
+  bool levelOfDetailIndex() const { return mLevelOfDetailIndex; }
+  bool spatialIndex() const { return mSpatialIndex; }
   
   // setters:
   void setData(QSharedPointer<QCPGraphDataContainer> data);
   void setData(const QVector<double> &keys, const QVector<double> &values, bool alreadySorted=false);
+  void setData(const double *keys, const double *values, int count, bool alreadySorted=false);
+  void setData(const QCPDataColumns &columns);
   void setLineStyle(LineStyle ls);
   void setScatterStyle(const QCPScatterStyle &style);
   void setScatterSkip(int skip);
   void setChannelFillGraph(QCPGraph *targetGraph);
   void setAdaptiveSampling(bool enabled);
+  void setLevelOfDetailIndex(bool enabled);
+  void setSpatialIndex(bool enabled);
   
   // non-property methods:
   void addData(const QVector<double> &keys, const QVector<double> &values, bool alreadySorted=false);
+  void addData(const double *keys, const double *values, int count, bool alreadySorted=false);
   void addData(double key, double value);
+  void invalidateSpatialIndex();
+  QVector<double> valuesAt(const QVector<double> &keys, bool interpolate=true) const;
+  void valuesAt(const double *keys, double *values, int count, bool interpolate=true, double *resultKeys=nullptr) const;
   
   // reimplemented virtual methods:
   virtual double selectTest(const QPointF &pos, bool onlySelectable, QVariant *details=nullptr) const Q_DECL_OVERRIDE;
+  virtual QCPDataSelection selectTestRect(const QRectF &rect, bool onlySelectable) const Q_DECL_OVERRIDE;
   virtual QCPRange getKeyRange(bool &foundRange, QCP::SignDomain inSignDomain=QCP::sdBoth) const Q_DECL_OVERRIDE;
   virtual QCPRange getValueRange(bool &foundRange, QCP::SignDomain inSignDomain=QCP::sdBoth, const QCPRange &inKeyRange=QCPRange()) const Q_DECL_OVERRIDE;
   
@@ -128,6 +141,13 @@ protected:
   int mScatterSkip;
   QPointer<QCPGraph> mChannelFillGraph;
   bool mAdaptiveSampling;
+  bool mLevelOfDetailIndex;
+  bool mSpatialIndex;
+  
+  // non-property members:
+  mutable QCPPixelGrid mSpatialIndexGrid;
+  mutable QVector<double> mSpatialIndexState;
+  mutable int mSpatialIndexDataOffset;
   
   // reimplemented virtual methods:
   virtual void draw(QCPPainter *painter) Q_DECL_OVERRIDE;
@@ -162,6 +182,7 @@ protected:
   int findIndexBelowY(const QVector<QPointF> *data, double y) const;
   int findIndexAboveY(const QVector<QPointF> *data, double y) const;
   double pointDistance(const QPointF &pixelPoint, QCPGraphDataContainer::const_iterator &closestData) const;
+  void updateSpatialIndex() const;
   
   friend class QCustomPlot;
   friend class QCPLegend;
@@ -257,6 +257,7 @@ QCPStatisticalBox::QCPStatisticalBox(QCPAxis *keyAxis, QCPAxis *valueAxis) :
 void QCPStatisticalBox::setData(QSharedPointer<QCPStatisticalBoxDataContainer> data)
 {
   mDataContainer = data;
+  markLayerDirty();
 }
 /*! \overload
   
@@ -273,6 +274,7 @@ void QCPStatisticalBox::setData(const QVector<double> &keys, const QVector<doubl
 {
   mDataContainer->clear();
   addData(keys, minimum, lowerQuartile, median, upperQuartile, maximum, alreadySorted);
+  markLayerDirty();
 }
 
 /*!
@@ -283,6 +285,7 @@ void QCPStatisticalBox::setData(const QVector<double> &keys, const QVector<doubl
 void QCPStatisticalBox::setWidth(double width)
 {
   mWidth = width;
+  markLayerDirty();
 }
 
 /*!
@@ -296,6 +299,7 @@ void QCPStatisticalBox::setWidth(double width)
 void QCPStatisticalBox::setWhiskerWidth(double width)
 {
   mWhiskerWidth = width;
+  markLayerDirty();
 }
 
 /*!
@@ -312,6 +316,7 @@ void QCPStatisticalBox::setWhiskerWidth(double width)
 void QCPStatisticalBox::setWhiskerPen(const QPen &pen)
 {
   mWhiskerPen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -326,6 +331,7 @@ void QCPStatisticalBox::setWhiskerPen(const QPen &pen)
 void QCPStatisticalBox::setWhiskerBarPen(const QPen &pen)
 {
   mWhiskerBarPen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -337,6 +343,7 @@ void QCPStatisticalBox::setWhiskerBarPen(const QPen &pen)
 void QCPStatisticalBox::setWhiskerAntialiased(bool enabled)
 {
   mWhiskerAntialiased = enabled;
+  markLayerDirty();
 }
 
 /*!
@@ -345,6 +352,7 @@ void QCPStatisticalBox::setWhiskerAntialiased(bool enabled)
 void QCPStatisticalBox::setMedianPen(const QPen &pen)
 {
   mMedianPen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -356,6 +364,7 @@ void QCPStatisticalBox::setMedianPen(const QPen &pen)
 void QCPStatisticalBox::setOutlierStyle(const QCPScatterStyle &style)
 {
   mOutlierStyle = style;
+  markLayerDirty();
 }
 
 /*! \overload
@@ -393,6 +402,7 @@ void QCPStatisticalBox::addData(const QVector<double> &keys, const QVector<doubl
     ++i;
   }
   mDataContainer->add(tempData, alreadySorted); // don't modify tempData beyond this to prevent copy on write
+  markLayerDirty();
 }
 
 /*! \overload
@@ -406,6 +416,7 @@ void QCPStatisticalBox::addData(const QVector<double> &keys, const QVector<doubl
 void QCPStatisticalBox::addData(double key, double minimum, double lowerQuartile, double median, double upperQuartile, double maximum, const QVector<double> &outliers)
 {
   mDataContainer->add(QCPStatisticalBoxData(key, minimum, lowerQuartile, median, upperQuartile, maximum, outliers));
+  markLayerDirty();
 }
 
 /*!
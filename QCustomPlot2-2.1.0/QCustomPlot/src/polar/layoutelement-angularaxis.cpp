@@ -376,6 +376,7 @@ void QCPPolarAxisAngular::moveRange(double diff)
   QCPRange oldRange = mRange;
   mRange.lower += diff;
   mRange.upper += diff;
+  markLayerDirty();
   emit rangeChanged(mRange);
   emit rangeChanged(mRange, oldRange);
 }
@@ -411,6 +412,7 @@ void QCPPolarAxisAngular::scaleRange(double factor, double center)
   newRange.upper = (mRange.upper-center)*factor + center;
   if (QCPRange::validRange(newRange))
     mRange = newRange.sanitizedForLinScale();
+  markLayerDirty();
   emit rangeChanged(mRange);
   emit rangeChanged(mRange, oldRange);
 }
@@ -686,6 +688,7 @@ void QCPPolarAxisAngular::setBackground(const QPixmap &pm)
 {
   mBackgroundPixmap = pm;
   mScaledBackgroundPixmap = QPixmap();
+  markLayerDirty();
 }
 
 /*! \overload
@@ -704,6 +707,7 @@ void QCPPolarAxisAngular::setBackground(const QPixmap &pm)
 void QCPPolarAxisAngular::setBackground(const QBrush &brush)
 {
   mBackgroundBrush = brush;
+  markLayerDirty();
 }
 
 /*! \overload
@@ -719,6 +723,7 @@ void QCPPolarAxisAngular::setBackground(const QPixmap &pm, bool scaled, Qt::Aspe
   mScaledBackgroundPixmap = QPixmap();
   mBackgroundScaled = scaled;
   mBackgroundScaledMode = mode;
+  markLayerDirty();
 }
 
 /*!
@@ -734,6 +739,7 @@ void QCPPolarAxisAngular::setBackground(const QPixmap &pm, bool scaled, Qt::Aspe
 void QCPPolarAxisAngular::setBackgroundScaled(bool scaled)
 {
   mBackgroundScaled = scaled;
+  markLayerDirty();
 }
 
 /*!
@@ -744,6 +750,7 @@ void QCPPolarAxisAngular::setBackgroundScaled(bool scaled)
 void QCPPolarAxisAngular::setBackgroundScaledMode(Qt::AspectRatioMode mode)
 {
   mBackgroundScaledMode = mode;
+  markLayerDirty();
 }
 
 void QCPPolarAxisAngular::setRangeDrag(bool enabled)
@@ -783,6 +790,7 @@ void QCPPolarAxisAngular::setRange(const QCPRange &range)
   if (!QCPRange::validRange(range)) return;
   QCPRange oldRange = mRange;
   mRange = range.sanitizedForLinScale();
+  markLayerDirty();
   emit rangeChanged(mRange);
   emit rangeChanged(mRange, oldRange);
 }
@@ -828,6 +836,7 @@ void QCPPolarAxisAngular::setSelectedParts(const SelectableParts &selected)
     mSelectedParts = selected;
     emit selectionChanged(mSelectedParts);
   }
+  markLayerDirty();
 }
 
 /*!
@@ -849,6 +858,7 @@ void QCPPolarAxisAngular::setRange(double lower, double upper)
   mRange.lower = lower;
   mRange.upper = upper;
   mRange = mRange.sanitizedForLinScale();
+  markLayerDirty();
   emit rangeChanged(mRange);
   emit rangeChanged(mRange, oldRange);
 }
@@ -872,6 +882,7 @@ void QCPPolarAxisAngular::setRange(double position, double size, Qt::AlignmentFl
     setRange(position-size, position);
   else // alignment == Qt::AlignCenter
     setRange(position-size/2.0, position+size/2.0);
+  markLayerDirty();
 }
 
 /*!
@@ -886,6 +897,7 @@ void QCPPolarAxisAngular::setRangeLower(double lower)
   QCPRange oldRange = mRange;
   mRange.lower = lower;
   mRange = mRange.sanitizedForLinScale();
+  markLayerDirty();
   emit rangeChanged(mRange);
   emit rangeChanged(mRange, oldRange);
 }
@@ -902,6 +914,7 @@ void QCPPolarAxisAngular::setRangeUpper(double upper)
   QCPRange oldRange = mRange;
   mRange.upper = upper;
   mRange = mRange.sanitizedForLinScale();
+  markLayerDirty();
   emit rangeChanged(mRange);
   emit rangeChanged(mRange, oldRange);
 }
@@ -918,12 +931,14 @@ void QCPPolarAxisAngular::setRangeUpper(double upper)
 void QCPPolarAxisAngular::setRangeReversed(bool reversed)
 {
   mRangeReversed = reversed;
+  markLayerDirty();
 }
 
 void QCPPolarAxisAngular::setAngle(double degrees)
 {
   mAngle = degrees;
   mAngleRad = mAngle/180.0*M_PI;
+  markLayerDirty();
 }
 
 /*!
@@ -946,6 +961,7 @@ void QCPPolarAxisAngular::setTicker(QSharedPointer<QCPAxisTicker> ticker)
   else
     qDebug() << Q_FUNC_INFO << "can not set 0 as axis ticker";
   // no need to invalidate margin cache here because produced tick labels are checked for changes in setupTickVector
+  markLayerDirty();
 }
 
 /*!
@@ -963,6 +979,7 @@ void QCPPolarAxisAngular::setTicks(bool show)
     mTicks = show;
     //mCachedMarginValid = false;
   }
+  markLayerDirty();
 }
 
 /*!
@@ -977,6 +994,7 @@ void QCPPolarAxisAngular::setTickLabels(bool show)
     if (!mTickLabels)
       mTickVectorLabels.clear();
   }
+  markLayerDirty();
 }
 
 /*!
@@ -986,6 +1004,7 @@ void QCPPolarAxisAngular::setTickLabels(bool show)
 void QCPPolarAxisAngular::setTickLabelPadding(int padding)
 {
   mLabelPainter.setPadding(padding);
+  markLayerDirty();
 }
 
 /*!
@@ -996,6 +1015,7 @@ void QCPPolarAxisAngular::setTickLabelPadding(int padding)
 void QCPPolarAxisAngular::setTickLabelFont(const QFont &font)
 {
   mTickLabelFont = font;
+  markLayerDirty();
 }
 
 /*!
@@ -1006,6 +1026,7 @@ void QCPPolarAxisAngular::setTickLabelFont(const QFont &font)
 void QCPPolarAxisAngular::setTickLabelColor(const QColor &color)
 {
   mTickLabelColor = color;
+  markLayerDirty();
 }
 
 /*!
@@ -1020,6 +1041,7 @@ void QCPPolarAxisAngular::setTickLabelColor(const QColor &color)
 void QCPPolarAxisAngular::setTickLabelRotation(double degrees)
 {
   mLabelPainter.setRotation(degrees);
+  markLayerDirty();
 }
 
 void QCPPolarAxisAngular::setTickLabelMode(LabelMode mode)
@@ -1029,6 +1051,7 @@ void QCPPolarAxisAngular::setTickLabelMode(LabelMode mode)
     case lmUpright: mLabelPainter.setAnchorMode(QCPLabelPainterPrivate::amSkewedUpright); break;
     case lmRotated: mLabelPainter.setAnchorMode(QCPLabelPainterPrivate::amSkewedRotated); break;
   }
+  markLayerDirty();
 }
 
 /*!
@@ -1109,6 +1132,7 @@ void QCPPolarAxisAngular::setNumberFormat(const QString &formatCode)
   }
   mLabelPainter.setSubstituteExponent(mNumberBeautifulPowers);
   mLabelPainter.setMultiplicationSymbol(mNumberMultiplyCross ? QCPLabelPainterPrivate::SymbolCross : QCPLabelPainterPrivate::SymbolDot);
+  markLayerDirty();
 }
 
 /*!
@@ -1123,6 +1147,7 @@ void QCPPolarAxisAngular::setNumberPrecision(int precision)
     mNumberPrecision = precision;
     //mCachedMarginValid = false;
   }
+  markLayerDirty();
 }
 
 /*!
@@ -1137,6 +1162,7 @@ void QCPPolarAxisAngular::setTickLength(int inside, int outside)
 {
   setTickLengthIn(inside);
   setTickLengthOut(outside);
+  markLayerDirty();
 }
 
 /*!
@@ -1151,6 +1177,7 @@ void QCPPolarAxisAngular::setTickLengthIn(int inside)
   {
     mTickLengthIn = inside;
   }
+  markLayerDirty();
 }
 
 /*!
@@ -1167,6 +1194,7 @@ void QCPPolarAxisAngular::setTickLengthOut(int outside)
     mTickLengthOut = outside;
     //mCachedMarginValid = false; // only outside tick length can change margin
   }
+  markLayerDirty();
 }
 
 /*!
@@ -1183,6 +1211,7 @@ void QCPPolarAxisAngular::setSubTicks(bool show)
     mSubTicks = show;
     //mCachedMarginValid = false;
   }
+  markLayerDirty();
 }
 
 /*!
@@ -1197,6 +1226,7 @@ void QCPPolarAxisAngular::setSubTickLength(int inside, int outside)
 {
   setSubTickLengthIn(inside);
   setSubTickLengthOut(outside);
+  markLayerDirty();
 }
 
 /*!
@@ -1211,6 +1241,7 @@ void QCPPolarAxisAngular::setSubTickLengthIn(int inside)
   {
     mSubTickLengthIn = inside;
   }
+  markLayerDirty();
 }
 
 /*!
@@ -1227,6 +1258,7 @@ void QCPPolarAxisAngular::setSubTickLengthOut(int outside)
     mSubTickLengthOut = outside;
     //mCachedMarginValid = false; // only outside tick length can change margin
   }
+  markLayerDirty();
 }
 
 /*!
@@ -1237,6 +1269,7 @@ void QCPPolarAxisAngular::setSubTickLengthOut(int outside)
 void QCPPolarAxisAngular::setBasePen(const QPen &pen)
 {
   mBasePen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -1247,6 +1280,7 @@ void QCPPolarAxisAngular::setBasePen(const QPen &pen)
 void QCPPolarAxisAngular::setTickPen(const QPen &pen)
 {
   mTickPen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -1257,6 +1291,7 @@ void QCPPolarAxisAngular::setTickPen(const QPen &pen)
 void QCPPolarAxisAngular::setSubTickPen(const QPen &pen)
 {
   mSubTickPen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -1271,6 +1306,7 @@ void QCPPolarAxisAngular::setLabelFont(const QFont &font)
     mLabelFont = font;
     //mCachedMarginValid = false;
   }
+  markLayerDirty();
 }
 
 /*!
@@ -1281,6 +1317,7 @@ void QCPPolarAxisAngular::setLabelFont(const QFont &font)
 void QCPPolarAxisAngular::setLabelColor(const QColor &color)
 {
   mLabelColor = color;
+  markLayerDirty();
 }
 
 /*!
@@ -1294,6 +1331,7 @@ void QCPPolarAxisAngular::setLabel(const QString &str)
     mLabel = str;
     //mCachedMarginValid = false;
   }
+  markLayerDirty();
 }
 
 /*!
@@ -1308,6 +1346,7 @@ void QCPPolarAxisAngular::setLabelPadding(int padding)
     mLabelPadding = padding;
     //mCachedMarginValid = false;
   }
+  markLayerDirty();
 }
 
 /*!
@@ -1322,6 +1361,7 @@ void QCPPolarAxisAngular::setSelectedTickLabelFont(const QFont &font)
     mSelectedTickLabelFont = font;
     // don't set mCachedMarginValid to false here because margin calculation is always done with non-selected fonts
   }
+  markLayerDirty();
 }
 
 /*!
@@ -1333,6 +1373,7 @@ void QCPPolarAxisAngular::setSelectedLabelFont(const QFont &font)
 {
   mSelectedLabelFont = font;
   // don't set mCachedMarginValid to false here because margin calculation is always done with non-selected fonts
+  markLayerDirty();
 }
 
 /*!
@@ -1346,6 +1387,7 @@ void QCPPolarAxisAngular::setSelectedTickLabelColor(const QColor &color)
   {
     mSelectedTickLabelColor = color;
   }
+  markLayerDirty();
 }
 
 /*!
@@ -1356,6 +1398,7 @@ void QCPPolarAxisAngular::setSelectedTickLabelColor(const QColor &color)
 void QCPPolarAxisAngular::setSelectedLabelColor(const QColor &color)
 {
   mSelectedLabelColor = color;
+  markLayerDirty();
 }
 
 /*!
@@ -1366,6 +1409,7 @@ void QCPPolarAxisAngular::setSelectedLabelColor(const QColor &color)
 void QCPPolarAxisAngular::setSelectedBasePen(const QPen &pen)
 {
   mSelectedBasePen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -1376,6 +1420,7 @@ void QCPPolarAxisAngular::setSelectedBasePen(const QPen &pen)
 void QCPPolarAxisAngular::setSelectedTickPen(const QPen &pen)
 {
   mSelectedTickPen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -1386,6 +1431,7 @@ void QCPPolarAxisAngular::setSelectedTickPen(const QPen &pen)
 void QCPPolarAxisAngular::setSelectedSubTickPen(const QPen &pen)
 {
   mSelectedSubTickPen = pen;
+  markLayerDirty();
 }
 
 /*! \internal
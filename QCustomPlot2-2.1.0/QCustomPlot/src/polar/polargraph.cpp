@@ -177,6 +177,7 @@ QCPPolarGraph::~QCPPolarGraph()
 void QCPPolarGraph::setName(const QString &name)
 {
   mName = name;
+  markLayerDirty();
 }
 
 /*!
@@ -188,6 +189,7 @@ void QCPPolarGraph::setName(const QString &name)
 void QCPPolarGraph::setAntialiasedFill(bool enabled)
 {
   mAntialiasedFill = enabled;
+  markLayerDirty();
 }
 
 /*!
@@ -199,6 +201,7 @@ void QCPPolarGraph::setAntialiasedFill(bool enabled)
 void QCPPolarGraph::setAntialiasedScatters(bool enabled)
 {
   mAntialiasedScatters = enabled;
+  markLayerDirty();
 }
 
 /*!
@@ -212,6 +215,7 @@ void QCPPolarGraph::setAntialiasedScatters(bool enabled)
 void QCPPolarGraph::setPen(const QPen &pen)
 {
   mPen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -226,11 +230,13 @@ void QCPPolarGraph::setPen(const QPen &pen)
 void QCPPolarGraph::setBrush(const QBrush &brush)
 {
   mBrush = brush;
+  markLayerDirty();
 }
 
 void QCPPolarGraph::setPeriodic(bool enabled)
 {
   mPeriodic = enabled;
+  markLayerDirty();
 }
 
 /*!
@@ -247,6 +253,7 @@ void QCPPolarGraph::setPeriodic(bool enabled)
 void QCPPolarGraph::setKeyAxis(QCPPolarAxisAngular *axis)
 {
   mKeyAxis = axis;
+  markLayerDirty();
 }
 
 /*!
@@ -263,6 +270,7 @@ void QCPPolarGraph::setKeyAxis(QCPPolarAxisAngular *axis)
 void QCPPolarGraph::setValueAxis(QCPPolarAxisRadial *axis)
 {
   mValueAxis = axis;
+  markLayerDirty();
 }
 
 /*!
@@ -318,6 +326,7 @@ void QCPPolarGraph::setSelection(QCPDataSelection selection)
     emit selectionChanged(selected());
     emit selectionChanged(mSelection);
   }
+  markLayerDirty();
 }
 
 /*! \overload
@@ -338,6 +347,7 @@ void QCPPolarGraph::setSelection(QCPDataSelection selection)
 void QCPPolarGraph::setData(QSharedPointer<QCPGraphDataContainer> data)
 {
   mDataContainer = data;
+  markLayerDirty();
 }
 
 /*! \overload
@@ -355,6 +365,26 @@ void QCPPolarGraph::setData(const QVector<double> &keys, const QVector<double> &
 {
   mDataContainer->clear();
   addData(keys, values, alreadySorted);
+  markLayerDirty();
+}
+
+/*! \overload
+  
+  Replaces the current data with the key/value pairs held by \a columns.
+  
+  Since \ref QCPDataColumns keeps its data sorted by key, the points are transferred into the
+  data container in a single pass, without sorting or per-point insertion. This is the preferred
+  way to hand over large data sets that are available as separate key and value arrays.
+  
+  The points are copied: the plottable draws from its own data container and doesn't refer to \a
+  columns afterwards, so \a columns can be discarded once the data is set.
+  
+  \see QCPDataColumns
+*/
+void QCPPolarGraph::setData(const QCPDataColumns &columns)
+{
+  mDataContainer->set(columns.toDataVector<QCPGraphData>(), true);
+  markLayerDirty();
 }
 
 /*!
@@ -366,6 +396,7 @@ void QCPPolarGraph::setData(const QVector<double> &keys, const QVector<double> &
 void QCPPolarGraph::setLineStyle(LineStyle ls)
 {
   mLineStyle = ls;
+  markLayerDirty();
 }
 
 /*!
@@ -377,6 +408,7 @@ void QCPPolarGraph::setLineStyle(LineStyle ls)
 void QCPPolarGraph::setScatterStyle(const QCPScatterStyle &style)
 {
   mScatterStyle = style;
+  markLayerDirty();
 }
 
 void QCPPolarGraph::addData(const QVector<double> &keys, const QVector<double> &values, bool alreadySorted)
@@ -428,6 +460,7 @@ void QCPPolarGraph::setSelectionDecorator(QCPSelectionDecorator *decorator)
     delete mSelectionDecorator;
     mSelectionDecorator = 0;
   }
+  markLayerDirty();
 }
 */
 
@@ -816,8 +849,7 @@ void QCPPolarGraph::drawScatterPlot(QCPPainter *painter, const QVector<QPointF>
 {
   applyScattersAntialiasingHint(painter);
   style.applyTo(painter, mPen);
-  for (int i=0; i<scatters.size(); ++i)
-    style.drawShape(painter, scatters.at(i).x(), scatters.at(i).y());
+  style.drawShapes(painter, scatters, mParentPlot->plottingHints().testFlag(QCP::phCacheScatters));
 }
 
 void QCPPolarGraph::drawLegendIcon(QCPPainter *painter, const QRectF &rect) const
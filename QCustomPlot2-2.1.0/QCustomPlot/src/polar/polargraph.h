@@ -119,6 +119,7 @@ public:
   //void setSelectionDecorator(QCPSelectionDecorator *decorator);
   void setData(QSharedPointer<QCPGraphDataContainer> data);
   void setData(const QVector<double> &keys, const QVector<double> &values, bool alreadySorted=false);
+  void setData(const QCPDataColumns &columns);
   void setLineStyle(LineStyle ls);
   void setScatterStyle(const QCPScatterStyle &style);
 
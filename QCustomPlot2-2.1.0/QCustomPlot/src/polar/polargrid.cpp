@@ -72,16 +72,19 @@ QCPPolarGrid::QCPPolarGrid(QCPPolarAxisAngular *parentAxis) :
 void QCPPolarGrid::setRadialAxis(QCPPolarAxisRadial *axis)
 {
   mRadialAxis = axis;
+  markLayerDirty();
 }
 
 void QCPPolarGrid::setType(GridTypes type)
 {
   mType = type;
+  markLayerDirty();
 }
 
 void QCPPolarGrid::setSubGridType(GridTypes type)
 {
   mSubGridType = type;
+  markLayerDirty();
 }
 
 /*!
@@ -90,6 +93,7 @@ void QCPPolarGrid::setSubGridType(GridTypes type)
 void QCPPolarGrid::setAntialiasedSubGrid(bool enabled)
 {
   mAntialiasedSubGrid = enabled;
+  markLayerDirty();
 }
 
 /*!
@@ -98,6 +102,7 @@ void QCPPolarGrid::setAntialiasedSubGrid(bool enabled)
 void QCPPolarGrid::setAntialiasedZeroLine(bool enabled)
 {
   mAntialiasedZeroLine = enabled;
+  markLayerDirty();
 }
 
 /*!
@@ -106,6 +111,7 @@ void QCPPolarGrid::setAntialiasedZeroLine(bool enabled)
 void QCPPolarGrid::setAngularPen(const QPen &pen)
 {
   mAngularPen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -114,21 +120,25 @@ void QCPPolarGrid::setAngularPen(const QPen &pen)
 void QCPPolarGrid::setAngularSubGridPen(const QPen &pen)
 {
   mAngularSubGridPen = pen;
+  markLayerDirty();
 }
 
 void QCPPolarGrid::setRadialPen(const QPen &pen)
 {
   mRadialPen = pen;
+  markLayerDirty();
 }
 
 void QCPPolarGrid::setRadialSubGridPen(const QPen &pen)
 {
   mRadialSubGridPen = pen;
+  markLayerDirty();
 }
 
 void QCPPolarGrid::setRadialZeroLinePen(const QPen &pen)
 {
   mRadialZeroLinePen = pen;
+  markLayerDirty();
 }
 
 /*! \internal
@@ -276,6 +276,7 @@ void QCPPolarAxisRadial::setScaleType(QCPPolarAxisRadial::ScaleType type)
     //mCachedMarginValid = false;
     emit scaleTypeChanged(mScaleType);
   }
+  markLayerDirty();
 }
 
 /*!
@@ -300,6 +301,7 @@ void QCPPolarAxisRadial::setRange(const QCPRange &range)
   {
     mRange = range.sanitizedForLinScale();
   }
+  markLayerDirty();
   emit rangeChanged(mRange);
   emit rangeChanged(mRange, oldRange);
 }
@@ -345,6 +347,7 @@ void QCPPolarAxisRadial::setSelectedParts(const SelectableParts &selected)
     mSelectedParts = selected;
     emit selectionChanged(mSelectedParts);
   }
+  markLayerDirty();
 }
 
 /*!
@@ -372,6 +375,7 @@ void QCPPolarAxisRadial::setRange(double lower, double upper)
   {
     mRange = mRange.sanitizedForLinScale();
   }
+  markLayerDirty();
   emit rangeChanged(mRange);
   emit rangeChanged(mRange, oldRange);
 }
@@ -395,6 +399,7 @@ void QCPPolarAxisRadial::setRange(double position, double size, Qt::AlignmentFla
     setRange(position-size, position);
   else // alignment == Qt::AlignCenter
     setRange(position-size/2.0, position+size/2.0);
+  markLayerDirty();
 }
 
 /*!
@@ -415,6 +420,7 @@ void QCPPolarAxisRadial::setRangeLower(double lower)
   {
     mRange = mRange.sanitizedForLinScale();
   }
+  markLayerDirty();
   emit rangeChanged(mRange);
   emit rangeChanged(mRange, oldRange);
 }
@@ -437,6 +443,7 @@ void QCPPolarAxisRadial::setRangeUpper(double upper)
   {
     mRange = mRange.sanitizedForLinScale();
   }
+  markLayerDirty();
   emit rangeChanged(mRange);
   emit rangeChanged(mRange, oldRange);
 }
@@ -453,16 +460,19 @@ void QCPPolarAxisRadial::setRangeUpper(double upper)
 void QCPPolarAxisRadial::setRangeReversed(bool reversed)
 {
   mRangeReversed = reversed;
+  markLayerDirty();
 }
 
 void QCPPolarAxisRadial::setAngle(double degrees)
 {
   mAngle = degrees;
+  markLayerDirty();
 }
 
 void QCPPolarAxisRadial::setAngleReference(AngleReference reference)
 {
   mAngleReference = reference;
+  markLayerDirty();
 }
 
 /*!
@@ -485,6 +495,7 @@ void QCPPolarAxisRadial::setTicker(QSharedPointer<QCPAxisTicker> ticker)
   else
     qDebug() << Q_FUNC_INFO << "can not set 0 as axis ticker";
   // no need to invalidate margin cache here because produced tick labels are checked for changes in setupTickVector
+  markLayerDirty();
 }
 
 /*!
@@ -502,6 +513,7 @@ void QCPPolarAxisRadial::setTicks(bool show)
     mTicks = show;
     //mCachedMarginValid = false;
   }
+  markLayerDirty();
 }
 
 /*!
@@ -516,6 +528,7 @@ void QCPPolarAxisRadial::setTickLabels(bool show)
     if (!mTickLabels)
       mTickVectorLabels.clear();
   }
+  markLayerDirty();
 }
 
 /*!
@@ -525,6 +538,7 @@ void QCPPolarAxisRadial::setTickLabels(bool show)
 void QCPPolarAxisRadial::setTickLabelPadding(int padding)
 {
   mLabelPainter.setPadding(padding);
+  markLayerDirty();
 }
 
 /*!
@@ -539,6 +553,7 @@ void QCPPolarAxisRadial::setTickLabelFont(const QFont &font)
     mTickLabelFont = font;
     //mCachedMarginValid = false;
   }
+  markLayerDirty();
 }
 
 /*!
@@ -549,6 +564,7 @@ void QCPPolarAxisRadial::setTickLabelFont(const QFont &font)
 void QCPPolarAxisRadial::setTickLabelColor(const QColor &color)
 {
   mTickLabelColor = color;
+  markLayerDirty();
 }
 
 /*!
@@ -563,6 +579,7 @@ void QCPPolarAxisRadial::setTickLabelColor(const QColor &color)
 void QCPPolarAxisRadial::setTickLabelRotation(double degrees)
 {
   mLabelPainter.setRotation(degrees);
+  markLayerDirty();
 }
 
 void QCPPolarAxisRadial::setTickLabelMode(LabelMode mode)
@@ -572,6 +589,7 @@ void QCPPolarAxisRadial::setTickLabelMode(LabelMode mode)
     case lmUpright: mLabelPainter.setAnchorMode(QCPLabelPainterPrivate::amSkewedUpright); break;
     case lmRotated: mLabelPainter.setAnchorMode(QCPLabelPainterPrivate::amSkewedRotated); break;
   }
+  markLayerDirty();
 }
 
 /*!
@@ -652,6 +670,7 @@ void QCPPolarAxisRadial::setNumberFormat(const QString &formatCode)
   }
   mLabelPainter.setSubstituteExponent(mNumberBeautifulPowers);
   mLabelPainter.setMultiplicationSymbol(mNumberMultiplyCross ? QCPLabelPainterPrivate::SymbolCross : QCPLabelPainterPrivate::SymbolDot);
+  markLayerDirty();
 }
 
 /*!
@@ -666,6 +685,7 @@ void QCPPolarAxisRadial::setNumberPrecision(int precision)
     mNumberPrecision = precision;
     //mCachedMarginValid = false;
   }
+  markLayerDirty();
 }
 
 /*!
@@ -680,6 +700,7 @@ void QCPPolarAxisRadial::setTickLength(int inside, int outside)
 {
   setTickLengthIn(inside);
   setTickLengthOut(outside);
+  markLayerDirty();
 }
 
 /*!
@@ -694,6 +715,7 @@ void QCPPolarAxisRadial::setTickLengthIn(int inside)
   {
     mTickLengthIn = inside;
   }
+  markLayerDirty();
 }
 
 /*!
@@ -710,6 +732,7 @@ void QCPPolarAxisRadial::setTickLengthOut(int outside)
     mTickLengthOut = outside;
     //mCachedMarginValid = false; // only outside tick length can change margin
   }
+  markLayerDirty();
 }
 
 /*!
@@ -726,6 +749,7 @@ void QCPPolarAxisRadial::setSubTicks(bool show)
     mSubTicks = show;
     //mCachedMarginValid = false;
   }
+  markLayerDirty();
 }
 
 /*!
@@ -740,6 +764,7 @@ void QCPPolarAxisRadial::setSubTickLength(int inside, int outside)
 {
   setSubTickLengthIn(inside);
   setSubTickLengthOut(outside);
+  markLayerDirty();
 }
 
 /*!
@@ -754,6 +779,7 @@ void QCPPolarAxisRadial::setSubTickLengthIn(int inside)
   {
     mSubTickLengthIn = inside;
   }
+  markLayerDirty();
 }
 
 /*!
@@ -770,6 +796,7 @@ void QCPPolarAxisRadial::setSubTickLengthOut(int outside)
     mSubTickLengthOut = outside;
     //mCachedMarginValid = false; // only outside tick length can change margin
   }
+  markLayerDirty();
 }
 
 /*!
@@ -780,6 +807,7 @@ void QCPPolarAxisRadial::setSubTickLengthOut(int outside)
 void QCPPolarAxisRadial::setBasePen(const QPen &pen)
 {
   mBasePen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -790,6 +818,7 @@ void QCPPolarAxisRadial::setBasePen(const QPen &pen)
 void QCPPolarAxisRadial::setTickPen(const QPen &pen)
 {
   mTickPen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -800,6 +829,7 @@ void QCPPolarAxisRadial::setTickPen(const QPen &pen)
 void QCPPolarAxisRadial::setSubTickPen(const QPen &pen)
 {
   mSubTickPen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -814,6 +844,7 @@ void QCPPolarAxisRadial::setLabelFont(const QFont &font)
     mLabelFont = font;
     //mCachedMarginValid = false;
   }
+  markLayerDirty();
 }
 
 /*!
@@ -824,6 +855,7 @@ void QCPPolarAxisRadial::setLabelFont(const QFont &font)
 void QCPPolarAxisRadial::setLabelColor(const QColor &color)
 {
   mLabelColor = color;
+  markLayerDirty();
 }
 
 /*!
@@ -837,6 +869,7 @@ void QCPPolarAxisRadial::setLabel(const QString &str)
     mLabel = str;
     //mCachedMarginValid = false;
   }
+  markLayerDirty();
 }
 
 /*!
@@ -851,6 +884,7 @@ void QCPPolarAxisRadial::setLabelPadding(int padding)
     mLabelPadding = padding;
     //mCachedMarginValid = false;
   }
+  markLayerDirty();
 }
 
 /*!
@@ -865,6 +899,7 @@ void QCPPolarAxisRadial::setSelectedTickLabelFont(const QFont &font)
     mSelectedTickLabelFont = font;
     // don't set mCachedMarginValid to false here because margin calculation is always done with non-selected fonts
   }
+  markLayerDirty();
 }
 
 /*!
@@ -876,6 +911,7 @@ void QCPPolarAxisRadial::setSelectedLabelFont(const QFont &font)
 {
   mSelectedLabelFont = font;
   // don't set mCachedMarginValid to false here because margin calculation is always done with non-selected fonts
+  markLayerDirty();
 }
 
 /*!
@@ -889,6 +925,7 @@ void QCPPolarAxisRadial::setSelectedTickLabelColor(const QColor &color)
   {
     mSelectedTickLabelColor = color;
   }
+  markLayerDirty();
 }
 
 /*!
@@ -899,6 +936,7 @@ void QCPPolarAxisRadial::setSelectedTickLabelColor(const QColor &color)
 void QCPPolarAxisRadial::setSelectedLabelColor(const QColor &color)
 {
   mSelectedLabelColor = color;
+  markLayerDirty();
 }
 
 /*!
@@ -909,6 +947,7 @@ void QCPPolarAxisRadial::setSelectedLabelColor(const QColor &color)
 void QCPPolarAxisRadial::setSelectedBasePen(const QPen &pen)
 {
   mSelectedBasePen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -919,6 +958,7 @@ void QCPPolarAxisRadial::setSelectedBasePen(const QPen &pen)
 void QCPPolarAxisRadial::setSelectedTickPen(const QPen &pen)
 {
   mSelectedTickPen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -929,6 +969,7 @@ void QCPPolarAxisRadial::setSelectedTickPen(const QPen &pen)
 void QCPPolarAxisRadial::setSelectedSubTickPen(const QPen &pen)
 {
   mSelectedSubTickPen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -950,6 +991,7 @@ void QCPPolarAxisRadial::moveRange(double diff)
     mRange.lower *= diff;
     mRange.upper *= diff;
   }
+  markLayerDirty();
   emit rangeChanged(mRange);
   emit rangeChanged(mRange, oldRange);
 }
@@ -999,6 +1041,7 @@ void QCPPolarAxisRadial::scaleRange(double factor, double center)
     } else
       qDebug() << Q_FUNC_INFO << "Center of scaling operation doesn't lie in same logarithmic sign domain as range:" << center;
   }
+  markLayerDirty();
   emit rangeChanged(mRange);
   emit rangeChanged(mRange, oldRange);
 }
@@ -58,6 +58,7 @@ HEADERS += \
     plottables/plottable-colormap.h \
     plottables/plottable-financial.h \
     plottables/plottable-errorbar.h \
+    plottables/plottable-annotations.h \
     items/item-straightline.h \
     items/item-line.h \
     items/item-curve.h \
@@ -73,6 +74,8 @@ HEADERS += \
     layoutelements/layoutelement-colorscale.h \
     colorgradient.h \
     vector2d.h \
+    pixelgrid.h \
+    labelcache.h \
     axis/axistickerdatetime.h \
     axis/axistickertime.h \
     axis/axistickerfixed.h \
@@ -80,6 +83,7 @@ HEADERS += \
     axis/axistickerpi.h \
     axis/axistickerlog.h \
     datacontainer.h \
+    datacolumns.h \
     selection.h \
     selectionrect.h \
     plottable1d.h \
@@ -110,6 +114,7 @@ SOURCES += \
     plottables/plottable-colormap.cpp \
     plottables/plottable-financial.cpp \
     plottables/plottable-errorbar.cpp \
+    plottables/plottable-annotations.cpp \
     items/item-straightline.cpp \
     items/item-line.cpp \
     items/item-curve.cpp \
@@ -125,6 +130,8 @@ SOURCES += \
     layoutelements/layoutelement-colorscale.cpp \
     colorgradient.cpp \
     vector2d.cpp \
+    pixelgrid.cpp \
+    labelcache.cpp \
     axis/axistickerdatetime.cpp \
     axis/axistickertime.cpp \
     axis/axistickerfixed.cpp \
@@ -134,6 +141,7 @@ SOURCES += \
     selection.cpp \
     selectionrect.cpp \
     scatterstyle.cpp \
+    datacolumns.cpp \
     selectiondecorator-bracket.cpp \
     polar/radialaxis.cpp \
     polar/layoutelement-angularaxis.cpp \
@@ -28,6 +28,8 @@
 
 #include "global.h"
 #include "vector2d.h"
+#include "pixelgrid.h"
+#include "labelcache.h"
 #include "painter.h"
 #include "paintbuffer.h"
 #include "layer.h"
@@ -46,6 +48,7 @@
 #include "axis/axis.h"
 #include "scatterstyle.h"
 #include "datacontainer.h"
+#include "datacolumns.h"
 #include "plottable.h"
 #include "item.h"
 #include "core.h"
@@ -63,6 +66,7 @@
 #include "plottables/plottable-colormap.h"
 #include "plottables/plottable-financial.h"
 #include "plottables/plottable-errorbar.h"
+#include "plottables/plottable-annotations.h"
 #include "items/item-straightline.h"
 #include "items/item-line.h"
 #include "items/item-curve.h"
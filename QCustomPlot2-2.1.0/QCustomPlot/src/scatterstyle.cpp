@@ -80,6 +80,13 @@
   For pixmaps, you call \ref setPixmap with the desired QPixmap. Alternatively you can use the
   constructor that takes a QPixmap. The scatter shape will automatically be set to \ref ssPixmap.
   Note that \ref setSize does not influence the appearance of the pixmap.
+  
+  \section QCPScatterStyle-sprites Drawing many scatter points
+  
+  Drawing a scatter shape means stroking and filling a small vector path, which is repeated for
+  every single data point. With \ref drawShapes, the shape can instead be rendered once into a
+  pixmap (a sprite), which is then copied to all positions at once. Plottables do this when the
+  plotting hint \ref QCP::phCacheScatters is set (see \ref QCustomPlot::setPlottingHints).
 */
 
 /* start documentation of inline functions */
@@ -495,3 +502,165 @@ void QCPScatterStyle::drawShape(QCPPainter *painter, double x, double y) const
     }
   }
 }
+
+/*!
+  Draws the scatter shape with \a painter at all \a positions. Positions with NaN coordinates are
+  skipped.
+  
+  If \a useSprites is false, this is equivalent to calling \ref drawShape for each position. If it
+  is true, the shape is rendered only once with the current pen, brush and antialiasing setting of
+  \a painter into a pixmap, which is then drawn at all positions in a single call to
+  QPainter::drawPixmapFragments. The rendered pixmaps are cached for subsequent calls, taking the
+  device pixel ratio of the painted device into account. Since the pixmaps are placed on whole
+  pixels, a symbol may appear shifted by up to half a pixel, compared to drawing the vector shape.
+  
+  Sprites are not used (and the vector shapes are drawn instead), if \a painter is in the mode \ref
+  QCPPainter::pmNoCaching or \ref QCPPainter::pmVectorized, as is the case for exports like PDF,
+  if the painter is rotated or scaled, if the pen or brush use patterns or gradients other than a
+  solid color, or if the shape is \ref ssPixmap, which is a pixmap already.
+  
+  Like \ref drawShape, this function does not modify the pen or the brush on the painter, as \ref
+  applyTo is meant to be called before.
+*/
+void QCPScatterStyle::drawShapes(QCPPainter *painter, const QVector<QPointF> &positions, bool useSprites) const
+{
+  if (mShape == ssNone)
+    return;
+  QPixmap spritePixmap;
+  if (useSprites && !painter->modes().testFlag(QCPPainter::pmNoCaching) && !painter->modes().testFlag(QCPPainter::pmVectorized))
+    spritePixmap = sprite(painter);
+  if (spritePixmap.isNull()) // sprites not requested or not possible for current painter state, draw vector shapes
+  {
+    foreach (const QPointF &pos, positions)
+    {
+      if (!qIsNaN(pos.x()) && !qIsNaN(pos.y()))
+        drawShape(painter, pos.x(), pos.y());
+    }
+    return;
+  }
+  
+#ifdef QCP_DEVICEPIXELRATIO_SUPPORTED
+#  ifdef QCP_DEVICEPIXELRATIO_FLOAT
+  const double devicePixelRatio = spritePixmap.devicePixelRatioF();
+#  else
+  const double devicePixelRatio = spritePixmap.devicePixelRatio();
+#  endif
+#else
+  const double devicePixelRatio = 1.0;
+#endif
+  // only consider positions where the sprite may be visible, this also keeps the coordinates in a safe range for rounding:
+  const double spriteHalf = spritePixmap.width()/devicePixelRatio*0.5;
+  QRectF visibleRect;
+  if (painter->hasClipping())
+  {
+#if QT_VERSION < QT_VERSION_CHECK(4, 8, 0)
+    visibleRect = painter->clipRegion().boundingRect();
+#else
+    visibleRect = painter->clipBoundingRect();
+#endif
+  } else
+    visibleRect = painter->transform().inverted().mapRect(QRectF(painter->window()));
+  visibleRect.adjust(-spriteHalf, -spriteHalf, spriteHalf, spriteHalf);
+  
+  // the sprite is placed on whole pixels and already contains the antialiasing half-pixel shift, so remove it from the painter:
+  const bool antialiasing = painter->antialiasing();
+  painter->setAntialiasing(false);
+#if QT_VERSION < QT_VERSION_CHECK(4, 7, 0)
+  foreach (const QPointF &pos, positions)
+  {
+    if (visibleRect.contains(pos))
+      painter->drawPixmap(QRectF(qRound(pos.x())-spriteHalf, qRound(pos.y())-spriteHalf, 2*spriteHalf, 2*spriteHalf), spritePixmap, QRectF(spritePixmap.rect()));
+  }
+#else
+  const QRectF sourceRect(spritePixmap.rect());
+  QVector<QPainter::PixmapFragment> fragments;
+  fragments.reserve(positions.size());
+  foreach (const QPointF &pos, positions)
+  {
+    if (visibleRect.contains(pos)) // also false for NaN coordinates
+      fragments.append(QPainter::PixmapFragment::create(QPointF(qRound(pos.x()), qRound(pos.y())), sourceRect, 1.0/devicePixelRatio, 1.0/devicePixelRatio));
+  }
+  if (!fragments.isEmpty())
+    painter->drawPixmapFragments(fragments.constData(), fragments.size(), spritePixmap);
+#endif
+  painter->setAntialiasing(antialiasing);
+}
+
+/*! \internal
+  
+  Returns a pixmap with the scatter shape rendered in its center, using the current pen, brush and
+  antialiasing setting of \a painter and the device pixel ratio of its paint device. The pixmap
+  has an even size, so the center of the shape lies on a pixel corner.
+  
+  The pixmaps are kept in the application-wide QPixmapCache, so the same shape is only rendered
+  once, and the cached pixmaps are released together with the application's pixmaps. Since
+  QPixmapCache may only be used from the GUI thread, a null pixmap is returned when called from
+  any other thread, as well as if the current state of \a painter doesn't allow using a pixmap
+  (see \ref drawShapes).
+*/
+QPixmap QCPScatterStyle::sprite(const QCPPainter *painter) const
+{
+  if (mShape == ssNone || mShape == ssPixmap)
+    return QPixmap();
+  if (!QCoreApplication::instance() || QThread::currentThread() != QCoreApplication::instance()->thread())
+    return QPixmap();
+  if (painter->transform().type() > QTransform::TxTranslate)
+    return QPixmap();
+  const QPen pen = painter->pen();
+  const QBrush brush = painter->brush();
+  if (pen.style() != Qt::NoPen && pen.brush().style() != Qt::SolidPattern)
+    return QPixmap();
+  if (brush.style() != Qt::NoBrush && brush.style() != Qt::SolidPattern)
+    return QPixmap();
+  double devicePixelRatio = 1.0;
+#ifdef QCP_DEVICEPIXELRATIO_SUPPORTED
+#  ifdef QCP_DEVICEPIXELRATIO_FLOAT
+  devicePixelRatio = painter->device()->devicePixelRatioF();
+#  else
+  devicePixelRatio = painter->device()->devicePixelRatio();
+#  endif
+#endif
+  
+  // the cache key consists of everything that influences the rendered pixmap:
+  QVector<double> properties;
+  properties << mShape << mSize << devicePixelRatio << painter->antialiasing()
+             << pen.style() << pen.color().rgba() << pen.widthF() << pen.isCosmetic() << pen.capStyle() << pen.joinStyle() << pen.miterLimit() << pen.dashOffset()
+             << brush.style() << brush.color().rgba();
+  if (pen.style() == Qt::CustomDashLine)
+    properties << pen.dashPattern();
+  if (mShape == ssCustom)
+  {
+    for (int i=0; i<mCustomPath.elementCount(); ++i)
+      properties << mCustomPath.elementAt(i).type << mCustomPath.elementAt(i).x << mCustomPath.elementAt(i).y;
+  }
+  const QString key = QLatin1String("qcp_scatter_") + QString::fromLatin1(QByteArray(reinterpret_cast<const char*>(properties.constData()), properties.size()*int(sizeof(double))).toBase64());
+  
+  QPixmap cachedSprite;
+  if (QPixmapCache::find(key, &cachedSprite))
+    return cachedSprite;
+  
+  // determine how far the shape may extend from its center, including the pen:
+  double extent = mSize*0.5;
+  if (mShape == ssCustom)
+  {
+    const QRectF bounds = mCustomPath.boundingRect();
+    extent = qMax(qMax(qAbs(bounds.left()), qAbs(bounds.right())), qMax(qAbs(bounds.top()), qAbs(bounds.bottom())))*mSize/6.0;
+  }
+  const double penWidth = pen.style() == Qt::NoPen ? 0 : qMax(1.0, pen.widthF());
+  const int halfSize = qCeil(extent + penWidth*qMax(1.0, pen.miterLimit()) + 2);
+  
+  QPixmap newSprite(qCeil(2*halfSize*devicePixelRatio), qCeil(2*halfSize*devicePixelRatio));
+#ifdef QCP_DEVICEPIXELRATIO_SUPPORTED
+  newSprite.setDevicePixelRatio(devicePixelRatio);
+#endif
+  newSprite.fill(Qt::transparent);
+  QCPPainter spritePainter(&newSprite);
+  spritePainter.setAntialiasing(painter->antialiasing());
+  spritePainter.setPen(pen);
+  spritePainter.setBrush(brush);
+  drawShape(&spritePainter, halfSize, halfSize);
+  spritePainter.end();
+  
+  QPixmapCache::insert(key, newSprite);
+  return newSprite;
+}
@@ -113,6 +113,7 @@ public:
   void applyTo(QCPPainter *painter, const QPen &defaultPen) const;
   void drawShape(QCPPainter *painter, const QPointF &pos) const;
   void drawShape(QCPPainter *painter, double x, double y) const;
+  void drawShapes(QCPPainter *painter, const QVector<QPointF> &positions, bool useSprites=false) const;
 
 protected:
   // property members:
@@ -125,6 +126,9 @@ protected:
   
   // non-property members:
   bool mPenDefined;
+  
+  // non-virtual methods:
+  QPixmap sprite(const QCPPainter *painter) const;
 };
 Q_DECLARE_TYPEINFO(QCPScatterStyle, Q_MOVABLE_TYPE);
 Q_DECLARE_OPERATORS_FOR_FLAGS(QCPScatterStyle::ScatterProperties)
@@ -73,6 +73,7 @@ QCPSelectionDecoratorBracket::~QCPSelectionDecoratorBracket()
 void QCPSelectionDecoratorBracket::setBracketPen(const QPen &pen)
 {
   mBracketPen = pen;
+  markPlottableLayerDirty();
 }
 
 /*!
@@ -82,6 +83,7 @@ void QCPSelectionDecoratorBracket::setBracketPen(const QPen &pen)
 void QCPSelectionDecoratorBracket::setBracketBrush(const QBrush &brush)
 {
   mBracketBrush = brush;
+  markPlottableLayerDirty();
 }
 
 /*!
@@ -92,6 +94,7 @@ void QCPSelectionDecoratorBracket::setBracketBrush(const QBrush &brush)
 void QCPSelectionDecoratorBracket::setBracketWidth(int width)
 {
   mBracketWidth = width;
+  markPlottableLayerDirty();
 }
 
 /*!
@@ -102,6 +105,7 @@ void QCPSelectionDecoratorBracket::setBracketWidth(int width)
 void QCPSelectionDecoratorBracket::setBracketHeight(int height)
 {
   mBracketHeight = height;
+  markPlottableLayerDirty();
 }
 
 /*!
@@ -112,6 +116,7 @@ void QCPSelectionDecoratorBracket::setBracketHeight(int height)
 void QCPSelectionDecoratorBracket::setBracketStyle(QCPSelectionDecoratorBracket::BracketStyle style)
 {
   mBracketStyle = style;
+  markPlottableLayerDirty();
 }
 
 /*!
@@ -124,6 +129,7 @@ void QCPSelectionDecoratorBracket::setBracketStyle(QCPSelectionDecoratorBracket:
 void QCPSelectionDecoratorBracket::setTangentToData(bool enabled)
 {
   mTangentToData = enabled;
+  markPlottableLayerDirty();
 }
 
 /*!
@@ -139,6 +145,7 @@ void QCPSelectionDecoratorBracket::setTangentAverage(int pointCount)
   mTangentAverage = pointCount;
   if (mTangentAverage < 1)
     mTangentAverage = 1;
+  markPlottableLayerDirty();
 }
 
 /*!
@@ -151,6 +151,7 @@ QCPRange QCPSelectionRect::range(const QCPAxis *axis) const
 void QCPSelectionRect::setPen(const QPen &pen)
 {
   mPen = pen;
+  markLayerDirty();
 }
 
 /*!
@@ -162,6 +163,7 @@ void QCPSelectionRect::setPen(const QPen &pen)
 void QCPSelectionRect::setBrush(const QBrush &brush)
 {
   mBrush = brush;
+  markLayerDirty();
 }
 
 /*!
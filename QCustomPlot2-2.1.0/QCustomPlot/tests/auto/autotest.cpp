@@ -3,10 +3,12 @@
 #include "test-qcpcurve/test-qcpcurve.h"
 #include "test-qcpbars/test-qcpbars.h"
 #include "test-qcpfinancial/test-qcpfinancial.h"
+#include "test-qcpannotations/test-qcpannotations.h"
 #include "test-colormap/test-colormap.h"
 #include "test-qcplayout/test-qcplayout.h"
 #include "test-qcplegend/test-qcplegend.h"
 #include "test-qcpaxisrect/test-qcpaxisrect.h"
+#include "test-qcpaxistickerdatetime/test-qcpaxistickerdatetime.h"
 #include "test-datacontainer/test-datacontainer.h"
 
 #define QCPTEST(t) t t##instance; QTest::qExec(&t##instance)
@@ -20,10 +22,12 @@ int main(int argc, char **argv)
   QCPTEST(TestQCPCurve);
   QCPTEST(TestQCPBars);
   QCPTEST(TestQCPFinancial);
+  QCPTEST(TestQCPAnnotations);
   QCPTEST(TestColorMap);
   QCPTEST(TestQCPLayout);
   QCPTEST(TestQCPLegend);
   QCPTEST(TestQCPAxisRect);
+  QCPTEST(TestQCPAxisTickerDateTime);
   QCPTEST(TestDatacontainer);
   
   return 0;
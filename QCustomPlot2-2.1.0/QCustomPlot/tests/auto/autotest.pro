@@ -17,8 +17,10 @@ HEADERS += ../../qcustomplot.h \
     test-qcpcurve/test-qcpcurve.h \
     test-qcpbars/test-qcpbars.h \
     test-qcpfinancial/test-qcpfinancial.h \
+    test-qcpannotations/test-qcpannotations.h \
     test-qcplayout/test-qcplayout.h \
     test-qcpaxisrect/test-qcpaxisrect.h \
+    test-qcpaxistickerdatetime/test-qcpaxistickerdatetime.h \
     test-colormap/test-colormap.h \
     test-datacontainer/test-datacontainer.h \
     test-qcplegend/test-qcplegend.h
@@ -30,8 +32,10 @@ SOURCES += ../../qcustomplot.cpp \
     test-qcpcurve/test-qcpcurve.cpp \
     test-qcpbars/test-qcpbars.cpp \
     test-qcpfinancial/test-qcpfinancial.cpp \
+    test-qcpannotations/test-qcpannotations.cpp \
     test-qcplayout/test-qcplayout.cpp \
     test-qcpaxisrect/test-qcpaxisrect.cpp \
+    test-qcpaxistickerdatetime/test-qcpaxistickerdatetime.cpp \
     test-colormap/test-colormap.cpp \
     test-datacontainer/test-datacontainer.cpp \
     test-qcplegend/test-qcplegend.cpp
@@ -101,3 +101,119 @@ void TestColorMap::cleanup()
 {
   delete mPlot;
 }
+
+void TestColorMap::QCPColorMapData_blockAccess()
+{
+  QCPColorMapData *data = mColorMap->data();
+  data->setSize(4, 3);
+  
+  // whole map, rows of key cells (internal layout):
+  QVector<double> rowMajor;
+  for (int v=0; v<3; ++v)
+    for (int k=0; k<4; ++k)
+      rowMajor << v*10+k;
+  data->setCells(0, 0, 4, 3, rowMajor.constData());
+  QCOMPARE(data->cell(0, 0), 0.0);
+  QCOMPARE(data->cell(3, 0), 3.0);
+  QCOMPARE(data->cell(1, 2), 21.0);
+  QCOMPARE(data->dataBounds(), QCPRange(0, 23));
+  
+  // whole map, columns of value cells:
+  QVector<double> columnMajor;
+  for (int k=0; k<4; ++k)
+    for (int v=0; v<3; ++v)
+      columnMajor << 100+v*10+k;
+  data->setCells(0, 0, 4, 3, columnMajor.constData(), 3, 1);
+  QCOMPARE(data->cell(0, 0), 100.0);
+  QCOMPARE(data->cell(3, 0), 103.0);
+  QCOMPARE(data->cell(1, 2), 121.0);
+  QCOMPARE(data->dataBounds(), QCPRange(100, 123)); // exact bounds, since the entire map was replaced
+  
+  // block of 2x2 cells, other cells stay untouched:
+  const double block[] = {-5, -6, -7, -8};
+  data->setCells(2, 1, 2, 2, block);
+  QCOMPARE(data->cell(2, 1), -5.0);
+  QCOMPARE(data->cell(3, 1), -6.0);
+  QCOMPARE(data->cell(2, 2), -7.0);
+  QCOMPARE(data->cell(3, 2), -8.0);
+  QCOMPARE(data->cell(1, 1), 111.0);
+  QCOMPARE(data->cell(3, 0), 103.0);
+  QCOMPARE(data->dataBounds(), QCPRange(-8, 123));
+  
+  // block exceeding the map is rejected:
+  data->setCells(3, 0, 2, 1, block);
+  QCOMPARE(data->cell(3, 0), 103.0);
+  
+  // read back a block in both layouts:
+  double readRows[4], readColumns[4];
+  data->cells(1, 1, 2, 2, readRows);
+  QCOMPARE(readRows[0], 111.0);
+  QCOMPARE(readRows[1], -5.0);
+  QCOMPARE(readRows[2], 121.0);
+  QCOMPARE(readRows[3], -7.0);
+  data->cells(1, 1, 2, 2, readColumns, 2, 1);
+  QCOMPARE(readColumns[0], 111.0);
+  QCOMPARE(readColumns[1], 121.0);
+  QCOMPARE(readColumns[2], -5.0);
+  QCOMPARE(readColumns[3], -7.0);
+  
+  // alpha block creates the alpha map, remaining cells opaque:
+  const unsigned char alphas[] = {10, 20, 30};
+  data->setAlphas(1, 0, 1, 3, alphas);
+  QCOMPARE(data->alpha(1, 0), (unsigned char)10);
+  QCOMPARE(data->alpha(1, 1), (unsigned char)20);
+  QCOMPARE(data->alpha(1, 2), (unsigned char)30);
+  QCOMPARE(data->alpha(0, 0), (unsigned char)255);
+  
+  mPlot->rescaleAxes();
+  mPlot->replot();
+}
+
+void TestColorMap::QCPColorMap_incrementalUpdate()
+{
+  mPlot->resize(400, 300);
+  // second color map with vertical key axis, value size small enough to be oversampled:
+  QCPColorMap *verticalMap = new QCPColorMap(mPlot->yAxis, mPlot->xAxis);
+  QList<QCPColorMap*> maps = QList<QCPColorMap*>() << mColorMap << verticalMap;
+  foreach (QCPColorMap *map, maps)
+  {
+    map->setInterpolate(false);
+    map->data()->setSize(120, 80);
+    map->data()->setRange(QCPRange(0, 10), QCPRange(0, 10));
+    for (int k=0; k<120; ++k)
+      for (int v=0; v<80; ++v)
+        map->data()->setCell(k, v, qSin(k*0.1)*qCos(v*0.2));
+    map->rescaleDataRange(true);
+  }
+  mPlot->rescaleAxes();
+  mPlot->replot();
+  
+  QVector<double> column(80);
+  for (int v=0; v<80; ++v)
+    column[v] = 0.5*qSin(v*0.3);
+  foreach (QCPColorMap *map, maps)
+  {
+    QCPColorMapData *data = map->data();
+    const double shiftedCell = data->cell(10, 20);
+    // waterfall: shift by one column and insert newest column at the right edge:
+    data->scroll(-1);
+    QCOMPARE(data->cell(9, 20), shiftedCell);
+    QCOMPARE(data->cell(119, 20), 0.0);
+    data->setCells(119, 0, 1, 80, column.constData(), 1, 1);
+    data->setCell(50, 40, 0.9);
+    data->setAlpha(60, 30, 100);
+  }
+  mPlot->replot();
+  foreach (QCPColorMap *map, maps)
+  {
+    map->data()->scroll(2, -3); // scroll also after modifications, both dimensions
+    map->data()->setCell(0, 0, -0.9);
+  }
+  const QImage incremental = mPlot->toImage();
+  
+  // force a full recolorization of both maps and compare:
+  foreach (QCPColorMap *map, maps)
+    map->setInterpolate(false);
+  const QImage full = mPlot->toImage();
+  QCOMPARE(incremental, full);
+}
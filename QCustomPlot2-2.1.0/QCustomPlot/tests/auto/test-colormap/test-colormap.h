@@ -9,6 +9,8 @@ private slots:
   void cleanup();
   
   void QCPColorScale_rescaleDataRange();
+  void QCPColorMapData_blockAccess();
+  void QCPColorMap_incrementalUpdate();
   
 private:
   QCustomPlot *mPlot;
@@ -234,6 +234,162 @@ void TestDatacontainer::removeAfter()
   }
 }
 
+void TestDatacontainer::dataColumns()
+{
+  BadRandom r(42, -10, 15);
+  QVector<double> keys, values;
+  QVector<QCPGraphData> unsortedData;
+  for (int i=0; i<1000; ++i)
+  {
+    keys << r.get();
+    values << r.get();
+    unsortedData << QCPGraphData(keys.last(), values.last());
+  }
+  QCPDataColumns columns(keys, values);
+  QCOMPARE(columns.size(), keys.size());
+  mData->set(unsortedData, false);
+  QVERIFY(isSameData(columns.toDataVector<QCPGraphData>(), mData));
+  
+  // adding data between existing keys keeps the columns sorted:
+  const QVector<double> keysBefore = columns.keys();
+  const double addedKeys[] = {-20, -5, 0, 5, 20};
+  const double addedValues[] = {1, 2, 3, 4, 5};
+  columns.add(addedKeys, addedValues, 5, true);
+  QCOMPARE(keysBefore.size(), keys.size()); // previously returned columns are detached, not modified
+  QVERIFY(keysBefore.constData() != columns.keyData());
+  for (int i=0; i<5; ++i)
+    mData->add(QCPGraphData(addedKeys[i], addedValues[i]));
+  QCOMPARE(columns.size(), mData->size());
+  QVERIFY(isSameData(columns.toDataVector<QCPGraphData>(), mData));
+  
+  // ranges must agree with the ones of the data container:
+  QList<QCP::SignDomain> signDomains = QList<QCP::SignDomain>() << QCP::sdBoth << QCP::sdNegative << QCP::sdPositive;
+  foreach (QCP::SignDomain signDomain, signDomains)
+  {
+    bool foundColumns, foundContainer;
+    QCOMPARE(columns.keyRange(foundColumns, signDomain), mData->keyRange(foundContainer, signDomain));
+    QCOMPARE(foundColumns, foundContainer);
+    QCOMPARE(columns.valueRange(foundColumns, signDomain), mData->valueRange(foundContainer, signDomain));
+    QCOMPARE(foundColumns, foundContainer);
+    QCOMPARE(columns.valueRange(foundColumns, signDomain, QCPRange(-3, 7)), mData->valueRange(foundContainer, signDomain, QCPRange(-3, 7)));
+    QCOMPARE(foundColumns, foundContainer);
+  }
+  QCOMPARE(columns.findBegin(0), int(mData->findBegin(0)-mData->constBegin()));
+  QCOMPARE(columns.findEnd(0), int(mData->findEnd(0)-mData->constBegin()));
+  
+  // NaN values are ignored by the range scans:
+  const double nanKeys[] = {-30, 30};
+  const double nanValues[] = {qQNaN(), qQNaN()};
+  bool foundRange;
+  const QCPRange keyRangeBefore = columns.keyRange(foundRange);
+  columns.add(nanKeys, nanValues, 2);
+  QCOMPARE(columns.keyRange(foundRange), keyRangeBefore);
+  QVERIFY(foundRange);
+  
+  columns.clear();
+  QVERIFY(columns.isEmpty());
+  columns.valueRange(foundRange);
+  QVERIFY(!foundRange);
+}
+
+void TestDatacontainer::streamingCapacity()
+{
+  const int capacity = 1000;
+  mData->setStreamingCapacity(capacity);
+  QCOMPARE(mData->streamingCapacity(), capacity);
+  
+  // append single points far beyond the capacity, only the newest ones must remain:
+  for (int i=0; i<10*capacity+123; ++i)
+  {
+    mData->add(QCPGraphData(i, -i));
+    QCOMPARE(mData->size(), qMin(i+1, capacity));
+    QCOMPARE((mData->constEnd()-1)->key, double(i));
+    QCOMPARE(mData->constBegin()->key, double(qMax(0, i-capacity+1)));
+  }
+  QVERIFY(isSorted());
+  const double lastKey = 10*capacity+122;
+  QCOMPARE(mData->findBegin(lastKey-10, false)->key, lastKey-10);
+  QCOMPARE(int(mData->findEnd(lastKey-10, false)-mData->findBegin(lastKey-500, false)), 491);
+  
+  // bulk adds are limited as well:
+  QVector<QCPGraphData> block;
+  for (int i=0; i<2500; ++i)
+    block << QCPGraphData(lastKey+1+i, i);
+  mData->add(block, true);
+  QCOMPARE(mData->size(), capacity);
+  QCOMPARE(mData->constBegin()->key, lastKey+1+1500);
+  
+  // a manual removeBefore still works in streaming mode:
+  mData->removeBefore(lastKey+1+2000);
+  QCOMPARE(mData->size(), 500);
+  
+  // reducing the capacity evicts immediately, disabling it stops eviction:
+  mData->setStreamingCapacity(100);
+  QCOMPARE(mData->size(), 100);
+  QCOMPARE((mData->constEnd()-1)->key, lastKey+2500);
+  mData->setStreamingCapacity(0);
+  mData->add(block, true);
+  QCOMPARE(mData->size(), 2600);
+  QVERIFY(isSorted());
+}
+
+void TestDatacontainer::levelOfDetailIndex()
+{
+  BadRandom r(42, -10, 15);
+  QVector<QCPGraphData> data;
+  for (int i=0; i<5000; ++i)
+    data << QCPGraphData(i, r.get());
+  data[1234].value = qQNaN();
+  mData->set(data, true);
+  mData->setLevelOfDetailIndex(true);
+  QVERIFY(mData->levelOfDetailIndex());
+  
+  // the spans from the index must match a linear scan for arbitrary ranges:
+  for (int round=0; round<4; ++round)
+  {
+    for (int i=0; i<200; ++i)
+    {
+      int first = int(r.get()+10)*mData->size()/25;
+      int last = qMin(mData->size(), first+int((r.get()+10)*(r.get()+10)*mData->size()/625));
+      if (first >= last)
+        continue;
+      bool foundRange;
+      const QCPRange span = mData->valueSpan(foundRange, mData->at(first), mData->at(last));
+      double lower = std::numeric_limits<double>::infinity(), upper = -std::numeric_limits<double>::infinity();
+      for (QCPGraphDataContainer::const_iterator it=mData->at(first); it!=mData->at(last); ++it)
+      {
+        if (it->value < lower) lower = it->value;
+        if (it->value > upper) upper = it->value;
+      }
+      QCOMPARE(foundRange, lower <= upper);
+      if (foundRange)
+      {
+        QCOMPARE(span.lower, lower);
+        QCOMPARE(span.upper, upper);
+      }
+    }
+    // modify the data in different ways, the index must follow:
+    if (round == 0)
+    {
+      for (int i=0; i<1000; ++i)
+        mData->add(QCPGraphData(5000+i, r.get()*2));
+      mData->removeBefore(700);
+    } else if (round == 1)
+    {
+      mData->add(QCPGraphData(-5, 100)); // prepend
+      mData->add(QCPGraphData(2500.5, -100)); // insert
+    } else if (round == 2)
+    {
+      mData->removeAfter(3000);
+      mData->remove(1000, 1500);
+    }
+  }
+  
+  bool foundRange;
+  mData->valueSpan(foundRange, mData->constEnd(), mData->constEnd());
+  QVERIFY(!foundRange);
+}
+
 bool TestDatacontainer::isSorted()
 {
   if (mData->isEmpty())
@@ -16,6 +16,9 @@ private slots:
   void remove();
   void removeBefore();
   void removeAfter();
+  void dataColumns();
+  void streamingCapacity();
+  void levelOfDetailIndex();
   
 private:
   bool isSorted();
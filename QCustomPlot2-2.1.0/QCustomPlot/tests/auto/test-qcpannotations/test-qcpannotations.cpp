@@ -0,0 +1,152 @@
+#include "test-qcpannotations.h"
+
+void TestQCPAnnotations::init()
+{
+  mPlot = new QCustomPlot(0);
+  mAnnotations = new QCPAnnotations(mPlot->xAxis, mPlot->yAxis);
+}
+
+void TestQCPAnnotations::cleanup()
+{
+  delete mPlot;
+}
+
+void TestQCPAnnotations::dataManipulation()
+{
+  QVERIFY(mAnnotations->data()->isEmpty());
+  
+  QVector<double> keys, values;
+  QStringList texts;
+  QVector<int> styleIndices;
+  keys << 3 << 1 << 2;
+  values << 30 << 10 << 20;
+  texts << "c" << "a" << "b";
+  styleIndices << 2 << 0 << 1;
+  mAnnotations->setData(keys, values, texts, styleIndices);
+  QCOMPARE(mAnnotations->data()->size(), 3);
+  // data should be sorted by key, texts and style indices must stay with their positions:
+  for (int i=0; i<3; ++i)
+  {
+    const QCPAnnotationData &d = *(mAnnotations->data()->constBegin()+i);
+    QCOMPARE(d.key, double(i+1));
+    QCOMPARE(d.value, (i+1)*10.0);
+    QCOMPARE(d.text, QString(QChar('a'+i)));
+    QCOMPARE(d.styleIndex, i);
+  }
+  
+  // texts and style indices are optional:
+  mAnnotations->setData(keys, values);
+  QCOMPARE(mAnnotations->data()->size(), 3);
+  QVERIFY(mAnnotations->data()->constBegin()->text.isEmpty());
+  QCOMPARE(mAnnotations->data()->constBegin()->styleIndex, 0);
+  
+  // the number of annotations is the size of the smallest vector:
+  mAnnotations->setData(keys, values, QStringList() << "x" << "y");
+  QCOMPARE(mAnnotations->data()->size(), 2);
+  
+  mAnnotations->addData(0.5, 5, "first", 1);
+  mAnnotations->addData(keys.constData(), values.constData(), nullptr, styleIndices.constData(), 3);
+  QCOMPARE(mAnnotations->data()->size(), 6);
+  QCOMPARE(mAnnotations->data()->constBegin()->text, QString("first"));
+  QCOMPARE(mAnnotations->data()->constBegin()->styleIndex, 1);
+  
+  bool foundRange;
+  QCOMPARE(mAnnotations->getKeyRange(foundRange), QCPRange(0.5, 3));
+  QVERIFY(foundRange);
+  QCOMPARE(mAnnotations->getValueRange(foundRange), QCPRange(5, 30));
+}
+
+void TestQCPAnnotations::styles()
+{
+  QCOMPARE(mAnnotations->styleCount(), 1);
+  QCOMPARE(mAnnotations->addStyle(QCPScatterStyle(QCPScatterStyle::ssSquare, 8)), 1);
+  QCOMPARE(mAnnotations->style(1).shape(), QCPScatterStyle::ssSquare);
+  QVERIFY(mAnnotations->style(2).isNone());
+  QVERIFY(mAnnotations->style(-1).isNone());
+  
+  mAnnotations->setStyle(0, QCPScatterStyle(QCPScatterStyle::ssNone));
+  QVERIFY(mAnnotations->style(0).isNone());
+  mAnnotations->setStyle(5, QCPScatterStyle(QCPScatterStyle::ssDisc)); // out of range, ignored
+  QCOMPARE(mAnnotations->styleCount(), 2);
+  
+  // annotations with style indices outside the table, label only annotations and an empty style
+  // table must all be drawn without problems:
+  mPlot->resize(300, 200);
+  mAnnotations->setData(QVector<double>() << 1 << 2 << 3 << 4, QVector<double>() << 1 << 2 << 3 << 4,
+                        QStringList() << "one" << "" << "three\nlines\nhere" << "four", QVector<int>() << 0 << 1 << 7 << -3);
+  mPlot->rescaleAxes();
+  mPlot->replot();
+  mAnnotations->setSelection(QCPDataSelection(QCPDataRange(1, 3)));
+  mPlot->replot();
+  mAnnotations->setStyles(QVector<QCPScatterStyle>());
+  mPlot->replot();
+  QCOMPARE(mAnnotations->styleCount(), 0);
+}
+
+void TestQCPAnnotations::selection()
+{
+  mPlot->resize(400, 300);
+  const int n = 2000;
+  QVector<double> keys(n), values(n);
+  QStringList texts;
+  for (int i=0; i<n; ++i)
+  {
+    keys[i] = i/100.0;
+    values[i] = qSin(keys[i]*7)+qCos(keys[i]*31)*0.3;
+    texts << QString::number(i);
+  }
+  mAnnotations->setData(keys, values, texts, QVector<int>(), true);
+  mPlot->rescaleAxes();
+  mPlot->xAxis->setRange(3, 9);
+  mPlot->replot();
+  const QRect axisRect = mPlot->axisRect()->rect();
+  
+  const double tolerance = mPlot->selectionTolerance();
+  
+  // within the selection tolerance, the closest annotation must match a brute force search:
+  for (int px=axisRect.left()+1; px<axisRect.right(); px+=13)
+  {
+    for (int py=axisRect.top()+1; py<axisRect.bottom(); py+=11)
+    {
+      const QPointF pos(px+0.3, py+0.6);
+      double minDist = -1;
+      for (int i=0; i<n; ++i)
+      {
+        const double dist = QCPVector2D(mAnnotations->coordsToPixels(keys.at(i), values.at(i))-pos).length();
+        if (minDist < 0 || dist < minDist)
+          minDist = dist;
+      }
+      QVariant details;
+      const double result = mAnnotations->selectTest(pos, false, &details);
+      QCOMPARE(result >= 0 && result < tolerance, minDist < tolerance);
+      if (minDist < tolerance)
+      {
+        QVERIFY(qAbs(result-minDist) < 1e-9);
+        const int index = details.value<QCPDataSelection>().dataRange().begin();
+        QVERIFY(qAbs(QCPVector2D(mAnnotations->coordsToPixels(keys.at(index), values.at(index))-pos).length()-minDist) < 1e-9);
+      }
+    }
+  }
+  
+  // rect selection must match the regular implementation:
+  QList<QRectF> rects = QList<QRectF>() << QRectF(axisRect.left()+10, axisRect.top()+10, 50, 80)
+                                        << QRectF(axisRect.left(), axisRect.center().y()-10, axisRect.width(), 20)
+                                        << QRectF(axisRect.right()-5, axisRect.bottom()-5, -100, -200) // not normalized
+                                        << QRectF(axisRect.left()-50, axisRect.top(), 150, 100); // reaches beyond key range
+  foreach (const QRectF &rect, rects)
+    QCOMPARE(mAnnotations->selectTestRect(rect, false), mAnnotations->QCPAbstractPlottable1D<QCPAnnotationData>::selectTestRect(rect, false));
+  
+  // index must follow changes of data and view:
+  const QPointF pos = mAnnotations->coordsToPixels(keys.at(500), values.at(500));
+  QVariant details;
+  QVERIFY(mAnnotations->selectTest(pos, false, &details) < 1e-6);
+  QCOMPARE(details.value<QCPDataSelection>(), QCPDataSelection(QCPDataRange(500, 501)));
+  mPlot->xAxis->moveRange(0.5);
+  const QPointF movedPos = mAnnotations->coordsToPixels(keys.at(500), values.at(500));
+  QVERIFY(mAnnotations->selectTest(movedPos, false) < 1e-6);
+  (mAnnotations->data()->begin()+500)->value += 10; // direct modification needs explicit invalidation
+  mAnnotations->invalidateCaches();
+  mAnnotations->selectTest(movedPos, false, &details);
+  QVERIFY(details.value<QCPDataSelection>() != QCPDataSelection(QCPDataRange(500, 501)));
+  mPlot->replot();
+}
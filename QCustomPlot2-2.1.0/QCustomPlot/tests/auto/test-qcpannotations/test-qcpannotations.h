@@ -0,0 +1,18 @@
+#include <QtTest/QtTest>
+#include "../../../qcustomplot.h"
+
+class TestQCPAnnotations : public QObject
+{
+  Q_OBJECT
+private slots:
+  void init();
+  void cleanup();
+  
+  void dataManipulation();
+  void styles();
+  void selection();
+  
+private:
+  QCustomPlot *mPlot;
+  QCPAnnotations *mAnnotations;
+};
@@ -240,15 +240,85 @@ void TestQCPAxisRect::axisRectRemovalConveniencePointers()
   QCOMPARE(mPlot->legend, leg);
 }
 
-
-
-
-
-
-
-
-
-
-
-
-
+void TestQCPAxisRect::arrayCoordinateTransforms()
+{
+  mPlot->resize(400, 300);
+  mPlot->replot();
+  QList<QCPAxis*> axes = QList<QCPAxis*>() << mPlot->xAxis << mPlot->yAxis;
+  
+  // compare the array versions against the scalar versions for all scale types and reversals:
+  QVector<double> coords, pixels(12), backCoords(12), pixelInput;
+  coords << -5 << -0.5 << 0 << 0.001 << 0.5 << 1 << 3.3 << 10 << 99.9 << 100 << 1e3 << 1e6;
+  pixelInput << -50 << 0 << 12.5 << 60 << 100 << 150.25 << 200 << 250 << 299 << 300 << 399 << 800;
+  foreach (QCPAxis *axis, axes)
+  {
+    for (int scaleType=0; scaleType<2; ++scaleType)
+    {
+      for (int reversed=0; reversed<2; ++reversed)
+      {
+        axis->setScaleType(scaleType == 0 ? QCPAxis::stLinear : QCPAxis::stLogarithmic);
+        axis->setRange(scaleType == 0 ? QCPRange(-2, 50) : QCPRange(0.1, 1000));
+        axis->setRangeReversed(reversed);
+        axis->coordToPixel(coords.constData(), pixels.data(), coords.size());
+        for (int i=0; i<coords.size(); ++i)
+        {
+          const double expected = axis->coordToPixel(coords.at(i));
+          QVERIFY(qAbs(pixels.at(i)-expected) < 1e-9*qMax(1.0, qAbs(expected)));
+        }
+        axis->pixelToCoord(pixelInput.constData(), backCoords.data(), pixelInput.size());
+        for (int i=0; i<pixelInput.size(); ++i)
+        {
+          const double expected = axis->pixelToCoord(pixelInput.at(i));
+          QVERIFY(qAbs(backCoords.at(i)-expected) < 1e-9*qMax(1.0, qAbs(expected)));
+        }
+      }
+    }
+    axis->setScaleType(QCPAxis::stLinear);
+    axis->setRangeReversed(false);
+  }
+  
+  // negative logarithmic domain, invalid values are placed like in the scalar version:
+  mPlot->yAxis->setScaleType(QCPAxis::stLogarithmic);
+  mPlot->yAxis->setRange(-1000, -0.1);
+  mPlot->yAxis->coordToPixel(coords.constData(), pixels.data(), coords.size());
+  for (int i=0; i<coords.size(); ++i)
+    QCOMPARE(pixels.at(i), mPlot->yAxis->coordToPixel(coords.at(i)));
+  mPlot->yAxis->setScaleType(QCPAxis::stLinear);
+  
+  // in-place transformation:
+  QVector<double> inPlace = coords;
+  mPlot->xAxis->setRange(-2, 50);
+  mPlot->xAxis->coordToPixel(inPlace.constData(), inPlace.data(), inPlace.size());
+  mPlot->xAxis->pixelToCoord(inPlace.constData(), inPlace.data(), inPlace.size());
+  for (int i=0; i<coords.size(); ++i)
+    QVERIFY(qAbs(inPlace.at(i)-coords.at(i)) < 1e-9*qMax(1.0, qAbs(coords.at(i))));
+  
+  // plottables with horizontal and vertical key axis:
+  QCPGraph *graph = mPlot->addGraph();
+  mPlot->yAxis->setRange(-10, 10);
+  mPlot->yAxis->setRangeReversed(true);
+  QVector<double> x(coords.size()), y(coords.size()), keys(coords.size()), values(coords.size());
+  for (int swapped=0; swapped<2; ++swapped)
+  {
+    if (swapped)
+    {
+      graph->setKeyAxis(mPlot->yAxis);
+      graph->setValueAxis(mPlot->xAxis);
+    }
+    graph->coordsToPixels(coords.constData(), pixelInput.constData(), x.data(), y.data(), coords.size());
+    for (int i=0; i<coords.size(); ++i)
+    {
+      const QPointF expected = graph->coordsToPixels(coords.at(i), pixelInput.at(i));
+      QVERIFY(qAbs(x.at(i)-expected.x()) < 1e-9*qMax(1.0, qAbs(expected.x())));
+      QVERIFY(qAbs(y.at(i)-expected.y()) < 1e-9*qMax(1.0, qAbs(expected.y())));
+    }
+    graph->pixelsToCoords(x.constData(), y.constData(), keys.data(), values.data(), coords.size());
+    for (int i=0; i<coords.size(); ++i)
+    {
+      double expectedKey, expectedValue;
+      graph->pixelsToCoords(x.at(i), y.at(i), expectedKey, expectedValue);
+      QVERIFY(qAbs(keys.at(i)-expectedKey) < 1e-9*qMax(1.0, qAbs(expectedKey)));
+      QVERIFY(qAbs(values.at(i)-expectedValue) < 1e-9*qMax(1.0, qAbs(expectedValue)));
+    }
+  }
+}
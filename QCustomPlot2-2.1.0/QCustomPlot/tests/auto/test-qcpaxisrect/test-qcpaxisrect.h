@@ -15,6 +15,7 @@ private slots:
   void axisRectRemovalConsequencesToPlottables();
   void axisRectRemovalConsequencesToItems();
   void axisRectRemovalConveniencePointers();
+  void arrayCoordinateTransforms();
   
 private:
   QCustomPlot *mPlot;
@@ -0,0 +1,167 @@
+#include "test-qcpaxistickerdatetime.h"
+
+void TestQCPAxisTickerDateTime::init()
+{
+  mTicker = QSharedPointer<QCPAxisTickerDateTime>(new QCPAxisTickerDateTime);
+  mTicker->setDateTimeSpec(Qt::UTC);
+  mTicker->setDateTimeFormat("yyyy-MM-dd");
+}
+
+void TestQCPAxisTickerDateTime::cleanup()
+{
+  mTicker.clear();
+}
+
+void TestQCPAxisTickerDateTime::monthTicks()
+{
+  // the last tick lies just inside the range and must not get lost:
+  mTicker->setTickCount(2);
+  QVector<double> ticks;
+  QCOMPARE(generateLabels(QCPRange(utcKey(2005, 1, 12), utcKey(2005, 4, 1, 4, 42)), &ticks), QStringList() << "2005-02-01" << "2005-03-01" << "2005-04-01");
+  QCOMPARE(ticks, QVector<double>() << utcKey(2005, 2, 1) << utcKey(2005, 3, 1) << utcKey(2005, 4, 1));
+  
+  // a lower bound late on the last day of a month doesn't shift the ticks:
+  QCOMPARE(generateLabels(QCPRange(utcKey(2005, 1, 31, 18, 0), utcKey(2005, 4, 20))), QStringList() << "2005-02-01" << "2005-03-01" << "2005-04-01");
+  
+  // bounds exactly on ticks are included:
+  QCOMPARE(generateLabels(QCPRange(utcKey(2005, 2, 1), utcKey(2005, 4, 1))), QStringList() << "2005-02-01" << "2005-03-01" << "2005-04-01");
+}
+
+void TestQCPAxisTickerDateTime::monthTicksUniformDay()
+{
+  // the day of the tick origin is used in every month, or the last day of shorter months:
+  mTicker->setTickOrigin(QDateTime(QDate(2005, 1, 31), QTime(0, 0), Qt::UTC));
+  mTicker->setTickCount(3);
+  QCOMPARE(generateLabels(QCPRange(utcKey(2005, 1, 15), utcKey(2005, 5, 15))), QStringList() << "2005-01-31" << "2005-02-28" << "2005-03-31" << "2005-04-30");
+  // leap year:
+  QCOMPARE(generateLabels(QCPRange(utcKey(2004, 1, 15), utcKey(2004, 5, 15))), QStringList() << "2004-01-31" << "2004-02-29" << "2004-03-31" << "2004-04-30");
+}
+
+void TestQCPAxisTickerDateTime::yearTicks()
+{
+  // multi-year steps are counted in whole months from the tick origin, so ticks don't drift over decades:
+  QCOMPARE(generateLabels(QCPRange(utcKey(1990, 1, 1), utcKey(2030, 1, 1))), QStringList() << "1990-01-01" << "2000-01-01" << "2010-01-01" << "2020-01-01" << "2030-01-01");
+  QCOMPARE(generateLabels(QCPRange(utcKey(1800, 6, 1), utcKey(2200, 6, 1))), QStringList() << "1870-01-01" << "1970-01-01" << "2070-01-01" << "2170-01-01");
+}
+
+void TestQCPAxisTickerDateTime::dayTicks()
+{
+  mTicker->setDateTimeFormat("yyyy-MM-dd hh:mm");
+  mTicker->setTickCount(5);
+  QVector<double> ticks;
+  QCOMPARE(generateLabels(QCPRange(utcKey(2005, 2, 25, 12, 0), utcKey(2005, 3, 7, 12, 0)), &ticks), QStringList() << "2005-02-26 00:00" << "2005-02-28 00:00" << "2005-03-02 00:00" << "2005-03-04 00:00" << "2005-03-06 00:00");
+  // the steps of two days are counted from the tick origin, 1. Jan 1970:
+  foreach (double tick, ticks)
+    QCOMPARE(qRound64(tick/86400.0) % 2, Q_INT64_C(0));
+  
+  // the time of day of the tick origin is used for all ticks, and the steps are counted from its day:
+  mTicker->setTickOrigin(QDateTime(QDate(2000, 1, 1), QTime(6, 30), Qt::UTC));
+  QCOMPARE(generateLabels(QCPRange(utcKey(2005, 2, 25, 12, 0), utcKey(2005, 3, 7, 12, 0))), QStringList() << "2005-02-27 06:30" << "2005-03-01 06:30" << "2005-03-03 06:30" << "2005-03-05 06:30" << "2005-03-07 06:30");
+}
+
+void TestQCPAxisTickerDateTime::preEpochTicks()
+{
+  mTicker->setTickCount(3);
+  QCOMPARE(generateLabels(QCPRange(utcKey(1960, 3, 10), utcKey(1960, 6, 20))), QStringList() << "1960-04-01" << "1960-05-01" << "1960-06-01");
+  
+  // day ticks around the epoch, aligned to the tick origin on both sides:
+  mTicker->setTickCount(5);
+  QCOMPARE(generateLabels(QCPRange(utcKey(1969, 12, 25, 12, 0), utcKey(1970, 1, 4, 12, 0))), QStringList() << "1969-12-26" << "1969-12-28" << "1969-12-30" << "1970-01-01" << "1970-01-03");
+  
+  // far before the epoch, ticks fall on midnight of the first of the month:
+  mTicker->setDateTimeFormat("yyyy-MM-dd hh:mm");
+  mTicker->setTickCount(2);
+  QCOMPARE(generateLabels(QCPRange(utcKey(1805, 1, 12), utcKey(1805, 4, 1, 4, 42))), QStringList() << "1805-02-01 00:00" << "1805-03-01 00:00" << "1805-04-01 00:00");
+}
+
+void TestQCPAxisTickerDateTime::localTimeTicks()
+{
+  // ticks fall on local midnight, also across daylight saving time changes (if the local time zone has them):
+  mTicker->setDateTimeSpec(Qt::LocalTime);
+  mTicker->setTickOrigin(QDateTime(QDate(2020, 3, 1), QTime(0, 0), Qt::LocalTime));
+  mTicker->setTickCount(5);
+  const QCPRange range(QCPAxisTickerDateTime::dateTimeToKey(QDateTime(QDate(2020, 3, 2), QTime(12, 0), Qt::LocalTime)),
+                       QCPAxisTickerDateTime::dateTimeToKey(QDateTime(QDate(2020, 3, 12), QTime(12, 0), Qt::LocalTime)));
+  QVector<double> ticks;
+  QCOMPARE(generateLabels(range, &ticks), QStringList() << "2020-03-03" << "2020-03-05" << "2020-03-07" << "2020-03-09" << "2020-03-11");
+  foreach (double tick, ticks)
+    QCOMPARE(QCPAxisTickerDateTime::keyToDateTime(tick).toLocalTime().time(), QTime(0, 0));
+  
+  // the same ticker in UTC puts the ticks on midnight UTC:
+  mTicker->setDateTimeSpec(Qt::UTC);
+  mTicker->setTickOrigin(0);
+  generateLabels(range, &ticks);
+  foreach (double tick, ticks)
+    QCOMPARE(QCPAxisTickerDateTime::keyToDateTime(tick).toUTC().time(), QTime(0, 0));
+}
+
+void TestQCPAxisTickerDateTime::timeZoneTicks()
+{
+# if QT_VERSION >= QT_VERSION_CHECK(5, 2, 0)
+  const QTimeZone zone(5*3600);
+  mTicker->setDateTimeFormat("yyyy-MM-dd hh:mm");
+  mTicker->setTickCount(2);
+  const QCPRange range(utcKey(2005, 1, 12), utcKey(2005, 4, 1, 4, 42));
+  QVector<double> utcTicks, zoneTicks;
+  const QStringList utcLabels = generateLabels(range, &utcTicks);
+  
+  mTicker->setTimeZone(zone);
+  mTicker->setTickOrigin(QDateTime(QDate(1970, 1, 1), QTime(0, 0), zone));
+  QCOMPARE(generateLabels(range, &zoneTicks), utcLabels);
+  QCOMPARE(zoneTicks.size(), utcTicks.size());
+  for (int i=0; i<zoneTicks.size(); ++i)
+    QCOMPARE(zoneTicks.at(i), utcTicks.at(i)-5*3600);
+#else
+  QSKIP("QTimeZone requires Qt 5.2");
+#endif
+}
+
+void TestQCPAxisTickerDateTime::labelMemoization()
+{
+  mTicker->setTickCount(2);
+  const QCPRange range(utcKey(2005, 1, 12), utcKey(2005, 4, 1, 4, 42));
+  QCOMPARE(generateLabels(range), QStringList() << "2005-02-01" << "2005-03-01" << "2005-04-01");
+  QCOMPARE(generateLabels(range), QStringList() << "2005-02-01" << "2005-03-01" << "2005-04-01");
+  
+  // format changes discard memorized labels:
+  mTicker->setDateTimeFormat("dd.MM.yyyy");
+  QCOMPARE(generateLabels(range), QStringList() << "01.02.2005" << "01.03.2005" << "01.04.2005");
+  mTicker->setDateTimeFormat("hh:mm");
+  QCOMPARE(generateLabels(range), QStringList() << "00:00" << "00:00" << "00:00");
+  
+# if QT_VERSION >= QT_VERSION_CHECK(5, 2, 0)
+  // the tick origin (epoch) is at 14:00 of the previous day in UTC-10, so the tick coordinates stay
+  // the same, but their labels change:
+  QVector<double> utcTicks, zoneTicks;
+  generateLabels(range, &utcTicks);
+  mTicker->setTimeZone(QTimeZone(-10*3600));
+  QCOMPARE(generateLabels(range, &zoneTicks), QStringList() << "14:00" << "14:00" << "14:00");
+  QCOMPARE(zoneTicks, utcTicks);
+#endif
+  
+  // time spec changes discard memorized labels:
+  mTicker->setDateTimeSpec(Qt::LocalTime);
+  mTicker->setDateTimeSpec(Qt::UTC);
+  QCOMPARE(generateLabels(range), QStringList() << "00:00" << "00:00" << "00:00");
+  
+  // locale changes discard memorized labels:
+  mTicker->setDateTimeFormat("MMMM");
+  QCOMPARE(generateLabels(range), QStringList() << "February" << "March" << "April");
+  QCOMPARE(generateLabels(range, 0, QLocale(QLocale::German, QLocale::Germany)), QStringList() << "Februar" << QString::fromUtf8("M\xc3\xa4rz") << "April");
+  QCOMPARE(generateLabels(range), QStringList() << "February" << "March" << "April");
+}
+
+QStringList TestQCPAxisTickerDateTime::generateLabels(const QCPRange &range, QVector<double> *ticks, const QLocale &locale)
+{
+  QVector<double> tickVector;
+  QVector<QString> labels;
+  mTicker->generate(range, locale, QLatin1Char('g'), 6, tickVector, 0, &labels);
+  if (ticks)
+    *ticks = tickVector;
+  return labels.toList();
+}
+
+double TestQCPAxisTickerDateTime::utcKey(int year, int month, int day, int hour, int minute)
+{
+  return QCPAxisTickerDateTime::dateTimeToKey(QDateTime(QDate(year, month, day), QTime(hour, minute), Qt::UTC));
+}
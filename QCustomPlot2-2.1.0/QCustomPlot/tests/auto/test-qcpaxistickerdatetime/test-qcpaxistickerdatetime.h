@@ -0,0 +1,25 @@
+#include <QtTest/QtTest>
+#include "../../../qcustomplot.h"
+
+class TestQCPAxisTickerDateTime : public QObject
+{
+  Q_OBJECT
+private slots:
+  void init();
+  void cleanup();
+  
+  void monthTicks();
+  void monthTicksUniformDay();
+  void yearTicks();
+  void dayTicks();
+  void preEpochTicks();
+  void localTimeTicks();
+  void timeZoneTicks();
+  void labelMemoization();
+  
+private:
+  QSharedPointer<QCPAxisTickerDateTime> mTicker;
+  
+  QStringList generateLabels(const QCPRange &range, QVector<double> *ticks=0, const QLocale &locale=QLocale::c());
+  static double utcKey(int year, int month, int day, int hour=0, int minute=0);
+};
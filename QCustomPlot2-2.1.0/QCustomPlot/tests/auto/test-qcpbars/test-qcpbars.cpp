@@ -136,3 +136,55 @@ void TestQCPBars::dataSharing()
   QCOMPARE(mBars->data()->size(), 1);
   QCOMPARE(bars2->data()->size(), 6);
 }
+
+void TestQCPBars::stacking()
+{
+  QCPBars *middle = new QCPBars(mPlot->xAxis, mPlot->yAxis);
+  QCPBars *top = new QCPBars(mPlot->xAxis, mPlot->yAxis);
+  QVector<double> x, y;
+  x << 1 << 2 << 3;
+  y << 1 << -2 << 3;
+  mBars->setData(x, y);
+  middle->setData(QVector<double>() << 1 << 3 << 4, QVector<double>() << 10 << 20 << -30);
+  top->setData(QVector<double>() << 1 << 2 << 4, QVector<double>() << 100 << -200 << 300);
+  middle->moveAbove(mBars);
+  top->moveAbove(middle);
+  
+  bool foundRange;
+  QCPRange range = top->getValueRange(foundRange);
+  QVERIFY(foundRange);
+  QCOMPARE(range.lower, -202.0); // key 2: -200 on top of -2
+  QCOMPARE(range.upper, 300.0); // key 4: positive bars start at the base value, the negative middle bar doesn't count
+  range = top->getValueRange(foundRange, QCP::sdBoth, QCPRange(0.5, 1.5));
+  QCOMPARE(range.upper, 111.0);
+  
+  // changing the data of a bars plottable in the stack updates the stack above it:
+  mBars->setData(x, QVector<double>() << 2 << -2 << 3);
+  range = top->getValueRange(foundRange, QCP::sdBoth, QCPRange(0.5, 1.5));
+  QCOMPARE(range.upper, 112.0);
+  mBars->setBaseValue(1);
+  range = top->getValueRange(foundRange, QCP::sdBoth, QCPRange(0.5, 1.5));
+  QCOMPARE(range.upper, 113.0);
+  mBars->setBaseValue(0);
+  mBars->data()->add(QCPBarsData(4, 5)); // modify from outside, the changed size is detected
+  range = top->getValueRange(foundRange);
+  QCOMPARE(range.upper, 305.0);
+  mBars->data()->begin()->value = 4; // modify values from outside, requires explicit invalidation
+  mBars->invalidateStacking();
+  range = top->getValueRange(foundRange, QCP::sdBoth, QCPRange(0.5, 1.5));
+  QCOMPARE(range.upper, 114.0);
+  
+  // taking the middle bars out of the stack:
+  middle->moveAbove(nullptr);
+  range = top->getValueRange(foundRange, QCP::sdBoth, QCPRange(0.5, 1.5));
+  QCOMPARE(range.upper, 104.0);
+  range = top->getValueRange(foundRange);
+  QCOMPARE(range.lower, -202.0);
+  QCOMPARE(range.upper, 305.0);
+  
+  // putting it back in between, the positions of the bars above follow:
+  middle->moveBelow(top);
+  range = top->getValueRange(foundRange, QCP::sdBoth, QCPRange(0.5, 1.5));
+  QCOMPARE(range.upper, 114.0);
+  QCOMPARE(top->dataPixelPosition(0), QPointF(mPlot->xAxis->coordToPixel(1), mPlot->yAxis->coordToPixel(114)));
+}
@@ -10,6 +10,7 @@ private slots:
   
   void dataManipulation();
   void dataSharing();
+  void stacking();
   
 private:
   QCustomPlot *mPlot;
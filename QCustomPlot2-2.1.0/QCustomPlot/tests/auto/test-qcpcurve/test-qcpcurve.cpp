@@ -1,6 +1,16 @@
 #include "test-qcpcurve.h"
 #include <QMainWindow>
 
+/* exposes the protected pixel conversion of QCPCurve, to test the output of adaptive sampling
+   directly */
+class QCPCurveLineProbe : public QCPCurve
+{
+public:
+  QCPCurveLineProbe(QCPAxis *keyAxis, QCPAxis *valueAxis) : QCPCurve(keyAxis, valueAxis) {}
+  using QCPCurve::getCurveLines;
+  using QCPCurve::getScatters;
+};
+
 void TestQCPCurve::init()
 {
   mPlot = new QCustomPlot(0);
@@ -140,3 +150,121 @@ void TestQCPCurve::dataSharing()
   QCOMPARE(curve2->data()->size(), 6);
 }
 
+void TestQCPCurve::adaptiveSampling()
+{
+  QCOMPARE(mCurve->adaptiveSampling(), false);
+  
+  // dense spiral with a gap, many points per pixel:
+  int n = 200000;
+  QVector<double> t(n), x(n), y(n);
+  for (int i=0; i<n; ++i)
+  {
+    t[i] = i;
+    const double phi = i/(double)n*20*M_PI;
+    x[i] = qCos(phi)*phi;
+    y[i] = i == n/2 ? qQNaN() : qSin(phi)*phi;
+  }
+  QCPCurveLineProbe *curve = new QCPCurveLineProbe(mPlot->xAxis, mPlot->yAxis);
+  curve->setData(t, x, y, true);
+  mPlot->resize(400, 300);
+  mPlot->rescaleAxes();
+  mPlot->replot();
+  
+  // without sampling, the lines and scatters are the pixel positions of all data points:
+  QVector<QPointF> linesOff, scattersOff;
+  curve->getCurveLines(&linesOff, QCPDataRange(0, n), 1);
+  curve->getScatters(&scattersOff, QCPDataRange(0, n), 1);
+  QCOMPARE(linesOff.size(), n);
+  QCOMPARE(scattersOff.size(), n-1); // scatters skip the NaN point
+  for (int i=0; i<n; ++i)
+  {
+    const QPointF expected = curve->coordsToPixels(x.at(i), y.at(i));
+    if (i == n/2)
+      QVERIFY(qIsNaN(linesOff.at(i).y()));
+    else
+      QCOMPARE(linesOff.at(i), expected);
+  }
+  
+  // with sampling, far fewer points remain:
+  curve->setAdaptiveSampling(true);
+  QCOMPARE(curve->adaptiveSampling(), true);
+  QVector<QPointF> linesOn, scattersOn;
+  curve->getCurveLines(&linesOn, QCPDataRange(0, n), 1);
+  curve->getScatters(&scattersOn, QCPDataRange(0, n), 1);
+  QVERIFY(linesOn.size() < linesOff.size()/5);
+  QVERIFY(scattersOn.size() < scattersOff.size()/5);
+  
+  // first and last point and the gap survive:
+  QCOMPARE(linesOn.first(), linesOff.first());
+  QCOMPARE(linesOn.last(), linesOff.last());
+  QCOMPARE(scattersOn.first(), scattersOff.first());
+  int nanCount = 0;
+  foreach (const QPointF &point, linesOn)
+  {
+    if (qIsNaN(point.x()) || qIsNaN(point.y()))
+      ++nanCount;
+  }
+  QCOMPARE(nanCount, 1);
+  
+  // the sampled lines are a subsequence of the original ones that visits the same pixels in the
+  // same order, so they deviate from the original path by less than a pixel:
+  QList<QVector<QPointF> > pairsOff = QList<QVector<QPointF> >() << linesOff << scattersOff;
+  QList<QVector<QPointF> > pairsOn = QList<QVector<QPointF> >() << linesOn << scattersOn;
+  for (int k=0; k<pairsOff.size(); ++k)
+  {
+    const QVector<QPointF> &off = pairsOff.at(k);
+    const QVector<QPointF> &on = pairsOn.at(k);
+    QSet<QPair<int, int> > pixelsOff, pixelsOn;
+    int offIndex = 0;
+    foreach (const QPointF &point, on)
+    {
+      const bool isNan = qIsNaN(point.x()) || qIsNaN(point.y());
+      while (offIndex < off.size() && (isNan ? !(qIsNaN(off.at(offIndex).x()) || qIsNaN(off.at(offIndex).y())) : off.at(offIndex) != point))
+        ++offIndex;
+      QVERIFY(offIndex < off.size());
+      ++offIndex;
+      if (!isNan)
+        pixelsOn.insert(qMakePair(qFloor(point.x()), qFloor(point.y())));
+    }
+    foreach (const QPointF &point, off)
+    {
+      if (!qIsNaN(point.x()) && !qIsNaN(point.y()))
+        pixelsOff.insert(qMakePair(qFloor(point.x()), qFloor(point.y())));
+    }
+    QCOMPARE(pixelsOn, pixelsOff);
+  }
+  
+  // sparse data with one point per pixel isn't reduced:
+  QVector<double> sparseKeys, sparseValues;
+  for (int i=0; i<50; ++i)
+  {
+    sparseKeys << i;
+    sparseValues << (i%2)*10;
+  }
+  curve->setData(sparseKeys, sparseValues);
+  mPlot->rescaleAxes();
+  mPlot->replot();
+  curve->setAdaptiveSampling(false);
+  curve->getCurveLines(&linesOff, QCPDataRange(0, 50), 1);
+  curve->setAdaptiveSampling(true);
+  curve->getCurveLines(&linesOn, QCPDataRange(0, 50), 1);
+  QCOMPARE(linesOn, linesOff);
+  
+  // drawing with line, fill, scatters and a selected part, also zoomed in so most of the curve is
+  // outside the axis rect:
+  curve->setData(t, x, y, true);
+  curve->setBrush(QColor(0, 0, 255, 20));
+  curve->setScatterStyle(QCPScatterStyle::ssDisc);
+  curve->setSelectable(QCP::stDataRange);
+  curve->setSelection(QCPDataSelection(QCPDataRange(n/4, n/3)));
+  mPlot->rescaleAxes();
+  mPlot->replot();
+  mPlot->xAxis->setRange(-5, 5);
+  mPlot->yAxis->setRange(-5, 5);
+  mPlot->replot();
+  
+  // too few points to be sampled:
+  curve->setData(QVector<double>() << 1 << 2, QVector<double>() << 3 << 4);
+  mPlot->replot();
+  QCOMPARE(curve->data()->size(), 2);
+}
@@ -160,3 +160,39 @@ void TestQCPFinancial::dataSharing()
   QCOMPARE(financial2->data()->size(), 6);
 }
 
+void TestQCPFinancial::adaptiveSampling()
+{
+  QCOMPARE(mFinancial->adaptiveSampling(), true);
+  
+  // many more bars than pixels, so they get merged per pixel column:
+  int n = 100000;
+  QVector<double> key(n), open(n), high(n), low(n), close(n);
+  double price = 100;
+  for (int i=0; i<n; ++i)
+  {
+    key[i] = i;
+    open[i] = price;
+    price += qSin(i*0.01)+qCos(i*0.37)*0.5;
+    close[i] = price;
+    high[i] = qMax(open[i], close[i])+1;
+    low[i] = qMin(open[i], close[i])-1;
+  }
+  mFinancial->setData(key, open, high, low, close, true);
+  mFinancial->setSelectable(QCP::stDataRange);
+  mFinancial->setSelection(QCPDataSelection(QCPDataRange(n/4, n/3)));
+  mPlot->rescaleAxes();
+  
+  mFinancial->setChartStyle(QCPFinancial::csOhlc);
+  mPlot->replot();
+  mFinancial->setChartStyle(QCPFinancial::csCandlestick);
+  mPlot->replot();
+  mPlot->xAxis->setRangeReversed(true);
+  mPlot->replot();
+  mFinancial->setAdaptiveSampling(false);
+  QCOMPARE(mFinancial->adaptiveSampling(), false);
+  mPlot->replot();
+  
+  // data must not be touched by the merging:
+  QCOMPARE(mFinancial->data()->size(), n);
+  QCOMPARE(mFinancial->data()->at(n/2)->close, close.at(n/2));
+}
@@ -146,6 +146,22 @@ void TestQCPGraph::dataManipulation()
   QCOMPARE((mGraph->data()->constBegin()+4)->value, 4.0);
   QCOMPARE((mGraph->data()->constBegin()+5)->value, 5.0);
   QCOMPARE((mGraph->data()->constBegin()+6)->value, 6.0);
+
+  // raw array overloads:
+  const double rawKeys[] = {-1, 1, -2, 2};
+  const double rawValues[] = {1, 2, 0, 3};
+  mGraph->setData(rawKeys, rawValues, 4);
+  QCOMPARE(mGraph->data()->size(), 4);
+  QCOMPARE((mGraph->data()->constBegin()+0)->key, -2.0);
+  QCOMPARE((mGraph->data()->constBegin()+3)->key, 2.0);
+  QCOMPARE((mGraph->data()->constBegin()+0)->value, 0.0);
+  QCOMPARE((mGraph->data()->constBegin()+3)->value, 3.0);
+  mGraph->addData(rawKeys, rawValues, 2);
+  QCOMPARE(mGraph->data()->size(), 6);
+  QCOMPARE((mGraph->data()->constBegin()+1)->key, -1.0);
+  QCOMPARE((mGraph->data()->constBegin()+3)->key, 1.0);
+  mGraph->addData(rawKeys, rawValues, 0);
+  QCOMPARE(mGraph->data()->size(), 6);
 }
 
 void TestQCPGraph::dataSharing()
@@ -200,4 +216,197 @@ void TestQCPGraph::channelFill()
   mPlot->replot();
 }
 
+void TestQCPGraph::spatialIndex()
+{
+  mPlot->resize(400, 300);
+  QVector<double> x(3000), y(3000);
+  for (int i=0; i<x.size(); ++i)
+  {
+    x[i] = i/300.0;
+    y[i] = qSin(x[i]*3)+qSin(x[i]*50)*0.2;
+  }
+  y[1500] = qQNaN(); // gap in the line
+  mGraph->setData(x, y, true);
+  mPlot->rescaleAxes();
+  mPlot->xAxis->setRange(1, 8);
+  mPlot->replot();
+  const QRect axisRect = mPlot->axisRect()->rect();
+  const double tolerance = mPlot->selectionTolerance();
+  
+  // point and line distances must match the regular implementation within the selection tolerance:
+  QList<QCPGraph::LineStyle> lineStyles = QList<QCPGraph::LineStyle>() << QCPGraph::lsLine << QCPGraph::lsStepCenter << QCPGraph::lsImpulse << QCPGraph::lsNone;
+  mGraph->setScatterStyle(QCPScatterStyle::ssDisc);
+  foreach (QCPGraph::LineStyle lineStyle, lineStyles)
+  {
+    mGraph->setLineStyle(lineStyle);
+    for (int px=axisRect.left()+1; px<axisRect.right(); px+=7)
+    {
+      for (int py=axisRect.top()+1; py<axisRect.bottom(); py+=5)
+      {
+        const QPointF pos(px+0.3, py+0.6);
+        QVariant regularDetails, indexedDetails;
+        mGraph->setSpatialIndex(false);
+        const double regular = mGraph->selectTest(pos, false, &regularDetails);
+        mGraph->setSpatialIndex(true);
+        const double indexed = mGraph->selectTest(pos, false, &indexedDetails);
+        QCOMPARE(indexed < tolerance, regular < tolerance);
+        if (regular < tolerance)
+        {
+          QVERIFY(qAbs(indexed-regular) < 1e-9);
+          if (lineStyle == QCPGraph::lsNone)
+            QCOMPARE(indexedDetails.value<QCPDataSelection>(), regularDetails.value<QCPDataSelection>());
+        }
+      }
+    }
+  }
+  
+  // rect selection must match the regular implementation:
+  QList<QRectF> rects = QList<QRectF>() << QRectF(axisRect.left()+10, axisRect.top()+10, 50, 80)
+                                        << QRectF(axisRect.left(), axisRect.center().y()-10, axisRect.width(), 20)
+                                        << QRectF(axisRect.right()-5, axisRect.bottom()-5, -100, -200) // not normalized
+                                        << QRectF(axisRect.left()-50, axisRect.top(), 150, 100); // reaches beyond key range
+  foreach (const QRectF &rect, rects)
+  {
+    mGraph->setSpatialIndex(false);
+    const QCPDataSelection regular = mGraph->selectTestRect(rect, false);
+    mGraph->setSpatialIndex(true);
+    QCOMPARE(mGraph->selectTestRect(rect, false), regular);
+  }
+  
+  // index must follow changes of data and view:
+  mGraph->setLineStyle(QCPGraph::lsNone);
+  const QPointF pos = mGraph->coordsToPixels(x.at(1000), y.at(1000));
+  QVariant details;
+  QVERIFY(mGraph->selectTest(pos, false, &details) < 1e-6);
+  QCOMPARE(details.value<QCPDataSelection>(), QCPDataSelection(QCPDataRange(1000, 1001)));
+  mPlot->xAxis->moveRange(0.5);
+  const QPointF movedPos = mGraph->coordsToPixels(x.at(1000), y.at(1000));
+  QVERIFY(mGraph->selectTest(movedPos, false) < 1e-6);
+  mGraph->setData(QVector<double>() << 1 << 8, QVector<double>() << -10 << -10);
+  QVERIFY(mGraph->selectTest(movedPos, false) > tolerance);
+  mGraph->data()->add(QCPGraphData(x.at(1000), y.at(1000))); // direct modification needs explicit invalidation
+  mGraph->invalidateSpatialIndex();
+  QVERIFY(mGraph->selectTest(movedPos, false) < 1e-6);
+}
 
+void TestQCPGraph::scatterSprites()
+{
+  QVector<QPointF> positions;
+  for (int i=0; i<20; ++i)
+    positions << QPointF(10+i*17, 15+(i*37)%160);
+  positions << QPointF(qQNaN(), 50) << QPointF(-100, 50) << QPointF(50, 1e9); // skipped or outside
+  
+  // without antialiasing, sprites placed at whole pixels must look exactly like the vector shapes:
+  QList<QCPScatterStyle::ScatterShape> shapes = QList<QCPScatterStyle::ScatterShape>() << QCPScatterStyle::ssCross << QCPScatterStyle::ssCircle << QCPScatterStyle::ssDisc << QCPScatterStyle::ssSquare << QCPScatterStyle::ssTriangle << QCPScatterStyle::ssPlusCircle;
+  QList<QPen> pens = QList<QPen>() << QPen(Qt::blue, 1) << QPen(QColor(200, 0, 0), 3);
+  foreach (QCPScatterStyle::ScatterShape shape, shapes)
+  {
+    foreach (const QPen &pen, pens)
+    {
+      QCPScatterStyle style(shape, pen, QBrush(Qt::green), 9);
+      QImage vectorImage(400, 200, QImage::Format_ARGB32_Premultiplied);
+      QImage spriteImage(400, 200, QImage::Format_ARGB32_Premultiplied);
+      vectorImage.fill(Qt::white);
+      spriteImage.fill(Qt::white);
+      QCPPainter vectorPainter(&vectorImage);
+      vectorPainter.setAntialiasing(false);
+      style.applyTo(&vectorPainter, QPen());
+      style.drawShapes(&vectorPainter, positions, false);
+      vectorPainter.end();
+      QCPPainter spritePainter(&spriteImage);
+      spritePainter.setAntialiasing(false);
+      style.applyTo(&spritePainter, QPen());
+      style.drawShapes(&spritePainter, positions, true);
+      spritePainter.end();
+      QCOMPARE(spriteImage, vectorImage);
+    }
+  }
+  
+  // replot must work with and without the plotting hint:
+  mGraph->setData(QVector<double>() << 1 << 2 << 3, QVector<double>() << 1 << 3 << 2);
+  mGraph->setScatterStyle(QCPScatterStyle::ssDisc);
+  mPlot->rescaleAxes();
+  mPlot->setPlottingHint(QCP::phCacheScatters);
+  mPlot->replot();
+  mPlot->setPlottingHint(QCP::phCacheScatters, false);
+  mPlot->replot();
+}
+
+void TestQCPGraph::valuesAt()
+{
+  // empty graph and NaN keys give NaN:
+  QVector<double> result = mGraph->valuesAt(QVector<double>() << 1 << 2);
+  QCOMPARE(result.size(), 2);
+  QVERIFY(qIsNaN(result.at(0)) && qIsNaN(result.at(1)));
+  mGraph->addData(5, 7);
+  result = mGraph->valuesAt(QVector<double>() << 1 << qQNaN() << 9);
+  QCOMPARE(result.at(0), 7.0);
+  QVERIFY(qIsNaN(result.at(1)));
+  QCOMPARE(result.at(2), 7.0);
+  
+  // sorted, reversed and unsorted keys must give the same positions as a linear scan and as a
+  // tracer at each key, including keys outside the data range, exactly on data points and on
+  // duplicate keys:
+  QVector<double> x, y;
+  for (int i=0; i<500; ++i)
+  {
+    x << i*0.5-(i%7 == 0 ? 0.5 : 0); // every seventh key duplicates its predecessor
+    y << qSin(i*0.1)*10;
+  }
+  mGraph->setData(x, y, true);
+  QVector<double> sortedKeys;
+  for (int i=0; i<2000; ++i)
+    sortedKeys << -20+i*0.15;
+  QVector<double> reversedKeys = sortedKeys;
+  std::reverse(reversedKeys.begin(), reversedKeys.end());
+  QVector<double> unsortedKeys = sortedKeys;
+  for (int i=0; i<unsortedKeys.size(); ++i)
+    unsortedKeys.swap(i, (i*7919)%unsortedKeys.size());
+  unsortedKeys << x.at(21) << x.at(20) << x.at(100) << x.at(0) << x.last();
+  
+  QCPItemTracer *tracer = new QCPItemTracer(mPlot);
+  tracer->setGraph(mGraph);
+  QList<QVector<double> > keyLists = QList<QVector<double> >() << sortedKeys << reversedKeys << unsortedKeys;
+  foreach (const QVector<double> &keys, keyLists)
+  {
+    for (int interpolate=0; interpolate<2; ++interpolate)
+    {
+      QVector<double> values(keys.size()), resultKeys(keys.size());
+      mGraph->valuesAt(keys.constData(), values.data(), keys.size(), interpolate, resultKeys.data());
+      QCOMPARE(mGraph->valuesAt(keys, interpolate), values);
+      tracer->setInterpolating(interpolate);
+      for (int i=0; i<keys.size(); ++i)
+      {
+        const double key = keys.at(i);
+        double expectedKey, expectedValue;
+        if (key <= x.first() || key >= x.last())
+        {
+          expectedKey = key <= x.first() ? x.first() : x.last();
+          expectedValue = key <= x.first() ? y.first() : y.last();
+        } else
+        {
+          int next = 0;
+          while (x.at(next) < key)
+            ++next;
+          const int prev = next-1;
+          if (interpolate)
+          {
+            expectedKey = key;
+            expectedValue = y.at(prev)+(key-x.at(prev))*(y.at(next)-y.at(prev))/(x.at(next)-x.at(prev));
+          } else
+          {
+            const int closest = key < (x.at(prev)+x.at(next))*0.5 ? prev : next;
+            expectedKey = x.at(closest);
+            expectedValue = y.at(closest);
+          }
+        }
+        QCOMPARE(resultKeys.at(i), expectedKey);
+        QVERIFY(qAbs(values.at(i)-expectedValue) < 1e-9);
+        tracer->setGraphKey(key);
+        tracer->updatePosition();
+        QCOMPARE(resultKeys.at(i), tracer->position->key());
+        QCOMPARE(values.at(i), tracer->position->value());
+      }
+    }
+  }
+}
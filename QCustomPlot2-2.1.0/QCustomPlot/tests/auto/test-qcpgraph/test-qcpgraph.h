@@ -12,6 +12,9 @@ private slots:
   void dataManipulation();
   void dataSharing();
   void channelFill();
+  void spatialIndex();
+  void scatterSprites();
+  void valuesAt();
   
 private:
   QCustomPlot *mPlot;
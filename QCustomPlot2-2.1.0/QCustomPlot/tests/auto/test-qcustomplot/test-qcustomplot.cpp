@@ -1,5 +1,25 @@
 #include "test-qcustomplot.h"
 
+/*
+  Exports a plot repeatedly from a worker thread, see TestQCustomPlot::labelCache.
+*/
+class ExportThread : public QThread
+{
+public:
+  explicit ExportThread(QCustomPlot *plot) : mPlot(plot) {}
+  QImage image;
+  
+protected:
+  void run() Q_DECL_OVERRIDE
+  {
+    for (int i=0; i<20; ++i)
+      image = mPlot->toImage();
+  }
+  
+private:
+  QCustomPlot *mPlot;
+};
+
 void TestQCustomPlot::init()
 {
   mPlot = new QCustomPlot(0);
@@ -162,16 +182,366 @@ void TestQCustomPlot::rescaleAxes_MultipleFlatGraphs()
   QCOMPARE(mPlot->yAxis->range().upper, 2.0);
 }
 
+void TestQCustomPlot::toImage()
+{
+  mPlot->setGeometry(0, 0, 300, 200);
+  mPlot->setBackground(QBrush(QColor(10, 20, 30)));
+  mPlot->addGraph()->setData(QVector<double>() << 1 << 2 << 3, QVector<double>() << 3 << 1 << 2);
+  mPlot->rescaleAxes();
+  const QRect viewport = mPlot->viewport();
+  
+  // widget size:
+  QImage image = mPlot->toImage();
+  QCOMPARE(image.size(), mPlot->size());
+  QCOMPARE(image.format(), QImage::Format_ARGB32_Premultiplied);
+  QCOMPARE(image.pixel(1, 1), QColor(10, 20, 30).rgb());
+  
+  // explicit size, scale and format:
+  image = mPlot->toImage(400, 100, 2.0, QImage::Format_RGB32);
+  QCOMPARE(image.size(), QSize(800, 200));
+  QCOMPARE(image.format(), QImage::Format_RGB32);
+  QCOMPARE(image.pixel(1, 1), QColor(10, 20, 30).rgb());
+  
+  // viewport is restored after rendering:
+  QCOMPARE(mPlot->viewport(), viewport);
+  
+  // invalid size:
+  QVERIFY(mPlot->toImage(100, 100, 0.001).isNull());
+}
 
+void TestQCustomPlot::dirtyLayerTracking()
+{
+  mPlot->setGeometry(0, 0, 300, 200);
+  mPlot->addLayer("data", mPlot->layer("main"), QCustomPlot::limAbove);
+  mPlot->layer("data")->setMode(QCPLayer::lmBuffered);
+  QCPGraph *graph = mPlot->addGraph();
+  graph->setLayer("data");
+  graph->setData(QVector<double>() << 1 << 2 << 3, QVector<double>() << 3 << 1 << 2);
+  mPlot->rescaleAxes();
+  QStringList allLayers;
+  for (int i=0; i<mPlot->layerCount(); ++i)
+    allLayers << mPlot->layer(i)->name();
+  
+  // without tracking, every replot draws all layers:
+  mPlot->replot();
+  mPlot->replot();
+  QCOMPARE(mPlot->redrawnLayers(), allLayers);
+  
+  mPlot->setPlottingHint(QCP::phTrackDirtyLayers);
+  mPlot->replot(); // plotting hints changed, so all layers are redrawn once
+  QCOMPARE(mPlot->redrawnLayers(), allLayers);
+  QVERIFY(!mPlot->layer("data")->isDirty());
+  mPlot->replot();
+  QCOMPARE(mPlot->redrawnLayers(), QStringList());
+  
+  // data change only redraws the graph's dedicated buffer:
+  graph->addData(4, 5);
+  QVERIFY(mPlot->layer("data")->isDirty());
+  mPlot->replot();
+  QCOMPARE(mPlot->redrawnLayers(), QStringList() << "data");
+  
+  // manually marked layer redraws all layers sharing its buffer:
+  mPlot->layer("legend")->markDirty();
+  mPlot->replot();
+  QCOMPARE(mPlot->redrawnLayers(), QStringList() << "axes" << "legend");
+  
+  // range changes affect everything:
+  mPlot->xAxis->setRange(0, 10);
+  mPlot->replot();
+  QCOMPARE(mPlot->redrawnLayers(), allLayers);
+  
+  // buffered content is reused, so the result equals a full replot:
+  graph->setPen(QPen(Qt::red));
+  mPlot->replot();
+  const QImage tracked = mPlot->grab().toImage();
+  mPlot->setPlottingHint(QCP::phTrackDirtyLayers, false);
+  mPlot->replot();
+  QCOMPARE(mPlot->grab().toImage(), tracked);
+}
 
+void TestQCustomPlot::dirtyLayerTrackingSetters()
+{
+  mPlot->setGeometry(0, 0, 400, 300);
+  mPlot->addLayer("data", mPlot->layer("main"), QCustomPlot::limAbove);
+  mPlot->addLayer("items", mPlot->layer("data"), QCustomPlot::limAbove);
+  mPlot->layer("data")->setMode(QCPLayer::lmBuffered);
+  mPlot->layer("items")->setMode(QCPLayer::lmBuffered);
+  mPlot->legend->setVisible(true);
+  QCPGraph *graph = mPlot->addGraph();
+  graph->setLayer("data");
+  graph->setName("graph");
+  graph->setData(QVector<double>() << 1 << 2 << 3, QVector<double>() << 3 << 1 << 2);
+  QCPBars *bars = new QCPBars(mPlot->xAxis, mPlot->yAxis);
+  bars->setLayer("data");
+  bars->setName("bars");
+  bars->setData(QVector<double>() << 1 << 2 << 3, QVector<double>() << 1 << 2 << 1);
+  QCPCurve *curve = new QCPCurve(mPlot->xAxis, mPlot->yAxis);
+  curve->setLayer("data");
+  curve->setName("curve");
+  curve->setData(QVector<double>() << 1 << 2 << 3, QVector<double>() << 2 << 3 << 1);
+  QCPFinancial *financial = new QCPFinancial(mPlot->xAxis, mPlot->yAxis);
+  financial->setLayer("data");
+  financial->setName("financial");
+  financial->setData(QVector<double>() << 1 << 2, QVector<double>() << 1 << 2, QVector<double>() << 3 << 3, QVector<double>() << 0 << 1, QVector<double>() << 2 << 1);
+  QCPItemLine *line = new QCPItemLine(mPlot);
+  line->setLayer("items");
+  line->start->setCoords(1, 1);
+  line->end->setCoords(2, 2);
+  QCPItemText *text = new QCPItemText(mPlot);
+  text->setLayer("overlay");
+  text->position->setParentAnchor(line->end);
+  text->setText("text");
+  mPlot->rescaleAxes();
+  QStringList allLayers;
+  for (int i=0; i<mPlot->layerCount(); ++i)
+    allLayers << mPlot->layer(i)->name();
+  mPlot->setPlottingHint(QCP::phTrackDirtyLayers);
+  mPlot->replot();
+  mPlot->replot();
+  QCOMPARE(mPlot->redrawnLayers(), QStringList());
+  
+  // plottable style setters redraw the plottable's layer and the legend showing its icon:
+  const QStringList dataLayers = QStringList() << "data" << "axes" << "legend";
+  graph->setLineStyle(QCPGraph::lsStepLeft);
+  mPlot->replot();
+  QCOMPARE(mPlot->redrawnLayers(), dataLayers);
+  graph->setScatterStyle(QCPScatterStyle::ssCircle);
+  mPlot->replot();
+  QCOMPARE(mPlot->redrawnLayers(), dataLayers);
+  graph->setAdaptiveSampling(false);
+  mPlot->replot();
+  QCOMPARE(mPlot->redrawnLayers(), dataLayers);
+  bars->setWidth(0.3);
+  mPlot->replot();
+  QCOMPARE(mPlot->redrawnLayers(), dataLayers);
+  bars->setBaseValue(0.5);
+  mPlot->replot();
+  QCOMPARE(mPlot->redrawnLayers(), dataLayers);
+  curve->setLineStyle(QCPCurve::lsNone);
+  mPlot->replot();
+  QCOMPARE(mPlot->redrawnLayers(), dataLayers);
+  financial->setChartStyle(QCPFinancial::csCandlestick);
+  mPlot->replot();
+  QCOMPARE(mPlot->redrawnLayers(), dataLayers);
+  graph->selectionDecorator()->setPen(QPen(Qt::green));
+  mPlot->replot();
+  QCOMPARE(mPlot->redrawnLayers(), dataLayers);
+  
+  // the legend text follows the plottable name:
+  graph->setName("renamed");
+  mPlot->replot();
+  QVERIFY(mPlot->redrawnLayers().contains("legend"));
+  
+  // axis and grid appearance:
+  mPlot->xAxis->setTickPen(QPen(Qt::red));
+  mPlot->replot();
+  QCOMPARE(mPlot->redrawnLayers(), QStringList() << "axes" << "legend");
+  mPlot->xAxis->setLabelColor(Qt::red);
+  mPlot->replot();
+  QCOMPARE(mPlot->redrawnLayers(), QStringList() << "axes" << "legend");
+  mPlot->xAxis->setLabel("x");
+  mPlot->replot();
+  QVERIFY(mPlot->redrawnLayers().contains("axes"));
+  mPlot->xAxis->grid()->setPen(QPen(Qt::red));
+  mPlot->replot();
+  QCOMPARE(mPlot->redrawnLayers(), QStringList() << "background" << "grid" << "main");
+  
+  // ticker changes move the ticks, which affects grid, axes and everything drawn relative to them:
+  QSharedPointer<QCPAxisTickerFixed> fixedTicker(new QCPAxisTickerFixed);
+  fixedTicker->setTickStep(0.25);
+  mPlot->xAxis->setTicker(fixedTicker);
+  mPlot->replot();
+  QCOMPARE(mPlot->redrawnLayers(), allLayers);
+  fixedTicker->setTickStep(0.5);
+  mPlot->replot();
+  QCOMPARE(mPlot->redrawnLayers(), allLayers);
+  mPlot->replot();
+  QCOMPARE(mPlot->redrawnLayers(), QStringList());
+  
+  // item setters and positions, and items anchored to changed items:
+  line->setPen(QPen(Qt::blue));
+  mPlot->replot();
+  QCOMPARE(mPlot->redrawnLayers(), QStringList() << "items");
+  line->start->setCoords(1.5, 1);
+  mPlot->replot();
+  QCOMPARE(mPlot->redrawnLayers(), QStringList() << "items");
+  line->end->setCoords(2.5, 2);
+  mPlot->replot();
+  QCOMPARE(mPlot->redrawnLayers(), QStringList() << "items" << "overlay");
+  text->setColor(Qt::red);
+  mPlot->replot();
+  QCOMPARE(mPlot->redrawnLayers(), QStringList() << "overlay");
+  
+  // tracers follow the data of their graph:
+  QCPItemTracer *tracer = new QCPItemTracer(mPlot);
+  tracer->setLayer("overlay");
+  tracer->setGraph(graph);
+  tracer->setGraphKey(2);
+  mPlot->replot();
+  mPlot->replot();
+  QCOMPARE(mPlot->redrawnLayers(), QStringList());
+  graph->addData(4, 1);
+  mPlot->replot();
+  QCOMPARE(mPlot->redrawnLayers(), QStringList() << "data" << "axes" << "legend" << "overlay");
+  
+  // buffered content is reused, so the result equals a full replot:
+  const QImage tracked = mPlot->grab().toImage();
+  mPlot->setPlottingHint(QCP::phTrackDirtyLayers, false);
+  mPlot->replot();
+  QCOMPARE(mPlot->grab().toImage(), tracked);
+}
 
+void TestQCustomPlot::maximumFrameRate()
+{
+  mPlot->setMaximumFrameRate(5); // frame interval of 200 ms
+  mPlot->replot();
+  QSignalSpy replotSpy(mPlot, SIGNAL(afterReplot()));
+  QSignalSpy droppedSpy(mPlot, SIGNAL(framesDropped(int)));
+  
+  // queued replots within one frame interval are merged into one:
+  for (int i=0; i<10; ++i)
+    mPlot->replot(QCustomPlot::rpQueuedReplot);
+  QTest::qWait(50);
+  QCOMPARE(replotSpy.count(), 0);
+  QTRY_COMPARE(replotSpy.count(), 1);
+  QCOMPARE(droppedSpy.count(), 1);
+  QCOMPARE(droppedSpy.at(0).at(0).toInt(), 9);
+  
+  // without limit, queued replots happen in the next event loop iteration and drop nothing:
+  mPlot->setMaximumFrameRate(0);
+  mPlot->replot(QCustomPlot::rpQueuedReplot);
+  mPlot->replot(QCustomPlot::rpQueuedReplot);
+  QTRY_COMPARE(replotSpy.count(), 2);
+  QCOMPARE(droppedSpy.count(), 1);
+}
 
+void TestQCustomPlot::profiling()
+{
+  QCPGraph *graph = mPlot->addGraph();
+  graph->setName(QLatin1String("sine"));
+  QVector<double> x(1000), y(1000);
+  for (int i=0; i<x.size(); ++i)
+  {
+    x[i] = i;
+    y[i] = qSin(i*0.1);
+  }
+  graph->setData(x, y);
+  mPlot->rescaleAxes();
+  QSignalSpy profiledSpy(mPlot, SIGNAL(replotProfiled(QVariantMap)));
+  
+  // disabled by default:
+  mPlot->replot();
+  QVERIFY(!mPlot->profiling());
+  QVERIFY(mPlot->replotProfile().isEmpty());
+  QCOMPARE(profiledSpy.count(), 0);
+  
+  mPlot->setProfiling(true);
+  mPlot->replot();
+  QCOMPARE(profiledSpy.count(), 1);
+  const QVariantMap profile = mPlot->replotProfile();
+  QCOMPARE(profiledSpy.at(0).at(0).toMap(), profile);
+  const double replotTime = profile.value(QLatin1String("replotTime")).toDouble();
+  QCOMPARE(replotTime, mPlot->replotTime());
+  double stepsTime = 0;
+  foreach (const QString &key, QStringList() << QLatin1String("layoutTime") << QLatin1String("bufferSetupTime") << QLatin1String("drawTime") << QLatin1String("refreshTime"))
+  {
+    QVERIFY(profile.contains(key));
+    QVERIFY(profile.value(key).toDouble() >= 0);
+    stepsTime += profile.value(key).toDouble();
+  }
+  QVERIFY(qAbs(stepsTime-replotTime) < 1e-6*qMax(1.0, replotTime));
+  
+  // the immediate refresh paints the widget within the replot, including the flush of the buffers:
+  QVERIFY(profile.contains(QLatin1String("flushTime")));
+  QVERIFY(profile.value(QLatin1String("flushTime")).toDouble() >= 0);
+  QVERIFY(profile.value(QLatin1String("flushTime")).toDouble() <= profile.value(QLatin1String("refreshTime")).toDouble());
+  
+  // all layers are listed in rendering order, the graph on the main layer:
+  QStringList layerNames;
+  bool foundGraph = false;
+  foreach (const QVariant &layerVariant, profile.value(QLatin1String("layers")).toList())
+  {
+    const QVariantMap layerProfile = layerVariant.toMap();
+    layerNames << layerProfile.value(QLatin1String("name")).toString();
+    QVERIFY(layerProfile.value(QLatin1String("time")).toDouble() >= 0);
+    foreach (const QVariant &layerableVariant, layerProfile.value(QLatin1String("layerables")).toList())
+    {
+      const QVariantMap layerableProfile = layerableVariant.toMap();
+      QVERIFY(layerableProfile.value(QLatin1String("time")).toDouble() >= 0);
+      if (layerableProfile.value(QLatin1String("className")).toString() == QLatin1String("QCPGraph"))
+      {
+        QCOMPARE(layerProfile.value(QLatin1String("name")).toString(), QString(QLatin1String("main")));
+        QCOMPARE(layerableProfile.value(QLatin1String("name")).toString(), QString(QLatin1String("sine")));
+        foundGraph = true;
+      }
+    }
+  }
+  QCOMPARE(layerNames, mPlot->redrawnLayers());
+  QVERIFY(foundGraph);
+  
+  // with a queued refresh, the flush time is added to the profile once the widget is painted:
+  mPlot->replot(QCustomPlot::rpQueuedRefresh);
+  QCOMPARE(profiledSpy.count(), 2);
+  QVERIFY(!mPlot->replotProfile().contains(QLatin1String("flushTime")));
+  QTRY_VERIFY(mPlot->replotProfile().contains(QLatin1String("flushTime")));
+  QVERIFY(mPlot->replotProfile().value(QLatin1String("flushTime")).toDouble() >= 0);
+  
+  mPlot->setProfiling(false);
+  QVERIFY(mPlot->replotProfile().isEmpty());
+  mPlot->replot();
+  QCOMPARE(profiledSpy.count(), 2);
+  QVERIFY(mPlot->replotProfile().isEmpty());
+}
 
-
-
-
-
-
-
-
-
+void TestQCustomPlot::labelCache()
+{
+  mPlot->xAxis->setRange(0, 10);
+  mPlot->yAxis->setRange(-1, 1);
+  QSharedPointer<QCPLabelCache> cache = mPlot->labelCache();
+  QVERIFY(!cache.isNull());
+  
+  // first replot renders all tick labels, the second one reuses them:
+  mPlot->replot();
+  const qint64 misses = cache->misses();
+  QVERIFY(misses > 0);
+  QVERIFY(cache->count() > 0);
+  const qint64 hits = cache->hits();
+  mPlot->replot();
+  QCOMPARE(cache->misses(), misses);
+  QVERIFY(cache->hits() > hits);
+  
+  // a second plot sharing the cache finds the same labels already rendered:
+  QCustomPlot otherPlot;
+  otherPlot.resize(mPlot->size());
+  otherPlot.setLabelCache(cache);
+  QCOMPARE(otherPlot.labelCache(), cache);
+  otherPlot.xAxis->setRange(0, 10);
+  otherPlot.yAxis->setRange(-1, 1);
+  otherPlot.replot();
+  QCOMPARE(cache->misses(), misses);
+  
+  // least recently used labels are evicted when the cache shrinks:
+  cache->setMaximumCount(2);
+  QVERIFY(cache->count() <= 2);
+  mPlot->replot();
+  QVERIFY(cache->count() <= 2);
+  QVERIFY(cache->misses() > misses);
+  
+  // the shared cache may be used by a thread exporting one plot while the GUI thread replots the other:
+  cache->setMaximumCount(16);
+  ExportThread exportThread(&otherPlot);
+  exportThread.start();
+  for (int i=0; i<20; ++i)
+  {
+    mPlot->xAxis->moveRange(0.7);
+    mPlot->replot();
+  }
+  QVERIFY(exportThread.wait(30000));
+  QVERIFY(!exportThread.image.isNull());
+  
+  // a null cache gives the plot a new one of its own:
+  otherPlot.setLabelCache(QSharedPointer<QCPLabelCache>());
+  QVERIFY(!otherPlot.labelCache().isNull());
+  QVERIFY(otherPlot.labelCache() != cache);
+  QCOMPARE(otherPlot.labelCache()->count(), 0);
+}
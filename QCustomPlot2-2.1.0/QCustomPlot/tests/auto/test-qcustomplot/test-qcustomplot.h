@@ -13,6 +13,12 @@ private slots:
   void rescaleAxes_GraphVisibility();
   void rescaleAxes_FlatGraph();
   void rescaleAxes_MultipleFlatGraphs();
+  void toImage();
+  void dirtyLayerTracking();
+  void dirtyLayerTrackingSetters();
+  void maximumFrameRate();
+  void profiling();
+  void labelCache();
   
 private:
   QCustomPlot *mPlot;
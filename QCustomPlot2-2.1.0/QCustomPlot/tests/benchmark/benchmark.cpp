@@ -12,8 +12,11 @@ private slots:
   
   void QCPGraph_Standard();
   void QCPGraph_ManyPoints();
+  void QCPGraph_ManyPointsCachedScatters();
   void QCPGraph_ManyLines();
   void QCPGraph_ManyOffScreenLines();
+  void QCPGraph_HugeZoomedOut();
+  void QCPGraph_HugeZoomedOutLevelOfDetail();
   void QCPGraph_RemoveDataBetween();
   void QCPGraph_RemoveDataAfter();
   void QCPGraph_RemoveDataBefore();
@@ -24,15 +27,44 @@ private slots:
   void QCPGraph_AddDataAtBeginUnsorted();
   void QCPGraph_AddDataMixedUnsorted();
   void QCPGraph_AddDataSingleAtEnd();
+  void QCPGraph_AddDataSingleAtEndRemoveBefore();
+  void QCPGraph_AddDataSingleAtEndStreaming();
   void QCPGraph_AddDataSingleAtBegin();
   void QCPGraph_AddDataSingleRandom();
+  void QCPGraph_ValueRange();
+  void QCPDataColumns_ValueRange();
+  void QCPGraph_SetDataColumns();
+  void QCPGraph_HoverSweep();
+  void QCPGraph_HoverSweepSpatialIndex();
+  void QCPGraph_ValuesAt();
+  void QCPGraph_ValuesAtTracer();
+  
+  void QCPCurve_Spiral();
+  void QCPCurve_SpiralAdaptiveSampling();
+  
+  void QCPFinancial_ManyBars();
+  void QCPFinancial_ManyBarsAdaptiveSampling();
+  
+  void QCPBars_DeepStack();
+  void QCPBars_DeepStackInteraction();
+  
+  void QCPAnnotations_Replot();
+  void QCPAnnotations_ReplotItems();
+  void QCPAnnotations_HoverSweep();
+  void QCPAnnotations_HoverSweepItems();
   
   void QCPColorMap_Standard();
   void QCPColorMap_ColorizeMap();
+  void QCPColorMap_Waterfall();
   
   
   void QCPAxis_TickLabels();
   void QCPAxis_TickLabelsCached();
+  void QCPAxis_TickLabelsDateTime();
+  void QCPAxis_TickLabelsDateTimeMonths();
+  
+  void QCustomPlot_StaticLayers();
+  void QCustomPlot_StaticLayersTrackDirty();
   
 private:
   QCustomPlot *mPlot;
@@ -126,6 +158,40 @@ void Benchmark::QCPGraph_ManyPoints()
   }
 }
 
+void Benchmark::QCPGraph_ManyPointsCachedScatters()
+{
+  mPlot->setPlottingHint(QCP::phCacheScatters);
+  QCPGraph *graph1 = mPlot->addGraph();
+  QCPGraph *graph2 = mPlot->addGraph();
+  QCPGraph *graph3 = mPlot->addGraph();
+  graph1->setBrush(QBrush(QColor(100, 0, 0, 100)));
+  graph1->setScatterStyle(QCPScatterStyle::ssCross);
+  graph2->setScatterStyle(QCPScatterStyle::ssCircle);
+  graph3->setScatterStyle(QCPScatterStyle::ssDiamond);
+  graph1->setLineStyle(QCPGraph::lsNone);
+  graph2->setLineStyle(QCPGraph::lsNone);
+  graph3->setLineStyle(QCPGraph::lsNone);
+  int n = 50000;
+  QVector<double> x(n), y1(n), y2(n), y3(n);
+  for (int i=0; i<n; ++i)
+  {
+    x[i] = i/(double)n;
+    y1[i] = qSin(x[i]*10*M_PI);
+    y2[i] = qCos(x[i]*40*M_PI);
+    y3[i] = x[i];
+  }
+  graph1->setData(x, y1);
+  graph2->setData(x, y2);
+  graph3->setData(x, y3);
+  mPlot->rescaleAxes();
+  mPlot->xAxis->scaleRange(0.7, mPlot->xAxis->range().center());
+  
+  QBENCHMARK
+  {
+    mPlot->replot();
+  }
+}
+
 void Benchmark::QCPGraph_ManyLines()
 {
   QCPGraph *graph1 = mPlot->addGraph();
@@ -192,6 +258,46 @@ void Benchmark::QCPGraph_ManyOffScreenLines()
   }
 }
 
+void Benchmark::QCPGraph_HugeZoomedOut()
+{
+  QCPGraph *graph = mPlot->addGraph();
+  int n = 5000000;
+  QVector<double> x(n), y(n);
+  for (int i=0; i<n; ++i)
+  {
+    x[i] = i/(double)n;
+    y[i] = qSin(x[i]*100*M_PI)+qSin(x[i]*2e5*M_PI)*0.1;
+  }
+  graph->setData(x, y, true);
+  mPlot->rescaleAxes();
+  
+  QBENCHMARK
+  {
+    mPlot->replot();
+  }
+}
+
+void Benchmark::QCPGraph_HugeZoomedOutLevelOfDetail()
+{
+  QCPGraph *graph = mPlot->addGraph();
+  graph->setLevelOfDetailIndex(true);
+  int n = 5000000;
+  QVector<double> x(n), y(n);
+  for (int i=0; i<n; ++i)
+  {
+    x[i] = i/(double)n;
+    y[i] = qSin(x[i]*100*M_PI)+qSin(x[i]*2e5*M_PI)*0.1;
+  }
+  graph->setData(x, y, true);
+  mPlot->rescaleAxes();
+  mPlot->replot(); // builds the index
+  
+  QBENCHMARK
+  {
+    mPlot->replot();
+  }
+}
+
 void Benchmark::QCPGraph_RemoveDataBetween()
 {
   // we time and report this benchmark ourselves because it must be re-setup
@@ -451,6 +557,86 @@ void Benchmark::QCPGraph_AddDataSingleAtEnd()
   QTest::setBenchmarkResult(elapsed/1e3/(double)iteration, QTest::WalltimeMilliseconds); // 1e3 instead of 1e6 is intentional to get time of 1000 iterations (fits better to precision of benchmark script)
 }
 
+void Benchmark::QCPGraph_AddDataSingleAtEndRemoveBefore()
+{
+  // sliding window as typically done for live data before the streaming mode: append a point and
+  // remove all points older than the window. Timed manually like QCPGraph_AddDataSingleAtEnd.
+  
+  QCPGraph *graph = mPlot->addGraph();
+  int n = 50000;
+  QVector<double> x1(n), y1(n);
+  for (int i=0; i<n; ++i)
+  {
+    x1[i] = i;
+    y1[i] = qSin(x1[i]/(double)n*10*M_PI);
+  }
+  int n2 = 200000;
+  QVector<double> y2(n2);
+  for (int i=0; i<n2; ++i)
+  {
+    y2[i] = qSin(i/(double)n*10*M_PI);
+  }
+  
+  graph->setData(x1, y1);
+  double key = x1.last()+1;
+  QElapsedTimer timer;
+  qint64 elapsed = 0;
+  int iteration = 0;
+  while (iteration < n2)
+  {
+    timer.restart();
+    
+    graph->addData(key, y2[iteration]);
+    graph->data()->removeBefore(key-n+0.5);
+    
+    elapsed += timer.nsecsElapsed();
+    key += 1;
+    ++iteration;
+  }
+  QCOMPARE(graph->data()->size(), n);
+  QTest::setBenchmarkResult(elapsed/1e3/(double)iteration, QTest::WalltimeMilliseconds); // 1e3 instead of 1e6 is intentional to get time of 1000 iterations (fits better to precision of benchmark script)
+}
+
+void Benchmark::QCPGraph_AddDataSingleAtEndStreaming()
+{
+  // same sliding window as QCPGraph_AddDataSingleAtEndRemoveBefore, but using the streaming mode
+  // of the data container, which evicts the oldest point on its own
+  
+  QCPGraph *graph = mPlot->addGraph();
+  int n = 50000;
+  QVector<double> x1(n), y1(n);
+  for (int i=0; i<n; ++i)
+  {
+    x1[i] = i;
+    y1[i] = qSin(x1[i]/(double)n*10*M_PI);
+  }
+  int n2 = 200000;
+  QVector<double> y2(n2);
+  for (int i=0; i<n2; ++i)
+  {
+    y2[i] = qSin(i/(double)n*10*M_PI);
+  }
+  
+  graph->setData(x1, y1);
+  graph->data()->setStreamingCapacity(n);
+  double key = x1.last()+1;
+  QElapsedTimer timer;
+  qint64 elapsed = 0;
+  int iteration = 0;
+  while (iteration < n2)
+  {
+    timer.restart();
+    
+    graph->addData(key, y2[iteration]);
+    
+    elapsed += timer.nsecsElapsed();
+    key += 1;
+    ++iteration;
+  }
+  QCOMPARE(graph->data()->size(), n);
+  QTest::setBenchmarkResult(elapsed/1e3/(double)iteration, QTest::WalltimeMilliseconds); // 1e3 instead of 1e6 is intentional to get time of 1000 iterations (fits better to precision of benchmark script)
+}
+
 void Benchmark::QCPGraph_AddDataSingleAtBegin()
 {
   // we time and report this benchmark ourselves because it must be re-setup
@@ -530,6 +716,414 @@ void Benchmark::QCPGraph_AddDataSingleRandom()
   QTest::setBenchmarkResult(elapsed/1e3/(double)iteration, QTest::WalltimeMilliseconds); // 1e3 instead of 1e6 is intentional to get time of 1000 iterations (fits better to precision of benchmark script)
 }
 
+void Benchmark::QCPGraph_ValueRange()
+{
+  QCPGraph *graph = mPlot->addGraph();
+  int n = 2000000;
+  QVector<double> x(n), y(n);
+  for (int i=0; i<n; ++i)
+  {
+    x[i] = i/(double)n;
+    y[i] = qSin(x[i]*10*M_PI);
+  }
+  graph->setData(x, y, true);
+  
+  bool foundRange;
+  QBENCHMARK
+  {
+    graph->data()->valueRange(foundRange);
+  }
+}
+
+void Benchmark::QCPDataColumns_ValueRange()
+{
+  int n = 2000000;
+  QVector<double> x(n), y(n);
+  for (int i=0; i<n; ++i)
+  {
+    x[i] = i/(double)n;
+    y[i] = qSin(x[i]*10*M_PI);
+  }
+  QCPDataColumns columns(x, y, true);
+  
+  bool foundRange;
+  QBENCHMARK
+  {
+    columns.valueRange(foundRange);
+  }
+}
+
+void Benchmark::QCPGraph_SetDataColumns()
+{
+  QCPGraph *graph = mPlot->addGraph();
+  int n = 2000000;
+  QVector<double> x(n), y(n);
+  for (int i=0; i<n; ++i)
+  {
+    x[i] = i/(double)n;
+    y[i] = qSin(x[i]*10*M_PI);
+  }
+  QCPDataColumns columns(x, y, true);
+  
+  QBENCHMARK
+  {
+    graph->setData(columns);
+  }
+}
+
+void Benchmark::QCPGraph_HoverSweep()
+{
+  int n = 200000;
+  QVector<double> x(n), y(n);
+  for (int g=0; g<10; ++g)
+  {
+    QCPGraph *graph = mPlot->addGraph();
+    for (int i=0; i<n; ++i)
+    {
+      x[i] = i/(double)n;
+      y[i] = g+qSin(x[i]*(10+g)*M_PI)+qSin(x[i]*1e4*M_PI)*0.2;
+    }
+    graph->setData(x, y, true);
+  }
+  mPlot->rescaleAxes();
+  mPlot->replot();
+  const QRect axisRect = mPlot->axisRect()->rect();
+  
+  QBENCHMARK
+  {
+    // simulate the mouse moving diagonally across the axis rect, hit-testing all graphs at each step:
+    for (int i=0; i<100; ++i)
+      mPlot->plottableAt(QPointF(axisRect.left()+axisRect.width()*i/100.0, axisRect.top()+axisRect.height()*i/100.0));
+  }
+}
+
+void Benchmark::QCPGraph_HoverSweepSpatialIndex()
+{
+  int n = 200000;
+  QVector<double> x(n), y(n);
+  for (int g=0; g<10; ++g)
+  {
+    QCPGraph *graph = mPlot->addGraph();
+    graph->setSpatialIndex(true);
+    for (int i=0; i<n; ++i)
+    {
+      x[i] = i/(double)n;
+      y[i] = g+qSin(x[i]*(10+g)*M_PI)+qSin(x[i]*1e4*M_PI)*0.2;
+    }
+    graph->setData(x, y, true);
+  }
+  mPlot->rescaleAxes();
+  mPlot->replot();
+  const QRect axisRect = mPlot->axisRect()->rect();
+  mPlot->plottableAt(axisRect.center()); // builds the indices
+  
+  QBENCHMARK
+  {
+    // simulate the mouse moving diagonally across the axis rect, hit-testing all graphs at each step:
+    for (int i=0; i<100; ++i)
+      mPlot->plottableAt(QPointF(axisRect.left()+axisRect.width()*i/100.0, axisRect.top()+axisRect.height()*i/100.0));
+  }
+}
+
+void Benchmark::QCPGraph_ValuesAt()
+{
+  QCPGraph *graph = mPlot->addGraph();
+  int n = 1000000;
+  QVector<double> x(n), y(n);
+  for (int i=0; i<n; ++i)
+  {
+    x[i] = i/(double)n;
+    y[i] = qSin(x[i]*10*M_PI);
+  }
+  graph->setData(x, y, true);
+  QVector<double> keys(10000);
+  for (int i=0; i<keys.size(); ++i)
+    keys[i] = (i+0.5)/(double)keys.size();
+  
+  QBENCHMARK
+  {
+    graph->valuesAt(keys);
+  }
+}
+
+void Benchmark::QCPGraph_ValuesAtTracer()
+{
+  QCPGraph *graph = mPlot->addGraph();
+  int n = 1000000;
+  QVector<double> x(n), y(n);
+  for (int i=0; i<n; ++i)
+  {
+    x[i] = i/(double)n;
+    y[i] = qSin(x[i]*10*M_PI);
+  }
+  graph->setData(x, y, true);
+  QCPItemTracer *tracer = new QCPItemTracer(mPlot);
+  tracer->setGraph(graph);
+  tracer->setInterpolating(true);
+  
+  QBENCHMARK
+  {
+    // the same lookups as QCPGraph_ValuesAt, one key at a time:
+    for (int i=0; i<10000; ++i)
+    {
+      tracer->setGraphKey((i+0.5)/10000.0);
+      tracer->updatePosition();
+    }
+  }
+}
+
+void Benchmark::QCPCurve_Spiral()
+{
+  QCPCurve *curve = new QCPCurve(mPlot->xAxis, mPlot->yAxis);
+  int n = 1000000;
+  QVector<double> t(n), x(n), y(n);
+  for (int i=0; i<n; ++i)
+  {
+    t[i] = i;
+    const double phi = i/(double)n*400*M_PI;
+    x[i] = qCos(phi)*(1+phi*0.1)+qSin(phi*97)*0.05;
+    y[i] = qSin(phi)*(1+phi*0.1)+qCos(phi*89)*0.05;
+  }
+  curve->setData(t, x, y, true);
+  mPlot->rescaleAxes();
+  
+  QBENCHMARK
+  {
+    mPlot->replot();
+  }
+}
+
+void Benchmark::QCPCurve_SpiralAdaptiveSampling()
+{
+  QCPCurve *curve = new QCPCurve(mPlot->xAxis, mPlot->yAxis);
+  curve->setAdaptiveSampling(true);
+  int n = 1000000;
+  QVector<double> t(n), x(n), y(n);
+  for (int i=0; i<n; ++i)
+  {
+    t[i] = i;
+    const double phi = i/(double)n*400*M_PI;
+    x[i] = qCos(phi)*(1+phi*0.1)+qSin(phi*97)*0.05;
+    y[i] = qSin(phi)*(1+phi*0.1)+qCos(phi*89)*0.05;
+  }
+  curve->setData(t, x, y, true);
+  mPlot->rescaleAxes();
+  
+  QBENCHMARK
+  {
+    mPlot->replot();
+  }
+}
+
+void Benchmark::QCPFinancial_ManyBars()
+{
+  QCPFinancial *financial = new QCPFinancial(mPlot->xAxis, mPlot->yAxis);
+  financial->setAdaptiveSampling(false);
+  int n = 500000;
+  QVector<double> key(n), open(n), high(n), low(n), close(n);
+  double price = 100;
+  for (int i=0; i<n; ++i)
+  {
+    key[i] = i;
+    open[i] = price;
+    price += qSin(i*0.01)+qCos(i*0.37)*0.5;
+    close[i] = price;
+    high[i] = qMax(open[i], close[i])+1;
+    low[i] = qMin(open[i], close[i])-1;
+  }
+  financial->setData(key, open, high, low, close, true);
+  mPlot->rescaleAxes();
+  
+  QBENCHMARK
+  {
+    mPlot->replot();
+  }
+}
+
+void Benchmark::QCPFinancial_ManyBarsAdaptiveSampling()
+{
+  QCPFinancial *financial = new QCPFinancial(mPlot->xAxis, mPlot->yAxis);
+  financial->setAdaptiveSampling(true);
+  int n = 500000;
+  QVector<double> key(n), open(n), high(n), low(n), close(n);
+  double price = 100;
+  for (int i=0; i<n; ++i)
+  {
+    key[i] = i;
+    open[i] = price;
+    price += qSin(i*0.01)+qCos(i*0.37)*0.5;
+    close[i] = price;
+    high[i] = qMax(open[i], close[i])+1;
+    low[i] = qMin(open[i], close[i])-1;
+  }
+  financial->setData(key, open, high, low, close, true);
+  mPlot->rescaleAxes();
+  
+  QBENCHMARK
+  {
+    mPlot->replot();
+  }
+}
+
+void Benchmark::QCPBars_DeepStack()
+{
+  // stacked histogram with 20 layers of 50000 bars each:
+  int n = 50000;
+  QVector<double> key(n), value(n);
+  QCPBars *below = nullptr;
+  for (int layer=0; layer<20; ++layer)
+  {
+    QCPBars *bars = new QCPBars(mPlot->xAxis, mPlot->yAxis);
+    for (int i=0; i<n; ++i)
+    {
+      key[i] = i;
+      value[i] = 1.5+qSin(i*0.01+layer)+qCos(i*0.37)*0.5;
+    }
+    bars->setData(key, value, true);
+    bars->moveAbove(below);
+    below = bars;
+  }
+  mPlot->rescaleAxes();
+  
+  QBENCHMARK
+  {
+    mPlot->replot();
+  }
+}
+
+void Benchmark::QCPBars_DeepStackInteraction()
+{
+  // value axis rescaling and hit tests on the topmost bars of a deep stack, as during interaction:
+  int n = 50000;
+  QVector<double> key(n), value(n);
+  QCPBars *below = nullptr;
+  for (int layer=0; layer<20; ++layer)
+  {
+    QCPBars *bars = new QCPBars(mPlot->xAxis, mPlot->yAxis);
+    for (int i=0; i<n; ++i)
+    {
+      key[i] = i;
+      value[i] = 1.5+qSin(i*0.01+layer)+qCos(i*0.37)*0.5;
+    }
+    bars->setData(key, value, true);
+    bars->moveAbove(below);
+    below = bars;
+  }
+  mPlot->xAxis->setRange(0, n);
+  mPlot->replot();
+  const QRectF rect = mPlot->axisRect()->rect();
+  
+  QBENCHMARK
+  {
+    mPlot->yAxis->rescale();
+    below->selectTest(rect.center(), false);
+    below->selectTestRect(rect.adjusted(rect.width()*0.4, 0, -rect.width()*0.4, 0), false);
+  }
+}
+
+void Benchmark::QCPAnnotations_Replot()
+{
+  // 10000 labeled markers of two kinds, a fifth of them in the visible key range:
+  int n = 10000;
+  QVector<double> key(n), value(n);
+  QStringList text;
+  QVector<int> style(n);
+  for (int i=0; i<n; ++i)
+  {
+    key[i] = i;
+    value[i] = qSin(i*0.01)+qCos(i*0.37)*0.3;
+    text << (i%2 == 0 ? QLatin1String("buy") : QLatin1String("sell"));
+    style[i] = i%2;
+  }
+  QCPAnnotations *annotations = new QCPAnnotations(mPlot->xAxis, mPlot->yAxis);
+  annotations->setStyle(0, QCPScatterStyle(QCPScatterStyle::ssTriangle, QPen(Qt::darkGreen), Qt::green, 7));
+  annotations->addStyle(QCPScatterStyle(QCPScatterStyle::ssTriangleInverted, QPen(Qt::darkRed), Qt::red, 7));
+  annotations->setData(key, value, text, style, true);
+  mPlot->rescaleAxes();
+  mPlot->xAxis->setRange(4000, 6000);
+  
+  QBENCHMARK
+  {
+    mPlot->replot();
+  }
+}
+
+void Benchmark::QCPAnnotations_ReplotItems()
+{
+  // the same annotations as in QCPAnnotations_Replot, as one tracer and text item each:
+  int n = 10000;
+  for (int i=0; i<n; ++i)
+  {
+    const double value = qSin(i*0.01)+qCos(i*0.37)*0.3;
+    QCPItemTracer *tracer = new QCPItemTracer(mPlot);
+    tracer->position->setCoords(i, value);
+    tracer->setStyle(QCPItemTracer::tsCircle);
+    tracer->setSize(7);
+    tracer->setPen(QPen(i%2 == 0 ? Qt::darkGreen : Qt::darkRed));
+    tracer->setBrush(i%2 == 0 ? Qt::green : Qt::red);
+    QCPItemText *label = new QCPItemText(mPlot);
+    label->position->setParentAnchor(tracer->position);
+    label->position->setCoords(0, -5);
+    label->setPositionAlignment(Qt::AlignHCenter|Qt::AlignBottom);
+    label->setText(i%2 == 0 ? QLatin1String("buy") : QLatin1String("sell"));
+  }
+  mPlot->yAxis->setRange(-1.5, 1.5);
+  mPlot->xAxis->setRange(4000, 6000);
+  
+  QBENCHMARK
+  {
+    mPlot->replot();
+  }
+}
+
+void Benchmark::QCPAnnotations_HoverSweep()
+{
+  int n = 10000;
+  QVector<double> key(n), value(n);
+  QStringList text;
+  for (int i=0; i<n; ++i)
+  {
+    key[i] = i;
+    value[i] = qSin(i*0.01)+qCos(i*0.37)*0.3;
+    text << QString::number(i);
+  }
+  QCPAnnotations *annotations = new QCPAnnotations(mPlot->xAxis, mPlot->yAxis);
+  annotations->setData(key, value, text, QVector<int>(), true);
+  mPlot->rescaleAxes();
+  mPlot->xAxis->setRange(4000, 6000);
+  mPlot->replot();
+  const QRect axisRect = mPlot->axisRect()->rect();
+  
+  QBENCHMARK
+  {
+    // simulate the mouse moving diagonally across the axis rect, hit-testing at each step:
+    for (int i=0; i<100; ++i)
+      mPlot->plottableAt(QPointF(axisRect.left()+axisRect.width()*i/100.0, axisRect.top()+axisRect.height()*i/100.0));
+  }
+}
+
+void Benchmark::QCPAnnotations_HoverSweepItems()
+{
+  int n = 10000;
+  for (int i=0; i<n; ++i)
+  {
+    QCPItemText *label = new QCPItemText(mPlot);
+    label->position->setCoords(i, qSin(i*0.01)+qCos(i*0.37)*0.3);
+    label->setText(QString::number(i));
+  }
+  mPlot->yAxis->setRange(-1.5, 1.5);
+  mPlot->xAxis->setRange(4000, 6000);
+  mPlot->replot();
+  const QRect axisRect = mPlot->axisRect()->rect();
+  
+  QBENCHMARK
+  {
+    // simulate the mouse moving diagonally across the axis rect, hit-testing at each step:
+    for (int i=0; i<100; ++i)
+      mPlot->itemAt(QPointF(axisRect.left()+axisRect.width()*i/100.0, axisRect.top()+axisRect.height()*i/100.0));
+  }
+}
+
 void Benchmark::QCPColorMap_Standard()
 {
   QCPColorMap *map = new QCPColorMap(mPlot->xAxis, mPlot->yAxis);
@@ -588,7 +1182,37 @@ void Benchmark::QCPColorMap_ColorizeMap()
   
   QBENCHMARK
   {
-    map->data()->setCell(0, 0, 0); // to invalidate the currently cached map image
+    map->setInterpolate(false); // to invalidate the currently cached map image (modifying single cells only recolorizes those)
+    mPlot->replot();
+  }
+}
+
+void Benchmark::QCPColorMap_Waterfall()
+{
+  QCPColorMap *map = new QCPColorMap(mPlot->xAxis, mPlot->yAxis);
+  const int n = 1000;
+  map->data()->setSize(n, n);
+  map->data()->setRange(QCPRange(0, 5), QCPRange(0, 5));
+  qsrand(0);
+  QVector<double> column(n);
+  for (int x=0; x<map->data()->keySize(); ++x)
+  {
+    for (int y=0; y<map->data()->valueSize(); ++y)
+      column[y] = qrand()/double(RAND_MAX);
+    map->data()->setCells(x, 0, 1, n, column.constData(), 1, 1);
+  }
+  
+  QCPColorGradient gradient(QCPColorGradient::gpHot);
+  map->setGradient(gradient);
+  map->setInterpolate(false);
+  map->rescaleDataRange();
+  mPlot->rescaleAxes();
+  
+  QBENCHMARK
+  {
+    // append one column per frame, shifting the existing map to the left:
+    map->data()->scroll(-1);
+    map->data()->setCells(n-1, 0, 1, n, column.constData(), 1, 1);
     mPlot->replot();
   }
 }
@@ -624,3 +1248,107 @@ void Benchmark::QCPAxis_TickLabelsCached()
     mPlot->replot();
   }
 }
+
+void Benchmark::QCPAxis_TickLabelsDateTime()
+{
+  QSharedPointer<QCPAxisTickerDateTime> dateTicker(new QCPAxisTickerDateTime);
+  dateTicker->setDateTimeSpec(Qt::UTC);
+  mPlot->axisRect()->setupFullAxesBox();
+  mPlot->xAxis->setTicker(dateTicker);
+  mPlot->xAxis2->setTicker(dateTicker);
+  mPlot->xAxis2->setTickLabels(true);
+  mPlot->xAxis->setRange(QCPAxisTickerDateTime::dateTimeToKey(QDate(2021, 3, 29), Qt::UTC), 86400*8, Qt::AlignLeft);
+  QBENCHMARK
+  {
+    // pan by a fraction of a tick step per frame, like dragging the axis:
+    mPlot->xAxis->moveRange(3600);
+    mPlot->xAxis2->setRange(mPlot->xAxis->range());
+    mPlot->replot();
+  }
+}
+
+void Benchmark::QCPAxis_TickLabelsDateTimeMonths()
+{
+  QSharedPointer<QCPAxisTickerDateTime> dateTicker(new QCPAxisTickerDateTime);
+  dateTicker->setDateTimeFormat(QLatin1String("MMM yyyy"));
+  dateTicker->setTickCount(12);
+  mPlot->axisRect()->setupFullAxesBox();
+  mPlot->xAxis->setTicker(dateTicker);
+  mPlot->xAxis2->setTicker(dateTicker);
+  mPlot->xAxis2->setTickLabels(true);
+  mPlot->xAxis->setRange(QCPAxisTickerDateTime::dateTimeToKey(QDate(2000, 1, 1)), QCPAxisTickerDateTime::dateTimeToKey(QDate(2021, 1, 1)));
+  QBENCHMARK
+  {
+    mPlot->xAxis->moveRange(86400*5);
+    mPlot->xAxis2->setRange(mPlot->xAxis->range());
+    mPlot->replot();
+  }
+}
+
+void Benchmark::QCustomPlot_StaticLayers()
+{
+  mPlot->setPlottingHint(QCP::phTrackDirtyLayers, false);
+  // static background graph with many scatters on the main layer:
+  QCPGraph *staticGraph = mPlot->addGraph();
+  staticGraph->setLineStyle(QCPGraph::lsNone);
+  staticGraph->setScatterStyle(QCPScatterStyle::ssCircle);
+  qsrand(0);
+  int n = 20000;
+  QVector<double> x(n), y(n);
+  for (int i=0; i<n; ++i)
+  {
+    x[i] = i/(double)n;
+    y[i] = qrand()/(double)RAND_MAX;
+  }
+  staticGraph->setData(x, y, true);
+  // small live graph on its own buffered layer, changing every frame:
+  mPlot->addLayer("live", mPlot->layer("main"), QCustomPlot::limAbove);
+  mPlot->layer("live")->setMode(QCPLayer::lmBuffered);
+  QCPGraph *liveGraph = mPlot->addGraph();
+  liveGraph->setLayer("live");
+  liveGraph->setPen(QPen(Qt::red));
+  mPlot->xAxis->setRange(0, 1);
+  mPlot->yAxis->setRange(0, 1);
+  
+  int frame = 0;
+  QBENCHMARK
+  {
+    liveGraph->setData(QVector<double>() << 0 << 1, QVector<double>() << (frame%10)/10.0 << 1-(frame%10)/10.0, true);
+    mPlot->replot();
+    ++frame;
+  }
+}
+
+void Benchmark::QCustomPlot_StaticLayersTrackDirty()
+{
+  mPlot->setPlottingHint(QCP::phTrackDirtyLayers, true);
+  // static background graph with many scatters on the main layer:
+  QCPGraph *staticGraph = mPlot->addGraph();
+  staticGraph->setLineStyle(QCPGraph::lsNone);
+  staticGraph->setScatterStyle(QCPScatterStyle::ssCircle);
+  qsrand(0);
+  int n = 20000;
+  QVector<double> x(n), y(n);
+  for (int i=0; i<n; ++i)
+  {
+    x[i] = i/(double)n;
+    y[i] = qrand()/(double)RAND_MAX;
+  }
+  staticGraph->setData(x, y, true);
+  // small live graph on its own buffered layer, changing every frame:
+  mPlot->addLayer("live", mPlot->layer("main"), QCustomPlot::limAbove);
+  mPlot->layer("live")->setMode(QCPLayer::lmBuffered);
+  QCPGraph *liveGraph = mPlot->addGraph();
+  liveGraph->setLayer("live");
+  liveGraph->setPen(QPen(Qt::red));
+  mPlot->xAxis->setRange(0, 1);
+  mPlot->yAxis->setRange(0, 1);
+  
+  int frame = 0;
+  QBENCHMARK
+  {
+    liveGraph->setData(QVector<double>() << 0 << 1, QVector<double>() << (frame%10)/10.0 << 1-(frame%10)/10.0, true);
+    mPlot->replot();
+    ++frame;
+  }
+}
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# PyQt5 binding for QCustomPlot v2.1.0
+#
+# License: MIT
+#
+# QCustomPlot author: Emanuel Eichhammer
+# QCustomPlot Website/Contact: http://www.qcustomplot.com
+
+"""Compares many labeled markers as QCPItemTracer/QCPItemText pairs with a single QCPAnnotations.
+
+Reported are the time to create the annotations, the replot time with a part of them in view and
+the mean time per mouse move of a hover sweep, which hit-tests at each step like a hover handler
+connected to mouseMove would.
+"""
+
+import argparse
+import array
+import math
+import os
+import sys
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtCore import QPointF, Qt
+from PyQt5.QtGui import QBrush, QPen
+from PyQt5.QtWidgets import QApplication
+
+from QCustomPlot2 import QCustomPlot, QCPAnnotations, QCPItemText, QCPItemTracer, QCPScatterStyle
+
+
+argparser = argparse.ArgumentParser()
+argparser.add_argument("-n", "--annotations", type=int, default=10000,
+                       help="Number of annotations.")
+argparser.add_argument("-v", "--visible", type=float, default=0.2,
+                       help="Fraction of the annotations in the visible key range.")
+argparser.add_argument("-m", "--moves", type=int, default=200,
+                       help="Number of mouse positions per sweep.")
+argparser.add_argument("-r", "--rounds", type=int, default=5,
+                       help="Number of timed rounds per case, the best one is reported.")
+config = argparser.parse_args()
+
+
+def best_time(func, rounds):
+    best = float("inf")
+    for i in range(rounds):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter()-start)
+    return best
+
+
+def make_data(n):
+    keys = array.array('d', range(n))
+    values = array.array('d', (math.sin(i*0.01)+0.3*math.cos(i*0.37) for i in range(n)))
+    texts = ["buy" if i % 2 == 0 else "sell" for i in range(n)]
+    styles = array.array('i', (i % 2 for i in range(n)))
+    return keys, values, texts, styles
+
+
+def add_items(plot, keys, values, texts, styles):
+    colors = (Qt.darkGreen, Qt.darkRed)
+    for key, value, text, style in zip(keys, values, texts, styles):
+        tracer = QCPItemTracer(plot)
+        tracer.position.setCoords(key, value)
+        tracer.setStyle(QCPItemTracer.tsCircle)
+        tracer.setSize(7)
+        tracer.setPen(QPen(colors[style]))
+        label = QCPItemText(plot)
+        label.position.setParentAnchor(tracer.position)
+        label.position.setCoords(0, -5)
+        label.setPositionAlignment(Qt.AlignHCenter | Qt.AlignBottom)
+        label.setText(text)
+
+
+def add_annotations(plot, keys, values, texts, styles):
+    annotations = QCPAnnotations(plot.xAxis, plot.yAxis)
+    annotations.setStyle(0, QCPScatterStyle(QCPScatterStyle.ssCircle, QPen(Qt.darkGreen), QBrush(Qt.NoBrush), 7))
+    annotations.addStyle(QCPScatterStyle(QCPScatterStyle.ssCircle, QPen(Qt.darkRed), QBrush(Qt.NoBrush), 7))
+    annotations.setData(keys, values, texts, styles, True)
+
+
+def sweep(plot, moves, hitTest):
+    rect = plot.axisRect().rect()
+    for i in range(moves):
+        x = rect.left()+rect.width()*i/moves
+        y = rect.top()+rect.height()*(0.5+0.45*math.sin(i*0.2))
+        hitTest(QPointF(x, y))
+
+
+def main():
+    app = QApplication(sys.argv)
+    keys, values, texts, styles = make_data(config.annotations)
+
+    print("{:>12} {:>12} {:>12} {:>12}".format("variant", "create ms", "replot ms", "ms per move"))
+    for name, add in (("items", add_items), ("annotations", add_annotations)):
+        plot = QCustomPlot()
+        plot.resize(1200, 900)
+        createTime = best_time(lambda: add(plot, keys, values, texts, styles), 1)
+        plot.yAxis.setRange(-1.5, 1.5)
+        center = config.annotations/2
+        plot.xAxis.setRange(center-config.annotations*config.visible/2, center+config.annotations*config.visible/2)
+        replotTime = best_time(plot.replot, config.rounds)
+        hitTest = plot.itemAt if name == "items" else plot.plottableAt
+        sweep(plot, config.moves, hitTest)  # builds the spatial index
+        sweepTime = best_time(lambda: sweep(plot, config.moves, hitTest), config.rounds)
+        print("{:>12} {:>12.1f} {:>12.2f} {:>12.3f}".format(name, createTime*1e3, replotTime*1e3,
+                                                            sweepTime*1e3/config.moves))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
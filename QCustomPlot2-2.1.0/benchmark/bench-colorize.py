@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# PyQt5 binding for QCustomPlot v2.1.0
+#
+# License: MIT
+#
+# QCustomPlot author: Emanuel Eichhammer
+# QCustomPlot Website/Contact: http://www.qcustomplot.com
+
+"""Compares QCPColorGradient.colorizeArray against a NumPy lookup table and per-value color calls."""
+
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtWidgets import QApplication
+
+from QCustomPlot2 import QCPColorGradient, QCPRange
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+argparser = argparse.ArgumentParser()
+argparser.add_argument("-s", "--size", type=int, nargs="+", default=[256, 1024, 2048],
+                       help="Number of values per dimension of the square input array.")
+argparser.add_argument("-r", "--rounds", type=int, default=5,
+                       help="Number of timed calls per case, the best one is reported.")
+argparser.add_argument("--color-limit", type=int, default=256,
+                       help="Largest size for which the per-value color() loop is timed.")
+config = argparser.parse_args()
+
+
+def best_time(func, rounds):
+    best = float("inf")
+    for i in range(rounds):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter()-start)
+    return best
+
+
+def numpy_lookup(gradient, data, dataRange):
+    """The NumPy equivalent of colorizeArray for linear mapping without NaN handling."""
+    levels = gradient.levelCount()
+    table = numpy.array([gradient.color(dataRange.lower+dataRange.size()*i/(levels-1), dataRange)
+                         for i in range(levels)], dtype=numpy.uint32)
+    index = ((data-dataRange.lower)*((levels-1)/dataRange.size())).astype(numpy.int64)
+    return table[numpy.clip(index, 0, levels-1)]
+
+
+def main():
+    if numpy is None:
+        print("this benchmark requires NumPy")
+        return 1
+    app = QApplication(sys.argv)
+    gradient = QCPColorGradient(QCPColorGradient.gpJet)
+    dataRange = QCPRange(-1, 1)
+
+    print("{:>6} {:>16} {:>16} {:>16} {:>16}".format("size", "colorizeArray ms", "rgba8 ms", "numpy LUT ms", "color() ms"))
+    for size in config.size:
+        x = numpy.linspace(0, 20, size)
+        data = numpy.sin(x)[:, None]*numpy.cos(x)[None, :]
+        rgba = numpy.empty(data.shape+(4,), dtype=numpy.uint8)
+        colorizeTime = best_time(lambda: gradient.colorizeArray(data, dataRange), config.rounds)
+        rgbaTime = best_time(lambda: gradient.colorizeArray(data, dataRange, out=rgba), config.rounds)
+        numpyTime = best_time(lambda: numpy_lookup(gradient, data, dataRange), config.rounds)
+        colorTime = float("nan")
+        if size <= config.color_limit:
+            colorTime = best_time(lambda: [gradient.color(v, dataRange) for v in data.flat], 1)
+        print("{:>6} {:>16.3f} {:>16.3f} {:>16.3f} {:>16.3f}".format(size, colorizeTime*1e3, rgbaTime*1e3, numpyTime*1e3, colorTime*1e3))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# PyQt5 binding for QCustomPlot v2.1.0
+#
+# License: MIT
+#
+# QCustomPlot author: Emanuel Eichhammer
+# QCustomPlot Website/Contact: http://www.qcustomplot.com
+
+"""Compares per-point coordinate transforms with the array versions of QCPAbstractPlottable."""
+
+import argparse
+import array
+import math
+import os
+import sys
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtWidgets import QApplication
+
+from QCustomPlot2 import QCustomPlot, QCPAxis
+
+
+argparser = argparse.ArgumentParser()
+argparser.add_argument("-n", "--points", type=int, nargs="+", default=[1000, 100000, 1000000],
+                       help="Numbers of points to transform.")
+argparser.add_argument("-r", "--rounds", type=int, default=3,
+                       help="Number of timed rounds per case, the best one is reported.")
+argparser.add_argument("--log", action="store_true",
+                       help="Use a logarithmic value axis.")
+config = argparser.parse_args()
+
+
+def best_time(func, rounds):
+    best = float("inf")
+    for i in range(rounds):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter()-start)
+    return best
+
+
+def scalar_transform(graph, keys, values):
+    points = [graph.coordsToPixels(k, v) for k, v in zip(keys, values)]
+    return [graph.pixelsToCoords(p) for p in points]
+
+
+def array_transform(graph, keys, values):
+    x, y = graph.coordsToPixelsArray(keys, values)
+    return graph.pixelsToCoordsArray(x, y)
+
+
+def main():
+    app = QApplication(sys.argv)
+    plot = QCustomPlot()
+    plot.resize(800, 600)
+    graph = plot.addGraph()
+    if config.log:
+        plot.yAxis.setScaleType(QCPAxis.stLogarithmic)
+        plot.yAxis.setRange(0.1, 1000)
+    else:
+        plot.yAxis.setRange(-1.5, 1.5)
+    plot.xAxis.setRange(0, 1)
+    plot.replot()
+
+    print("{:>10} {:>12} {:>12} {:>9}".format("points", "scalar ms", "array ms", "speedup"))
+    for n in config.points:
+        keys = array.array('d', (i/n for i in range(n)))
+        if config.log:
+            values = array.array('d', (10**(3*math.sin(k*20)) for k in keys))
+        else:
+            values = array.array('d', (math.sin(k*20) for k in keys))
+        scalarTime = best_time(lambda: scalar_transform(graph, keys, values), config.rounds)
+        arrayTime = best_time(lambda: array_transform(graph, keys, values), config.rounds)
+        print("{:>10} {:>12.2f} {:>12.2f} {:>8.0f}x".format(n, scalarTime*1e3, arrayTime*1e3,
+                                                           scalarTime/max(arrayTime, 1e-9)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# PyQt5 binding for QCustomPlot v2.1.0
+#
+# License: MIT
+#
+# QCustomPlot author: Emanuel Eichhammer
+# QCustomPlot Website/Contact: http://www.qcustomplot.com
+
+"""Compares reading graph data back by iterating the data container against the bulk array export."""
+
+import argparse
+import math
+import os
+import sys
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtWidgets import QApplication
+
+from QCustomPlot2 import QCustomPlot
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+argparser = argparse.ArgumentParser()
+argparser.add_argument("-n", "--points", type=int, nargs="+", default=[10000, 100000, 1000000],
+                       help="Number of data points in the graph.")
+argparser.add_argument("-r", "--rounds", type=int, default=5,
+                       help="Number of timed calls per case, the best one is reported.")
+config = argparser.parse_args()
+
+
+def best_time(func, rounds):
+    best = float("inf")
+    for i in range(rounds):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter()-start)
+    return best
+
+
+def iterate(container):
+    keys = [d.key for d in container]
+    values = [d.value for d in container]
+    return keys, values
+
+
+def main():
+    app = QApplication(sys.argv)
+    plot = QCustomPlot()
+    graph = plot.addGraph()
+
+    print("{:>9} {:>14} {:>14} {:>14}".format("points", "iterate ms", "toArrays ms", "numpy ms"))
+    for n in config.points:
+        graph.setData([i/n for i in range(n)], [math.sin(i/n*10*math.pi) for i in range(n)], True)
+        container = graph.data()
+        iterateTime = best_time(lambda: iterate(container), config.rounds)
+        arraysTime = best_time(lambda: container.toArrays(), config.rounds)
+        if numpy is not None:
+            numpyTime = best_time(lambda: [numpy.asarray(a) for a in container.toArrays()], config.rounds)
+            numpyText = "{:>14.3f}".format(numpyTime*1e3)
+        else:
+            numpyText = "{:>14}".format("-")
+        print("{:>9} {:>14.3f} {:>14.3f} {}".format(n, iterateTime*1e3, arraysTime*1e3, numpyText))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
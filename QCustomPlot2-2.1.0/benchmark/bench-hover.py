@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# PyQt5 binding for QCustomPlot v2.1.0
+#
+# License: MIT
+#
+# QCustomPlot author: Emanuel Eichhammer
+# QCustomPlot Website/Contact: http://www.qcustomplot.com
+
+"""Simulates mouse-move sweeps over many large graphs, with and without the spatial index.
+
+Each step of a sweep hit-tests all graphs with QCustomPlot.plottableAt, like a hover handler
+connected to mouseMove would. Reported are the time of the first sweep after a view change (which
+includes building the indices) and the mean time per mouse move of the following sweeps.
+"""
+
+import argparse
+import array
+import math
+import os
+import sys
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtCore import QPointF
+from PyQt5.QtWidgets import QApplication
+
+from QCustomPlot2 import QCustomPlot
+
+
+argparser = argparse.ArgumentParser()
+argparser.add_argument("-g", "--graphs", type=int, default=30,
+                       help="Number of graphs.")
+argparser.add_argument("-n", "--points", type=int, default=500000,
+                       help="Number of data points per graph.")
+argparser.add_argument("-m", "--moves", type=int, default=200,
+                       help="Number of mouse positions per sweep.")
+argparser.add_argument("-r", "--rounds", type=int, default=3,
+                       help="Number of timed sweeps per case, the best one is reported.")
+config = argparser.parse_args()
+
+
+def best_time(func, rounds):
+    best = float("inf")
+    for i in range(rounds):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter()-start)
+    return best
+
+
+def make_plot(graphs, n):
+    plot = QCustomPlot()
+    plot.resize(1200, 900)
+    keys = array.array('d', (i/n for i in range(n)))
+    for g in range(graphs):
+        values = array.array('d', (g+math.sin(k*(10+g)*math.pi)+0.2*math.sin(k*1e4*math.pi) for k in keys))
+        plot.addGraph().setData(keys, values, True)
+    plot.rescaleAxes()
+    plot.replot()
+    return plot
+
+
+def sweep(plot, moves):
+    rect = plot.axisRect().rect()
+    for i in range(moves):
+        # zig-zag across the axis rect, like a mouse hovering over the curves:
+        x = rect.left()+rect.width()*i/moves
+        y = rect.top()+rect.height()*(0.5+0.45*math.sin(i*0.2))
+        plot.plottableAt(QPointF(x, y))
+
+
+def main():
+    app = QApplication(sys.argv)
+    plot = make_plot(config.graphs, config.points)
+
+    print("{:>14} {:>16} {:>16}".format("spatial index", "first sweep ms", "ms per move"))
+    for enabled in (False, True):
+        for g in range(plot.graphCount()):
+            plot.graph(g).setSpatialIndex(enabled)
+        # the first sweep after a view change builds the indices:
+        plot.xAxis.scaleRange(1.0001)
+        plot.replot()
+        firstTime = best_time(lambda: sweep(plot, config.moves), 1)
+        sweepTime = best_time(lambda: sweep(plot, config.moves), config.rounds)
+        print("{:>14} {:>16.1f} {:>16.3f}".format("on" if enabled else "off", firstTime*1e3,
+                                                  sweepTime*1e3/config.moves))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
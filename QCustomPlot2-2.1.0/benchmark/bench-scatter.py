@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# PyQt5 binding for QCustomPlot v2.1.0
+#
+# License: MIT
+#
+# QCustomPlot author: Emanuel Eichhammer
+# QCustomPlot Website/Contact: http://www.qcustomplot.com
+
+"""Compares replotting many scatter points drawn as vector shapes and as cached sprites.
+
+The sprites are enabled with the plotting hint QCP.phCacheScatters. Adaptive sampling is disabled,
+so every data point is drawn.
+"""
+
+import argparse
+import array
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtWidgets import QApplication
+
+from QCustomPlot2 import QCP, QCPGraph, QCPScatterStyle, QCustomPlot
+
+
+argparser = argparse.ArgumentParser()
+argparser.add_argument("-n", "--points", type=int, default=100000,
+                       help="Number of scatter points.")
+argparser.add_argument("-s", "--shapes", nargs="+", default=["ssCircle", "ssDisc", "ssStar"],
+                       help="Scatter shapes to compare.")
+argparser.add_argument("-r", "--rounds", type=int, default=5,
+                       help="Number of timed replots per case, the best one is reported.")
+config = argparser.parse_args()
+
+
+def best_time(func, rounds):
+    best = float("inf")
+    for i in range(rounds):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter()-start)
+    return best
+
+
+def main():
+    app = QApplication(sys.argv)
+    plot = QCustomPlot()
+    plot.resize(1200, 900)
+    rng = random.Random(1)
+    keys = array.array('d', (rng.gauss(0, 1) for i in range(config.points)))
+    values = array.array('d', (k*0.5+rng.gauss(0, 1) for k in keys))
+    graph = plot.addGraph()
+    graph.setData(keys, values)
+    graph.setLineStyle(QCPGraph.lsNone)
+    graph.setAdaptiveSampling(False)
+    plot.rescaleAxes()
+
+    print("{:>12} {:>12} {:>12}".format("shape", "vector ms", "sprite ms"))
+    for shapeName in config.shapes:
+        graph.setScatterStyle(QCPScatterStyle(getattr(QCPScatterStyle, shapeName), 6))
+        times = []
+        for enabled in (False, True):
+            plot.setPlottingHint(QCP.phCacheScatters, enabled)
+            plot.replot()  # warm up, renders the sprite
+            times.append(best_time(plot.replot, config.rounds))
+        print("{:>12} {:>12.1f} {:>12.1f}".format(shapeName, times[0]*1e3, times[1]*1e3))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
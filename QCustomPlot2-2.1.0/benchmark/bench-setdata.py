@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# PyQt5 binding for QCustomPlot v2.1.0
+#
+# License: MIT
+#
+# QCustomPlot author: Emanuel Eichhammer
+# QCustomPlot Website/Contact: http://www.qcustomplot.com
+
+"""Compares QCPGraph.setData/addData with Python lists against the float64 buffer overloads."""
+
+import argparse
+import array
+import math
+import os
+import sys
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtWidgets import QApplication
+
+from QCustomPlot2 import QCustomPlot
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+argparser = argparse.ArgumentParser()
+argparser.add_argument("-n", "--points", type=int, nargs="+", default=[10000, 100000, 1000000, 2000000],
+                       help="Number of data points to pass per call.")
+argparser.add_argument("-r", "--rounds", type=int, default=5,
+                       help="Number of timed calls per case, the best one is reported.")
+config = argparser.parse_args()
+
+
+def best_time(func, rounds):
+    best = float("inf")
+    for i in range(rounds):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter()-start)
+    return best
+
+
+def make_inputs(n):
+    keys = [i/n for i in range(n)]
+    values = [math.sin(k*10*math.pi) for k in keys]
+    inputs = [("list", keys, values),
+              ("array.array", array.array('d', keys), array.array('d', values))]
+    if numpy is not None:
+        inputs.append(("numpy", numpy.asarray(keys), numpy.asarray(values)))
+    return inputs
+
+
+def main():
+    app = QApplication(sys.argv)
+    plot = QCustomPlot()
+    graph = plot.addGraph()
+
+    print("{:>9} {:<12} {:>12} {:>12}".format("points", "input", "setData ms", "addData ms"))
+    for n in config.points:
+        for name, keys, values in make_inputs(n):
+            setTime = best_time(lambda: graph.setData(keys, values, True), config.rounds)
+            def add():
+                graph.data().clear()
+                graph.addData(keys, values)
+            addTime = best_time(add, config.rounds)
+            print("{:>9} {:<12} {:>12.3f} {:>12.3f}".format(n, name, setTime*1e3, addTime*1e3))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# PyQt5 binding for QCustomPlot v2.1.0
+#
+# License: MIT
+#
+# QCustomPlot author: Emanuel Eichhammer
+# QCustomPlot Website/Contact: http://www.qcustomplot.com
+
+"""Compares rendering several plots with QCustomPlot.toImage serially and on a thread pool."""
+
+import argparse
+import math
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtWidgets import QApplication
+
+from QCustomPlot2 import QCustomPlot
+
+
+argparser = argparse.ArgumentParser()
+argparser.add_argument("-c", "--charts", type=int, default=32,
+                       help="Number of charts to render per round.")
+argparser.add_argument("-n", "--points", type=int, default=100000,
+                       help="Number of data points per chart.")
+argparser.add_argument("-t", "--threads", type=int, nargs="+", default=[1, 2, 4, 8],
+                       help="Thread pool sizes to compare.")
+argparser.add_argument("-r", "--rounds", type=int, default=3,
+                       help="Number of timed rounds per case, the best one is reported.")
+config = argparser.parse_args()
+
+
+def best_time(func, rounds):
+    best = float("inf")
+    for i in range(rounds):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter()-start)
+    return best
+
+
+def make_plot(index, n):
+    # widgets must be created in the GUI thread, only the rendering is done by the workers
+    plot = QCustomPlot()
+    plot.resize(800, 600)
+    graph = plot.addGraph()
+    keys = [i/n for i in range(n)]
+    values = [math.sin(k*(10+index)*math.pi)+math.sin(k*1e3*math.pi)*0.1 for k in keys]
+    graph.setData(keys, values, True)
+    plot.rescaleAxes()
+    return plot
+
+
+def main():
+    app = QApplication(sys.argv)
+    plots = [make_plot(i, config.points) for i in range(config.charts)]
+
+    print("{:>8} {:>12} {:>14}".format("threads", "total ms", "ms per chart"))
+    serialTime = best_time(lambda: [plot.toImage() for plot in plots], config.rounds)
+    print("{:>8} {:>12.1f} {:>14.2f}".format("serial", serialTime*1e3, serialTime*1e3/len(plots)))
+    for threads in config.threads:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            pooledTime = best_time(lambda: list(executor.map(lambda plot: plot.toImage(), plots)), config.rounds)
+        print("{:>8} {:>12.1f} {:>14.2f}".format(threads, pooledTime*1e3, pooledTime*1e3/len(plots)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
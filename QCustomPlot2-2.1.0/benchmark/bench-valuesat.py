@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# PyQt5 binding for QCustomPlot v2.1.0
+#
+# License: MIT
+#
+# QCustomPlot author: Emanuel Eichhammer
+# QCustomPlot Website/Contact: http://www.qcustomplot.com
+
+"""Compares sampling graph values at many keys with QCPGraph.valuesAt against one QCPItemTracer
+lookup per key.
+
+The keys are sampled in ascending and in shuffled order, over a readout across several graphs.
+"""
+
+import argparse
+import array
+import math
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtWidgets import QApplication
+
+from QCustomPlot2 import QCustomPlot, QCPItemTracer
+
+
+argparser = argparse.ArgumentParser()
+argparser.add_argument("-n", "--points", type=int, default=200000,
+                       help="Number of data points per graph.")
+argparser.add_argument("-g", "--graphs", type=int, default=30,
+                       help="Number of graphs.")
+argparser.add_argument("-k", "--keys", type=int, nargs="+", default=[1, 100, 10000],
+                       help="Number of keys to sample per graph.")
+argparser.add_argument("-r", "--rounds", type=int, default=5,
+                       help="Number of timed rounds per case, the best one is reported.")
+config = argparser.parse_args()
+
+
+def best_time(func, rounds):
+    best = float("inf")
+    for i in range(rounds):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter()-start)
+    return best
+
+
+def make_plot(points, graphs):
+    plot = QCustomPlot()
+    keys = array.array('d', (i/points for i in range(points)))
+    for g in range(graphs):
+        values = array.array('d', (g+math.sin(k*(10+g)*math.pi) for k in keys))
+        plot.addGraph().setData(keys, values, True)
+    return plot
+
+
+def sample_tracer(plot, tracer, keys):
+    for g in range(plot.graphCount()):
+        tracer.setGraph(plot.graph(g))
+        for key in keys:
+            tracer.setGraphKey(key)
+            tracer.updatePosition()
+            tracer.position.value()
+
+
+def sample_valuesat(plot, keys):
+    for g in range(plot.graphCount()):
+        plot.graph(g).valuesAt(keys)
+
+
+def main():
+    app = QApplication(sys.argv)
+    plot = make_plot(config.points, config.graphs)
+    tracer = QCPItemTracer(plot)
+    tracer.setInterpolating(True)
+
+    print("{:>7} {:<9} {:>12} {:>12}".format("keys", "order", "tracer ms", "valuesAt ms"))
+    for n in config.keys:
+        sortedKeys = [(i+0.5)/n for i in range(n)]
+        shuffledKeys = list(sortedKeys)
+        random.Random(1).shuffle(shuffledKeys)
+        for order, keys in (("sorted", sortedKeys), ("shuffled", shuffledKeys)):
+            buffer = array.array('d', keys)
+            tracerTime = best_time(lambda: sample_tracer(plot, tracer, keys), config.rounds)
+            valuesAtTime = best_time(lambda: sample_valuesat(plot, buffer), config.rounds)
+            print("{:>7} {:<9} {:>12.3f} {:>12.3f}".format(n, order, tracerTime*1e3, valuesAtTime*1e3))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# PyQt5 binding for QCustomPlot v2.1.0
+#
+# License: MIT
+#
+# QCustomPlot author: Emanuel Eichhammer
+# QCustomPlot Website/Contact: http://www.qcustomplot.com
+
+"""Prints where the time of a replot goes, using QCustomPlot.setProfiling.
+
+The plot combines a colormap, a large graph and a legend, like a typical dashboard. The profiles of
+several replots are averaged and printed per replot step, layer and layerable.
+"""
+
+import argparse
+import array
+import collections
+import math
+import os
+import sys
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtWidgets import QApplication
+
+from QCustomPlot2 import QCustomPlot, QCPColorGradient, QCPColorMap, QCPRange
+
+
+argparser = argparse.ArgumentParser()
+argparser.add_argument("-n", "--points", type=int, default=1000000,
+                       help="Number of graph data points.")
+argparser.add_argument("-s", "--size", type=int, default=500,
+                       help="Number of colormap cells per dimension.")
+argparser.add_argument("-r", "--rounds", type=int, default=10,
+                       help="Number of profiled replots to average.")
+config = argparser.parse_args()
+
+
+def make_plot():
+    plot = QCustomPlot()
+    plot.resize(1200, 900)
+    colorMap = QCPColorMap(plot.xAxis, plot.yAxis)
+    colorMap.setName("colormap")
+    colorMap.data().setSize(config.size, config.size)
+    colorMap.data().setRange(QCPRange(0, 1), QCPRange(-1, 1))
+    for x in range(config.size):
+        for y in range(config.size):
+            colorMap.data().setCell(x, y, math.sin(x*0.05)*math.cos(y*0.07))
+    colorMap.setGradient(QCPColorGradient(QCPColorGradient.gpJet))
+    colorMap.rescaleDataRange()
+
+    graph = plot.addGraph()
+    graph.setName("graph")
+    keys = array.array('d', (i/config.points for i in range(config.points)))
+    values = array.array('d', (math.sin(k*50*math.pi)*0.8+0.1*math.sin(k*1e4*math.pi) for k in keys))
+    graph.setData(keys, values, True)
+    plot.legend.setVisible(True)
+    plot.rescaleAxes()
+    return plot, colorMap
+
+
+def main():
+    app = QApplication(sys.argv)
+    plot, colorMap = make_plot()
+    plot.setProfiling(True)
+    plot.replot()  # warm up
+
+    steps = collections.OrderedDict()
+    parts = collections.OrderedDict()
+    for i in range(config.rounds):
+        # alternate the data range, so the colormap image is recalculated every replot:
+        colorMap.setDataRange(QCPRange(-1, 1) if i % 2 else QCPRange(-1.1, 1.1))
+        plot.replot()
+        profile = plot.replotProfile()
+        for key in ("replotTime", "layoutTime", "bufferSetupTime", "drawTime", "refreshTime", "flushTime"):
+            if key in profile:  # flushTime is only measured when the widget is painted
+                steps[key] = steps.get(key, 0.0)+profile[key]/config.rounds
+        for layer in profile["layers"]:
+            layerKey = "layer " + layer["name"]
+            parts[layerKey] = parts.get(layerKey, 0.0)+layer["time"]/config.rounds
+            for layerable in layer["layerables"]:
+                layerableKey = "  {} {}".format(layerable["className"], layerable["name"]).rstrip()
+                parts[layerableKey] = parts.get(layerableKey, 0.0)+layerable["time"]/config.rounds
+
+    print("{:<40} {:>10}".format("step", "ms"))
+    for key, value in steps.items():
+        print("{:<40} {:>10.2f}".format(key, value))
+    print()
+    print("{:<40} {:>10}".format("layer / layerable", "ms"))
+    for key, value in parts.items():
+        print("{:<40} {:>10.2f}".format(key, value))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# PyQt5 binding for QCustomPlot v2.1.0
+#
+# License: MIT
+#
+# QCustomPlot author: Emanuel Eichhammer
+# QCustomPlot Website/Contact: http://www.qcustomplot.com
+
+"""Checks that Python threads keep running while QCustomPlot replots.
+
+An acquisition thread produces samples in pure Python, which needs the GIL. Its throughput is
+measured once while the main thread idles and once while the main thread continuously replots a
+dense colormap and graph. Since replot releases the GIL, the throughput should stay about the same
+on a machine with at least two cores.
+"""
+
+import argparse
+import math
+import os
+import sys
+import threading
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtWidgets import QApplication
+
+from QCustomPlot2 import QCustomPlot, QCPColorGradient, QCPColorMap, QCPRange
+
+
+argparser = argparse.ArgumentParser()
+argparser.add_argument("-s", "--size", type=int, default=1000,
+                       help="Number of colormap cells per dimension.")
+argparser.add_argument("-n", "--points", type=int, default=1000000,
+                       help="Number of graph data points.")
+argparser.add_argument("-d", "--duration", type=float, default=3.0,
+                       help="Measurement duration in seconds per phase.")
+argparser.add_argument("--min-ratio", type=float, default=0.7,
+                       help="Minimum acquisition throughput during replots relative to idle, "
+                            "checked if the machine has at least two cores.")
+config = argparser.parse_args()
+
+
+class Acquisition(threading.Thread):
+    """Generates samples in pure Python as fast as it can and counts them."""
+
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.samples = 0
+        self.running = True
+        self.buffer = []
+
+    def run(self):
+        phase = 0.0
+        while self.running:
+            for i in range(1000):
+                phase += 0.001
+                self.buffer.append(math.sin(phase)*math.cos(phase*0.3))
+            self.samples += 1000
+            if len(self.buffer) > 100000:
+                self.buffer = []
+
+
+def measure(acquisition, duration, work=None):
+    """Returns the acquisition throughput in samples per second and the number of work calls."""
+    calls = 0
+    startSamples = acquisition.samples
+    start = time.perf_counter()
+    while time.perf_counter()-start < duration:
+        if work is None:
+            time.sleep(0.01)
+        else:
+            work()
+            calls += 1
+    elapsed = time.perf_counter()-start
+    return (acquisition.samples-startSamples)/elapsed, calls
+
+
+def main():
+    app = QApplication(sys.argv)
+    plot = QCustomPlot()
+    plot.resize(1200, 900)
+
+    colorMap = QCPColorMap(plot.xAxis, plot.yAxis)
+    colorMap.data().setSize(config.size, config.size)
+    colorMap.data().setRange(QCPRange(0, 1), QCPRange(0, 1))
+    for x in range(config.size):
+        for y in range(config.size):
+            colorMap.data().setCell(x, y, math.sin(x*0.05)*math.cos(y*0.07))
+    colorMap.setGradient(QCPColorGradient(QCPColorGradient.gpJet))
+    colorMap.setInterpolate(True)
+
+    graph = plot.addGraph()
+    keys = [i/config.points for i in range(config.points)]
+    values = [0.5+0.4*math.sin(k*200*math.pi) for k in keys]
+    graph.setData(keys, values, True)
+    plot.rescaleAxes()
+
+    frame = [0]
+    def replot():
+        # alternate the data range, so the colormap image is recalculated every frame:
+        frame[0] += 1
+        colorMap.setDataRange(QCPRange(-1, 1) if frame[0] % 2 else QCPRange(-1.1, 1.1))
+        plot.replot()
+
+    acquisition = Acquisition()
+    acquisition.start()
+    time.sleep(0.2)  # let the thread settle
+    idleRate, _ = measure(acquisition, config.duration)
+    busyRate, replots = measure(acquisition, config.duration, replot)
+    acquisition.running = False
+    acquisition.join()
+
+    ratio = busyRate/idleRate if idleRate > 0 else 0
+    print("acquisition while idle:      {:12.0f} samples/s".format(idleRate))
+    print("acquisition while replotting: {:11.0f} samples/s ({} replots, {:.1f} ms each)".format(
+        busyRate, replots, config.duration*1e3/max(1, replots)))
+    print("ratio: {:.2f}".format(ratio))
+    if (os.cpu_count() or 1) < 2:
+        print("only one core available, ratio not checked")
+        return 0
+    if ratio < config.min_ratio:
+        print("FAIL: acquisition throughput dropped below {:.2f} of idle during replots".format(config.min_ratio))
+        return 1
+    print("PASS")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,7 +4,7 @@ import os
 import platform
 import subprocess
 from os.path import join
-from sipbuild import Option
+from sipbuild import Installable, Option
 from pyqtbuild import PyQtBindings, PyQtProject
 import PyQt5
 
@@ -24,6 +24,12 @@ class QCustomPlotProject(PyQtProject):
         super().update(tool)
         self.sip_include_dirs.append(join(PyQt5.__path__[0], 'bindings'))
 
+        # pure Python helper modules shipped next to the bindings:
+        helpers = Installable('python_modules')
+        helpers.files.append(join(self.root_dir, 'python', 'qcustomplot2_batch.py'))
+        helpers.files.append(join(self.root_dir, 'python', 'qcustomplot2_benchmark.py'))
+        self.installables.append(helpers)
+
     def build(self):
         self.build_qcustomplot()
         super().build()
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+
+# PyQt5 binding for QCustomPlot v2.1.0
+#
+# License: MIT
+#
+# QCustomPlot author: Emanuel Eichhammer
+# QCustomPlot Website/Contact: http://www.qcustomplot.com
+
+"""Batch export of QCustomPlot charts on a pool of offscreen worker processes.
+
+Every chart is described by a plain, picklable spec dictionary. Data arrays may be NumPy arrays,
+array.array('d') or lists. The specs are distributed over a multiprocessing pool, each worker
+process runs its own QApplication on the offscreen platform plugin and renders the charts into
+memory. The encoded files are streamed back to the caller as soon as they are done:
+
+    from qcustomplot2_batch import export_charts
+
+    specs = [{'name': 'sine', 'format': 'png', 'width': 800, 'height': 600,
+              'graphs': [{'keys': x, 'values': numpy.sin(x), 'pen': 'steelblue'}]}]
+    for result in export_charts(specs, processes=4):
+        if result.error is None:
+            with open(result.name + '.png', 'wb') as f:
+                f.write(result.data)
+
+Supported spec keys (all optional):
+
+    name        Passed through to the result, defaults to the spec index.
+    format      'png' (default), 'jpg', 'bmp' or 'pdf'.
+    width       Chart width in pixels, defaults to 800.
+    height      Chart height in pixels, defaults to 600.
+    scale       Scale factor of raster formats, defaults to 1.0.
+    quality     Compression quality of raster formats, defaults to -1 (format default).
+    title       Text shown above the axis rect.
+    xlabel      Label of the bottom axis.
+    ylabel      Label of the left axis.
+    xrange      (lower, upper) range of the bottom axis, else the axes are rescaled to the data.
+    yrange      (lower, upper) range of the left axis, else the axes are rescaled to the data.
+    legend      Whether the legend is shown, defaults to False.
+    graphs      List of graph specs with the keys 'keys', 'values' (required), 'sorted' (keys are
+                already sorted ascending), 'name', 'pen' (color name), 'penWidth', 'brush'
+                (color name) and 'scatter' (name of a QCPScatterStyle.ScatterShape, e.g. 'ssDisc')
+                with 'scatterSize'.
+    setup       A picklable module level function setup(plot, spec), called after the chart was
+                built from the other keys, for anything not covered here.
+"""
+
+import collections
+import multiprocessing
+import os
+import tempfile
+import time
+
+
+__all__ = ['ExportResult', 'build_plot', 'render_chart', 'export_charts']
+
+
+ExportResult = collections.namedtuple('ExportResult', ['index', 'name', 'format', 'data',
+                                                       'render_time', 'encode_time', 'error'])
+ExportResult.__doc__ = """Outcome of rendering one chart spec.
+
+index is the position of the spec in the input, data the encoded file content as bytes.
+render_time (building and drawing the chart) and encode_time are given in seconds. For PDF, rendering and encoding can't be
+separated, so render_time covers both and encode_time is zero. If the chart failed, data is None
+and error holds the formatted exception.
+"""
+
+_RASTER_FORMATS = {'png': 'PNG', 'jpg': 'JPG', 'jpeg': 'JPG', 'bmp': 'BMP'}
+
+_application = None  # the QApplication of a worker process
+
+
+def _init_worker(platform):
+    """Sets up the Qt platform and the QApplication of a worker process."""
+    global _application
+    if platform:
+        os.environ['QT_QPA_PLATFORM'] = platform
+    from PyQt5.QtWidgets import QApplication
+    _application = QApplication.instance() or QApplication(['qcustomplot2_batch'])
+
+
+def build_plot(spec):
+    """Creates a QCustomPlot according to the chart spec and returns it."""
+    from PyQt5.QtGui import QBrush, QColor, QPen
+    from QCustomPlot2 import QCustomPlot, QCPScatterStyle, QCPTextElement
+
+    plot = QCustomPlot()
+    plot.resize(spec.get('width', 800), spec.get('height', 600))
+    if spec.get('title'):
+        plot.plotLayout().insertRow(0)
+        plot.plotLayout().addElement(0, 0, QCPTextElement(plot, spec['title']))
+    plot.xAxis.setLabel(spec.get('xlabel', ''))
+    plot.yAxis.setLabel(spec.get('ylabel', ''))
+
+    for graphSpec in spec.get('graphs', ()):
+        graph = plot.addGraph()
+        graph.setData(graphSpec['keys'], graphSpec['values'], graphSpec.get('sorted', False))
+        if 'name' in graphSpec:
+            graph.setName(graphSpec['name'])
+        if 'pen' in graphSpec:
+            graph.setPen(QPen(QColor(graphSpec['pen']), graphSpec.get('penWidth', 1)))
+        if 'brush' in graphSpec:
+            graph.setBrush(QBrush(QColor(graphSpec['brush'])))
+        if 'scatter' in graphSpec:
+            shape = getattr(QCPScatterStyle, graphSpec['scatter'])
+            graph.setScatterStyle(QCPScatterStyle(shape, graphSpec.get('scatterSize', 6)))
+
+    plot.rescaleAxes()
+    if 'xrange' in spec:
+        plot.xAxis.setRange(*spec['xrange'])
+    if 'yrange' in spec:
+        plot.yAxis.setRange(*spec['yrange'])
+    plot.legend.setVisible(spec.get('legend', False))
+
+    if spec.get('setup') is not None:
+        spec['setup'](plot, spec)
+    return plot
+
+
+def render_chart(spec):
+    """Renders the chart spec in the current process.
+
+    Returns a tuple (data, render_time, encode_time), see ExportResult. A QApplication must exist.
+    """
+    from PyQt5.QtCore import QBuffer, QByteArray, QIODevice
+    from QCustomPlot2 import QCP
+
+    fileFormat = spec.get('format', 'png').lower()
+    width = spec.get('width', 800)
+    height = spec.get('height', 600)
+    start = time.perf_counter()
+    plot = build_plot(spec)
+    if fileFormat == 'pdf':
+        # savePdf needs a file name, so go through a temporary file:
+        fd, path = tempfile.mkstemp(suffix='.pdf')
+        os.close(fd)
+        try:
+            if not plot.savePdf(path, width, height, QCP.epAllowCosmetic, '', str(spec.get('title', ''))):
+                raise RuntimeError("savePdf failed")
+            with open(path, 'rb') as f:
+                data = f.read()
+        finally:
+            os.remove(path)
+        return data, time.perf_counter()-start, 0.0
+
+    if fileFormat not in _RASTER_FORMATS:
+        raise ValueError("unsupported format '{}'".format(fileFormat))
+    image = plot.toImage(width, height, spec.get('scale', 1.0))
+    rendered = time.perf_counter()
+    byteArray = QByteArray()
+    buffer = QBuffer(byteArray)
+    buffer.open(QIODevice.WriteOnly)
+    if not image.save(buffer, _RASTER_FORMATS[fileFormat], spec.get('quality', -1)):
+        raise RuntimeError("encoding the image as {} failed".format(fileFormat))
+    buffer.close()
+    return bytes(byteArray), rendered-start, time.perf_counter()-rendered
+
+
+def _render_job(job):
+    """Worker side of export_charts, never raises so a bad spec doesn't abort the batch."""
+    index, spec = job
+    name = spec.get('name', index)
+    fileFormat = spec.get('format', 'png').lower()
+    try:
+        data, renderTime, encodeTime = render_chart(spec)
+    except Exception:
+        import traceback
+        return ExportResult(index, name, fileFormat, None, 0.0, 0.0, traceback.format_exc())
+    return ExportResult(index, name, fileFormat, data, renderTime, encodeTime, None)
+
+
+def export_charts(specs, processes=None, chunksize=1, ordered=False, platform='offscreen', context='spawn'):
+    """Renders the chart specs on a pool of worker processes and yields an ExportResult per chart.
+
+    The results are yielded as soon as they are available, so their order may differ from specs
+    unless ordered is True. processes defaults to the number of CPUs. Larger values of chunksize
+    reduce the scheduling overhead for many small charts.
+
+    Each worker creates its own QApplication with the given Qt platform plugin. The default
+    multiprocessing context 'spawn' starts clean interpreters, which is required if the calling
+    process already runs Qt, since Qt doesn't survive a fork.
+    """
+    ctx = multiprocessing.get_context(context)
+    with ctx.Pool(processes, initializer=_init_worker, initargs=(platform,)) as pool:
+        mapper = pool.imap if ordered else pool.imap_unordered
+        for result in mapper(_render_job, enumerate(specs), chunksize):
+            yield result
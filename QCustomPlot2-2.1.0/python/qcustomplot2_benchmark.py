@@ -0,0 +1,364 @@
+# -*- coding: utf-8 -*-
+
+# PyQt5 binding for QCustomPlot v2.1.0
+#
+# License: MIT
+#
+# QCustomPlot author: Emanuel Eichhammer
+# QCustomPlot Website/Contact: http://www.qcustomplot.com
+
+"""Benchmark suite for the Python binding layer of QCustomPlot.
+
+The C++ benchmarks in QCustomPlot/tests/benchmark measure the library itself. This suite measures
+what Python code actually pays for when calling it: converting Python lists in setData, adding
+points one at a time, iterating data containers, filling color maps cell by cell and exporting.
+It runs headless on the offscreen Qt platform plugin and needs no packages beyond PyQt5 (NumPy is
+used for some cases, if installed):
+
+    python -m qcustomplot2_benchmark --sizes 1000 100000 10000000 --json current.json
+    python -m qcustomplot2_benchmark --baseline current.json
+
+Each case is run for every size (number of data points, or color map cells). Cases that loop over
+the points in Python have a size limit, so the default run finishes in a few minutes; pass
+--all-sizes to lift it. The best time of several rounds is compared against the baseline, a JSON
+file written by an earlier run with --json. Cases that became slower than the threshold are
+reported, and the exit code is 1, so the suite can guard against regressions in a CI job.
+
+The suite can also be used from Python with run_suite, compare and write_json.
+"""
+
+import argparse
+import array
+import collections
+import fnmatch
+import json
+import math
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+__all__ = ['CASES', 'BenchmarkResult', 'Regression', 'run_suite', 'compare', 'write_json', 'read_json', 'main']
+
+
+BenchmarkResult = collections.namedtuple('BenchmarkResult', ['case', 'points', 'rounds', 'best', 'mean', 'stdev'])
+BenchmarkResult.__doc__ = """Timing of one case at one size, all times in milliseconds."""
+
+Regression = collections.namedtuple('Regression', ['case', 'points', 'baseline', 'current', 'ratio'])
+Regression.__doc__ = """A case that got slower than allowed, with the best times in milliseconds."""
+
+DEFAULT_SIZES = [1000, 10000, 100000, 1000000]
+
+CASES = collections.OrderedDict()
+
+
+def _case(name, maxPoints=None):
+    """Registers a case factory under name.
+
+    The factory is called with a _Workspace and the size n, and returns the function to time. All
+    preparations that shouldn't be measured happen in the factory. maxPoints limits the sizes the
+    case runs at, unless all sizes are requested.
+    """
+    def register(factory):
+        CASES[name] = (factory, maxPoints)
+        return factory
+    return register
+
+
+class _Workspace(object):
+    """Holds the plot, the input data of the current size and a temporary directory for exports."""
+
+    def __init__(self):
+        from QCustomPlot2 import QCustomPlot
+        self.plot = QCustomPlot()
+        self.plot.resize(800, 600)
+        self.directory = tempfile.mkdtemp(prefix='qcustomplot2_benchmark')
+        self.n = 0
+        self.keys = self.values = None
+
+    def setSize(self, n):
+        if n != self.n:
+            self.n = n
+            self.keys = [i/n for i in range(n)]
+            self.values = [math.sin(k*10*math.pi)+0.1*math.sin(k*1e3*math.pi) for k in self.keys]
+
+    def freshGraph(self):
+        """Returns the only graph of the plot, with the current data."""
+        self.plot.clearPlottables()
+        graph = self.plot.addGraph()
+        graph.setData(self.keys, self.values, True)
+        self.plot.rescaleAxes()
+        return graph
+
+    def path(self, fileName):
+        return os.path.join(self.directory, fileName)
+
+    def close(self):
+        self.plot.clearPlottables()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+@_case('graph.setData.list')
+def _graphSetDataList(ws, n):
+    graph = ws.freshGraph()
+    return lambda: graph.setData(ws.keys, ws.values, True)
+
+
+@_case('graph.setData.array')
+def _graphSetDataArray(ws, n):
+    graph = ws.freshGraph()
+    keys, values = array.array('d', ws.keys), array.array('d', ws.values)
+    return lambda: graph.setData(keys, values, True)
+
+
+@_case('graph.setData.numpy')
+def _graphSetDataNumpy(ws, n):
+    if numpy is None:
+        return None
+    graph = ws.freshGraph()
+    keys, values = numpy.asarray(ws.keys), numpy.asarray(ws.values)
+    return lambda: graph.setData(keys, values, True)
+
+
+@_case('graph.addData.perPoint', maxPoints=1000000)
+def _graphAddDataPerPoint(ws, n):
+    graph = ws.freshGraph()
+    def run():
+        graph.data().clear()
+        for key, value in zip(ws.keys, ws.values):
+            graph.addData(key, value)
+    return run
+
+
+@_case('graph.data.iterate', maxPoints=1000000)
+def _graphDataIterate(ws, n):
+    container = ws.freshGraph().data()
+    return lambda: [(d.key, d.value) for d in container]
+
+
+@_case('graph.data.toArrays')
+def _graphDataToArrays(ws, n):
+    container = ws.freshGraph().data()
+    return lambda: container.toArrays()
+
+
+def _colorMap(ws, n):
+    from QCustomPlot2 import QCPColorMap, QCPRange
+    ws.plot.clearPlottables()
+    side = max(1, int(math.sqrt(n)))
+    colorMap = QCPColorMap(ws.plot.xAxis, ws.plot.yAxis)
+    colorMap.data().setSize(side, side)
+    colorMap.data().setRange(QCPRange(0, 1), QCPRange(0, 1))
+    return colorMap, side
+
+
+@_case('colormap.setCell.loop', maxPoints=1000000)
+def _colorMapSetCellLoop(ws, n):
+    colorMap, side = _colorMap(ws, n)
+    data = colorMap.data()
+    def run():
+        for y in range(side):
+            for x in range(side):
+                data.setCell(x, y, math.sin(x*0.05)*math.cos(y*0.07))
+    return run
+
+
+@_case('colormap.setCells')
+def _colorMapSetCells(ws, n):
+    colorMap, side = _colorMap(ws, n)
+    data = colorMap.data()
+    cells = array.array('d', (math.sin(x*0.05)*math.cos(y*0.07) for y in range(side) for x in range(side)))
+    if numpy is not None:
+        cells = numpy.asarray(cells).reshape(side, side)
+        return lambda: data.setCells(cells)
+    # without NumPy, pass one row of the map at a time:
+    rows = [memoryview(cells)[y*side:(y+1)*side] for y in range(side)]
+    def run():
+        for y, row in enumerate(rows):
+            data.setCells(row, 0, y)
+    return run
+
+
+@_case('plot.replot')
+def _plotReplot(ws, n):
+    ws.freshGraph()
+    return lambda: ws.plot.replot()
+
+
+@_case('export.toImage')
+def _exportToImage(ws, n):
+    ws.freshGraph()
+    return lambda: ws.plot.toImage(800, 600)
+
+
+@_case('export.savePng')
+def _exportSavePng(ws, n):
+    ws.freshGraph()
+    path = ws.path('benchmark.png')
+    return lambda: ws.plot.savePng(path, 800, 600)
+
+
+@_case('export.savePdf', maxPoints=1000000)
+def _exportSavePdf(ws, n):
+    ws.freshGraph()
+    path = ws.path('benchmark.pdf')
+    return lambda: ws.plot.savePdf(path, 800, 600)
+
+
+def _statistics(times):
+    mean = sum(times)/len(times)
+    stdev = math.sqrt(sum((t-mean)**2 for t in times)/len(times))
+    return min(times), mean, stdev
+
+
+def run_suite(sizes=None, rounds=5, patterns=None, allSizes=False, progress=None):
+    """Runs the benchmark cases and returns a list of BenchmarkResult.
+
+    sizes defaults to DEFAULT_SIZES. patterns is a list of fnmatch patterns of case names, e.g.
+    ['graph.*'], by default all cases run. progress is called with the case name and size before
+    each case. A QApplication must exist.
+    """
+    results = []
+    ws = _Workspace()
+    try:
+        for name, (factory, maxPoints) in CASES.items():
+            if patterns and not any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns):
+                continue
+            for n in sizes or DEFAULT_SIZES:
+                if maxPoints is not None and n > maxPoints and not allSizes:
+                    continue
+                if progress is not None:
+                    progress(name, n)
+                ws.setSize(n)
+                func = factory(ws, n)
+                if func is None:  # case not available, e.g. NumPy not installed
+                    break
+                times = []
+                for i in range(rounds):
+                    start = time.perf_counter()
+                    func()
+                    times.append((time.perf_counter()-start)*1e3)
+                results.append(BenchmarkResult(name, n, rounds, *_statistics(times)))
+    finally:
+        ws.close()
+    return results
+
+
+def compare(results, baseline, threshold=0.25, minimumTime=0.05):
+    """Compares results against the baseline results and returns a list of Regression.
+
+    A case regressed, if its best time is more than threshold (a fraction) above the best time of
+    the same case and size in baseline. Differences below minimumTime milliseconds are ignored, as
+    they are dominated by timer noise. Cases missing in baseline are skipped.
+    """
+    baselineTimes = dict(((r.case, r.points), r.best) for r in baseline)
+    regressions = []
+    for r in results:
+        reference = baselineTimes.get((r.case, r.points))
+        if reference is None:
+            continue
+        if r.best > reference*(1+threshold) and r.best-reference > minimumTime:
+            regressions.append(Regression(r.case, r.points, reference, r.best, r.best/reference if reference > 0 else float('inf')))
+    return regressions
+
+
+def _environment():
+    from PyQt5.QtCore import PYQT_VERSION_STR, QT_VERSION_STR
+    return collections.OrderedDict([
+        ('timestamp', time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())),
+        ('platform', platform.platform()),
+        ('python', platform.python_version()),
+        ('qt', QT_VERSION_STR),
+        ('pyqt', PYQT_VERSION_STR),
+        ('qcustomplot', '2.1.0'),
+        ('numpy', numpy.__version__ if numpy is not None else None)])
+
+
+def write_json(fileName, results, comment=''):
+    """Writes results to fileName, together with a description of the environment."""
+    content = collections.OrderedDict([
+        ('environment', _environment()),
+        ('comment', comment),
+        ('unit', 'ms'),
+        ('results', [r._asdict() for r in results])])
+    with open(fileName, 'w') as f:
+        json.dump(content, f, indent=2)
+        f.write('\n')
+
+
+def read_json(fileName):
+    """Reads a file written by write_json and returns its list of BenchmarkResult."""
+    with open(fileName) as f:
+        content = json.load(f)
+    return [BenchmarkResult(**r) for r in content['results']]
+
+
+def main(argv=None):
+    argparser = argparse.ArgumentParser(prog='qcustomplot2_benchmark', description=__doc__.split('\n')[0])
+    argparser.add_argument("-s", "--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                           help="Numbers of data points (or color map cells) to run each case with.")
+    argparser.add_argument("-r", "--rounds", type=int, default=5,
+                           help="Number of timed calls per case and size, the best one is compared.")
+    argparser.add_argument("-k", "--cases", nargs="+", default=None,
+                           help="Only run cases matching these patterns, e.g. 'graph.*'.")
+    argparser.add_argument("--all-sizes", action="store_true",
+                           help="Also run cases that loop in Python at sizes above their limit.")
+    argparser.add_argument("--list", action="store_true",
+                           help="List the available cases and exit.")
+    argparser.add_argument("-j", "--json", default=None,
+                           help="Write the results to this JSON file, which can serve as a baseline later.")
+    argparser.add_argument("-b", "--baseline", default=None,
+                           help="Compare the results against this JSON file from an earlier run.")
+    argparser.add_argument("-t", "--threshold", type=float, default=0.25,
+                           help="Allowed slowdown relative to the baseline, as a fraction.")
+    argparser.add_argument("-c", "--comment", default="",
+                           help="Comment stored in the JSON file.")
+    argparser.add_argument("-q", "--quiet", action="store_true",
+                           help="Only print regressions.")
+    config = argparser.parse_args(argv)
+
+    if config.list:
+        for name, (factory, maxPoints) in CASES.items():
+            print(name if maxPoints is None else "{} (up to {} points)".format(name, maxPoints))
+        return 0
+
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    from PyQt5.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication(['qcustomplot2_benchmark'])
+
+    def progress(name, n):
+        if sys.stdout.isatty() and not config.quiet:
+            print("{:<28} {:>9}\r".format(name, n), end='')
+            sys.stdout.flush()
+    results = run_suite(config.sizes, config.rounds, config.cases, config.all_sizes, progress)
+    baseline = read_json(config.baseline) if config.baseline else []
+    baselineTimes = dict(((r.case, r.points), r.best) for r in baseline)
+
+    if not config.quiet:
+        print("{:<28} {:>9} {:>12} {:>12} {:>12} {:>8}".format("case", "points", "best ms", "mean ms", "baseline ms", "change"))
+        for r in results:
+            reference = baselineTimes.get((r.case, r.points))
+            referenceText = "{:>12.3f} {:>+7.0f}%".format(reference, (r.best/reference-1)*100) if reference else "{:>12} {:>8}".format("-", "-")
+            print("{:<28} {:>9} {:>12.3f} {:>12.3f} {}".format(r.case, r.points, r.best, r.mean, referenceText))
+    if config.json:
+        write_json(config.json, results, config.comment)
+
+    regressions = compare(results, baseline, config.threshold)
+    if regressions:
+        print("{} regression(s) above {:.0f}% of the baseline:".format(len(regressions), config.threshold*100))
+        for r in regressions:
+            print("  {} at {} points: {:.3f} ms -> {:.3f} ms ({:.2f}x)".format(r.case, r.points, r.baseline, r.current, r.ratio))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -214,6 +214,8 @@ setup(
         'sipconfig',
         'PyQt5'
     ],
+    package_dir={'': 'python'},
+    py_modules=['qcustomplot2_batch', 'qcustomplot2_benchmark'],
     ext_modules=[
         Extension(
             'QCustomPlot2',
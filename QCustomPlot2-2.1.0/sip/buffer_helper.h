@@ -0,0 +1,564 @@
+#if !defined(__QCUSTOMPLOT_SIP_BUFFER_HELPER)
+#define __QCUSTOMPLOT_SIP_BUFFER_HELPER
+
+#include <Python.h>
+#include <string.h>
+#include <limits.h>
+#include <QtCore/QVector>
+
+/** Returns true if the buffer format string describes a single native item of the struct module
+ *  type code (e.g. 'd' for float64, 'B' for uint8) */
+inline bool qcpIsFormat(const char *format, char code)
+{
+    if (!format)
+        return code == 'B'; // NULL means unsigned bytes
+    if (*format == '@' || *format == '=')
+        ++format;
+#if Q_BYTE_ORDER == Q_LITTLE_ENDIAN
+    else if (*format == '<')
+        ++format;
+#else
+    else if (*format == '>' || *format == '!')
+        ++format;
+#endif
+    return format[0] == code && format[1] == '\0';
+}
+
+/** Returns true if the buffer format string describes a native float64 */
+inline bool qcpIsDoubleFormat(const char *format)
+{
+    return qcpIsFormat(format, 'd');
+}
+
+/** Provides read access to a one-dimensional array of doubles passed from Python.
+ *
+ *  Objects exporting a contiguous float64 buffer (NumPy arrays, array.array('d'), memoryview, ...)
+ *  are accessed in place, without any copy. Everything else (lists, integer arrays, ...) is
+ *  converted element by element into an internal vector, like a regular sequence argument.
+ *
+ *  The data pointer stays valid as long as the QCPDoubleBuffer exists, which allows to release
+ *  the GIL while the C++ side processes the data.
+ */
+class QCPDoubleBuffer
+{
+public:
+    explicit QCPDoubleBuffer(PyObject *obj) :
+        m_pData(nullptr), m_Size(0), m_HasView(false), m_Valid(false)
+    {
+        if (PyObject_CheckBuffer(obj) && PyObject_GetBuffer(obj, &m_View, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) == 0)
+        {
+            if (m_View.ndim <= 1 && m_View.itemsize == sizeof(double) && qcpIsDoubleFormat(m_View.format))
+            {
+                m_HasView = true;
+                m_Valid = true;
+                m_pData = static_cast<const double*>(m_View.buf);
+                m_Size = m_View.len/Py_ssize_t(sizeof(double));
+                return;
+            }
+            PyBuffer_Release(&m_View);
+        }
+        PyErr_Clear();
+
+        // not a float64 buffer, fall back to the generic sequence protocol:
+        PyObject *seq = PySequence_Fast(obj, "expected a sequence of floats or a contiguous float64 buffer");
+        if (!seq)
+            return;
+        const Py_ssize_t n = PySequence_Fast_GET_SIZE(seq);
+        m_Copy.resize(int(n));
+        for (Py_ssize_t i=0; i<n; ++i)
+        {
+            const double v = PyFloat_AsDouble(PySequence_Fast_GET_ITEM(seq, i));
+            if (v == -1.0 && PyErr_Occurred())
+            {
+                Py_DECREF(seq);
+                return;
+            }
+            m_Copy[int(i)] = v;
+        }
+        Py_DECREF(seq);
+        m_Valid = true;
+        m_pData = m_Copy.constData();
+        m_Size = n;
+    }
+
+    ~QCPDoubleBuffer()
+    {
+        if (m_HasView)
+            PyBuffer_Release(&m_View);
+    }
+
+    /** False if the object could not be converted, a Python exception is set in that case */
+    bool isValid() const noexcept { return m_Valid; }
+    const double *data() const noexcept { return m_pData; }
+    int size() const noexcept { return int(m_Size); }
+
+private:
+    Q_DISABLE_COPY(QCPDoubleBuffer)
+
+    Py_buffer m_View;
+    QVector<double> m_Copy;
+    const double *m_pData;
+    Py_ssize_t m_Size;
+    bool m_HasView;
+    bool m_Valid;
+};
+
+/** Provides read access to a one-dimensional array of ints passed from Python, e.g. indices.
+ *
+ *  Objects exporting a contiguous int32 buffer (NumPy arrays of dtype int32, array.array('i'), ...)
+ *  are accessed in place. Other one-dimensional integer buffers, like NumPy's default int64
+ *  arrays, are converted in a single pass without creating Python objects. Everything else is
+ *  converted element by element, like a regular sequence argument. Values outside the range of
+ *  int raise an OverflowError.
+ */
+class QCPIntBuffer
+{
+public:
+    explicit QCPIntBuffer(PyObject *obj) :
+        m_pData(nullptr), m_Size(0), m_HasView(false), m_Valid(false)
+    {
+        if (PyObject_CheckBuffer(obj) && PyObject_GetBuffer(obj, &m_View, PyBUF_STRIDES | PyBUF_FORMAT) == 0)
+        {
+            if (m_View.ndim == 1 && (m_View.shape[0] <= 1 || m_View.strides[0] == Py_ssize_t(sizeof(int))) && m_View.itemsize == sizeof(int) && qcpIsFormat(m_View.format, 'i'))
+            {
+                m_HasView = true;
+                m_Valid = true;
+                m_pData = static_cast<const int*>(m_View.buf);
+                m_Size = m_View.shape[0];
+                return;
+            }
+            const int converted = m_View.ndim == 1 ? convertView() : 0;
+            PyBuffer_Release(&m_View);
+            if (converted != 0)
+            {
+                m_Valid = converted > 0;
+                m_pData = m_Copy.constData();
+                m_Size = m_Copy.size();
+                return;
+            }
+        }
+        PyErr_Clear();
+
+        // not an integer buffer, fall back to the generic sequence protocol:
+        PyObject *seq = PySequence_Fast(obj, "expected a sequence of ints or a one-dimensional integer buffer");
+        if (!seq)
+            return;
+        const Py_ssize_t n = PySequence_Fast_GET_SIZE(seq);
+        m_Copy.resize(int(n));
+        for (Py_ssize_t i=0; i<n; ++i)
+        {
+            int overflow = 0;
+            const long long v = PyLong_AsLongLongAndOverflow(PySequence_Fast_GET_ITEM(seq, i), &overflow);
+            if ((v == -1 && PyErr_Occurred()) || overflow != 0 || v < INT_MIN || v > INT_MAX)
+            {
+                if (!PyErr_Occurred())
+                    PyErr_SetString(PyExc_OverflowError, "value does not fit into an int");
+                Py_DECREF(seq);
+                return;
+            }
+            m_Copy[int(i)] = int(v);
+        }
+        Py_DECREF(seq);
+        m_Valid = true;
+        m_pData = m_Copy.constData();
+        m_Size = n;
+    }
+
+    ~QCPIntBuffer()
+    {
+        if (m_HasView)
+            PyBuffer_Release(&m_View);
+    }
+
+    /** False if the object could not be converted, a Python exception is set in that case */
+    bool isValid() const noexcept { return m_Valid; }
+    const int *data() const noexcept { return m_pData; }
+    int size() const noexcept { return int(m_Size); }
+
+private:
+    Q_DISABLE_COPY(QCPIntBuffer)
+
+    /** Copies the items of the one-dimensional integer view into m_Copy. Returns 1 on success, -1
+     *  with a Python exception set if a value doesn't fit into an int, and 0 if the item type is
+     *  not an integer type */
+    int convertView()
+    {
+        // the type code is the last character of a native single item format, e.g. "q" or "<q":
+        const char *format = m_View.format ? m_View.format : "B";
+        const size_t length = strlen(format);
+        const char code = length > 0 && length <= 2 ? format[length-1] : '\0';
+        if (!code || !qcpIsFormat(format, code))
+            return 0;
+        switch (code)
+        {
+            case 'b': return copyItems<signed char>();
+            case 'B': return copyItems<unsigned char>();
+            case 'h': return copyItems<short>();
+            case 'H': return copyItems<unsigned short>();
+            case 'i': return copyItems<int>();
+            case 'I': return copyItems<unsigned int>();
+            case 'l': return copyItems<long>();
+            case 'L': return copyItems<unsigned long>();
+            case 'q': return copyItems<long long>();
+            case 'Q': return copyItems<unsigned long long>();
+            case 'n': return copyItems<Py_ssize_t>();
+            case 'N': return copyItems<size_t>();
+            default: return 0;
+        }
+    }
+
+    template<typename T>
+    int copyItems()
+    {
+        if (m_View.itemsize != Py_ssize_t(sizeof(T)))
+            return 0;
+        const Py_ssize_t n = m_View.shape[0];
+        const char *item = static_cast<const char*>(m_View.buf);
+        m_Copy.resize(int(n));
+        for (Py_ssize_t i=0; i<n; ++i, item += m_View.strides[0])
+        {
+            T v;
+            memcpy(&v, item, sizeof(T)); // strided items need not be aligned
+            if (v < T(0) ? (long long)(v) < INT_MIN : (unsigned long long)(v) > (unsigned long long)(INT_MAX))
+            {
+                PyErr_SetString(PyExc_OverflowError, "value does not fit into an int");
+                return -1;
+            }
+            m_Copy[int(i)] = int(v);
+        }
+        return 1;
+    }
+
+    Py_buffer m_View;
+    QVector<int> m_Copy;
+    const int *m_pData;
+    Py_ssize_t m_Size;
+    bool m_HasView;
+    bool m_Valid;
+};
+
+/** Provides access to a two-dimensional array passed from Python, like a 2D NumPy array.
+ *
+ *  The object must export a buffer whose items have the struct module type code passed in code
+ *  (e.g. 'd' for float64, 'B' for uint8). Arbitrary strides are supported, so row-major (C order),
+ *  column-major (Fortran order) and sliced arrays are all accessed in place, without any copy. A
+ *  one-dimensional buffer is treated as a single row.
+ *
+ *  Strides are given in numbers of items. The item at (row, column) is found at
+ *  data()[row*rowStride() + column*columnStride()].
+ */
+class QCPBuffer2D
+{
+public:
+    QCPBuffer2D(PyObject *obj, char code, bool writable=false) :
+        m_Rows(0), m_Columns(0), m_RowStride(0), m_ColumnStride(0), m_HasView(false), m_Valid(false)
+    {
+        if (PyObject_GetBuffer(obj, &m_View, PyBUF_STRIDES | PyBUF_FORMAT | (writable ? PyBUF_WRITABLE : 0)) != 0)
+            return;
+        m_HasView = true;
+        if (m_View.ndim < 1 || m_View.ndim > 2)
+        {
+            PyErr_Format(PyExc_ValueError, "expected a two-dimensional array, got %d dimensions", m_View.ndim);
+            return;
+        }
+        if (!qcpIsFormat(m_View.format, code))
+        {
+            PyErr_Format(PyExc_TypeError, "expected an array with item type '%c', got '%s'", code, m_View.format ? m_View.format : "B");
+            return;
+        }
+        const Py_ssize_t rows = m_View.ndim == 2 ? m_View.shape[0] : 1;
+        const Py_ssize_t columns = m_View.shape[m_View.ndim-1];
+        const Py_ssize_t columnStride = m_View.strides[m_View.ndim-1];
+        const Py_ssize_t rowStride = m_View.ndim == 2 ? m_View.strides[0] : columns*columnStride;
+        if (rows > INT_MAX || columns > INT_MAX ||
+            rowStride/m_View.itemsize > INT_MAX || rowStride/m_View.itemsize < -INT_MAX)
+        {
+            PyErr_SetString(PyExc_OverflowError, "array is too large");
+            return;
+        }
+        if (rowStride % m_View.itemsize != 0 || columnStride % m_View.itemsize != 0)
+        {
+            PyErr_SetString(PyExc_ValueError, "array strides must be multiples of the item size");
+            return;
+        }
+        if ((rows > 1 && rowStride == 0) || (columns > 1 && columnStride == 0))
+        {
+            PyErr_SetString(PyExc_ValueError, "arrays with zero strides (broadcast arrays) are not supported, pass a copy");
+            return;
+        }
+        m_Rows = int(rows);
+        m_Columns = int(columns);
+        m_RowStride = int(rowStride/m_View.itemsize);
+        m_ColumnStride = int(columnStride/m_View.itemsize);
+        m_Valid = true;
+    }
+
+    ~QCPBuffer2D()
+    {
+        if (m_HasView)
+            PyBuffer_Release(&m_View);
+    }
+
+    /** False if the object could not be accessed, a Python exception is set in that case */
+    bool isValid() const noexcept { return m_Valid; }
+    void *data() const noexcept { return m_View.buf; }
+    int rows() const noexcept { return m_Rows; }
+    int columns() const noexcept { return m_Columns; }
+    int rowStride() const noexcept { return m_RowStride; }
+    int columnStride() const noexcept { return m_ColumnStride; }
+
+private:
+    Q_DISABLE_COPY(QCPBuffer2D)
+
+    Py_buffer m_View;
+    int m_Rows, m_Columns;
+    int m_RowStride, m_ColumnStride;
+    bool m_HasView;
+    bool m_Valid;
+};
+
+/** Provides access to an array with any number of dimensions passed from Python, like a NumPy
+ *  array of any shape.
+ *
+ *  Like QCPBuffer2D, arbitrary strides are supported and the array is accessed in place. The array
+ *  is processed as a sequence of rows along its last dimension: rows() is the product of all other
+ *  dimensions, and the item at (row, column) is found at
+ *  data()[rowOffset(row) + column*columnStride()], with rows counted in C order.
+ *
+ *  If code is zero, any item type is accepted and may be checked with hasFormat.
+ */
+class QCPBufferND
+{
+public:
+    QCPBufferND(PyObject *obj, char code, bool writable=false) :
+        m_Rows(0), m_HasView(false), m_Valid(false)
+    {
+        if (PyObject_GetBuffer(obj, &m_View, PyBUF_STRIDES | PyBUF_FORMAT | (writable ? PyBUF_WRITABLE : 0)) != 0)
+            return;
+        m_HasView = true;
+        if (m_View.ndim < 1)
+        {
+            PyErr_SetString(PyExc_ValueError, "expected an array, got a scalar");
+            return;
+        }
+        if (code && !qcpIsFormat(m_View.format, code))
+        {
+            PyErr_Format(PyExc_TypeError, "expected an array with item type '%c', got '%s'", code, m_View.format ? m_View.format : "B");
+            return;
+        }
+        Py_ssize_t rows = 1;
+        for (int i=0; i<m_View.ndim; ++i)
+        {
+            if (m_View.strides[i] % m_View.itemsize != 0)
+            {
+                PyErr_SetString(PyExc_ValueError, "array strides must be multiples of the item size");
+                return;
+            }
+            if (m_View.shape[i] > 1 && m_View.strides[i] == 0)
+            {
+                PyErr_SetString(PyExc_ValueError, "arrays with zero strides (broadcast arrays) are not supported, pass a copy");
+                return;
+            }
+            m_Shape.append(m_View.shape[i]);
+            m_Strides.append(m_View.strides[i]/m_View.itemsize);
+            if (i < m_View.ndim-1)
+                rows *= m_View.shape[i];
+        }
+        m_Rows = rows;
+        m_Valid = true;
+    }
+
+    ~QCPBufferND()
+    {
+        if (m_HasView)
+            PyBuffer_Release(&m_View);
+    }
+
+    /** False if the object could not be accessed, a Python exception is set in that case */
+    bool isValid() const noexcept { return m_Valid; }
+    bool hasFormat(char code) const { return qcpIsFormat(m_View.format, code); }
+    Py_ssize_t itemSize() const noexcept { return m_View.itemsize; }
+    void *data() const noexcept { return m_View.buf; }
+    int ndim() const noexcept { return m_Shape.size(); }
+    Py_ssize_t shape(int dimension) const { return m_Shape.at(dimension); }
+    Py_ssize_t stride(int dimension) const { return m_Strides.at(dimension); }
+    Py_ssize_t rows() const noexcept { return m_Rows; }
+    Py_ssize_t columns() const { return m_Shape.last(); }
+    Py_ssize_t columnStride() const { return m_Strides.last(); }
+
+    /** Returns the offset in items of the first item of row */
+    Py_ssize_t rowOffset(Py_ssize_t row) const
+    {
+        Py_ssize_t offset = 0;
+        for (int i=m_Shape.size()-2; i>=0; --i)
+        {
+            offset += (row % m_Shape.at(i))*m_Strides.at(i);
+            row /= m_Shape.at(i);
+        }
+        return offset;
+    }
+
+private:
+    Q_DISABLE_COPY(QCPBufferND)
+
+    Py_buffer m_View;
+    QVector<Py_ssize_t> m_Shape;
+    QVector<Py_ssize_t> m_Strides;
+    Py_ssize_t m_Rows;
+    bool m_HasView;
+    bool m_Valid;
+};
+
+/** Creates a new writable one-dimensional float64 buffer with size elements and returns it as a
+ *  memoryview of format 'd', which NumPy accepts without copying (numpy.asarray).
+ *
+ *  The memory is owned by the returned object and is written through data. Returns NULL with a
+ *  Python exception set if the allocation failed.
+ */
+inline PyObject *qcpNewDoubleArray(Py_ssize_t size, double **data)
+{
+    PyObject *bytes = PyByteArray_FromStringAndSize(nullptr, size*Py_ssize_t(sizeof(double)));
+    if (!bytes)
+        return nullptr;
+    *data = reinterpret_cast<double*>(PyByteArray_AS_STRING(bytes));
+    PyObject *view = PyMemoryView_FromObject(bytes);
+    Py_DECREF(bytes); // the memoryview keeps the bytearray alive
+    if (!view)
+        return nullptr;
+    PyObject *result = PyObject_CallMethod(view, "cast", "s", "d");
+    Py_DECREF(view);
+    return result;
+}
+
+/** Like qcpNewDoubleArray, but returns a two-dimensional C-ordered memoryview with rows times
+ *  columns elements of format 'd'.
+ */
+inline PyObject *qcpNewDoubleArray2D(Py_ssize_t rows, Py_ssize_t columns, double **data)
+{
+    PyObject *bytes = PyByteArray_FromStringAndSize(nullptr, rows*columns*Py_ssize_t(sizeof(double)));
+    if (!bytes)
+        return nullptr;
+    *data = reinterpret_cast<double*>(PyByteArray_AS_STRING(bytes));
+    PyObject *view = PyMemoryView_FromObject(bytes);
+    Py_DECREF(bytes); // the memoryview keeps the bytearray alive
+    if (!view)
+        return nullptr;
+    PyObject *result = PyObject_CallMethod(view, "cast", "s(nn)", "d", rows, columns);
+    Py_DECREF(view);
+    return result;
+}
+
+/** Creates a new writable C-ordered array with the given shape and items of the struct module
+ *  type code (e.g. 'I' for uint32) of itemSize bytes, returned as a memoryview.
+ *
+ *  memoryview can't represent empty multidimensional arrays, so an array without any items is
+ *  returned one-dimensional. Returns NULL with a Python exception set if the allocation failed.
+ */
+inline PyObject *qcpNewArray(char code, Py_ssize_t itemSize, int ndim, const Py_ssize_t *shape, void **data)
+{
+    Py_ssize_t size = 1;
+    for (int i=0; i<ndim; ++i)
+        size *= shape[i];
+    PyObject *bytes = PyByteArray_FromStringAndSize(nullptr, size*itemSize);
+    if (!bytes)
+        return nullptr;
+    *data = PyByteArray_AS_STRING(bytes);
+    PyObject *view = PyMemoryView_FromObject(bytes);
+    Py_DECREF(bytes); // the memoryview keeps the bytearray alive
+    if (!view)
+        return nullptr;
+    const char format[2] = {code, '\0'};
+    PyObject *result = nullptr;
+    if (size == 0)
+    {
+        result = PyObject_CallMethod(view, "cast", "s", format);
+    } else if (PyObject *shapeTuple = PyTuple_New(ndim))
+    {
+        for (int i=0; i<ndim; ++i)
+            PyTuple_SET_ITEM(shapeTuple, i, PyLong_FromSsize_t(shape[i]));
+        result = PyObject_CallMethod(view, "cast", "sO", format, shapeTuple);
+        Py_DECREF(shapeTuple);
+    }
+    Py_DECREF(view);
+    return result;
+}
+
+/** Python object holding a QVector<double>, which exports it as a read-only one-dimensional
+ *  float64 buffer. See qcpDoubleVectorView.
+ */
+struct QCPDoubleVectorObject
+{
+    PyObject_HEAD
+    QVector<double> *vector;
+    Py_ssize_t shape;
+    Py_ssize_t stride;
+};
+
+inline int qcpDoubleVectorGetBuffer(PyObject *self, Py_buffer *view, int flags)
+{
+    QCPDoubleVectorObject *object = reinterpret_cast<QCPDoubleVectorObject*>(self);
+    if (flags & PyBUF_WRITABLE)
+    {
+        PyErr_SetString(PyExc_BufferError, "the data is read-only");
+        view->obj = nullptr;
+        return -1;
+    }
+    view->buf = const_cast<double*>(object->vector->constData());
+    view->obj = self;
+    Py_INCREF(self);
+    view->len = object->shape*Py_ssize_t(sizeof(double));
+    view->readonly = 1;
+    view->itemsize = sizeof(double);
+    view->format = (flags & PyBUF_FORMAT) ? const_cast<char*>("d") : nullptr;
+    view->ndim = 1;
+    view->shape = (flags & PyBUF_ND) ? &object->shape : nullptr;
+    view->strides = (flags & PyBUF_STRIDES) == PyBUF_STRIDES ? &object->stride : nullptr;
+    view->suboffsets = nullptr;
+    view->internal = nullptr;
+    return 0;
+}
+
+inline void qcpDoubleVectorDealloc(PyObject *self)
+{
+    delete reinterpret_cast<QCPDoubleVectorObject*>(self)->vector;
+    Py_TYPE(self)->tp_free(self);
+}
+
+/** Returns a read-only one-dimensional memoryview of format 'd' on the elements of vector, which
+ *  NumPy accepts without copying (numpy.asarray).
+ *
+ *  The memoryview holds its own reference to the data of vector. Since QVector is implicitly
+ *  shared, this doesn't copy the data, and the view stays valid as long as it exists: If vector
+ *  is modified or destroyed afterwards, it detaches from the data held by the view, which keeps
+ *  showing the elements at the time of the call. Returns NULL with a Python exception set on
+ *  failure.
+ */
+inline PyObject *qcpDoubleVectorView(const QVector<double> &vector)
+{
+    static PyBufferProcs bufferProcs;
+    static PyTypeObject type = { PyVarObject_HEAD_INIT(nullptr, 0) };
+    static bool typeReady = false;
+    if (!typeReady)
+    {
+        bufferProcs.bf_getbuffer = qcpDoubleVectorGetBuffer;
+        type.tp_name = "QCustomPlot2._DoubleVector";
+        type.tp_basicsize = sizeof(QCPDoubleVectorObject);
+        type.tp_flags = Py_TPFLAGS_DEFAULT;
+        type.tp_dealloc = qcpDoubleVectorDealloc;
+        type.tp_as_buffer = &bufferProcs;
+        if (PyType_Ready(&type) < 0)
+            return nullptr;
+        typeReady = true;
+    }
+    QCPDoubleVectorObject *object = PyObject_New(QCPDoubleVectorObject, &type);
+    if (!object)
+        return nullptr;
+    object->vector = new QVector<double>(vector);
+    object->shape = vector.size();
+    object->stride = sizeof(double);
+    PyObject *result = PyMemoryView_FromObject(reinterpret_cast<PyObject*>(object));
+    Py_DECREF(object); // the memoryview keeps the object alive
+    return result;
+}
+
+#endif  // __QCUSTOMPLOT_SIP_BUFFER_HELPER
@@ -0,0 +1,71 @@
+#if !defined(__QCUSTOMPLOT_SIP_COLORGRADIENT_HELPER)
+#define __QCUSTOMPLOT_SIP_COLORGRADIENT_HELPER
+
+#include "buffer_helper.h"
+
+/** Colorizes all items of data with the gradient and writes the colors to out, row by row along
+ *  the last dimension, using QCPColorGradient::colorize and thus its cached color lookup table.
+ *
+ *  out either holds one QRgb per item and has the shape of data (rgba8 false), or holds the red,
+ *  green, blue and alpha bytes of each item in an additional last dimension of size 4 (rgba8
+ *  true). alpha is optional and has the shape of data. Rows must not be longer than INT_MAX items.
+ *
+ *  Doesn't use the Python API, so it may run with the GIL released.
+ */
+inline void qcpColorizeArray(QCPColorGradient *gradient, const QCPBufferND &data, const QCPBufferND *alpha, const QCPRange &range, bool logarithmic, const QCPBufferND &out, bool rgba8)
+{
+    const int n = int(data.columns());
+    const bool directOut = !rgba8 && out.columnStride() == 1; // colorize can write the rows of out in place
+    QVector<double> dataRow;
+    QVector<unsigned char> alphaRow;
+    QVector<QRgb> scanLine(directOut ? 0 : n);
+    for (Py_ssize_t row=0; row<data.rows(); ++row)
+    {
+        const double *rowData = static_cast<const double*>(data.data())+data.rowOffset(row);
+        int rowStride = int(data.columnStride());
+        const unsigned char *rowAlpha = alpha ? static_cast<const unsigned char*>(alpha->data())+alpha->rowOffset(row) : nullptr;
+        if (alpha && alpha->columnStride() != data.columnStride())
+        {
+            // colorize addresses data and alpha with the same stride, so gather both into contiguous rows:
+            const int alphaStride = int(alpha->columnStride());
+            dataRow.resize(n);
+            alphaRow.resize(n);
+            for (int i=0; i<n; ++i)
+            {
+                dataRow[i] = rowData[i*rowStride];
+                alphaRow[i] = rowAlpha[i*alphaStride];
+            }
+            rowData = dataRow.constData();
+            rowAlpha = alphaRow.constData();
+            rowStride = 1;
+        }
+        QRgb *rowColors = directOut ? static_cast<QRgb*>(out.data())+out.rowOffset(row) : scanLine.data();
+        if (rowAlpha)
+            gradient->colorize(rowData, rowAlpha, range, rowColors, n, rowStride, logarithmic);
+        else
+            gradient->colorize(rowData, range, rowColors, n, rowStride, logarithmic);
+        
+        if (rgba8)
+        {
+            unsigned char *outBytes = static_cast<unsigned char*>(out.data())+out.rowOffset(row*n);
+            const Py_ssize_t itemStride = out.stride(out.ndim()-2);
+            const Py_ssize_t channelStride = out.columnStride();
+            for (int i=0; i<n; ++i)
+            {
+                unsigned char *item = outBytes+i*itemStride;
+                item[0] = static_cast<unsigned char>(qRed(scanLine.at(i)));
+                item[channelStride] = static_cast<unsigned char>(qGreen(scanLine.at(i)));
+                item[2*channelStride] = static_cast<unsigned char>(qBlue(scanLine.at(i)));
+                item[3*channelStride] = static_cast<unsigned char>(qAlpha(scanLine.at(i)));
+            }
+        } else if (!directOut)
+        {
+            QRgb *outColors = static_cast<QRgb*>(out.data())+out.rowOffset(row);
+            const Py_ssize_t outStride = out.columnStride();
+            for (int i=0; i<n; ++i)
+                outColors[i*outStride] = scanLine.at(i);
+        }
+    }
+}
+
+#endif  // __QCUSTOMPLOT_SIP_COLORGRADIENT_HELPER
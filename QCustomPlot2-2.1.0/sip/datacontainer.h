@@ -2,6 +2,7 @@
 #define __QCUSTOMPLOT_SIP_DATACONTAINER_H
 
 #include <QCustomPlot/src/datacontainer.h>
+#include "buffer_helper.h"
 
 /** Defines an iterator that can be reasonably wrapped to Python */
 template<typename T>
@@ -37,4 +38,74 @@ protected:
     typename QCPDataContainer<T>::iterator m_Iter;
 };
 
+/** Describes the double fields of a data type, in the order they are exported by toArrays.
+ *  Specialized for every data type in datacontainer_helper.h */
+template<typename T>
+struct QCPDataFields;
+
+/** Limits begin and end to the data points of the container, a negative end means up to the last one */
+template<typename T>
+void qcpLimitIndexRange(const QCPDataContainer<T> *container, int &begin, int &end)
+{
+    if (end < 0 || end > container->size())
+        end = container->size();
+    begin = qBound(0, begin, end);
+}
+
+/** Returns the main keys of the data points with index in [begin, end) as float64 buffer */
+template<typename T>
+PyObject *qcpDataContainerKeys(const QCPDataContainer<T> *container, int begin, int end)
+{
+    qcpLimitIndexRange(container, begin, end);
+    double *out;
+    PyObject *result = qcpNewDoubleArray(end-begin, &out);
+    if (!result)
+        return nullptr;
+    typename QCPDataContainer<T>::const_iterator it = container->constBegin()+begin;
+    for (int i=0; i<end-begin; ++i, ++it)
+        out[i] = it->mainKey();
+    return result;
+}
+
+/** Returns the main values of the data points with index in [begin, end) as float64 buffer */
+template<typename T>
+PyObject *qcpDataContainerValues(const QCPDataContainer<T> *container, int begin, int end)
+{
+    qcpLimitIndexRange(container, begin, end);
+    double *out;
+    PyObject *result = qcpNewDoubleArray(end-begin, &out);
+    if (!result)
+        return nullptr;
+    typename QCPDataContainer<T>::const_iterator it = container->constBegin()+begin;
+    for (int i=0; i<end-begin; ++i, ++it)
+        out[i] = it->mainValue();
+    return result;
+}
+
+/** Returns a tuple with one float64 buffer per field of the data points with index in [begin, end) */
+template<typename T>
+PyObject *qcpDataContainerArrays(const QCPDataContainer<T> *container, int begin, int end)
+{
+    qcpLimitIndexRange(container, begin, end);
+    const int fieldCount = QCPDataFields<T>::count;
+    PyObject *result = PyTuple_New(fieldCount);
+    if (!result)
+        return nullptr;
+    double *columns[QCPDataFields<T>::count];
+    for (int field=0; field<fieldCount; ++field)
+    {
+        PyObject *column = qcpNewDoubleArray(end-begin, &columns[field]);
+        if (!column)
+        {
+            Py_DECREF(result);
+            return nullptr;
+        }
+        PyTuple_SET_ITEM(result, field, column);
+    }
+    typename QCPDataContainer<T>::const_iterator it = container->constBegin()+begin;
+    for (int i=0; i<end-begin; ++i, ++it)
+        QCPDataFields<T>::get(*it, columns, i);
+    return result;
+}
+
 #endif  // __QCUSTOMPLOT_SIP_DATACONTAINER_H
@@ -1,6 +1,9 @@
 #if !defined(__QCUSTOMPLOT_SIP_DATACONTAINER_HELPER)
 #define __QCUSTOMPLOT_SIP_DATACONTAINER_HELPER
 
+typedef QCPDataContainer<QCPAnnotationData> QCPAnnotationDataContainer;
+typedef QCPDataContainerIterator<QCPAnnotationData> QCPAnnotationDataContainerIterator;
+
 typedef QCPDataContainer<QCPBarsData> QCPBarsDataContainer;
 typedef QCPDataContainerIterator<QCPBarsData> QCPBarsDataContainerIterator;
 
@@ -16,4 +19,86 @@ typedef QCPDataContainerIterator<QCPGraphData> QCPGraphDataContainerIterator;
 typedef QCPDataContainer<QCPStatisticalBoxData> QCPStatisticalBoxDataContainer;
 typedef QCPDataContainerIterator<QCPStatisticalBoxData> QCPStatisticalBoxDataContainerIterator;
 
+template<>
+struct QCPDataFields<QCPAnnotationData>
+{
+    static const int count = 3; // key, value, styleIndex (texts are not exported)
+    static void get(const QCPAnnotationData &d, double **columns, int i) { columns[0][i] = d.key; columns[1][i] = d.value; columns[2][i] = d.styleIndex; }
+};
+
+template<>
+struct QCPDataFields<QCPBarsData>
+{
+    static const int count = 2; // key, value
+    static void get(const QCPBarsData &d, double **columns, int i) { columns[0][i] = d.key; columns[1][i] = d.value; }
+};
+
+template<>
+struct QCPDataFields<QCPCurveData>
+{
+    static const int count = 3; // t, key, value
+    static void get(const QCPCurveData &d, double **columns, int i) { columns[0][i] = d.t; columns[1][i] = d.key; columns[2][i] = d.value; }
+};
+
+template<>
+struct QCPDataFields<QCPFinancialData>
+{
+    static const int count = 5; // key, open, high, low, close
+    static void get(const QCPFinancialData &d, double **columns, int i)
+    {
+        columns[0][i] = d.key;
+        columns[1][i] = d.open;
+        columns[2][i] = d.high;
+        columns[3][i] = d.low;
+        columns[4][i] = d.close;
+    }
+};
+
+template<>
+struct QCPDataFields<QCPGraphData>
+{
+    static const int count = 2; // key, value
+    static void get(const QCPGraphData &d, double **columns, int i) { columns[0][i] = d.key; columns[1][i] = d.value; }
+};
+
+template<>
+struct QCPDataFields<QCPStatisticalBoxData>
+{
+    static const int count = 6; // key, minimum, lowerQuartile, median, upperQuartile, maximum (outliers are not exported)
+    static void get(const QCPStatisticalBoxData &d, double **columns, int i)
+    {
+        columns[0][i] = d.key;
+        columns[1][i] = d.minimum;
+        columns[2][i] = d.lowerQuartile;
+        columns[3][i] = d.median;
+        columns[4][i] = d.upperQuartile;
+        columns[5][i] = d.maximum;
+    }
+};
+
+/** QCPErrorBarsDataContainer is a plain QVector, this is the equivalent of qcpDataContainerArrays for it */
+inline PyObject *qcpErrorBarsArrays(const QCPErrorBarsDataContainer *container, int begin, int end)
+{
+    if (end < 0 || end > container->size())
+        end = container->size();
+    begin = qBound(0, begin, end);
+    double *minus, *plus;
+    PyObject *minusArray = qcpNewDoubleArray(end-begin, &minus);
+    if (!minusArray)
+        return nullptr;
+    PyObject *plusArray = qcpNewDoubleArray(end-begin, &plus);
+    if (!plusArray)
+    {
+        Py_DECREF(minusArray);
+        return nullptr;
+    }
+    QCPErrorBarsDataContainer::const_iterator it = container->constBegin()+begin;
+    for (int i=0; i<end-begin; ++i, ++it)
+    {
+        minus[i] = it->errorMinus;
+        plus[i] = it->errorPlus;
+    }
+    return Py_BuildValue("(NN)", minusArray, plusArray);
+}
+
 #endif  // __QCUSTOMPLOT_SIP_DATACONTAINER_HELPER
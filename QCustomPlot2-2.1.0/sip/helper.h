@@ -6,5 +6,6 @@ typedef QCPAbstractPlottable1D<QCPBarsData> QCPAbstractPlottable1D_QCPBarsData;
 typedef QCPAbstractPlottable1D<QCPCurveData> QCPAbstractPlottable1D_QCPCurveData;
 typedef QCPAbstractPlottable1D<QCPStatisticalBoxData> QCPAbstractPlottable1D_QCPStatisticalBoxData;
 typedef QCPAbstractPlottable1D<QCPFinancialData> QCPAbstractPlottable1D_QCPFinancialData;
+typedef QCPAbstractPlottable1D<QCPAnnotationData> QCPAbstractPlottable1D_QCPAnnotationData;
 
 #endif  // __QCUSTOMPLOT_SIP_HELPER